@@ -8,7 +8,6 @@ import Swal from 'sweetalert2';
 import DOMPurify from 'dompurify';
 import Raphael from 'raphael';
 import 'justgage'; 
-import { instance } from '@viz-js/viz';
 import {
     parseModel,
     generateRisks,
@@ -16,20 +15,33 @@ import {
     printGraphvizDOT, 
     printDataFlowDiagramGraphvizDOT,
     applyRAAMethod,
-    initModelState
+    initModelState,
+    applyModelEdits,
+    hasIncrementalModel,
+    getGeneratedRisks
 } from './backend/main.ts';
+import { EngineClient } from './backend/worker/engine-client.ts';
+import { LayoutClient } from './backend/worker/layout-client.ts';
+import { diagramGeometrySection, readDiagramGeometry, layoutFromGeometry, mergePersistedLayout } from './backend/layout/diagram-geometry.ts';
 
 window.applyRAAJS = applyRAAMethod;
-window.Viz = instance;
 window.initModelState = initModelState;
 window.parseModelViaString = parseModel;
 window.applyRiskGenerationJS = generateRisks;
+window.applyModelEditsJS = applyModelEdits;
+window.hasIncrementalModelJS = hasIncrementalModel;
+window.getGeneratedRisksJS = getGeneratedRisks;
+window.threagileEngine = new EngineClient('dist/engine.worker.js');
 window.printGraphvizDOT = printGraphvizDOT;
 window.printDataFlowDiagramGraphvizDOT = printDataFlowDiagramGraphvizDOT;
+window.graphvizLayout = new LayoutClient('dist/layout.worker.js');
+window.diagramGeometrySection = diagramGeometrySection;
+window.readDiagramGeometry = readDiagramGeometry;
+window.layoutFromDiagramGeometry = layoutFromGeometry;
+window.mergePersistedLayout = mergePersistedLayout;
 
 // --- Add Imports for Phase 3 Libraries ---
 import { Graphviz } from '@hpcc-js/wasm';         // For rendering DOT strings
-import { parse as parseDotToAST } from '@ts-graphviz/ast';
 
 // --- Global Assignments (If needed) ---
 window.pako = pako;
@@ -39,7 +51,6 @@ window.Tagify = Tagify;
 window.Swal = Swal;
 window.DOMPurify = DOMPurify; // Make DOMPurify global (needed for sanitizer replacement)
 window.Raphael = Raphael;     // Make Raphael global (needed by JustGage)
-window.DOTParser = parseDotToAST; // Make the renamed parser function globally available
 
 console.log("app.js: Deno-managed modules loaded and attached to window.");
 // Log the newly added ones too for confirmation
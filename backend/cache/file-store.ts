@@ -0,0 +1,75 @@
+// File backed ModelCacheStore for the headless (Deno) path: one JSON file per entry, the file's
+// modification time doubles as the last access time. Values must be JSON serializable.
+
+import { ModelCacheEntry, ModelCacheEntryInfo, ModelCacheStore } from './model-cache.ts';
+
+export class FileCacheStore<T> implements ModelCacheStore<T> {
+    private directory: string;
+
+    constructor(directory: string) {
+        this.directory = directory;
+    }
+
+    private path(key: string): string {
+        if (!/^[0-9a-f]+$/.test(key)) {
+            throw new Error(`Invalid model cache key: ${key}`);
+        }
+        return `${this.directory}/${key}.json`;
+    }
+
+    async get(key: string): Promise<ModelCacheEntry<T> | undefined> {
+        try {
+            const value = JSON.parse(await Deno.readTextFile(this.path(key))) as T;
+            const info = await Deno.stat(this.path(key));
+            return { key, value, sizeBytes: info.size, lastAccess: info.mtime?.getTime() ?? 0 };
+        } catch (e) {
+            if (e instanceof Deno.errors.NotFound) {
+                return undefined;
+            }
+            throw e;
+        }
+    }
+
+    async put(entry: ModelCacheEntry<T>): Promise<void> {
+        await Deno.mkdir(this.directory, { recursive: true });
+        // Write and rename, so concurrent readers never see a partial file
+        const temporaryPath = `${this.path(entry.key)}.${crypto.randomUUID()}.tmp`;
+        await Deno.writeTextFile(temporaryPath, JSON.stringify(entry.value));
+        await Deno.rename(temporaryPath, this.path(entry.key));
+    }
+
+    async touch(key: string, lastAccess: number): Promise<void> {
+        const time = new Date(lastAccess);
+        await Deno.utime(this.path(key), time, time);
+    }
+
+    async delete(key: string): Promise<void> {
+        try {
+            await Deno.remove(this.path(key));
+        } catch (e) {
+            if (!(e instanceof Deno.errors.NotFound)) {
+                throw e;
+            }
+        }
+    }
+
+    async list(): Promise<ModelCacheEntryInfo[]> {
+        const entries: ModelCacheEntryInfo[] = [];
+        try {
+            for await (const file of Deno.readDir(this.directory)) {
+                const match = /^([0-9a-f]+)\.json$/.exec(file.name);
+                if (file.isFile && match) {
+                    const info = await Deno.stat(`${this.directory}/${file.name}`).catch(() => null); // Evicted by another process
+                    if (info) {
+                        entries.push({ key: match[1], sizeBytes: info.size, lastAccess: info.mtime?.getTime() ?? 0 });
+                    }
+                }
+            }
+        } catch (e) {
+            if (!(e instanceof Deno.errors.NotFound)) {
+                throw e;
+            }
+        }
+        return entries;
+    }
+}
@@ -0,0 +1,82 @@
+// IndexedDB backed ModelCacheStore, usable from the page and from workers. Values are stored
+// as structured clones, the same way they cross postMessage.
+
+import { ModelCacheEntry, ModelCacheEntryInfo, ModelCacheStore } from './model-cache.ts';
+
+const entryStore = 'entries';
+const infoStore = 'info'; // Key, size and last access only, so eviction doesn't load the values
+
+function promisify<R>(request: IDBRequest<R>): Promise<R> {
+    return new Promise((resolve, reject) => {
+        request.onsuccess = () => resolve(request.result);
+        request.onerror = () => reject(request.error);
+    });
+}
+
+function completion(transaction: IDBTransaction): Promise<void> {
+    return new Promise((resolve, reject) => {
+        transaction.oncomplete = () => resolve();
+        transaction.onerror = () => reject(transaction.error);
+        transaction.onabort = () => reject(transaction.error);
+    });
+}
+
+export class IndexedDbCacheStore<T> implements ModelCacheStore<T> {
+    private database: Promise<IDBDatabase> | null = null;
+    private databaseName: string;
+
+    constructor(databaseName: string) {
+        this.databaseName = databaseName;
+    }
+
+    private open(): Promise<IDBDatabase> {
+        if (!this.database) {
+            const request = indexedDB.open(this.databaseName, 1);
+            request.onupgradeneeded = () => {
+                request.result.createObjectStore(entryStore);
+                request.result.createObjectStore(infoStore);
+            };
+            this.database = promisify(request);
+            this.database.catch(() => { this.database = null; }); // Retry on the next access
+        }
+        return this.database;
+    }
+
+    async get(key: string): Promise<ModelCacheEntry<T> | undefined> {
+        const database = await this.open();
+        return promisify(database.transaction(entryStore).objectStore(entryStore).get(key));
+    }
+
+    async put(entry: ModelCacheEntry<T>): Promise<void> {
+        const database = await this.open();
+        const transaction = database.transaction([entryStore, infoStore], 'readwrite');
+        const info: ModelCacheEntryInfo = { key: entry.key, sizeBytes: entry.sizeBytes, lastAccess: entry.lastAccess };
+        transaction.objectStore(entryStore).put(entry, entry.key);
+        transaction.objectStore(infoStore).put(info, entry.key);
+        await completion(transaction);
+    }
+
+    async touch(key: string, lastAccess: number): Promise<void> {
+        const database = await this.open();
+        const transaction = database.transaction(infoStore, 'readwrite');
+        const store = transaction.objectStore(infoStore);
+        const info: ModelCacheEntryInfo | undefined = await promisify(store.get(key));
+        if (info) {
+            store.put({ ...info, lastAccess }, key);
+        }
+        await completion(transaction);
+    }
+
+    async delete(key: string): Promise<void> {
+        const database = await this.open();
+        const transaction = database.transaction([entryStore, infoStore], 'readwrite');
+        transaction.objectStore(entryStore).delete(key);
+        transaction.objectStore(infoStore).delete(key);
+        await completion(transaction);
+    }
+
+    async list(): Promise<ModelCacheEntryInfo[]> {
+        const database = await this.open();
+        return promisify(database.transaction(infoStore).objectStore(infoStore).getAll());
+    }
+}
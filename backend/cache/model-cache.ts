@@ -0,0 +1,133 @@
+// Content-addressed cache of engine results, keyed by a hash of the model YAML and the rule set.
+// The store is pluggable: IndexedDB in the browser (indexeddb-store.ts), files in the headless path (file-store.ts).
+
+export interface ModelCacheEntry<T> {
+    key: string;
+    value: T;
+    sizeBytes: number; // Estimate, see estimateSize
+    lastAccess: number; // Epoch milliseconds, drives the LRU eviction
+}
+
+export interface ModelCacheEntryInfo {
+    key: string;
+    sizeBytes: number;
+    lastAccess: number;
+}
+
+export interface ModelCacheStore<T> {
+    get(key: string): Promise<ModelCacheEntry<T> | undefined>;
+    put(entry: ModelCacheEntry<T>): Promise<void>;
+    touch(key: string, lastAccess: number): Promise<void>;
+    delete(key: string): Promise<void>;
+    list(): Promise<ModelCacheEntryInfo[]>;
+}
+
+export interface ModelCacheLimits {
+    maxEntries: number;
+    maxBytes: number;
+}
+
+export const defaultModelCacheLimits: ModelCacheLimits = {
+    maxEntries: 20,
+    maxBytes: 50 * 1024 * 1024,
+};
+
+// SHA-256 over the rule set version and the YAML text, hex encoded
+export async function modelCacheKey(yaml: string, ruleSetVersion: string): Promise<string> {
+    const data = new TextEncoder().encode(ruleSetVersion + '\n' + yaml);
+    const digest = await crypto.subtle.digest('SHA-256', data);
+    return [...new Uint8Array(digest)].map(byte => byte.toString(16).padStart(2, '0')).join('');
+}
+
+// Rough serialized size of a value, Maps and Sets included, binary data (snapshots) at its byte
+// length. Objects referenced more than once are counted once, which also keeps cyclic models from failing.
+export function estimateSize(value: unknown): number {
+    const seen = new WeakSet<object>();
+    let binaryBytes = 0;
+    const json = JSON.stringify(value, (_key, item) => {
+        if (typeof item === 'object' && item !== null) {
+            if (seen.has(item)) return undefined;
+            seen.add(item);
+        }
+        if (item instanceof ArrayBuffer || ArrayBuffer.isView(item)) {
+            binaryBytes += item.byteLength;
+            return undefined;
+        }
+        if (item instanceof Map) return [...item.entries()];
+        if (item instanceof Set) return [...item.values()];
+        return item;
+    });
+    return (json ? json.length * 2 : 0) + binaryBytes; // UTF-16
+}
+
+/**
+ * LRU cache on top of a ModelCacheStore. Storage failures (quota, private browsing, read-only
+ * file systems) are logged and treated as misses; the cache must never break an analysis.
+ */
+export class ModelCache<T> {
+    private store: ModelCacheStore<T>;
+    private limits: ModelCacheLimits;
+
+    constructor(store: ModelCacheStore<T>, limits: Partial<ModelCacheLimits> = {}) {
+        this.store = store;
+        this.limits = { ...defaultModelCacheLimits, ...limits };
+    }
+
+    async get(key: string): Promise<T | undefined> {
+        try {
+            const entry = await this.store.get(key);
+            if (!entry) {
+                return undefined;
+            }
+            await this.store.touch(key, Date.now());
+            return entry.value;
+        } catch (e) {
+            console.warn("Model cache lookup failed:", e);
+            return undefined;
+        }
+    }
+
+    async put(key: string, value: T): Promise<void> {
+        try {
+            const sizeBytes = estimateSize(value);
+            if (sizeBytes > this.limits.maxBytes) {
+                console.warn(`Model cache entry of ${sizeBytes} bytes exceeds the cache size of ${this.limits.maxBytes} bytes, not cached.`);
+                return;
+            }
+            await this.store.put({ key, value, sizeBytes, lastAccess: Date.now() });
+            await this.evict();
+        } catch (e) {
+            console.warn("Model cache store failed:", e);
+        }
+    }
+
+    // Replaces the value of an existing entry, e.g. to add the rendered layout later on
+    async update(key: string, change: (value: T) => T): Promise<void> {
+        try {
+            const entry = await this.store.get(key);
+            if (entry) {
+                await this.put(key, change(entry.value));
+            }
+        } catch (e) {
+            console.warn("Model cache update failed:", e);
+        }
+    }
+
+    // Drops the least recently used entries until both limits are met
+    private async evict(): Promise<void> {
+        const entries = (await this.store.list()).sort((a, b) => b.lastAccess - a.lastAccess);
+        let totalBytes = 0;
+        let kept = 0;
+        for (const entry of entries) {
+            if (kept < this.limits.maxEntries && totalBytes + entry.sizeBytes <= this.limits.maxBytes) {
+                kept++;
+                totalBytes += entry.sizeBytes;
+            } else {
+                await this.store.delete(entry.key);
+            }
+        }
+        if (kept < entries.length) {
+            console.log(`Model cache evicted ${entries.length - kept} entry(s), keeping ${kept} (${totalBytes} bytes).`);
+        }
+    }
+}
@@ -0,0 +1,79 @@
+// ModelCache evicts the least recently used entries, by entry count and by estimated size.
+//
+//   deno task test
+
+import { assertEquals } from 'https://deno.land/std@0.224.0/assert/mod.ts';
+import { estimateSize, ModelCache, type ModelCacheEntry, type ModelCacheEntryInfo, type ModelCacheStore } from './model-cache.ts';
+
+class MemoryStore<T> implements ModelCacheStore<T> {
+    entries = new Map<string, ModelCacheEntry<T>>();
+
+    get(key: string): Promise<ModelCacheEntry<T> | undefined> {
+        return Promise.resolve(this.entries.get(key));
+    }
+    put(entry: ModelCacheEntry<T>): Promise<void> {
+        this.entries.set(entry.key, entry);
+        return Promise.resolve();
+    }
+    touch(key: string, lastAccess: number): Promise<void> {
+        const entry = this.entries.get(key);
+        if (entry) entry.lastAccess = lastAccess;
+        return Promise.resolve();
+    }
+    delete(key: string): Promise<void> {
+        this.entries.delete(key);
+        return Promise.resolve();
+    }
+    list(): Promise<ModelCacheEntryInfo[]> {
+        return Promise.resolve([...this.entries.values()].map(({ key, sizeBytes, lastAccess }) => ({ key, sizeBytes, lastAccess })));
+    }
+}
+
+// Every cache operation sees a later time, so the LRU order doesn't depend on the clock's resolution
+async function withTicks(fn: () => Promise<void>): Promise<void> {
+    const now = Date.now;
+    let tick = 0;
+    Date.now = () => ++tick;
+    try {
+        await fn();
+    } finally {
+        Date.now = now;
+    }
+}
+
+Deno.test('ModelCache evicts the least recently used entries beyond maxEntries', () => withTicks(async () => {
+    const store = new MemoryStore<string>();
+    const cache = new ModelCache(store, { maxEntries: 3 });
+
+    await cache.put('a', 'model a');
+    await cache.put('b', 'model b');
+    await cache.put('c', 'model c');
+    assertEquals(await cache.get('a'), 'model a'); // b is now the least recently used
+    await cache.put('d', 'model d');
+
+    assertEquals([...store.entries.keys()].sort(), ['a', 'c', 'd']);
+    assertEquals(await cache.get('b'), undefined);
+}));
+
+Deno.test('ModelCache evicts the least recently used entries beyond maxBytes', () => withTicks(async () => {
+    const value = 'x'.repeat(100);
+    const entryBytes = estimateSize(value);
+    const store = new MemoryStore<string>();
+    const cache = new ModelCache(store, { maxEntries: 10, maxBytes: entryBytes * 2 + entryBytes / 2 });
+
+    await cache.put('a', value);
+    await cache.put('b', value);
+    await cache.get('a');
+    await cache.put('c', value);
+    assertEquals([...store.entries.keys()].sort(), ['a', 'c']);
+
+    // Larger than the whole cache: not stored, nothing evicted for it
+    await cache.put('huge', 'x'.repeat(1000));
+    assertEquals([...store.entries.keys()].sort(), ['a', 'c']);
+}));
+
+Deno.test('estimateSize counts binary data at its byte length and shared objects once', () => {
+    const shared = { id: 'shared' };
+    assertEquals(estimateSize({ snapshot: new ArrayBuffer(1024) }), estimateSize({}) + 1024);
+    assertEquals(estimateSize([shared, shared]), estimateSize([shared, null]));
+});
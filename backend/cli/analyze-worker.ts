@@ -0,0 +1,119 @@
+/// <reference lib="deno.worker" />
+// Pool worker of the headless CLI (analyze.ts): runs the engine on one model file per job
+// and writes its JSON reports (and optionally its snapshot).
+
+import {
+    parseModel,
+    parseModelInSections,
+    textOnlyModelSections,
+    applyRAAMethod,
+    generateRisks,
+    applyRiskTracking,
+    getGeneratedRisks,
+    getRuleSetVersion,
+} from '../main.ts';
+import { createModelContext, getRisksByTechnicalAssetId, withModelContext } from '../model/types.ts';
+import { writeModelSnapshot } from '../model/snapshot.ts';
+import { ModelCache, modelCacheKey } from '../cache/model-cache.ts';
+import { FileCacheStore } from '../cache/file-store.ts';
+import { AnalysisReports, reportFileNames, writeReportsToStrings } from './reports.ts';
+
+export interface AnalyzeJob {
+    modelPath: string;
+    outputDirectory: string;
+}
+
+export interface AnalyzeWorkerOptions {
+    threatStandard: string;
+    ignoreOrphanedRiskTracking: boolean;
+    sectioned: boolean; // Parse the YAML section by section, see parseModelInSections
+    skipTextSections: boolean; // Don't parse textOnlyModelSections, the reports don't use them
+    snapshot: boolean; // Also write the model snapshot, see model/snapshot.ts
+    cacheDirectory: string | null;
+    verbose: boolean;
+}
+
+export type AnalyzeWorkerMessage =
+    | { type: 'init'; options: AnalyzeWorkerOptions }
+    | { type: 'job'; job: AnalyzeJob };
+
+export interface AnalyzeJobResult {
+    modelPath: string;
+    error?: string;
+    fromCache: boolean;
+    milliseconds: number;
+}
+
+// The rules read window.currentSelectedThreatStandard
+const workerGlobal = self as unknown as { window: unknown; currentSelectedThreatStandard?: string };
+workerGlobal.window = self;
+
+let options: AnalyzeWorkerOptions | null = null;
+let reportCache: ModelCache<AnalysisReports> | null = null;
+
+self.onmessage = async (event: MessageEvent<AnalyzeWorkerMessage>) => {
+    const message = event.data;
+    if (message.type === 'init') {
+        options = message.options;
+        workerGlobal.currentSelectedThreatStandard = options.threatStandard;
+        reportCache = options.cacheDirectory
+            ? new ModelCache<AnalysisReports>(new FileCacheStore<AnalysisReports>(options.cacheDirectory), { maxEntries: 5000, maxBytes: 2 * 1024 * 1024 * 1024 })
+            : null;
+        if (!options.verbose) {
+            console.log = () => {}; // The engine logs every step, keep the CLI output readable
+        }
+        return;
+    }
+    self.postMessage(await analyze(message.job));
+};
+
+async function analyze(job: AnalyzeJob): Promise<AnalyzeJobResult> {
+    const start = performance.now();
+    const result: AnalyzeJobResult = { modelPath: job.modelPath, fromCache: false, milliseconds: 0 };
+    try {
+        if (!options) {
+            throw new Error("Analyze worker not initialized.");
+        }
+        const yaml = await Deno.readTextFile(job.modelPath);
+        const ruleSetVersion = `${options.threatStandard}:${getRuleSetVersion()}`;
+        const cacheKey = reportCache ? await modelCacheKey(yaml, ruleSetVersion) : null;
+
+        let reports = cacheKey ? await reportCache!.get(cacheKey) : undefined;
+        let snapshot: ArrayBuffer | null = null;
+        if (reports) {
+            result.fromCache = true;
+        } else {
+            // A fresh context per model, so nothing of the previous model is retained
+            const context = createModelContext();
+            const parsedModel = options.sectioned || options.skipTextSections
+                ? parseModelInSections(yaml, { skipSections: options.skipTextSections ? textOnlyModelSections : [] }, context)
+                : parseModel(yaml, context);
+            applyRAAMethod(context);
+            generateRisks([], new Set(), context);
+            applyRiskTracking(options.ignoreOrphanedRiskTracking, context);
+            reports = withModelContext(context, () => writeReportsToStrings(parsedModel));
+            if (options.snapshot) {
+                snapshot = withModelContext(context, () => writeModelSnapshot({
+                    parsedModel,
+                    risksByCategory: getGeneratedRisks(context),
+                    risksByTechnicalAssetId: getRisksByTechnicalAssetId(),
+                }));
+            }
+            if (cacheKey) {
+                await reportCache!.put(cacheKey, reports);
+            }
+        }
+
+        await Deno.mkdir(job.outputDirectory, { recursive: true });
+        for (const report of Object.keys(reportFileNames) as (keyof AnalysisReports)[]) {
+            await Deno.writeTextFile(`${job.outputDirectory}/${reportFileNames[report]}`, reports[report]);
+        }
+        if (snapshot) {
+            await Deno.writeFile(`${job.outputDirectory}/model.snapshot`, new Uint8Array(snapshot));
+        }
+    } catch (e) {
+        result.error = e instanceof Error ? e.message : String(e);
+    }
+    result.milliseconds = performance.now() - start;
+    return result;
+}
@@ -0,0 +1,150 @@
+// Headless batch analysis: runs the risk engine on many threat models across a pool of workers.
+//
+//   deno task analyze [options] <directory|file|glob>...
+//
+// For every model <output>/<model path without extension>/ receives risks.json, stats.json
+// and technical-assets.json, with --snapshot also model.snapshot. Exits with 1 if any model failed.
+
+import { parseArgs } from 'https://deno.land/std@0.224.0/cli/parse_args.ts';
+import { expandGlob, walk } from 'https://deno.land/std@0.224.0/fs/mod.ts';
+import { isGlob, join, relative, resolve } from 'https://deno.land/std@0.224.0/path/mod.ts';
+import type { AnalyzeJob, AnalyzeJobResult, AnalyzeWorkerMessage, AnalyzeWorkerOptions } from './analyze-worker.ts';
+
+const usage = `Usage: deno task analyze [options] <directory|file|glob>...
+
+Options:
+  --output <dir>                      Report directory (default: threagile-output)
+  --workers <n>                       Number of worker threads (default: number of CPUs)
+  --threat-standard <BSI|ORIGINAL>    Risk rule selection (default: BSI)
+  --ignore-orphaned-risk-tracking     Warn instead of failing on tracking entries without a risk
+  --sectioned                         Parse models one top-level section at a time: less memory,
+                                      invalid models fail earlier (block style YAML only)
+  --skip-text-sections                Don't parse overviews, questions and abuse cases (implies --sectioned)
+  --snapshot                          Also write model.snapshot, the binary model and risks the editor
+                                      loads (see backend/model/snapshot.ts; implies --no-cache)
+  --cache <dir>                       Report cache directory (default: .perimeta-cache)
+  --no-cache                          Always run the engine
+  --verbose                           Keep the engine's progress output`;
+
+const modelFilePattern = /\.ya?ml$/i;
+
+async function collectModelFiles(inputs: string[]): Promise<string[]> {
+    const files = new Set<string>();
+    for (const input of inputs) {
+        if (isGlob(input)) {
+            for await (const entry of expandGlob(input)) {
+                if (entry.isFile) files.add(entry.path);
+            }
+            continue;
+        }
+        const info = await Deno.stat(input);
+        if (info.isDirectory) {
+            for await (const entry of walk(input, { includeDirs: false, match: [modelFilePattern] })) {
+                files.add(resolve(entry.path));
+            }
+        } else {
+            files.add(resolve(input));
+        }
+    }
+    return [...files].sort();
+}
+
+function outputDirectoryOf(modelPath: string, outputRoot: string): string {
+    // Paths outside the working directory keep their structure below the output root, without the ".." parts
+    const modelName = relative(Deno.cwd(), modelPath).replace(modelFilePattern, '');
+    return join(outputRoot, ...modelName.split(/[\\/]/).filter(part => part !== '..' && part !== ''));
+}
+
+function runPool(jobs: AnalyzeJob[], workerCount: number, options: AnalyzeWorkerOptions): Promise<AnalyzeJobResult[]> {
+    return new Promise(resolvePool => {
+        const results: AnalyzeJobResult[] = [];
+        const pending = [...jobs];
+        const runningJobs = new Map<Worker, AnalyzeJob>();
+        const dispatch = (worker: Worker) => {
+            const job = pending.shift();
+            if (job) {
+                runningJobs.set(worker, job);
+                worker.postMessage({ type: 'job', job } as AnalyzeWorkerMessage);
+            } else {
+                runningJobs.delete(worker);
+                worker.terminate();
+            }
+        };
+        const complete = (worker: Worker, result: AnalyzeJobResult) => {
+            results.push(result);
+            if (result.error) {
+                console.error(`FAILED ${result.modelPath}: ${result.error}`);
+            } else {
+                console.log(`Analyzed ${result.modelPath} in ${result.milliseconds.toFixed(0)} ms${result.fromCache ? ' (cached)' : ''}`);
+            }
+            dispatch(worker);
+            if (results.length === jobs.length) {
+                resolvePool(results);
+            }
+        };
+
+        for (let i = 0; i < Math.min(workerCount, jobs.length); i++) {
+            const worker = new Worker(new URL('./analyze-worker.ts', import.meta.url).href, { type: 'module' });
+            worker.onmessage = (event: MessageEvent<AnalyzeJobResult>) => complete(worker, event.data);
+            worker.onerror = (event: ErrorEvent) => {
+                // Uncaught errors only fail the job the worker was running, the worker itself carries on
+                event.preventDefault();
+                const job = runningJobs.get(worker);
+                if (job) {
+                    complete(worker, { modelPath: job.modelPath, error: event.message, fromCache: false, milliseconds: 0 });
+                }
+            };
+            worker.postMessage({ type: 'init', options } as AnalyzeWorkerMessage);
+            dispatch(worker);
+        }
+        if (jobs.length === 0) {
+            resolvePool(results);
+        }
+    });
+}
+
+async function main(): Promise<number> {
+    const args = parseArgs(Deno.args, {
+        string: ['output', 'workers', 'threat-standard', 'cache'],
+        boolean: ['ignore-orphaned-risk-tracking', 'sectioned', 'skip-text-sections', 'snapshot', 'verbose', 'help'],
+        negatable: ['cache'],
+        default: { output: 'threagile-output', 'threat-standard': 'BSI', cache: '.perimeta-cache' },
+    });
+    if (args.help || args._.length === 0) {
+        console.log(usage);
+        return args.help ? 0 : 1;
+    }
+
+    const workerCount = args.workers ? parseInt(args.workers, 10) : navigator.hardwareConcurrency;
+    if (!(workerCount > 0)) {
+        console.error(`Invalid worker count: ${args.workers}`);
+        return 1;
+    }
+    const threatStandard = args['threat-standard'].toUpperCase();
+    if (threatStandard !== 'BSI' && threatStandard !== 'ORIGINAL') {
+        console.error(`Unknown threat standard: ${args['threat-standard']}`);
+        return 1;
+    }
+
+    const modelFiles = await collectModelFiles(args._.map(String));
+    const jobs = modelFiles.map(modelPath => ({ modelPath, outputDirectory: outputDirectoryOf(modelPath, args.output) }));
+    console.log(`Analyzing ${jobs.length} model(s) with ${Math.min(workerCount, jobs.length)} worker(s)...`);
+
+    const start = performance.now();
+    const results = await runPool(jobs, workerCount, {
+        threatStandard,
+        ignoreOrphanedRiskTracking: args['ignore-orphaned-risk-tracking'],
+        sectioned: args.sectioned,
+        skipTextSections: args['skip-text-sections'],
+        snapshot: args.snapshot,
+        // The cache holds the JSON reports only
+        cacheDirectory: args.cache === false || args.snapshot ? null : resolve(String(args.cache)),
+        verbose: args.verbose,
+    });
+    const failed = results.filter(result => result.error).length;
+    const cached = results.filter(result => result.fromCache).length;
+    console.log(`Done in ${((performance.now() - start) / 1000).toFixed(1)} s: ${results.length - failed} analyzed (${cached} from cache), ${failed} failed.`);
+    return failed > 0 ? 1 : 0;
+}
+
+Deno.exit(await main());
@@ -0,0 +1,46 @@
+// JSON reports of the current engine state, in the shapes of backend/risks.json, stats.json and technical-assets.json
+
+import {
+    ParsedModel,
+    getSortedRiskCategories,
+    getSortedRisksOfCategory,
+    getOverallRiskStatistics,
+    marshalRiskCategory,
+} from '../model/types.ts';
+
+export interface AnalysisReports {
+    risks: string;
+    stats: string;
+    technicalAssets: string;
+}
+
+export const reportFileNames: Record<keyof AnalysisReports, string> = {
+    risks: 'risks.json',
+    stats: 'stats.json',
+    technicalAssets: 'technical-assets.json',
+};
+
+export function writeReportsToStrings(parsedModel: ParsedModel): AnalysisReports {
+    const risks: object[] = [];
+    for (const category of getSortedRiskCategories()) {
+        for (const risk of getSortedRisksOfCategory(category)) {
+            // Risk.toJSON only resolves individual risk categories, built-in ones are known here
+            risks.push({ ...risk.toJSON(), category: marshalRiskCategory(category) });
+        }
+    }
+
+    const technicalAssets = Object.values(parsedModel.technicalAssets).map(techAsset => ({
+        id: techAsset.id,
+        title: techAsset.title,
+        type: techAsset.type,
+        technology: techAsset.technology,
+        tags: techAsset.tags,
+        raa: techAsset.raa,
+    }));
+
+    return {
+        risks: JSON.stringify(risks, null, 2),
+        stats: JSON.stringify(getOverallRiskStatistics(), null, 2),
+        technicalAssets: JSON.stringify(technicalAssets, null, 2),
+    };
+}
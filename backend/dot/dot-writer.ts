@@ -0,0 +1,136 @@
+// Writes DOT text directly from attribute objects, without building a graph model first.
+// HTML-like labels are written as <...> while serializing, so the output needs no post-processing,
+// and a document is collected as chunks that are joined once at the end.
+
+// An HTML-like value, written between < and > instead of quotes
+export interface DotHtml {
+    readonly html: string;
+}
+
+export type DotValue = string | number | boolean | DotHtml;
+export type DotAttributes = Record<string, DotValue | undefined>; // Undefined values are left out
+
+export function html(markup: string): DotHtml {
+    return { html: markup };
+}
+
+// IDs and plain values are always quoted, that way keywords and any characters are safe. Backslashes
+// are doubled, so a value ending in one can't escape the closing quote and none start a label escape.
+export function quoteDot(text: string): string {
+    let needsEscaping = false;
+    for (let i = 0; i < text.length; i++) {
+        const ch = text.charCodeAt(i);
+        if (ch === 34 /* " */ || ch === 92 /* \ */ || ch === 10 /* \n */ || ch === 13 /* \r */) {
+            needsEscaping = true;
+            break;
+        }
+    }
+    if (!needsEscaping) {
+        return `"${text}"`;
+    }
+    return `"${text.replace(/\\/g, '\\\\').replace(/"/g, '\\"').replace(/\r?\n|\r/g, '\\n')}"`;
+}
+
+function dotValue(value: DotValue): string {
+    switch (typeof value) {
+        case 'string': return quoteDot(value);
+        case 'number': return String(value);
+        case 'boolean': return value ? 'true' : 'false';
+        default: return `<${value.html}>`;
+    }
+}
+
+function attributeList(attributes: DotAttributes): string {
+    const parts: string[] = [];
+    for (const key in attributes) {
+        const value = attributes[key];
+        if (value !== undefined) {
+            parts.push(`${key}=${dotValue(value)}`);
+        }
+    }
+    return parts.length > 0 ? ` [${parts.join(', ')}]` : '';
+}
+
+export function nodeStatement(id: string, attributes: DotAttributes = {}): string {
+    return `${quoteDot(id)}${attributeList(attributes)};\n`;
+}
+
+export function edgeStatement(tail: string, head: string, attributes: DotAttributes = {}, directed: boolean = true): string {
+    return `${quoteDot(tail)} ${directed ? '->' : '--'} ${quoteDot(head)}${attributeList(attributes)};\n`;
+}
+
+// Graph attributes as statements of the graph or subgraph they are written in
+export function graphAttributeStatements(attributes: DotAttributes): string {
+    const parts: string[] = [];
+    for (const key in attributes) {
+        const value = attributes[key];
+        if (value !== undefined) {
+            parts.push(`${key}=${dotValue(value)};\n`);
+        }
+    }
+    return parts.join('');
+}
+
+// "subgraph id {" with the subgraph's attributes, closed by closingStatement
+export function subgraphOpening(id: string, attributes: DotAttributes = {}): string {
+    return `subgraph ${quoteDot(id)} {\n${graphAttributeStatements(attributes)}`;
+}
+
+export const closingStatement = '}\n';
+
+/**
+ * Collects a DOT document statement by statement. Statements rendered elsewhere (see nodeStatement
+ * and friends) can be added with raw, e.g. cached ones; nothing is concatenated before toString.
+ */
+export class DotWriter {
+    private readonly chunks: string[] = [];
+    private openGraphs = 0;
+    private directed = true;
+
+    openGraph(id: string, attributes: DotAttributes = {}, directed: boolean = true): this {
+        this.directed = directed;
+        this.chunks.push(`${directed ? 'digraph' : 'graph'} ${quoteDot(id)} {\n`, graphAttributeStatements(attributes));
+        this.openGraphs++;
+        return this;
+    }
+
+    openSubgraph(id: string, attributes: DotAttributes = {}): this {
+        this.chunks.push(subgraphOpening(id, attributes));
+        this.openGraphs++;
+        return this;
+    }
+
+    close(): this {
+        if (this.openGraphs === 0) {
+            throw new Error('DotWriter: close without an open graph');
+        }
+        this.chunks.push(closingStatement);
+        this.openGraphs--;
+        return this;
+    }
+
+    // Default attributes for the following nodes, edges or subgraphs
+    defaults(kind: 'graph' | 'node' | 'edge', attributes: DotAttributes): this {
+        this.chunks.push(`${kind}${attributeList(attributes)};\n`);
+        return this;
+    }
+
+    node(id: string, attributes: DotAttributes = {}): this {
+        this.chunks.push(nodeStatement(id, attributes));
+        return this;
+    }
+
+    edge(tail: string, head: string, attributes: DotAttributes = {}): this {
+        this.chunks.push(edgeStatement(tail, head, attributes, this.directed));
+        return this;
+    }
+
+    raw(dot: string): this {
+        this.chunks.push(dot);
+        return this;
+    }
+
+    toString(): string {
+        return this.chunks.join('');
+    }
+}
@@ -0,0 +1,82 @@
+// Serializing large data flow diagrams: DotWriter against the former ts-graphviz model, toDot and
+// HTML label regex pass.
+//
+//   deno task bench
+
+import { Digraph, Node, Edge, Subgraph, toDot } from 'npm:ts-graphviz';
+import { DotAttributes, DotWriter, html } from './dot-writer.ts';
+
+interface SyntheticNode {
+    id: string;
+    attributes: DotAttributes;
+}
+
+// Shaped like the data flow diagram: clusters of nodes with table labels, edges to neighbouring nodes
+function syntheticDiagram(nodeCount: number, nodesPerCluster: number) {
+    const clusters: { id: string; label: string; nodes: SyntheticNode[] }[] = [];
+    const edges: { tail: string; head: string; attributes: DotAttributes }[] = [];
+    for (let i = 0; i < nodeCount; i++) {
+        if (i % nodesPerCluster === 0) {
+            clusters.push({ id: `cluster_${i / nodesPerCluster}`, label: `Boundary ${i / nodesPerCluster}`, nodes: [] });
+        }
+        clusters[clusters.length - 1].nodes.push({
+            id: `asset_${i}`,
+            attributes: {
+                shape: 'ellipse',
+                style: 'filled',
+                fillcolor: '#FFFFFF',
+                penwidth: 2,
+                label: html(`<table border="0" cellborder="0" cellspacing="0" cellpadding="2"><tr><td align="center">` +
+                    `<font point-size="15" color="#000060">web-server</font><br/><font point-size="15" color="#666666">service</font>` +
+                    `</td></tr><tr><td align="center"><b><font color="#000000">Asset ${i}</font></b><br/></td></tr>` +
+                    `<tr><td align="center"><font point-size="15" color="#603112">RAA: ${i % 100} %</font></td></tr></table>`),
+            },
+        });
+        for (const offset of [1, 7]) {
+            if (i + offset < nodeCount) {
+                edges.push({ tail: `asset_${i}`, head: `asset_${i + offset}`, attributes: { style: 'solid', arrowhead: 'normal', xlabel: 'HTTPS' } });
+            }
+        }
+    }
+    return { clusters, edges };
+}
+
+function withDotWriter(diagram: ReturnType<typeof syntheticDiagram>): string {
+    const writer = new DotWriter().openGraph('generatedModel', { splines: 'ortho', rankdir: 'TB' });
+    for (const cluster of diagram.clusters) {
+        writer.openSubgraph(cluster.id, { label: html(`<b>${cluster.label}</b>`), style: 'dashed' });
+        cluster.nodes.forEach(node => writer.node(node.id, node.attributes));
+        writer.close();
+    }
+    diagram.edges.forEach(edge => writer.edge(edge.tail, edge.head, edge.attributes));
+    return writer.close().toString();
+}
+
+// The former export: labels were passed as bare HTML and repaired with this regex afterwards
+function withTsGraphvizAndRegex(diagram: ReturnType<typeof syntheticDiagram>): string {
+    const plain = (attributes: DotAttributes) => Object.fromEntries(Object.entries(attributes)
+        .map(([key, value]) => [key, typeof value === 'object' ? value.html : value]));
+    const G = new Digraph('generatedModel', { splines: 'ortho', rankdir: 'TB' });
+    const nodes = new Map<string, Node>();
+    for (const cluster of diagram.clusters) {
+        const sub = new Subgraph(cluster.id, { label: `<<b>${cluster.label}</b>>`, style: 'dashed' });
+        for (const node of cluster.nodes) {
+            const graphNode = new Node(node.id, plain(node.attributes));
+            nodes.set(node.id, graphNode);
+            sub.addNode(graphNode);
+        }
+        G.addSubgraph(sub);
+    }
+    diagram.edges.forEach(edge => G.addEdge(new Edge([nodes.get(edge.tail)!, nodes.get(edge.head)!], plain(edge.attributes))));
+    return toDot(G).replace(/label\s*=\s*(<([a-zA-Z]+)(?:[^>"]*|"[^"]*")*>[\s\S]*?<\/\2>)\s*;?/gs, 'label=<$1>');
+}
+
+for (const nodeCount of [1_000, 10_000, 50_000]) {
+    const diagram = syntheticDiagram(nodeCount, 25);
+    Deno.bench(`DotWriter, ${nodeCount} nodes`, { group: `${nodeCount} nodes`, baseline: true }, () => {
+        withDotWriter(diagram);
+    });
+    Deno.bench(`ts-graphviz toDot + label regex, ${nodeCount} nodes`, { group: `${nodeCount} nodes` }, () => {
+        withTsGraphvizAndRegex(diagram);
+    });
+}
@@ -0,0 +1,261 @@
+// DotWriter output: pinned for quoting, HTML-like labels and clusters, and compared statement by
+// statement with what the former ts-graphviz model + toDot (+ HTML label regex) wrote for a sample diagram.
+//
+//   deno task test
+
+import { Digraph, Edge, Node, Subgraph, toDot } from 'npm:ts-graphviz';
+import { assertEquals } from 'https://deno.land/std@0.224.0/assert/mod.ts';
+import { type DotAttributes, DotWriter, html, quoteDot } from './dot-writer.ts';
+
+Deno.test('quoteDot escapes quotes, backslashes and line breaks', () => {
+    assertEquals(quoteDot('web-server'), '"web-server"');
+    assertEquals(quoteDot('node'), '"node"'); // Keywords are safe quoted
+    assertEquals(quoteDot('say "hi"'), '"say \\"hi\\""');
+    assertEquals(quoteDot('C:\\temp\\'), '"C:\\\\temp\\\\"');
+    assertEquals(quoteDot('a\\"b'), '"a\\\\\\"b"');
+    assertEquals(quoteDot('two\nlines\r\nthree\rfour'), '"two\\nlines\\nthree\\nfour"');
+});
+
+Deno.test('DotWriter writes HTML-like labels, clusters and defaults', () => {
+    const dot = new DotWriter()
+        .openGraph('generatedModel', { concentrate: false, fontsize: 40, rankdir: 'TB' })
+        .defaults('node', { fontname: 'Verdana' })
+        .openSubgraph('cluster_dmz', { label: html('<b>DMZ &amp; Web</b>'), style: 'dashed', color: undefined })
+        .node('web\\server', { label: html('<table border="0"><tr><td>Web &lt;1&gt;</td></tr></table>'), penwidth: 3.5 })
+        .close()
+        .node('db', { label: 'Customer "DB"' })
+        .edge('web\\server', 'db', { xlabel: 'jdbc', constraint: true })
+        .close()
+        .toString();
+
+    assertEquals(dot, [
+        'digraph "generatedModel" {',
+        'concentrate=false;',
+        'fontsize=40;',
+        'rankdir="TB";',
+        'node [fontname="Verdana"];',
+        'subgraph "cluster_dmz" {',
+        'label=<<b>DMZ &amp; Web</b>>;',
+        'style="dashed";',
+        '"web\\\\server" [label=<<table border="0"><tr><td>Web &lt;1&gt;</td></tr></table>>, penwidth=3.5];',
+        '}',
+        '"db" [label="Customer \\"DB\\""];',
+        '"web\\\\server" -> "db" [xlabel="jdbc", constraint=true];',
+        '}',
+        '',
+    ].join('\n'));
+});
+
+// --- Comparison with the former ts-graphviz output ---
+
+interface SampleNode {
+    id: string;
+    attributes: DotAttributes;
+}
+
+interface SampleCluster {
+    id: string;
+    attributes: DotAttributes;
+    nodes: SampleNode[];
+    clusters: SampleCluster[];
+}
+
+// Shaped like the data flow diagram: nested trust boundaries with table labels, edges across them
+const graphAttributes: DotAttributes = { concentrate: false, labelloc: 't', fontname: 'Verdana', fontsize: 40, rankdir: 'TB', nodesep: 2 };
+const nodeDefaults: DotAttributes = { fontname: 'Verdana', fontsize: 20 };
+const edgeDefaults: DotAttributes = { shape: 'none', fontname: 'Verdana', fontsize: 18 };
+
+function assetNode(id: string, title: string, technology: string): SampleNode {
+    return {
+        id,
+        attributes: {
+            shape: 'ellipse', style: 'filled', fillcolor: '#FFFFFF', color: '#000000', penwidth: 3.5, fontcolor: '#000000',
+            label: html(`<table border="0" cellborder="0" cellspacing="0" cellpadding="2"><tr><td align="center">` +
+                `<font point-size="15" color="#000060">${technology}</font><br/></td></tr>` +
+                `<tr><td align="center"><b><font color="#000000">${title}</font></b><br/></td></tr></table>`),
+        },
+    };
+}
+
+function boundary(id: string, title: string, nodes: SampleNode[], clusters: SampleCluster[] = []): SampleCluster {
+    return {
+        id,
+        attributes: {
+            label: html(`<table border="0" cellborder="0" cellpadding="0"><tr><td><b>${title}</b> (network-on-prem)</td></tr></table>`),
+            fontsize: 21, style: 'dashed', color: '#3A52C8', fontcolor: '#3A52C8', penwidth: 4.5,
+        },
+        nodes,
+        clusters,
+    };
+}
+
+const sampleClusters = [
+    boundary('cluster_web_dmz', 'Web DMZ', [assetNode('apache_webserver', 'Apache Webserver', 'web-server')], [
+        boundary('cluster_portal', 'Portal &amp; CMS', [assetNode('cms', 'Marketing CMS &lt;v2&gt;', 'cms')]),
+    ]),
+    boundary('cluster_erp_dmz', 'ERP DMZ', [assetNode('erp_system', 'Backoffice ERP System', 'erp'), assetNode('sql_database', 'Customer DB', 'database')]),
+];
+const sampleRootNodes = [assetNode('customer_client', 'Customer Web Client', 'browser')];
+const sampleEdges: { tail: string; head: string; attributes: DotAttributes }[] = [
+    { tail: 'customer_client', head: 'apache_webserver', attributes: { style: 'solid', dir: 'forward', arrowhead: 'normal', xlabel: 'https', color: '#000000' } },
+    { tail: 'apache_webserver', head: 'erp_system', attributes: { style: 'dashed', dir: 'forward', arrowhead: 'empty', xlabel: 'https', color: '#8B0000' } },
+    { tail: 'erp_system', head: 'sql_database', attributes: { style: 'solid', dir: 'forward', arrowhead: 'normal', xlabel: 'jdbc-encrypted', color: '#000000' } },
+    { tail: 'cms', head: 'sql_database', attributes: { style: 'solid', dir: 'forward', arrowhead: 'normal', xlabel: 'jdbc', color: '#8B0000' } },
+];
+
+function withDotWriter(): string {
+    const writer = new DotWriter().openGraph('generatedModel', graphAttributes).defaults('node', nodeDefaults).defaults('edge', edgeDefaults);
+    const writeCluster = (cluster: SampleCluster) => {
+        writer.openSubgraph(cluster.id, cluster.attributes);
+        cluster.nodes.forEach(node => writer.node(node.id, node.attributes));
+        cluster.clusters.forEach(writeCluster);
+        writer.close();
+    };
+    sampleClusters.forEach(writeCluster);
+    sampleRootNodes.forEach(node => writer.node(node.id, node.attributes));
+    sampleEdges.forEach(edge => writer.edge(edge.tail, edge.head, edge.attributes));
+    return writer.close().toString();
+}
+
+// The former export: node labels were passed as bare HTML and repaired with this regex afterwards,
+// cluster labels already carried their outer <>
+function withTsGraphvizAndRegex(): string {
+    const plain = (attributes: DotAttributes, outerBrackets = false) => Object.fromEntries(Object.entries(attributes)
+        .map(([key, value]) => [key, typeof value === 'object' ? (outerBrackets ? `<${value.html}>` : value.html) : value]));
+    const G = new Digraph('generatedModel', plain(graphAttributes));
+    G.attributes.node.apply(plain(nodeDefaults));
+    G.attributes.edge.apply(plain(edgeDefaults));
+    const nodes = new Map<string, Node>();
+    const addNode = (parent: Digraph | Subgraph, sample: SampleNode) => {
+        const node = new Node(sample.id, plain(sample.attributes));
+        nodes.set(sample.id, node);
+        parent.addNode(node);
+    };
+    const addCluster = (parent: Digraph | Subgraph, cluster: SampleCluster) => {
+        const sub = new Subgraph(cluster.id, plain(cluster.attributes, true));
+        cluster.nodes.forEach(node => addNode(sub, node));
+        cluster.clusters.forEach(inner => addCluster(sub, inner));
+        parent.addSubgraph(sub);
+    };
+    sampleClusters.forEach(cluster => addCluster(G, cluster));
+    sampleRootNodes.forEach(node => addNode(G, node));
+    sampleEdges.forEach(edge => G.addEdge(new Edge([nodes.get(edge.tail)!, nodes.get(edge.head)!], plain(edge.attributes))));
+    return toDot(G).replace(/label\s*=\s*(<([a-zA-Z]+)(?:[^>"]*|"[^"]*")*>[\s\S]*?<\/\2>)\s*;?/gs, 'label=<$1>');
+}
+
+// --- A reader for the DOT both write, down to what Graphviz sees: formatting and statement order
+// within a graph don't matter, quoted and bare values compare by their text, HTML labels by their markup
+
+type Token = { kind: 'id' | 'html' | 'punct'; text: string };
+
+function tokenize(dot: string): Token[] {
+    const tokens: Token[] = [];
+    let i = 0;
+    while (i < dot.length) {
+        const ch = dot[i];
+        if (/\s/.test(ch)) {
+            i++;
+        } else if (ch === '"') {
+            let text = '';
+            for (i++; dot[i] !== '"'; i++) {
+                if (dot[i] === '\\' && (dot[i + 1] === '"' || dot[i + 1] === '\\')) i++;
+                text += dot[i];
+            }
+            i++;
+            tokens.push({ kind: 'id', text });
+        } else if (ch === '<') {
+            let depth = 0;
+            const start = i;
+            do {
+                if (dot[i] === '<') depth++;
+                if (dot[i] === '>') depth--;
+                i++;
+            } while (depth > 0);
+            tokens.push({ kind: 'html', text: dot.slice(start + 1, i - 1) });
+        } else if (dot.startsWith('->', i) || dot.startsWith('--', i)) {
+            tokens.push({ kind: 'punct', text: dot.slice(i, i + 2) });
+            i += 2;
+        } else if ('{}[]=;,'.includes(ch)) {
+            tokens.push({ kind: 'punct', text: ch });
+            i++;
+        } else {
+            const match = /^[A-Za-z0-9_.\-#]+/.exec(dot.slice(i))!;
+            tokens.push({ kind: 'id', text: match[0] });
+            i += match[0].length;
+        }
+    }
+    return tokens;
+}
+
+interface GraphStructure {
+    attributes: Record<string, string>;
+    defaults: Record<string, Record<string, string>>;
+    nodes: Record<string, Record<string, string>>;
+    subgraphs: Record<string, GraphStructure>;
+    edges: string[];
+}
+
+function readDot(dot: string): GraphStructure {
+    const tokens = tokenize(dot);
+    let position = 0;
+    const next = () => tokens[position++];
+    const peek = (offset = 0) => tokens[position + offset];
+    const value = (token: Token) => token.kind === 'html' ? `<${token.text}>` : token.text;
+    const attributeList = (): Record<string, string> => {
+        const attributes: Record<string, string> = {};
+        next(); // [
+        while (peek().text !== ']') {
+            if (peek().text === ';' || peek().text === ',') { next(); continue; }
+            const key = next().text;
+            next(); // =
+            attributes[key] = value(next());
+        }
+        next(); // ]
+        return attributes;
+    };
+    const body = (): GraphStructure => {
+        const graph: GraphStructure = { attributes: {}, defaults: {}, nodes: {}, subgraphs: {}, edges: [] };
+        next(); // {
+        while (peek().text !== '}') {
+            const token = next();
+            if (token.kind === 'punct') continue; // Statement separators
+            if (token.text === 'subgraph') {
+                const id = next().text;
+                graph.subgraphs[id] = body();
+            } else if (token.text === 'graph' && peek().text === '[') {
+                Object.assign(graph.attributes, attributeList()); // Same as key=value statements
+            } else if ((token.text === 'node' || token.text === 'edge') && peek().text === '[') {
+                graph.defaults[token.text] = { ...graph.defaults[token.text], ...attributeList() };
+            } else if (peek().text === '=') {
+                next();
+                graph.attributes[token.text] = value(next());
+            } else if (peek().text === '->' || peek().text === '--') {
+                const op = next().text;
+                const head = next().text;
+                const attributes = peek()?.text === '[' ? attributeList() : {};
+                graph.edges.push(`${token.text} ${op} ${head} ${JSON.stringify(Object.entries(attributes).sort())}`);
+            } else {
+                graph.nodes[token.text] = { ...graph.nodes[token.text], ...(peek()?.text === '[' ? attributeList() : {}) };
+            }
+        }
+        next(); // }
+        graph.edges.sort();
+        return graph;
+    };
+    const kind = next().text;
+    if (kind === 'strict') next();
+    next(); // ID
+    return body();
+}
+
+Deno.test('DotWriter writes the same graph as ts-graphviz toDot with the HTML label fix', () => {
+    const written = readDot(withDotWriter());
+    assertEquals(written, readDot(withTsGraphvizAndRegex()));
+
+    // And the reader did see the parts being compared
+    assertEquals(Object.keys(written.subgraphs), ['cluster_web_dmz', 'cluster_erp_dmz']);
+    assertEquals(written.subgraphs['cluster_web_dmz'].subgraphs['cluster_portal'].attributes.label,
+        '<<table border="0" cellborder="0" cellpadding="0"><tr><td><b>Portal &amp; CMS</b> (network-on-prem)</td></tr></table>>');
+    assertEquals(Object.keys(written.subgraphs['cluster_erp_dmz'].nodes), ['erp_system', 'sql_database']);
+    assertEquals(written.edges.length, 4);
+});
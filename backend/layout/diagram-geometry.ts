@@ -0,0 +1,154 @@
+// Diagram geometry persisted with the model, so reopening an arranged diagram needs no Graphviz layout.
+// It is kept in a reserved top-level section of the YAML, keyed by the YAML keys of the entities:
+//
+//   perimeta_diagram:
+//     technical_assets:    { <asset key>: [x, y, width, height] }
+//     trust_boundaries:    { <boundary key>: [x, y, width, height] }
+//     communication_links: { <source asset key>: { <link key>: [[x, y], ...] } }  # Waypoints
+//
+// The Threagile engine ignores the section; the editor removes it on import and writes it on export.
+
+import type { DiagramLayout, LayoutCluster, LayoutEdge, LayoutNode, LayoutPoint } from './graphviz-layout.ts';
+
+export const diagramGeometrySection = 'perimeta_diagram';
+
+export type PersistedBox = [number, number, number, number];
+
+export interface DiagramGeometry {
+    technical_assets: Record<string, PersistedBox>;
+    trust_boundaries: Record<string, PersistedBox>;
+    communication_links: Record<string, Record<string, [number, number][]>>;
+}
+
+type Box = 'x' | 'y' | 'width' | 'height';
+
+// What the data flow diagram shows, styled like Graphviz draws it (see getDataFlowDiagramEntities).
+// Cluster and node labels are the YAML keys of the trust boundaries and technical assets.
+export interface DiagramEntities {
+    clusters: Omit<LayoutCluster, Box>[]; // Visible clusters only, no layout spacers
+    nodes: Omit<LayoutNode, Box>[];
+    edges: (Omit<LayoutEdge, 'points'> & { linkKey: string })[]; // tail/head are node names
+}
+
+const unplacedMargin = 100; // Between the persisted diagram and entities laid out by Graphviz
+
+function isBox(value: unknown): value is PersistedBox {
+    return Array.isArray(value) && value.length === 4 && value.every(n => typeof n === 'number' && isFinite(n));
+}
+
+function isPoint(value: unknown): value is [number, number] {
+    return Array.isArray(value) && value.length === 2 && value.every(n => typeof n === 'number' && isFinite(n));
+}
+
+// The persisted section as read from the YAML, null if it is missing. Malformed entries are dropped.
+export function readDiagramGeometry(section: unknown): DiagramGeometry | null {
+    if (!section || typeof section !== 'object') {
+        return null;
+    }
+    const input = section as Record<string, unknown>;
+    const boxes = (value: unknown) => {
+        const result: Record<string, PersistedBox> = {};
+        for (const [key, box] of Object.entries(value && typeof value === 'object' ? value : {})) {
+            if (isBox(box)) result[key] = box;
+        }
+        return result;
+    };
+    const links: DiagramGeometry['communication_links'] = {};
+    for (const [assetKey, assetLinks] of Object.entries(input.communication_links && typeof input.communication_links === 'object' ? input.communication_links : {})) {
+        for (const [linkKey, points] of Object.entries(assetLinks && typeof assetLinks === 'object' ? assetLinks : {})) {
+            if (Array.isArray(points) && points.every(isPoint)) {
+                (links[assetKey] ??= {})[linkKey] = points;
+            }
+        }
+    }
+    return { technical_assets: boxes(input.technical_assets), trust_boundaries: boxes(input.trust_boundaries), communication_links: links };
+}
+
+function boxOf([x, y, width, height]: PersistedBox) {
+    return { x, y, width, height };
+}
+
+function extent(layout: Pick<DiagramLayout, 'clusters' | 'nodes'>) {
+    let right = 0;
+    let bottom = 0;
+    for (const box of [...layout.clusters, ...layout.nodes]) {
+        right = Math.max(right, box.x + box.width);
+        bottom = Math.max(bottom, box.y + box.height);
+    }
+    return { right, bottom };
+}
+
+/**
+ * Lays out the entities that have persisted geometry. unplaced counts the clusters and nodes without it;
+ * when it is 0 the layout is complete and Graphviz is not needed. Edges are drawn between placed nodes,
+ * with their persisted waypoints if there are any.
+ */
+export function layoutFromGeometry(entities: DiagramEntities, geometry: DiagramGeometry): { layout: DiagramLayout; unplaced: number } {
+    const layout: DiagramLayout = { width: 0, height: 0, clusters: [], nodes: [], edges: [] };
+    let unplaced = 0;
+    for (const cluster of entities.clusters) {
+        const box = geometry.trust_boundaries[cluster.label];
+        if (box) layout.clusters.push({ ...cluster, ...boxOf(box) });
+        else unplaced++;
+    }
+    const placedNodes = new Map<string, string>(); // Node name -> asset key
+    for (const node of entities.nodes) {
+        const box = geometry.technical_assets[node.label];
+        if (box) {
+            layout.nodes.push({ ...node, ...boxOf(box) });
+            placedNodes.set(node.name, node.label);
+        } else {
+            unplaced++;
+        }
+    }
+    for (const { linkKey, ...edge } of entities.edges) {
+        const sourceKey = placedNodes.get(edge.tail);
+        if (sourceKey === undefined || !placedNodes.has(edge.head)) continue;
+        const points = geometry.communication_links[sourceKey]?.[linkKey] ?? [];
+        layout.edges.push({ ...edge, points: points.map(([x, y]) => ({ x, y })) });
+    }
+    const { right, bottom } = extent(layout);
+    layout.width = right;
+    layout.height = bottom;
+    return { layout, unplaced };
+}
+
+/**
+ * Combines the persisted layout with a Graphviz layout of the whole diagram: placed entities keep their
+ * persisted geometry, the others are taken from Graphviz and moved right of the persisted diagram so they
+ * don't land on top of it. Edges between two newly placed nodes keep their Graphviz route, edges between
+ * a placed and a new node are routed by the editor.
+ */
+export function mergePersistedLayout(graphviz: DiagramLayout, persisted: DiagramLayout): DiagramLayout {
+    const placedClusters = new Set(persisted.clusters.map(cluster => cluster.name));
+    const placedNodes = new Set(persisted.nodes.map(node => node.name));
+    // Layout spacers are not drawn, see internalGenerateDataFlowDiagramDot
+    const newClusters = graphviz.clusters.filter(cluster =>
+        !placedClusters.has(cluster.name) && !cluster.name.includes('space_boundary'));
+    const newNodes = graphviz.nodes.filter(node => !placedNodes.has(node.name));
+
+    const persistedExtent = extent(persisted);
+    const left = Math.min(...[...newClusters, ...newNodes].map(box => box.x));
+    const top = Math.min(...[...newClusters, ...newNodes].map(box => box.y));
+    const dx = isFinite(left) ? persistedExtent.right + unplacedMargin - left : 0;
+    const dy = isFinite(top) ? -top : 0;
+    const move = <T extends LayoutPoint>(item: T): T => ({ ...item, x: item.x + dx, y: item.y + dy });
+
+    const merged: DiagramLayout = {
+        width: 0,
+        height: 0,
+        clusters: [...persisted.clusters, ...newClusters.map(move)],
+        nodes: [...persisted.nodes, ...newNodes.map(move)],
+        edges: [...persisted.edges],
+    };
+    for (const edge of graphviz.edges) {
+        const tailPlaced = placedNodes.has(edge.tail);
+        const headPlaced = placedNodes.has(edge.head);
+        if (tailPlaced && headPlaced) continue; // Already in the persisted layout
+        merged.edges.push({ ...edge, points: !tailPlaced && !headPlaced ? edge.points.map(move) : [] });
+    }
+    const { right, bottom } = extent(merged);
+    merged.width = right;
+    merged.height = bottom;
+    return merged;
+}
@@ -0,0 +1,265 @@
+// Reads the geometry of a Graphviz layout from its JSON output (-Tjson, Viz renderJSON) into plain
+// data the editor turns into cells. Coordinates are converted to the editor's orientation (y down).
+
+// The parts of Graphviz' JSON output used here
+interface XdotOp {
+    op: string;
+    color?: string;
+    style?: string;
+    fontchar?: number;
+    text?: string;
+    align?: string;
+}
+
+interface GraphvizJsonObject {
+    _gvid: number;
+    name: string;
+    bb?: string;
+    pos?: string;
+    width?: string;
+    height?: string;
+    shape?: string;
+    _draw_?: XdotOp[];
+    _ldraw_?: XdotOp[];
+}
+
+interface GraphvizJsonEdge {
+    tail: number;
+    head: number;
+    pos?: string;
+    xlabel?: string;
+    label?: string;
+}
+
+export interface GraphvizJson {
+    bb: string;
+    _subgraph_cnt?: number;
+    objects?: GraphvizJsonObject[];
+    edges?: GraphvizJsonEdge[];
+}
+
+export interface LayoutPoint {
+    x: number;
+    y: number;
+}
+
+interface LayoutBox {
+    x: number; // Top left corner
+    y: number;
+    width: number;
+    height: number;
+    fill: string | null;
+    stroke: string | null;
+    strokeWidth: string | null; // Only set when Graphviz draws a non-default pen width
+}
+
+export interface LayoutCluster extends LayoutBox {
+    name: string; // Subgraph ID
+    label: string; // Bold label text (trust boundary title)
+    contentHash: string | null; // Hash of everything inside, see getDataFlowDiagramClusterHashes
+}
+
+export interface LayoutNode extends LayoutBox {
+    name: string; // Node ID
+    label: string; // Bold label text (technical asset title)
+    shape: 'ellipse' | 'datastore' | 'hexagon';
+}
+
+export interface LayoutEdge {
+    tail: string; // Node IDs
+    head: string;
+    label: string; // xlabel (the protocol), else label
+    points: LayoutPoint[]; // Spline control points after the start point
+}
+
+export interface DiagramLayout {
+    width: number;
+    height: number;
+    clusters: LayoutCluster[];
+    nodes: LayoutNode[];
+    edges: LayoutEdge[];
+}
+
+const pointsPerInch = 72;
+
+function parseNumbers(value: string): number[] {
+    return value.split(',').map(parseFloat);
+}
+
+// Fill, pen color and pen width of the first shape drawn
+function drawStyle(ops: XdotOp[] | undefined): Pick<LayoutBox, 'fill' | 'stroke' | 'strokeWidth'> {
+    const style: Pick<LayoutBox, 'fill' | 'stroke' | 'strokeWidth'> = { fill: null, stroke: null, strokeWidth: null };
+    for (const op of ops ?? []) {
+        switch (op.op) {
+            case 'C': style.fill = op.color ?? null; break;
+            case 'c': style.stroke = op.color ?? null; break;
+            case 'S': {
+                const lineWidth = /^setlinewidth\((.*)\)$/.exec(op.style ?? '');
+                if (lineWidth) style.strokeWidth = lineWidth[1];
+                break;
+            }
+            case 'E': case 'e': case 'P': case 'p': case 'B': case 'b': case 'L':
+                return style;
+        }
+    }
+    return style;
+}
+
+// The bold text of a label, falling back to its first left aligned text like the SVG import did
+function labelText(ops: XdotOp[] | undefined): string {
+    let bold = false;
+    let firstLeftAligned: string | null = null;
+    for (const op of ops ?? []) {
+        if (op.op === 't') {
+            bold = ((op.fontchar ?? 0) & 1) !== 0;
+        } else if (op.op === 'T' && op.text !== undefined) {
+            if (bold) return op.text;
+            if (firstLeftAligned === null && op.align === 'l') firstLeftAligned = op.text;
+        }
+    }
+    return firstLeftAligned ?? '';
+}
+
+// The editor shape of a Graphviz node shape
+export function layoutNodeShape(shape: string | undefined): LayoutNode['shape'] {
+    switch (shape) {
+        case 'ellipse': return 'ellipse';
+        case 'cylinder': return 'datastore';
+        default: return 'hexagon'; // Boxes and octagons
+    }
+}
+
+// clusterHashes: content hash by subgraph ID, clusters without one are never reused
+export function readGraphvizJsonLayout(json: GraphvizJson, clusterHashes: Record<string, string> = {}): DiagramLayout {
+    const [, , graphWidth, graphHeight] = parseNumbers(json.bb);
+    const flip = (y: number) => graphHeight - y;
+    const objects = json.objects ?? [];
+    const subgraphCount = json._subgraph_cnt ?? 0;
+    const layout: DiagramLayout = { width: graphWidth, height: graphHeight, clusters: [], nodes: [], edges: [] };
+
+    for (const object of objects.slice(0, subgraphCount)) {
+        if (!object.name.startsWith('cluster') || !object.bb) continue;
+        const [left, bottom, right, top] = parseNumbers(object.bb);
+        layout.clusters.push({
+            name: object.name,
+            label: labelText(object._ldraw_),
+            contentHash: clusterHashes[object.name] ?? null,
+            x: left, y: flip(top), width: right - left, height: top - bottom,
+            ...drawStyle(object._draw_),
+        });
+    }
+
+    for (const object of objects.slice(subgraphCount)) {
+        if (!object.pos) continue;
+        const [centerX, centerY] = parseNumbers(object.pos);
+        const width = parseFloat(object.width ?? '0') * pointsPerInch;
+        const height = parseFloat(object.height ?? '0') * pointsPerInch;
+        layout.nodes.push({
+            name: object.name,
+            label: labelText(object._ldraw_),
+            shape: layoutNodeShape(object.shape),
+            x: centerX - width / 2, y: flip(centerY) - height / 2, width, height,
+            ...drawStyle(object._draw_),
+        });
+    }
+
+    for (const edge of json.edges ?? []) {
+        // pos is "[e,x,y] [s,x,y] x,y x,y ...": arrow end/start points, then the spline's control points
+        const splinePoints = (edge.pos ?? '').split(/\s+/)
+            .filter(point => point !== '' && !point.startsWith('e,') && !point.startsWith('s,'))
+            .map(point => parseNumbers(point))
+            .map(([x, y]) => ({ x, y: flip(y) }));
+        layout.edges.push({
+            tail: objects[edge.tail]?.name ?? '',
+            head: objects[edge.head]?.name ?? '',
+            label: edge.xlabel ?? edge.label ?? '',
+            points: splinePoints.slice(1),
+        });
+    }
+    return layout;
+}
+
+function encloses(outer: LayoutBox, inner: LayoutBox): boolean {
+    const tolerance = 0.5;
+    return inner.x >= outer.x - tolerance && inner.y >= outer.y - tolerance &&
+        inner.x + inner.width <= outer.x + outer.width + tolerance &&
+        inner.y + inner.height <= outer.y + outer.height + tolerance;
+}
+
+function edgeKey(edge: LayoutEdge): string {
+    return `${edge.tail}->${edge.head}@${edge.label}`;
+}
+
+/**
+ * Moves the contents of every cluster whose content hash and size did not change back to where they
+ * were inside the cluster in the previous layout. dot minimizes crossings over the whole graph, so an
+ * edit elsewhere can reshuffle a cluster nobody touched; this keeps its arrangement stable. Edges with
+ * both ends in a reused cluster take their previous points too. Other edges of moved nodes lose their
+ * points, Graphviz routed them to where the nodes were, so the editor routes them instead (as in
+ * mergePersistedLayout). Returns the number of reused clusters.
+ */
+export function reuseUnchangedClusterLayouts(previous: DiagramLayout, next: DiagramLayout): number {
+    const previousClusters = new Map(previous.clusters.map(cluster => [cluster.name, cluster]));
+    const nextClusters = new Map(next.clusters.map(cluster => [cluster.name, cluster]));
+    const nextNodes = new Map(next.nodes.map(node => [node.name, node]));
+    const nextEdges = new Map<string, LayoutEdge[]>();
+    for (const edge of next.edges) {
+        const key = edgeKey(edge);
+        nextEdges.set(key, [...(nextEdges.get(key) ?? []), edge]);
+    }
+
+    const displacedNodes = new Set<string>(); // Nodes placed elsewhere than Graphviz put them
+    const restoredEdges = new Set<LayoutEdge>();
+
+    // Outermost first: nested clusters move along with a reused parent
+    const reused: LayoutCluster[] = [];
+    for (const cluster of [...next.clusters].sort((a, b) => b.width * b.height - a.width * a.height)) {
+        const before = previousClusters.get(cluster.name);
+        if (!before || cluster.contentHash === null || before.contentHash !== cluster.contentHash ||
+            before.width !== cluster.width || before.height !== cluster.height ||
+            reused.some(outer => encloses(outer, cluster))) {
+            continue;
+        }
+        reused.push(cluster);
+        const dx = cluster.x - before.x;
+        const dy = cluster.y - before.y;
+
+        for (const inner of previous.clusters) {
+            const target = nextClusters.get(inner.name);
+            if (target && target !== cluster && encloses(before, inner)) {
+                target.x = inner.x + dx;
+                target.y = inner.y + dy;
+            }
+        }
+        const movedNodes = new Set<string>();
+        for (const node of previous.nodes) {
+            const target = nextNodes.get(node.name);
+            if (target && encloses(before, node)) {
+                if (target.x !== node.x + dx || target.y !== node.y + dy) {
+                    displacedNodes.add(node.name);
+                }
+                target.x = node.x + dx;
+                target.y = node.y + dy;
+                movedNodes.add(node.name);
+            }
+        }
+        const taken = new Map<string, number>(); // Parallel edges are matched in order
+        for (const edge of previous.edges) {
+            if (!movedNodes.has(edge.tail) || !movedNodes.has(edge.head)) continue;
+            const key = edgeKey(edge);
+            const index = taken.get(key) ?? 0;
+            const target = nextEdges.get(key)?.[index];
+            taken.set(key, index + 1);
+            if (target) {
+                target.points = edge.points.map(point => ({ x: point.x + dx, y: point.y + dy }));
+                restoredEdges.add(target);
+            }
+        }
+    }
+    for (const edge of next.edges) {
+        if (!restoredEdges.has(edge) && (displacedNodes.has(edge.tail) || displacedNodes.has(edge.head))) {
+            edge.points = [];
+        }
+    }
+    return reused.length;
+}
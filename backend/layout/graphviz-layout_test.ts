@@ -0,0 +1,67 @@
+// reuseUnchangedClusterLayouts on hand-made layouts: an unchanged cluster gets its previous
+// arrangement back, and edges leaving it are rerouted when its nodes moved.
+//
+//   deno task test
+
+import { assertEquals } from 'https://deno.land/std@0.224.0/assert/mod.ts';
+import { type DiagramLayout, type LayoutEdge, type LayoutNode, reuseUnchangedClusterLayouts } from './graphviz-layout.ts';
+
+function node(name: string, x: number, y: number): LayoutNode {
+    return { name, label: name, shape: 'ellipse', x, y, width: 20, height: 10, fill: null, stroke: null, strokeWidth: null };
+}
+
+function edge(tail: string, head: string, ...points: [number, number][]): LayoutEdge {
+    return { tail, head, label: 'https', points: points.map(([x, y]) => ({ x, y })) };
+}
+
+// Trust boundary "dmz" with the nodes a and b, c outside of it
+function layout(a: [number, number], b: [number, number], nodeC: [number, number], edges: LayoutEdge[]): DiagramLayout {
+    return {
+        width: 300,
+        height: 200,
+        clusters: [{
+            name: 'cluster_dmz', label: 'DMZ', contentHash: 'dmz-hash',
+            x: 0, y: 0, width: 100, height: 100, fill: null, stroke: null, strokeWidth: null,
+        }],
+        nodes: [node('a', ...a), node('b', ...b), node('c', ...nodeC)],
+        edges,
+    };
+}
+
+Deno.test('reuseUnchangedClusterLayouts restores a reshuffled cluster and reroutes edges leaving it', () => {
+    const previous = layout([10, 10], [10, 60], [200, 10], [
+        edge('a', 'b', [20, 30], [20, 60]),
+        edge('a', 'c', [40, 15], [200, 15]),
+    ]);
+    const next = layout([10, 60], [10, 10], [200, 10], [
+        edge('a', 'b', [20, 55], [20, 20]),
+        edge('a', 'c', [40, 65], [200, 15]),
+        edge('c', 'c', [210, 0], [220, 5]),
+    ]);
+
+    assertEquals(reuseUnchangedClusterLayouts(previous, next), 1);
+    assertEquals(next.nodes.map(({ name, x, y }) => [name, x, y]), [['a', 10, 10], ['b', 10, 60], ['c', 200, 10]]);
+    assertEquals(next.edges.map(({ tail, head, points }) => [tail, head, points]), [
+        ['a', 'b', [{ x: 20, y: 30 }, { x: 20, y: 60 }]], // Previous route inside the cluster
+        ['a', 'c', []], // Graphviz routed it from where a was, left to the editor
+        ['c', 'c', [{ x: 210, y: 0 }, { x: 220, y: 5 }]],
+    ]);
+});
+
+Deno.test('reuseUnchangedClusterLayouts keeps the routes of edges leaving a cluster whose nodes stayed', () => {
+    const previous = layout([10, 10], [10, 60], [200, 10], [edge('a', 'c', [40, 15], [200, 15])]);
+    const next = layout([10, 10], [10, 60], [200, 40], [edge('a', 'c', [40, 15], [200, 45])]);
+
+    assertEquals(reuseUnchangedClusterLayouts(previous, next), 1);
+    assertEquals(next.edges[0].points, [{ x: 40, y: 15 }, { x: 200, y: 45 }]);
+});
+
+Deno.test('reuseUnchangedClusterLayouts leaves changed clusters to Graphviz', () => {
+    const previous = layout([10, 10], [10, 60], [200, 10], [edge('a', 'c', [40, 15], [200, 15])]);
+    const next = layout([10, 60], [10, 10], [200, 10], [edge('a', 'c', [40, 65], [200, 15])]);
+    next.clusters[0].contentHash = 'changed';
+
+    assertEquals(reuseUnchangedClusterLayouts(previous, next), 0);
+    assertEquals(next.nodes[0], node('a', 10, 60));
+    assertEquals(next.edges[0].points, [{ x: 40, y: 65 }, { x: 200, y: 15 }]);
+});
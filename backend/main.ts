@@ -3,8 +3,6 @@ import * as YAML from 'npm:yaml';
 import {
   Digraph,
   Subgraph,
-  Node,
-  Edge,
   NodeAttributes,
   EdgeAttributes,
   SubgraphAttributes,
@@ -20,8 +18,12 @@ import {
 // Import Core Types and State Management
 import {
     modelState,
-    initModelState,
+    ModelContext,
+    DotFragment,
+    DataFlowDiagramFragments,
+    withModelContext,
     CustomRiskRule,
+    RiskRuleDependencies,
     ModelInput,
     InputTechnicalAsset,
     InputDataAsset,
@@ -53,13 +55,22 @@ import {
     RiskFunction, STRIDE, RiskSeverity, RiskExploitationLikelihood, RiskExploitationImpact,
     DataBreachProbability, RiskStatus,
     // Helper functions
-    makeID, normalizeTag, checkTags, // Assuming checkTags exists or is added
+    makeID, validIdSyntax, contentHash, normalizeTag,
     addTagToModelInput,
+    indexTrustBoundaryNesting, indexSharedRuntimeMembership, indexDataAssetUsage, resetTopologyIndexes,
+    invalidateDerivedValues, getDerivedValueStats, resetDerivedValueStats, invalidateRiskIndex, getRiskTrackingResolution,
     getSortedRiskCategories, getSortedRisksOfCategory, getAllRisks, RiskStatistics, getOverallRiskStatistics,
     // Risk Calculation
     CalculateSeverity,
+    getHighestSeverityStillAtRisk, reduceToOnlyStillAtRisk, sortByDataAssetDataBreachProbabilityAndTitle,
 } from './model/types.ts'; // Adjust path if needed
 
+import { DotAttributes, DotValue, DotWriter, html, nodeStatement, edgeStatement, subgraphOpening, closingStatement } from './dot/dot-writer.ts';
+
+import type { DiagramEntities } from './layout/diagram-geometry.ts';
+import { parseYamlSection, yamlSections } from './model/yaml-sections.ts';
+import { layoutNodeShape } from './layout/graphviz-layout.ts';
+
 import { applyRAA as calculateRAA } from './raa/multifactor/multi.ts'; // Assuming it's in raa-calculator.ts
 
 // Import Colors (if needed directly, often used by diagramming/reporting)
@@ -69,57 +80,56 @@ import * as colors from './colors/colors.ts';
 // (This list will be long - consider dynamic imports or a build step if it gets unwieldy)
 
 
-import * as missing_security_process_update from './risks/built-in/missing-security-process-update/missing-security-process-update-rule.ts';
-import * as violation_legal_contractual_obligations from './risks/built/violation-legal-contractual-obligations/violation-legal-contractual-obligations-rule.ts';
-
-import * as insufficient_enforceability_measures from './risks/built-in/insufficient-enforceability-measures/insufficient-enforceability-measures-rule.ts';
-import * as insufficient_misguided_investments_role_comm from './risks/built-in/insufficient-misguided-investments-role-comm/insufficient-misguided-investments-role-comm-rule.ts';
-import * as insufficient_strategic_conceptual_guidelines from './risks/built-in/insufficient-strategic-conceptual-guidelines/insufficient-strategic-conceptual-guidelines-rules.ts';
-import * as lack_of_management_support_for_security from './risks/built-in/lack-of-management-support-for-security/lack-of-management-support-for-security-rule.ts';
-import * as lack_of_management_support_for_security from './risks/built-in/lack-of-management-support-for-security/lack-of-management-support-for-security-rule.ts';
-import * as lack_of_personal_responsibility from './risks/built-in/lack-of-personal-responsibility/lack-of-personal-responsibility-rule.ts';
-import * as accidental_secret_leak from './risks/built-in/accidental-secret-leak/accidental-secret-leak-rule.ts';
-import * as code_backdooring from './risks/built-in/code-backdooring/code-backdooring-rule.ts';
-import * as container_baseimage_backdooring from './risks/built-in/container-baseimage-backdooring/container-baseimage-backdooring-rule.ts';
-import * as container_platform_escape from './risks/built-in/container-platform-escape/container-platform-escape-rule.ts';
-import * as cross_site_request_forgery from './risks/built-in/cross-site-request-forgery/cross-site-request-forgery-rule.ts';
-import * as cross_site_scripting from './risks/built-in/cross-site-scripting/cross-site-scripting-rule.ts';
-import * as dos_risky_access_across_trust_boundary from './risks/built-in/dos-risky-access-across-trust-boundary/dos-risky-access-across-trust-boundary-rule.ts';
-import * as incomplete_model from './risks/built-in/incomplete-model/incomplete-model-rule.ts';
-import * as ldap_injection from './risks/built-in/ldap-injection/ldap-injection-rule.ts';
-import * as missing_authentication from './risks/built-in/missing-authentication/missing-authentication-rule.ts';
-import * as missing_authentication_second_factor from './risks/built-in/missing-authentication-second-factor/missing-authentication-second-factor-rule.ts';
-import * as missing_build_infrastructure from './risks/built-in/missing-build-infrastructure/missing-build-infrastructure-rule.ts';
-import * as missing_cloud_hardening from './risks/built-in/missing-cloud-hardening/missing-cloud-hardening-rule.ts';
-import * as missing_file_validation from './risks/built-in/missing-file-validation/missing-file-validation-rule.ts';
-import * as missing_hardening from './risks/built-in/missing-hardening/missing-hardening-rule.ts';
-import * as missing_identity_propagation from './risks/built-in/missing-identity-propagation/missing-identity-propagation-rule.ts';
-import * as missing_identity_provider_isolation from './risks/built-in/missing-identity-provider-isolation/missing-identity-provider-isolation-rule.ts';
-import * as missing_identity_store from './risks/built-in/missing-identity-store/missing-identity-store-rule.ts';
-import * as missing_network_segmentation from './risks/built-in/missing-network-segmentation/missing-network-segmentation-rule.ts';
-import * as missing_vault from './risks/built-in/missing-vault/missing-vault-rule.ts';
-import * as missing_vault_isolation from './risks/built-in/missing-vault-isolation/missing-vault-isolation-rule.ts';
-import * as missing_waf from './risks/built-in/missing-waf/missing-waf-rule.ts';
-import * as mixed_targets_on_shared_runtime from './risks/built-in/mixed-targets-on-shared-runtime/mixed-targets-on-shared-runtime-rule.ts';
-import * as path_traversal from './risks/built-in/path-traversal/path-traversal-rule.ts';
-import * as push_instead_of_pull_deployment from './risks/built-in/push-instead-of-pull-deployment/push-instead-of-pull-deployment-rule.ts';
-import * as search_query_injection from './risks/built-in/search-query-injection/search-query-injection-rule.ts';
-import * as server_side_request_forgery from './risks/built-in/server-side-request-forgery/server-side-request-forgery-rule.ts';
-import * as service_registry_poisoning from './risks/built-in/service-registry-poisoning/service-registry-poisoning-rule.ts';
-import * as sql_nosql_injection from './risks/built-in/sql-nosql-injection/sql-nosql-injection-rule.ts';
-import * as unchecked_deployment from './risks/built-in/unchecked-deployment/unchecked-deployment-rule.ts';
-import * as unencrypted_asset from './risks/built-in/unencrypted-asset/unencrypted-asset-rule.ts';
-import * as unencrypted_communication from './risks/built-in/unencrypted-communication/unencrypted-communication-rule.ts';
-import * as unguarded_access_from_internet from './risks/built-in/unguarded-access-from-internet/unguarded-access-from-internet-rule.ts';
-import * as unguarded_direct_datastore_access from './risks/built-in/unguarded-direct-datastore-access/unguarded-direct-datastore-access-rule.ts';
-import * as unnecessary_communication_link from './risks/built-in/unnecessary-communication-link/unnecessary-communication-link-rule.ts';
-import * as unnecessary_data_asset from './risks/built-in/unnecessary-data-asset/unnecessary-data-asset-rule.ts';
-import * as unnecessary_data_transfer from './risks/built-in/unnecessary-data-transfer/unnecessary-data-transfer-rule.ts';
-import * as unnecessary_technical_asset from './risks/built-in/unnecessary-technical-asset/unnecessary-technical-asset-rule.ts';
-import * as untrusted_deserialization from './risks/built-in/untrusted-deserialization/untrusted-deserialization-rule.ts';
-import * as wrong_communication_link_content from './risks/built-in/wrong-communication-link-content/wrong-communication-link-content-rule.ts';
-import * as wrong_trust_boundary_content from './risks/built-in/wrong-trust-boundary-content/wrong-trust-boundary-content-rule.ts';
-import * as xml_external_entity from './risks/built-in/xml-external-entity/xml-external-entity-rule.ts';
+import * as missing_security_process_update from './risks/built-in/bsi/missing-security-process-update/missing-security-process-update-rule.ts';
+import * as violation_legal_contractual_obligations from './risks/built-in/bsi/violation-legal-contractual-obligations/violation-legal-contractual-obligations-rule.ts';
+
+import * as insufficient_enforceability_measures from './risks/built-in/bsi/insufficient-enforceability-measures/insufficient-enforceability-measures-rule.ts';
+import * as insufficient_misguided_investments_role_comm from './risks/built-in/bsi/insufficient-misguided-investments-role-comm/insufficient-misguided-investments-role-comm-rule.ts';
+import * as insufficient_strategic_conceptual_guidelines from './risks/built-in/bsi/insufficient-strategic-conceptual-guidelines/insufficient-strategic-conceptual-guidelines-rules.ts';
+import * as lack_of_management_support_for_security from './risks/built-in/bsi/lack-of-management-support-for-security/lack-of-management-support-for-security-rule.ts';
+import * as lack_of_personal_responsibility from './risks/built-in/bsi/lack-of-personal-responsibility/lack-of-personal-responsibility-rule.ts';
+import * as accidental_secret_leak from './risks/built-in/original/accidental-secret-leak/accidental-secret-leak-rule.ts';
+import * as code_backdooring from './risks/built-in/original/code-backdooring/code-backdooring-rule.ts';
+import * as container_baseimage_backdooring from './risks/built-in/original/container-baseimage-backdooring/container-baseimage-backdooring-rule.ts';
+import * as container_platform_escape from './risks/built-in/original/container-platform-escape/container-platform-escape-rule.ts';
+import * as cross_site_request_forgery from './risks/built-in/original/cross-site-request-forgery/cross-site-request-forgery-rule.ts';
+import * as cross_site_scripting from './risks/built-in/original/cross-site-scripting/cross-site-scripting-rule.ts';
+import * as dos_risky_access_across_trust_boundary from './risks/built-in/original/dos-risky-access-across-trust-boundary/dos-risky-access-across-trust-boundary-rule.ts';
+import * as incomplete_model from './risks/built-in/baseline/incomplete-model/incomplete-model-rule.ts';
+import * as ldap_injection from './risks/built-in/original/ldap-injection/ldap-injection-rule.ts';
+import * as missing_authentication from './risks/built-in/original/missing-authentication/missing-authentication-rule.ts';
+import * as missing_authentication_second_factor from './risks/built-in/original/missing-authentication-second-factor/missing-authentication-second-factor-rule.ts';
+import * as missing_build_infrastructure from './risks/built-in/original/missing-build-infrastructure/missing-build-infrastructure-rule.ts';
+import * as missing_cloud_hardening from './risks/built-in/original/missing-cloud-hardening/missing-cloud-hardening-rule.ts';
+import * as missing_file_validation from './risks/built-in/original/missing-file-validation/missing-file-validation-rule.ts';
+import * as missing_hardening from './risks/built-in/original/missing-hardening/missing-hardening-rule.ts';
+import * as missing_identity_propagation from './risks/built-in/original/missing-identity-propagation/missing-identity-propagation-rule.ts';
+import * as missing_identity_provider_isolation from './risks/built-in/original/missing-identity-provider-isolation/missing-identity-provider-isolation-rule.ts';
+import * as missing_identity_store from './risks/built-in/original/missing-identity-store/missing-identity-store-rule.ts';
+import * as missing_network_segmentation from './risks/built-in/original/missing-network-segmentation/missing-network-segmentation-rule.ts';
+import * as missing_vault from './risks/built-in/original/missing-vault/missing-vault-rule.ts';
+import * as missing_vault_isolation from './risks/built-in/original/missing-vault-isolation/missing-vault-isolation-rule.ts';
+import * as missing_waf from './risks/built-in/original/missing-waf/missing-waf-rule.ts';
+import * as mixed_targets_on_shared_runtime from './risks/built-in/original/mixed-targets-on-shared-runtime/mixed-targets-on-shared-runtime-rule.ts';
+import * as path_traversal from './risks/built-in/original/path-traversal/path-traversal-rule.ts';
+import * as push_instead_of_pull_deployment from './risks/built-in/original/push-instead-of-pull-deployment/push-instead-of-pull-deployment-rule.ts';
+import * as search_query_injection from './risks/built-in/original/search-query-injection/search-query-injection-rule.ts';
+import * as server_side_request_forgery from './risks/built-in/original/server-side-request-forgery/server-side-request-forgery-rule.ts';
+import * as service_registry_poisoning from './risks/built-in/original/service-registry-poisoning/service-registry-poisoning-rule.ts';
+import * as sql_nosql_injection from './risks/built-in/original/sql-nosql-injection/sql-nosql-injection-rule.ts';
+import * as unchecked_deployment from './risks/built-in/baseline/unchecked-deployment/unchecked-deployment-rule.ts';
+import * as unencrypted_asset from './risks/built-in/baseline/unencrypted-asset/unencrypted-asset-rule.ts';
+import * as unencrypted_communication from './risks/built-in/baseline/unencrypted-communication/unencrypted-communication-rule.ts';
+import * as unguarded_access_from_internet from './risks/built-in/baseline/unguarded-access-from-internet/unguarded-access-from-internet-rule.ts';
+import * as unguarded_direct_datastore_access from './risks/built-in/original/unguarded-direct-datastore-access/unguarded-direct-datastore-access-rule.ts';
+import * as unnecessary_communication_link from './risks/built-in/baseline/unnecessary-communication-link/unnecessary-communication-link-rule.ts';
+import * as unnecessary_data_asset from './risks/built-in/baseline/unnecessary-data-asset/unnecessary-data-asset-rule.ts';
+import * as unnecessary_data_transfer from './risks/built-in/baseline/unnecessary-data-transfer/unnecessary-data-transfer-rule.ts';
+import * as unnecessary_technical_asset from './risks/built-in/baseline/unnecessary-technical-asset/unnecessary-technical-asset-rule.ts';
+import * as untrusted_deserialization from './risks/built-in/original/untrusted-deserialization/untrusted-deserialization-rule.ts';
+import * as wrong_communication_link_content from './risks/built-in/original/wrong-communication-link-content/wrong-communication-link-content-rule.ts';
+import * as wrong_trust_boundary_content from './risks/built-in/original/wrong-trust-boundary-content/wrong-trust-boundary-content-rule.ts';
+import * as xml_external_entity from './risks/built-in/original/xml-external-entity/xml-external-entity-rule.ts';
 
 // --- Global Settings / Constants ---
 // const THREAGILE_VERSION = "1.0.0"; // Defined in types.ts
@@ -154,9 +164,6 @@ const DEFAULT_RISK_DB_PROBABILITY = DataBreachProbability.Possible;
 
 const DEFAULT_RISK_TRACKING_STATUS = RiskStatus.Unchecked;
 
-// Regular Expression for ID validation (similar to Go's)
-const validIdSyntax = /^[A-Za-z0-9\-]+$/;
-
 // --- Register Built-in Risk Rules ---
 // Each rule file should export an object conforming to the CustomRiskRule interface
 const builtInRiskRules: CustomRiskRule[] = [
@@ -180,6 +187,41 @@ const builtInRiskRules: CustomRiskRule[] = [
     insufficient_enforceability_measures.Rule,missing_security_process_update.Rule
 ];
 
+// Bump whenever the parser or the engine output changes in a way the rule IDs don't reflect,
+// cached results (see backend/cache) of older versions are then no longer used
+const ENGINE_CACHE_VERSION = 1;
+
+// Identifies the rules generateRisks would run, part of the model cache key
+export function getRuleSetVersion(customRiskRules: CustomRiskRule[] = [], skippedRuleIds: Set<string> = new Set()): string {
+    const ruleIds = [...builtInRiskRules, ...customRiskRules]
+        .map(rule => rule.category().id)
+        .filter(id => !skippedRuleIds.has(id));
+    return `engine-${ENGINE_CACHE_VERSION}:${ruleIds.join(',')}`;
+}
+
+// Engine state of a model context beyond the lookup maps in ModelContext
+interface EngineModelState {
+    // Raw input of the last successful parse, patched in place by applyModelEdits
+    modelInput: ModelInput | null;
+    // Rule selection of the last generateRisks call, reused when risks are refreshed incrementally
+    ruleSet: {
+        customRiskRules: CustomRiskRule[];
+        skippedRuleIds: Set<string>;
+        dependencyIndex: RiskRuleDependencyIndex;
+    } | null;
+}
+const engineModelStates = new WeakMap<ModelContext, EngineModelState>();
+
+// Engine state of the active model context
+function engineState(): EngineModelState {
+    let state = engineModelStates.get(modelState);
+    if (!state) {
+        state = { modelInput: null, ruleSet: null };
+        engineModelStates.set(modelState, state);
+    }
+    return state;
+}
+
 
 // Basic `withDefault` equivalent
 function withDefault<T>(value: T | undefined | null, defaultValue: T): T {
@@ -257,32 +299,133 @@ function sortByTechnicalAssetOrderAndId(a: TechnicalAsset, b: TechnicalAsset): n
     // If order is the same, sort by ID
     return a.id.localeCompare(b.id);
 }
-export function applyRAAMethod() {
-    calculateRAA();
+export function applyRAAMethod(context: ModelContext = modelState) {
+    withModelContext(context, () => calculateRAA());
 }
 
+// Model input as YAML text, as a Document from YAML.parseDocument or as the plain object of one.
+// A Document or object is used as is, without tokenizing the YAML again; an object is taken over
+// as the model input, later edits are patched into it (see applyModelEdits).
+export type ModelSource = string | YAML.Document | ModelInput;
+
 // Parses and validates the model input YAML
-export function parseModel(modelYaml: string): ParsedModel {
+export function parseModel(modelSource: ModelSource, context: ModelContext = modelState): ParsedModel {
+    return withModelContext(context, () => parseModelInActiveContext(modelSource));
+}
+
+function modelInputOf(modelSource: ModelSource): unknown {
+    if (typeof modelSource === 'string') {
+        return YAML.parse(modelSource);
+    }
+    if (YAML.isDocument(modelSource)) {
+        if (modelSource.errors.length > 0) {
+            throw modelSource.errors[0];
+        }
+        return modelSource.toJS();
+    }
+    return modelSource;
+}
+
+function parseModelInActiveContext(modelSource: ModelSource): ParsedModel {
     console.log("Initializing model state...");
     initModelState(); // Clear any previous state
 
     let modelInput: ModelInput;
     try {
-        // Ensure the input is treated as a string before parsing
-        const yamlContent = typeof modelYaml === 'string' ? modelYaml : String(modelYaml);
-        const rawParsed = YAML.parse(yamlContent);
+        const rawParsed = modelInputOf(modelSource);
         // Basic type check after parsing
         if (typeof rawParsed !== 'object' || rawParsed === null) {
             throw new Error("Parsed YAML is not a valid object.");
         }
         modelInput = rawParsed as ModelInput; // Cast after basic check
-        console.log("YAML parsed successfully.");
+        console.log(typeof modelSource === 'string' ? "YAML parsed successfully." : "Using the already parsed YAML input.");
     } catch (e) {
         console.error("Error parsing YAML input:", e);
         throw new Error(`Failed to parse YAML: ${e instanceof Error ? e.message : String(e)}`);
     }
 
-    // --- Basic Model Info ---
+    const parsedModel = buildParsedModel(modelInput);
+    // Keep the raw input around so later path edits can be patched in (see applyModelEdits)
+    engineState().modelInput = modelInput;
+    return parsedModel;
+}
+
+// Top-level sections that only carry text for the report, none of the rules read them
+export const textOnlyModelSections = ['business_overview', 'technical_overview', 'questions', 'abuse_cases', 'management_summary_comment'];
+
+export interface SectionParseOptions {
+    skipSections?: Iterable<string>; // Top-level keys that are not parsed at all, e.g. textOnlyModelSections
+}
+
+/**
+ * Like parseModel, but parses the YAML one top-level section at a time (see yaml-sections.ts):
+ * only one section's YAML syntax tree exists at a time, skipped sections are not even tokenized,
+ * and the data and technical assets are built and validated as soon as their sections arrive, so
+ * an invalid model fails without parsing the rest. The plain input of every parsed section is
+ * still collected into the model input, which completeParsedModel and applyModelEdits read.
+ */
+export function parseModelInSections(modelYaml: string, options: SectionParseOptions = {}, context: ModelContext = modelState): ParsedModel {
+    return withModelContext(context, () => parseModelInSectionsInActiveContext(modelYaml, options));
+}
+
+function parseModelInSectionsInActiveContext(modelYaml: string, options: SectionParseOptions): ParsedModel {
+    console.log("Initializing model state...");
+    initModelState(); // Clear any previous state
+
+    const skipSections = new Set(options.skipSections ?? []);
+    const modelInput: Record<string, unknown> = {};
+    const parsedModel = createParsedModel({} as ModelInput); // Top-level fields are filled in at the end
+    let dataAssetsParsed = false;
+    let pendingTechAssetInputs: Record<string, InputTechnicalAsset> | null = null; // Waiting for the data assets
+
+    for (const section of yamlSections(modelYaml)) {
+        if (section.key !== null && skipSections.has(section.key)) {
+            console.log(`Skipping section ${section.key}.`);
+            continue;
+        }
+        for (const [key, value] of Object.entries(parseYamlSection(section))) {
+            if (key in modelInput) {
+                throw new Error(`Duplicate top-level key in model YAML: ${key}`);
+            }
+            modelInput[key] = value;
+            if (key === 'data_assets') {
+                addDataAssets(parsedModel, (value ?? {}) as Record<string, InputDataAsset>);
+                dataAssetsParsed = true;
+                if (pendingTechAssetInputs) {
+                    addTechnicalAssets(parsedModel, pendingTechAssetInputs);
+                    pendingTechAssetInputs = null;
+                }
+            } else if (key === 'technical_assets') {
+                const techAssetInputs = (value ?? {}) as Record<string, InputTechnicalAsset>;
+                if (dataAssetsParsed) {
+                    addTechnicalAssets(parsedModel, techAssetInputs);
+                } else {
+                    pendingTechAssetInputs = techAssetInputs;
+                }
+            }
+        }
+    }
+    if (pendingTechAssetInputs) {
+        addTechnicalAssets(parsedModel, pendingTechAssetInputs); // The model has no data assets
+    }
+
+    Object.assign(parsedModel, basicModelInfo(modelInput as ModelInput));
+    completeParsedModel(parsedModel, modelInput as ModelInput);
+    // Keep the raw input around so later path edits can be patched in (see applyModelEdits)
+    engineState().modelInput = modelInput as ModelInput;
+    return parsedModel;
+}
+
+// Builds the complete ParsedModel (and the modelState lookup maps) from already parsed YAML input
+function buildParsedModel(modelInput: ModelInput): ParsedModel {
+    const parsedModel = createParsedModel(modelInput);
+    addDataAssets(parsedModel, modelInput.data_assets);
+    addTechnicalAssets(parsedModel, modelInput.technical_assets);
+    return completeParsedModel(parsedModel, modelInput);
+}
+
+// The top-level fields of the model, without the entities
+function basicModelInfo(modelInput: ModelInput) {
     const businessCriticality = parseCriticality(modelInput.business_criticality || '') ?? DEFAULT_BUSINESS_CRITICALITY;
     let reportDate: Date;
     try {
@@ -296,8 +439,7 @@ export function parseModel(modelYaml: string): ParsedModel {
         reportDate = new Date();
     }
 
-    // Create the root object for the parsed model state
-    const parsedModel: ParsedModel = {
+    return {
         author: modelInput.author ?? {},
         title: modelInput.title ?? 'Untitled Model',
         date: reportDate,
@@ -309,12 +451,6 @@ export function parseModel(modelYaml: string): ParsedModel {
         questions: modelInput.questions ?? {},
         abuseCases: modelInput.abuse_cases ?? {},
         tagsAvailable: (modelInput.tags_available ?? []).map(normalizeTag),
-        dataAssets: {},
-        technicalAssets: {},
-        trustBoundaries: {},
-        sharedRuntimes: {},
-        individualRiskCategories: {},
-        riskTracking: {},
         diagramTweakNodesep: modelInput.diagram_tweak_nodesep ?? 2,
         diagramTweakRanksep: modelInput.diagram_tweak_ranksep ?? 2,
         diagramTweakEdgeLayout: modelInput.diagram_tweak_edge_layout ?? '',
@@ -323,114 +459,52 @@ export function parseModel(modelYaml: string): ParsedModel {
         diagramTweakInvisibleConnectionsBetweenAssets: modelInput.diagram_tweak_invisible_connections_between_assets ?? [],
         diagramTweakSameRankAssets: modelInput.diagram_tweak_same_rank_assets ?? [],
     };
+}
+
+function createParsedModel(modelInput: ModelInput): ParsedModel {
+    // Create the root object for the parsed model state
+    const parsedModel: ParsedModel = {
+        ...basicModelInfo(modelInput),
+        dataAssets: {},
+        technicalAssets: {},
+        trustBoundaries: {},
+        sharedRuntimes: {},
+        individualRiskCategories: {},
+        riskTracking: {},
+    };
     modelState.parsedModelRoot = parsedModel; // Assign to global state
     console.log("Parsed basic model information.");
+    return parsedModel;
+}
 
-    // --- Data Assets ---
+function addDataAssets(parsedModel: ParsedModel, dataAssetInputs: Record<string, InputDataAsset> | undefined): void {
     console.log("Parsing data assets...");
-    for (const title in modelInput.data_assets) {
-        const assetInput = modelInput.data_assets[title];
-        const id = makeID(assetInput.id); // Use makeID consistent with potential Go counterpart
-        const context = `data asset '${title}' (ID: ${id})`;
-        checkIdSyntax(id, context);
-        if (parsedModel.dataAssets[id]) {
-            throw new Error(`Duplicate data asset ID used: ${id}`);
+    for (const title in dataAssetInputs) {
+        const dataAsset = parseDataAsset(title, dataAssetInputs[title], parsedModel);
+        if (parsedModel.dataAssets[dataAsset.id]) {
+            throw new Error(`Duplicate data asset ID used: ${dataAsset.id}`);
         }
-
-        // Use defaults from constants
-        const usage = parseUsage(assetInput.usage) ?? DEFAULT_DATA_ASSET_USAGE;
-        const quantity = parseQuantity(assetInput.quantity) ?? DEFAULT_DATA_ASSET_QUANTITY;
-        const confidentiality = parseConfidentiality(assetInput.confidentiality) ?? DEFAULT_DATA_ASSET_CONFIDENTIALITY;
-        const integrity = parseCriticality(assetInput.integrity) ?? DEFAULT_DATA_ASSET_INTEGRITY;
-        const availability = parseCriticality(assetInput.availability) ?? DEFAULT_DATA_ASSET_AVAILABILITY;
-
-        // Create DataAsset instance (constructor handles defaults for some fields)
-        const dataAsset = new DataAsset({
-            ...assetInput, // Spread the input
-            id: id, // Ensure ID is set
-            // Override parsed enums/values
-            usage: usage,
-            quantity: quantity,
-            confidentiality: confidentiality,
-            integrity: integrity,
-            availability: availability,
-            tags: checkTags(assetInput.tags, context),
-        }, id); // Pass ID to constructor too
-        dataAsset.title = title; // Set title explicitly from the key
-
-        parsedModel.dataAssets[id] = dataAsset;
+        parsedModel.dataAssets[dataAsset.id] = dataAsset;
     }
     console.log(`Parsed ${Object.keys(parsedModel.dataAssets).length} data assets.`);
+}
 
-    // --- Technical Assets ---
+// Needs the data assets parsed first, they are referenced
+function addTechnicalAssets(parsedModel: ParsedModel, techAssetInputs: Record<string, InputTechnicalAsset> | undefined): void {
     console.log("Parsing technical assets...");
-    const techAssetInputs: Record<string, InputTechnicalAsset> = modelInput.technical_assets ?? {};
     for (const title in techAssetInputs) {
-        const assetInput = techAssetInputs[title];
-        const id = makeID(assetInput.id);
-        const context = `technical asset '${title}' (ID: ${id})`;
-        checkIdSyntax(id, context);
-        if (parsedModel.technicalAssets[id]) {
-            throw new Error(`Duplicate technical asset ID used: ${id}`);
+        const techAsset = parseTechnicalAsset(title, techAssetInputs[title], parsedModel);
+        if (parsedModel.technicalAssets[techAsset.id]) {
+            throw new Error(`Duplicate technical asset ID used: ${techAsset.id}`);
         }
-
-        // Parse enums with defaults
-        const usage = parseUsage(assetInput.usage) ?? DEFAULT_TECH_ASSET_USAGE;
-        const type = (assetInput.type as TechnicalAssetType) ?? DEFAULT_TECH_ASSET_TYPE; // Direct cast assumes string enums in YAML
-        const size = (assetInput.size as TechnicalAssetSize) ?? DEFAULT_TECH_ASSET_SIZE; // Adjust if YAML uses different values
-        const technology = (assetInput.technology as TechnicalAssetTechnology) ?? DEFAULT_TECH_ASSET_TECH;
-        const machine = (assetInput.machine as TechnicalAssetMachine) ?? DEFAULT_TECH_ASSET_MACHINE;
-        const encryption = parseEncryptionStyle(assetInput.encryption) ?? DEFAULT_TECH_ASSET_ENCRYPTION;
-        const confidentiality = parseConfidentiality(assetInput.confidentiality) ?? DEFAULT_TECH_ASSET_CONFIDENTIALITY;
-        const integrity = parseCriticality(assetInput.integrity) ?? DEFAULT_TECH_ASSET_INTEGRITY;
-        const availability = parseCriticality(assetInput.availability) ?? DEFAULT_TECH_ASSET_AVAILABILITY;
-
-        // Validate referenced data assets
-        const dataAssetsProcessed = (assetInput.data_assets_processed ?? []).map(daId => {
-            if (!parsedModel.dataAssets[daId]) {
-                throw new Error(`Missing referenced data asset processed by ${context}: ${daId}`);
-            }
-            return daId;
-        });
-        const dataAssetsStored = (assetInput.data_assets_stored ?? []).map(daId => {
-            if (!parsedModel.dataAssets[daId]) {
-                throw new Error(`Missing referenced data asset stored by ${context}: ${daId}`);
-            }
-            return daId;
-        });
-        const dataFormatsAccepted = (assetInput.data_formats_accepted ?? []).map(df => {
-             const parsed = parseDataFormat(df); // Assuming parseDataFormat exists
-             if (!parsed) throw new Error(`Unknown data format accepted by ${context}: ${df}`);
-             return parsed;
-        });
-
-
-        const techAsset = new TechnicalAsset({
-            ...assetInput,
-            id: id,
-            // Override parsed/validated values
-            usage: usage,
-            type: type,
-            size: size,
-            technology: technology,
-            machine: machine,
-            encryption: encryption,
-            confidentiality: confidentiality,
-            integrity: integrity,
-            availability: availability,
-            tags: checkTags(assetInput.tags, context),
-            data_assets_processed: dataAssetsProcessed,
-            data_assets_stored: dataAssetsStored,
-            data_formats_accepted: dataFormatsAccepted,
-            // Communication links processed separately below
-            communication_links: undefined, // Clear input comm links here
-        }, id);
-        techAsset.title = title; // Set title explicitly
-
-        parsedModel.technicalAssets[id] = techAsset;
+        parsedModel.technicalAssets[techAsset.id] = techAsset;
     }
      console.log(`Parsed ${Object.keys(parsedModel.technicalAssets).length} technical assets.`);
+}
 
+// Everything after the data and technical assets, down to the RAA
+function completeParsedModel(parsedModel: ParsedModel, modelInput: ModelInput): ParsedModel {
+    const techAssetInputs: Record<string, InputTechnicalAsset> = modelInput.technical_assets ?? {};
 
     // --- Communication Links (Needs all Tech Assets parsed first) ---
     console.log("Parsing communication links...");
@@ -438,64 +512,7 @@ export function parseModel(modelYaml: string): ParsedModel {
     for (const sourceId in parsedModel.technicalAssets) {
         const sourceAsset = parsedModel.technicalAssets[sourceId];
         const assetInput = techAssetInputs[sourceAsset.title]; // Get the original input again
-        const commLinksInput = assetInput?.communication_links ?? {};
-
-        for (const commLinkTitle in commLinksInput) {
-            const linkInput = commLinksInput[commLinkTitle];
-            const targetId = makeID(linkInput.target);
-             const context = `communication link '${commLinkTitle}' from '${sourceAsset.title}' (ID: ${sourceId}) to '${targetId}'`;
-
-            // Validate target exists
-            if (!parsedModel.technicalAssets[targetId]) {
-                 throw new Error(`Missing referenced target technical asset in ${context}: ${targetId}`);
-            }
-
-            // Parse enums with defaults
-            const protocol = (linkInput.protocol as Protocol) ?? DEFAULT_COMM_LINK_PROTOCOL; // Direct cast
-            const authentication = (linkInput.authentication as Authentication) ?? DEFAULT_COMM_LINK_AUTHN;
-            const authorization = (linkInput.authorization as Authorization) ?? DEFAULT_COMM_LINK_AUTHZ;
-            const usage = parseUsage(linkInput.usage) ?? DEFAULT_COMM_LINK_USAGE;
-
-             // Validate referenced data assets
-            const dataAssetsSent = (linkInput.data_assets_sent ?? []).map(daId => {
-                if (!parsedModel.dataAssets[daId]) {
-                    throw new Error(`Missing referenced data asset sent via ${context}: ${daId}`);
-                }
-                return daId;
-            });
-            const dataAssetsReceived = (linkInput.data_assets_received ?? []).map(daId => {
-                if (!parsedModel.dataAssets[daId]) {
-                     throw new Error(`Missing referenced data asset received via ${context}: ${daId}`);
-                }
-                return daId;
-            });
-
-            // Create CommunicationLink instance
-             const commLink = new CommunicationLink({
-                ...linkInput,
-                // Override parsed/validated values
-                target: targetId, // Use the validated target ID
-                protocol: protocol,
-                authentication: authentication,
-                authorization: authorization,
-                usage: usage,
-                tags: checkTags(linkInput.tags, context),
-                data_assets_sent: dataAssetsSent,
-                data_assets_received: dataAssetsReceived,
-            }, sourceId, targetId); // Pass source and target IDs
-            commLink.title = commLinkTitle; // Set title from key
-
-            // Add to source asset's list
-            sourceAsset.communicationLinks.push(commLink);
-
-            // Add to global maps in modelState
-            modelState.communicationLinks[commLink.id] = commLink;
-            if (!modelState.incomingTechnicalCommunicationLinksMappedByTargetId[targetId]) {
-                modelState.incomingTechnicalCommunicationLinksMappedByTargetId[targetId] = [];
-            }
-            modelState.incomingTechnicalCommunicationLinksMappedByTargetId[targetId].push(commLink);
-            commLinkCounter++;
-        }
+        commLinkCounter += parseCommunicationLinks(sourceAsset, assetInput, parsedModel);
     }
     console.log(`Parsed ${commLinkCounter} communication links.`);
 
@@ -503,48 +520,255 @@ export function parseModel(modelYaml: string): ParsedModel {
     console.log("Parsing trust boundaries...");
     const checklistToAvoidAssetInMultipleBoundaries: Record<string, string> = {}; // Store boundary ID
     for (const title in modelInput.trust_boundaries) {
-        const boundaryInput = modelInput.trust_boundaries[title];
-        const id = makeID(boundaryInput.id);
-        const context = `trust boundary '${title}' (ID: ${id})`;
-        checkIdSyntax(id, context);
-        if (parsedModel.trustBoundaries[id]) {
-            throw new Error(`Duplicate trust boundary ID used: ${id}`);
+        const trustBoundary = parseTrustBoundary(title, modelInput.trust_boundaries[title], parsedModel, checklistToAvoidAssetInMultipleBoundaries);
+        if (parsedModel.trustBoundaries[trustBoundary.id]) {
+            throw new Error(`Duplicate trust boundary ID used: ${trustBoundary.id}`);
         }
+        parsedModel.trustBoundaries[trustBoundary.id] = trustBoundary;
 
-        const type = (boundaryInput.type as TrustBoundaryType) ?? DEFAULT_TRUST_BOUNDARY_TYPE;
+         // Populate mapping for direct parent
+        trustBoundary.technicalAssetsInside.forEach(taId => {
+            modelState.directContainingTrustBoundaryMappedByTechnicalAssetId[taId] = trustBoundary;
+        });
+    }
+    indexTrustBoundaryNesting(parsedModel.trustBoundaries);
+    validateNestedTrustBoundaries(parsedModel);
+    console.log(`Parsed ${Object.keys(parsedModel.trustBoundaries).length} trust boundaries.`);
 
-        const technicalAssetsInside = (boundaryInput.technical_assets_inside ?? []).map(taId => {
-            if (!parsedModel.technicalAssets[taId]) {
-                 throw new Error(`Missing referenced technical asset inside ${context}: ${taId}`);
-            }
-            if (checklistToAvoidAssetInMultipleBoundaries[taId]) {
-                throw new Error(`Technical asset ${taId} is defined inside multiple trust boundaries ('${checklistToAvoidAssetInMultipleBoundaries[taId]}' and '${id}')`);
-            }
-            checklistToAvoidAssetInMultipleBoundaries[taId] = id;
-            return taId;
+
+    // --- Shared Runtimes ---
+    console.log("Parsing shared runtimes...");
+    for (const title in modelInput.shared_runtimes) {
+        const sharedRuntime = parseSharedRuntime(title, modelInput.shared_runtimes[title], parsedModel);
+        if (parsedModel.sharedRuntimes[sharedRuntime.id]) {
+            throw new Error(`Duplicate shared runtime ID used: ${sharedRuntime.id}`);
+        }
+        parsedModel.sharedRuntimes[sharedRuntime.id] = sharedRuntime;
+
+        // Populate mapping
+        sharedRuntime.technicalAssetsRunning.forEach(taId => {
+            modelState.directContainingSharedRuntimeMappedByTechnicalAssetId[taId] = sharedRuntime;
         });
+    }
+    indexSharedRuntimeMembership(parsedModel.sharedRuntimes);
+    console.log(`Parsed ${Object.keys(parsedModel.sharedRuntimes).length} shared runtimes.`);
 
-        // Nested boundaries validated later
-        const trustBoundariesNested = (boundaryInput.trust_boundaries_nested ?? []).map(tbId => makeID(tbId));
+    indexDataAssetUsage(parsedModel.technicalAssets, modelState.communicationLinks);
 
-        const trustBoundary = new TrustBoundary({
-            ...boundaryInput,
-            id: id,
-            type: type,
-            tags: checkTags(boundaryInput.tags, context),
-            technical_assets_inside: technicalAssetsInside,
-            trust_boundaries_nested: trustBoundariesNested, // Use mapped IDs
-        }, id);
-        trustBoundary.title = title;
+    // --- Individual Risk Categories (Used for Custom Risks and Pre-defined Risk Instances) ---
+    console.log("Parsing individual risk categories and instances...");
+    parseIndividualRiskCategories(modelInput, parsedModel);
+    console.log(`Parsed ${Object.keys(parsedModel.individualRiskCategories).length} individual risk categories.`);
 
-        parsedModel.trustBoundaries[id] = trustBoundary;
 
-         // Populate mapping for direct parent
-        technicalAssetsInside.forEach(taId => {
-            modelState.directContainingTrustBoundaryMappedByTechnicalAssetId[taId] = trustBoundary;
+    // --- Risk Tracking ---
+    console.log("Parsing risk tracking entries...");
+    parsedModel.riskTracking = parseRiskTracking(modelInput);
+    invalidateRiskIndex();
+    console.log(`Parsed ${Object.keys(parsedModel.riskTracking).length} risk tracking entries.`);
+
+
+    // --- Final Steps ---
+    console.log("Calculating RAA...");
+    calculateRAA(); // Call the RAA calculation function
+
+    console.log("Model parsing complete.");
+    return parsedModel;
+}
+
+function parseDataAsset(title: string, assetInput: InputDataAsset, parsedModel: ParsedModel): DataAsset {
+    const id = makeID(assetInput.id); // Use makeID consistent with potential Go counterpart
+    const context = `data asset '${title}' (ID: ${id})`;
+    checkIdSyntax(id, context);
+
+    // Use defaults from constants
+    const usage = parseUsage(assetInput.usage) ?? DEFAULT_DATA_ASSET_USAGE;
+    const quantity = parseQuantity(assetInput.quantity) ?? DEFAULT_DATA_ASSET_QUANTITY;
+    const confidentiality = parseConfidentiality(assetInput.confidentiality) ?? DEFAULT_DATA_ASSET_CONFIDENTIALITY;
+    const integrity = parseCriticality(assetInput.integrity) ?? DEFAULT_DATA_ASSET_INTEGRITY;
+    const availability = parseCriticality(assetInput.availability) ?? DEFAULT_DATA_ASSET_AVAILABILITY;
+
+    // Create DataAsset instance (constructor handles defaults for some fields)
+    const dataAsset = new DataAsset({
+        ...assetInput, // Spread the input
+        id: id, // Ensure ID is set
+        // Override parsed enums/values
+        usage: usage,
+        quantity: quantity,
+        confidentiality: confidentiality,
+        integrity: integrity,
+        availability: availability,
+        tags: checkTags(assetInput.tags, context),
+    }, id); // Pass ID to constructor too
+    dataAsset.title = title; // Set title explicitly from the key
+    return dataAsset;
+}
+
+function parseTechnicalAsset(title: string, assetInput: InputTechnicalAsset, parsedModel: ParsedModel): TechnicalAsset {
+    const id = makeID(assetInput.id);
+    const context = `technical asset '${title}' (ID: ${id})`;
+    checkIdSyntax(id, context);
+
+    // Parse enums with defaults
+    const usage = parseUsage(assetInput.usage) ?? DEFAULT_TECH_ASSET_USAGE;
+    const type = (assetInput.type as TechnicalAssetType) ?? DEFAULT_TECH_ASSET_TYPE; // Direct cast assumes string enums in YAML
+    const size = (assetInput.size as TechnicalAssetSize) ?? DEFAULT_TECH_ASSET_SIZE; // Adjust if YAML uses different values
+    const technology = (assetInput.technology as TechnicalAssetTechnology) ?? DEFAULT_TECH_ASSET_TECH;
+    const machine = (assetInput.machine as TechnicalAssetMachine) ?? DEFAULT_TECH_ASSET_MACHINE;
+    const encryption = parseEncryptionStyle(assetInput.encryption) ?? DEFAULT_TECH_ASSET_ENCRYPTION;
+    const confidentiality = parseConfidentiality(assetInput.confidentiality) ?? DEFAULT_TECH_ASSET_CONFIDENTIALITY;
+    const integrity = parseCriticality(assetInput.integrity) ?? DEFAULT_TECH_ASSET_INTEGRITY;
+    const availability = parseCriticality(assetInput.availability) ?? DEFAULT_TECH_ASSET_AVAILABILITY;
+
+    // Validate referenced data assets
+    const dataAssetsProcessed = (assetInput.data_assets_processed ?? []).map(daId => {
+        if (!parsedModel.dataAssets[daId]) {
+            throw new Error(`Missing referenced data asset processed by ${context}: ${daId}`);
+        }
+        return daId;
+    });
+    const dataAssetsStored = (assetInput.data_assets_stored ?? []).map(daId => {
+        if (!parsedModel.dataAssets[daId]) {
+            throw new Error(`Missing referenced data asset stored by ${context}: ${daId}`);
+        }
+        return daId;
+    });
+    const dataFormatsAccepted = (assetInput.data_formats_accepted ?? []).map(df => {
+         const parsed = parseDataFormat(df); // Assuming parseDataFormat exists
+         if (!parsed) throw new Error(`Unknown data format accepted by ${context}: ${df}`);
+         return parsed;
+    });
+
+
+    const techAsset = new TechnicalAsset({
+        ...assetInput,
+        id: id,
+        // Override parsed/validated values
+        usage: usage,
+        type: type,
+        size: size,
+        technology: technology,
+        machine: machine,
+        encryption: encryption,
+        confidentiality: confidentiality,
+        integrity: integrity,
+        availability: availability,
+        tags: checkTags(assetInput.tags, context),
+        data_assets_processed: dataAssetsProcessed,
+        data_assets_stored: dataAssetsStored,
+        data_formats_accepted: dataFormatsAccepted,
+        // Communication links processed separately below
+        communication_links: undefined, // Clear input comm links here
+    }, id);
+    techAsset.title = title; // Set title explicitly
+    return techAsset;
+}
+
+// Parses the outgoing links of one source asset and registers them in modelState. Returns the number of links added.
+function parseCommunicationLinks(sourceAsset: TechnicalAsset, assetInput: InputTechnicalAsset | undefined, parsedModel: ParsedModel): number {
+    const sourceId = sourceAsset.id;
+    const commLinksInput = assetInput?.communication_links ?? {};
+    let commLinkCounter = 0;
+
+    for (const commLinkTitle in commLinksInput) {
+        const linkInput = commLinksInput[commLinkTitle];
+        const targetId = makeID(linkInput.target);
+         const context = `communication link '${commLinkTitle}' from '${sourceAsset.title}' (ID: ${sourceId}) to '${targetId}'`;
+
+        // Validate target exists
+        if (!parsedModel.technicalAssets[targetId]) {
+             throw new Error(`Missing referenced target technical asset in ${context}: ${targetId}`);
+        }
+
+        // Parse enums with defaults
+        const protocol = (linkInput.protocol as Protocol) ?? DEFAULT_COMM_LINK_PROTOCOL; // Direct cast
+        const authentication = (linkInput.authentication as Authentication) ?? DEFAULT_COMM_LINK_AUTHN;
+        const authorization = (linkInput.authorization as Authorization) ?? DEFAULT_COMM_LINK_AUTHZ;
+        const usage = parseUsage(linkInput.usage) ?? DEFAULT_COMM_LINK_USAGE;
+
+         // Validate referenced data assets
+        const dataAssetsSent = (linkInput.data_assets_sent ?? []).map(daId => {
+            if (!parsedModel.dataAssets[daId]) {
+                throw new Error(`Missing referenced data asset sent via ${context}: ${daId}`);
+            }
+            return daId;
         });
+        const dataAssetsReceived = (linkInput.data_assets_received ?? []).map(daId => {
+            if (!parsedModel.dataAssets[daId]) {
+                 throw new Error(`Missing referenced data asset received via ${context}: ${daId}`);
+            }
+            return daId;
+        });
+
+        // Create CommunicationLink instance
+         const commLink = new CommunicationLink({
+            ...linkInput,
+            // Override parsed/validated values
+            target: targetId, // Use the validated target ID
+            protocol: protocol,
+            authentication: authentication,
+            authorization: authorization,
+            usage: usage,
+            tags: checkTags(linkInput.tags, context),
+            data_assets_sent: dataAssetsSent,
+            data_assets_received: dataAssetsReceived,
+        }, sourceId, targetId); // Pass source and target IDs
+        commLink.title = commLinkTitle; // Set title from key
+
+        // Add to source asset's list
+        sourceAsset.communicationLinks.push(commLink);
+
+        // Add to global maps in modelState
+        modelState.communicationLinks[commLink.id] = commLink;
+        if (!modelState.incomingTechnicalCommunicationLinksMappedByTargetId[targetId]) {
+            modelState.incomingTechnicalCommunicationLinksMappedByTargetId[targetId] = [];
+        }
+        modelState.incomingTechnicalCommunicationLinksMappedByTargetId[targetId].push(commLink);
+        commLinkCounter++;
     }
-    // Validate nested trust boundaries exist
+    return commLinkCounter;
+}
+
+function parseTrustBoundary(
+    title: string,
+    boundaryInput: InputTrustBoundary,
+    parsedModel: ParsedModel,
+    checklistToAvoidAssetInMultipleBoundaries: Record<string, string>
+): TrustBoundary {
+    const id = makeID(boundaryInput.id);
+    const context = `trust boundary '${title}' (ID: ${id})`;
+    checkIdSyntax(id, context);
+
+    const type = (boundaryInput.type as TrustBoundaryType) ?? DEFAULT_TRUST_BOUNDARY_TYPE;
+
+    const technicalAssetsInside = (boundaryInput.technical_assets_inside ?? []).map(taId => {
+        if (!parsedModel.technicalAssets[taId]) {
+             throw new Error(`Missing referenced technical asset inside ${context}: ${taId}`);
+        }
+        if (checklistToAvoidAssetInMultipleBoundaries[taId]) {
+            throw new Error(`Technical asset ${taId} is defined inside multiple trust boundaries ('${checklistToAvoidAssetInMultipleBoundaries[taId]}' and '${id}')`);
+        }
+        checklistToAvoidAssetInMultipleBoundaries[taId] = id;
+        return taId;
+    });
+
+    // Nested boundaries validated later
+    const trustBoundariesNested = (boundaryInput.trust_boundaries_nested ?? []).map(tbId => makeID(tbId));
+
+    const trustBoundary = new TrustBoundary({
+        ...boundaryInput,
+        id: id,
+        type: type,
+        tags: checkTags(boundaryInput.tags, context),
+        technical_assets_inside: technicalAssetsInside,
+        trust_boundaries_nested: trustBoundariesNested, // Use mapped IDs
+    }, id);
+    trustBoundary.title = title;
+    return trustBoundary;
+}
+
+// Validate nested trust boundaries exist
+function validateNestedTrustBoundaries(parsedModel: ParsedModel): void {
     for(const tbId in parsedModel.trustBoundaries) {
         const tb = parsedModel.trustBoundaries[tbId];
         tb.trustBoundariesNested.forEach(nestedId => {
@@ -559,48 +783,33 @@ export function parseModel(modelYaml: string): ParsedModel {
             // Deeper cycle check might be needed if complex nesting occurs
         });
     }
-    console.log(`Parsed ${Object.keys(parsedModel.trustBoundaries).length} trust boundaries.`);
+}
 
+function parseSharedRuntime(title: string, runtimeInput: InputSharedRuntime, parsedModel: ParsedModel): SharedRuntime {
+    const id = makeID(runtimeInput.id);
+    const context = `shared runtime '${title}' (ID: ${id})`;
+     checkIdSyntax(id, context);
 
-    // --- Shared Runtimes ---
-    console.log("Parsing shared runtimes...");
-    for (const title in modelInput.shared_runtimes) {
-        const runtimeInput = modelInput.shared_runtimes[title];
-        const id = makeID(runtimeInput.id);
-        const context = `shared runtime '${title}' (ID: ${id})`;
-         checkIdSyntax(id, context);
-        if (parsedModel.sharedRuntimes[id]) {
-            throw new Error(`Duplicate shared runtime ID used: ${id}`);
+    const technicalAssetsRunning = (runtimeInput.technical_assets_running ?? []).map(taId => {
+        if (!parsedModel.technicalAssets[taId]) {
+            throw new Error(`Missing referenced technical asset running on ${context}: ${taId}`);
         }
+        // Optionally check if asset is already in another runtime if that's disallowed
+        return taId;
+    });
 
-        const technicalAssetsRunning = (runtimeInput.technical_assets_running ?? []).map(taId => {
-            if (!parsedModel.technicalAssets[taId]) {
-                throw new Error(`Missing referenced technical asset running on ${context}: ${taId}`);
-            }
-            // Optionally check if asset is already in another runtime if that's disallowed
-            return taId;
-        });
-
-
-        const sharedRuntime = new SharedRuntime({
-            ...runtimeInput,
-            id: id,
-            tags: checkTags(runtimeInput.tags, context),
-            technical_assets_running: technicalAssetsRunning,
-        }, id);
-        sharedRuntime.title = title;
-
-        parsedModel.sharedRuntimes[id] = sharedRuntime;
 
-        // Populate mapping
-        technicalAssetsRunning.forEach(taId => {
-            modelState.directContainingSharedRuntimeMappedByTechnicalAssetId[taId] = sharedRuntime;
-        });
-    }
-    console.log(`Parsed ${Object.keys(parsedModel.sharedRuntimes).length} shared runtimes.`);
+    const sharedRuntime = new SharedRuntime({
+        ...runtimeInput,
+        id: id,
+        tags: checkTags(runtimeInput.tags, context),
+        technical_assets_running: technicalAssetsRunning,
+    }, id);
+    sharedRuntime.title = title;
+    return sharedRuntime;
+}
 
-    // --- Individual Risk Categories (Used for Custom Risks and Pre-defined Risk Instances) ---
-    console.log("Parsing individual risk categories and instances...");
+function parseIndividualRiskCategories(modelInput: ModelInput, parsedModel: ParsedModel): void {
     for (const title in modelInput.individual_risk_categories) {
         const catInput = modelInput.individual_risk_categories[title];
         const id = makeID(catInput.id);
@@ -719,11 +928,10 @@ export function parseModel(modelYaml: string): ParsedModel {
 
         }
     }
-    console.log(`Parsed ${Object.keys(parsedModel.individualRiskCategories).length} individual risk categories.`);
-
+}
 
-    // --- Risk Tracking ---
-    console.log("Parsing risk tracking entries...");
+function parseRiskTracking(modelInput: ModelInput): Record<string, RiskTracking> {
+    const riskTracking: Record<string, RiskTracking> = {};
     for (const syntheticRiskId in modelInput.risk_tracking) {
         const trackingInput = modelInput.risk_tracking[syntheticRiskId];
         const context = `risk tracking for '${syntheticRiskId}'`;
@@ -748,30 +956,26 @@ export function parseModel(modelYaml: string): ParsedModel {
 
         const tracking: RiskTracking = {
             syntheticRiskId: syntheticRiskId.trim(), // Keep original ID with potential wildcards for later matching
-            justification: trackingInput.justification ?? '',
-            ticket: trackingInput.ticket ?? '',
-            checkedBy: trackingInput.checked_by ?? '',
+            justification: String(trackingInput.justification ?? ''),
+            ticket: String(trackingInput.ticket ?? ''), // YAML reads ticket numbers as numbers
+            checkedBy: String(trackingInput.checked_by ?? ''),
             status: status,
             date: trackingDate,
         };
 
         // Store all tracking entries, including wildcards. Validation happens later.
-        parsedModel.riskTracking[tracking.syntheticRiskId] = tracking;
+        riskTracking[tracking.syntheticRiskId] = tracking;
     }
-    console.log(`Parsed ${Object.keys(parsedModel.riskTracking).length} risk tracking entries.`);
-
-
-    // --- Final Steps ---
-    console.log("Calculating RAA...");
-    calculateRAA(); // Call the RAA calculation function
-
-    console.log("Model parsing complete.");
-    return parsedModel;
+    return riskTracking;
 }
 
 
 // Generates risks based on the parsed model and registered rules
-export function generateRisks(customRiskRules: CustomRiskRule[] = [], skippedRuleIds: Set<string> = new Set()): Map<RiskCategory, Risk[]> {
+export function generateRisks(customRiskRules: CustomRiskRule[] = [], skippedRuleIds: Set<string> = new Set(), context: ModelContext = modelState): Map<RiskCategory, Risk[]> {
+    return withModelContext(context, () => generateRisksInActiveContext(customRiskRules, skippedRuleIds));
+}
+
+function generateRisksInActiveContext(customRiskRules: CustomRiskRule[] = [], skippedRuleIds: Set<string> = new Set()): Map<RiskCategory, Risk[]> {
     if (!modelState.parsedModelRoot) {
         throw new Error("Model not parsed. Call parseModel first.");
     }
@@ -795,53 +999,70 @@ export function generateRisks(customRiskRules: CustomRiskRule[] = [], skippedRul
          }
      }
 
+    const activeRules: CustomRiskRule[] = [];
     for (const rule of allRules) {
         const category = rule.category();
         if (skippedRuleIds.has(category.id)) {
             console.log(`Skipping risk rule: ${category.id} - ${category.title}`);
             continue;
         }
-
-        try {
-            // console.log(`Executing risk rule: ${category.id} - ${category.title}`); // Verbose
-            // Add supported tags (ensure modelState is updated)
-            // modelState.addToListOfSupportedTags(rule.supportedTags()); // addToListOfSupportedTags needs export or move
-            rule.supportedTags().forEach(tag => modelState.allSupportedTags[tag] = true);
-
-            const generated = rule.generateRisks();
-
-            if (generated.length > 0) {
-                // console.log(`Rule ${category.id} generated ${generated.length} risk(s).`); // Verbose
-                const existingRisks = modelState.generatedRisksByCategory.get(category) || [];
-                const updatedRisks = [...existingRisks, ...generated];
-                modelState.generatedRisksByCategory.set(category, updatedRisks);
-
-                // Update the map keyed by synthetic ID
-                generated.forEach(risk => {
-                    const lowerId = risk.syntheticId.toLowerCase();
-                    if (modelState.generatedRisksBySyntheticId[lowerId]) {
-                         // This can happen if a built-in rule generates the same risk as an individual definition
-                        console.warn(`Duplicate synthetic risk ID detected during generation: ${risk.syntheticId}. Keeping existing entry (potentially from individual definition).`);
-                    } else {
-                        modelState.generatedRisksBySyntheticId[lowerId] = risk;
-                    }
-                });
-            }
-        } catch (error) {
-            console.error(`Error executing risk rule ${category.id} (${category.title}):`, error);
-            // Decide whether to continue or re-throw
-            // throw error; // Stop execution on first error
-        }
+        runRiskRule(rule, category);
+        activeRules.push(rule);
     }
+    engineState().ruleSet = { customRiskRules, skippedRuleIds, dependencyIndex: buildRiskRuleDependencyIndex(activeRules) };
 
     console.log(`Risk generation complete. Total risks identified: ${Object.keys(modelState.generatedRisksBySyntheticId).length}`);
+    logDerivedValueStats();
     return modelState.generatedRisksByCategory;
 }
 
-// Applies and validates risk tracking information
-// Note: This version primarily validates. Attaching status to risks for output
-// is often done in the reporting/serialization step.
-export function applyRiskTracking(ignoreOrphaned: boolean = false): void {
+function logDerivedValueStats(): void {
+    const { hits, misses, hitRate } = getDerivedValueStats();
+    console.log(`Derived value cache: ${hits} hits, ${misses} misses (${(hitRate * 100).toFixed(1)}% hit rate).`);
+}
+
+// Executes a single rule and merges its risks into the modelState collections
+function runRiskRule(rule: CustomRiskRule, category: RiskCategory): void {
+    try {
+        // console.log(`Executing risk rule: ${category.id} - ${category.title}`); // Verbose
+        // Add supported tags (ensure modelState is updated)
+        // modelState.addToListOfSupportedTags(rule.supportedTags()); // addToListOfSupportedTags needs export or move
+        rule.supportedTags().forEach(tag => modelState.allSupportedTags[tag] = true);
+
+        const generated = rule.generateRisks();
+
+        if (generated.length > 0) {
+            // console.log(`Rule ${category.id} generated ${generated.length} risk(s).`); // Verbose
+            const existingRisks = modelState.generatedRisksByCategory.get(category) || [];
+            const updatedRisks = [...existingRisks, ...generated];
+            modelState.generatedRisksByCategory.set(category, updatedRisks);
+
+            // Update the map keyed by synthetic ID
+            generated.forEach(risk => {
+                const lowerId = risk.syntheticId.toLowerCase();
+                if (modelState.generatedRisksBySyntheticId[lowerId]) {
+                     // This can happen if a built-in rule generates the same risk as an individual definition
+                    console.warn(`Duplicate synthetic risk ID detected during generation: ${risk.syntheticId}. Keeping existing entry (potentially from individual definition).`);
+                } else {
+                    modelState.generatedRisksBySyntheticId[lowerId] = risk;
+                }
+            });
+            invalidateRiskIndex();
+        }
+    } catch (error) {
+        console.error(`Error executing risk rule ${category.id} (${category.title}):`, error);
+        // Decide whether to continue or re-throw
+        // throw error; // Stop execution on first error
+    }
+}
+
+// Applies and validates risk tracking information. The matching itself happens in
+// getRiskTrackingResolution, which Risk.getRiskTracking() reads the status from.
+export function applyRiskTracking(ignoreOrphaned: boolean = false, context: ModelContext = modelState): void {
+    return withModelContext(context, () => applyRiskTrackingInActiveContext(ignoreOrphaned));
+}
+
+function applyRiskTrackingInActiveContext(ignoreOrphaned: boolean = false): void {
     if (!modelState.parsedModelRoot) {
         throw new Error("Model not parsed. Call parseModel first.");
     }
@@ -851,71 +1072,378 @@ export function applyRiskTracking(ignoreOrphaned: boolean = false): void {
      }
 
     console.log("Applying and validating risk tracking...");
-    let orphanedCount = 0;
-    let matchedCount = 0;
-    const appliedTracking = new Set<string>(); // Track applied exact matches
+    invalidateRiskIndex(); // Re-resolve against the current risks and tracking entries
+    const resolution = getRiskTrackingResolution();
+
+    for (const syntheticRiskId of resolution.orphanedIds) {
+        const message = `Risk tracking references unknown risk (exact ID not found): ${syntheticRiskId}`;
+        if (ignoreOrphaned) {
+            console.warn(message);
+        } else {
+            // Provide more context like the Go version
+             throw new Error(message + "\n\nNOTE: Ensure the synthetic risk ID in your tracking section matches a generated risk. Check IDs in generated reports/JSON. You might need to use the 'ignore-orphaned-risk-tracking' option (or equivalent flag).");
+        }
+    }
+    for (const wildcardId of resolution.unmatchedWildcardIds) {
+        console.warn(`Wildcard risk tracking entry did not match any remaining risks: ${wildcardId}`);
+    }
+
+    console.log(`Risk tracking validation complete. Matched: ${resolution.matchedCount}, Orphaned/Unmatched: ${resolution.orphanedIds.length + resolution.unmatchedWildcardIds.length}`);
+}
+
+
+// --- Incremental Model Updates ---
+
+// A single path-level edit, using the same paths the editor passes to Document.setIn/deleteIn
+export interface ModelEdit {
+    op: 'set' | 'delete';
+    path: (string | number)[];
+    value?: unknown;
+}
+
+// Input fields the RAA calculation reads (see raa/multifactor/multi.ts), for rules depending on `raa`
+const raaTechnicalAssetFields = [
+    'confidentiality', 'integrity', 'availability', 'data_assets_processed', 'data_assets_stored', 'internet',
+    'used_as_client_by_human', 'multi_tenant', 'custom_developed_parts', 'technology', 'out_of_scope',
+];
+const raaDataAssetFields = ['confidentiality', 'integrity', 'availability'];
 
-    const riskTrackingEntries = modelState.parsedModelRoot.riskTracking;
+/**
+ * Maps dependency keys to the rules reading them. Keys are "<section>.<field>" for
+ * technical_assets, communication_links and data_assets ("<section>.*" matches any field of
+ * the section), plus "trust_boundaries" and "shared_runtimes" for any change in those sections.
+ */
+interface RiskRuleDependencyIndex {
+    rulesByKey: Map<string, Set<CustomRiskRule>>;
+    undeclaredRules: Set<CustomRiskRule>; // Re-run after every edit
+    rules: CustomRiskRule[]; // Active rules in generation order
+}
+
+// True once parseModel succeeded and the retained input can be patched via applyModelEdits
+export function hasIncrementalModel(context: ModelContext = modelState): boolean {
+    return withModelContext(context, () => engineState().modelInput !== null && !!modelState.parsedModelRoot);
+}
+
+export function getGeneratedRisks(context: ModelContext = modelState): Map<RiskCategory, Risk[]> {
+    return context.generatedRisksByCategory;
+}
 
-    // --- Handle Exact Matches First ---
-    for (const syntheticRiskId in riskTrackingEntries) {
-        if (syntheticRiskId.includes('*')) continue; // Skip wildcards for now
+/**
+ * Applies path-level edits to the last parsed model instead of re-parsing the whole YAML.
+ * Only the touched data assets, technical assets (with their outgoing links), trust boundaries
+ * and shared runtimes are rebuilt, RAA is recalculated for the affected assets only and the
+ * risk rules are re-run only when a field they read has changed. Edits that can't be
+ * localised (new/removed/renamed entities, changed IDs, top-level settings, individual risk
+ * categories) fall back to a full rebuild from the retained input.
+ */
+export function applyModelEdits(edits: ModelEdit[], context: ModelContext = modelState): ParsedModel {
+    return withModelContext(context, () => applyModelEditsInActiveContext(edits));
+}
 
-        const tracking = riskTrackingEntries[syntheticRiskId];
-        const lowerId = syntheticRiskId.toLowerCase();
+function applyModelEditsInActiveContext(edits: ModelEdit[]): ParsedModel {
+    const { modelInput, ruleSet } = engineState();
+    if (!modelInput || !modelState.parsedModelRoot) {
+        throw new Error("Model not parsed. Call parseModel first.");
+    }
+    const parsedModel = modelState.parsedModelRoot;
 
-        if (modelState.generatedRisksBySyntheticId[lowerId]) {
-            matchedCount++;
-            appliedTracking.add(lowerId);
-            // console.log(`Tracking applied to risk: ${lowerId} -> Status: ${tracking.status}`); // Verbose
-            // In Go, status was directly updated on the risk object here.
-            // In TS, we might prefer to look up tracking status when needed (e.g., Risk.getRiskTracking()).
+    let fullRebuild = false;
+    let trackingAffected = false;
+    const dependencyKeys = new Set<string>();
+    const touchedDataAssets = new Set<string>();
+    const touchedTechnicalAssets = new Set<string>();
+    const touchedTrustBoundaries = new Set<string>();
+    const touchedSharedRuntimes = new Set<string>();
+
+    for (const edit of edits) {
+        if (edit.path.length === 0) {
+            fullRebuild = true;
+            continue;
+        }
+        if (edit.op === 'delete') {
+            deleteInModelInput(modelInput, edit.path);
         } else {
-            orphanedCount++;
-            const message = `Risk tracking references unknown risk (exact ID not found): ${syntheticRiskId}`;
-            if (ignoreOrphaned) {
-                console.warn(message);
-            } else {
-                // Provide more context like the Go version
-                 throw new Error(message + "\n\nNOTE: Ensure the synthetic risk ID in your tracking section matches a generated risk. Check IDs in generated reports/JSON. You might need to use the 'ignore-orphaned-risk-tracking' option (or equivalent flag).");
+            setInModelInput(modelInput, edit.path, edit.value);
+        }
+
+        const [section, title, field] = edit.path.map(String);
+        if (section === 'risk_tracking') {
+            trackingAffected = true;
+            continue;
+        }
+        // Adding, removing or replacing a whole entity (or changing its ID) moves references around
+        if (edit.path.length < 3 || field === 'id') {
+            fullRebuild = true;
+            continue;
+        }
+        switch (section) {
+            case 'data_assets': touchedDataAssets.add(title); break;
+            case 'technical_assets': touchedTechnicalAssets.add(title); break;
+            case 'trust_boundaries': touchedTrustBoundaries.add(title); break;
+            case 'shared_runtimes': touchedSharedRuntimes.add(title); break;
+            default: fullRebuild = true; continue;
+        }
+        dependencyKeysOfEdit(edit.path).forEach(key => dependencyKeys.add(key));
+    }
+
+    if (!fullRebuild) {
+        try {
+            const changedRaaAssetIds = new Set<string>();
+            // Highest CIA values depend on the assets and data assets being patched below
+            invalidateDerivedValues();
+            resetDerivedValueStats();
+            fullRebuild =
+                ![...touchedDataAssets].every(title => patchDataAsset(title, parsedModel, changedRaaAssetIds)) ||
+                ![...touchedTechnicalAssets].every(title => patchTechnicalAsset(title, parsedModel, changedRaaAssetIds)) ||
+                ![...touchedTrustBoundaries].every(title => patchTrustBoundary(title, parsedModel)) ||
+                ![...touchedSharedRuntimes].every(title => patchSharedRuntime(title, parsedModel));
+
+            if (!fullRebuild) {
+                if (touchedTrustBoundaries.size > 0) {
+                    indexTrustBoundaryNesting(parsedModel.trustBoundaries);
+                    validateNestedTrustBoundaries(parsedModel);
+                }
+                if (touchedSharedRuntimes.size > 0) {
+                    indexSharedRuntimeMembership(parsedModel.sharedRuntimes);
+                }
+                if (touchedTechnicalAssets.size > 0) {
+                    indexDataAssetUsage(parsedModel.technicalAssets, modelState.communicationLinks);
+                }
+                if (trackingAffected) {
+                    parsedModel.riskTracking = parseRiskTracking(modelInput);
+                    invalidateRiskIndex();
+                }
+                if (changedRaaAssetIds.size > 0) {
+                    calculateRAA(changedRaaAssetIds);
+                }
+                if (ruleSet) {
+                    const affectedRules = riskRulesAffectedBy(ruleSet.dependencyIndex, dependencyKeys);
+                    rerunRiskRules(affectedRules, ruleSet.skippedRuleIds);
+                    console.log(`Re-ran ${affectedRules.length} of ${ruleSet.dependencyIndex.rules.length} risk rule(s).`);
+                }
+                logDerivedValueStats();
+                console.log(`Applied ${edits.length} model edit(s) incrementally.`);
+                return parsedModel;
             }
+        } catch (e) {
+            // Leave the half-patched state behind; the rebuild below reports the validation error properly
+            console.warn("Incremental model update failed, rebuilding the full model:", e);
         }
     }
 
-    // --- Handle Wildcard Matches ---
-    // Basic wildcard implementation (simple '*' match anywhere)
-    // Go's version might be more sophisticated (matching parts between '@')
-    for (const wildcardId in riskTrackingEntries) {
-        if (!wildcardId.includes('*')) continue;
+    console.log(`Model edit(s) can't be applied incrementally, rebuilding the full model...`);
+    return rebuildModelFromInput(modelInput);
+}
 
-        const tracking = riskTrackingEntries[wildcardId];
-        const regex = new RegExp('^' + wildcardId.replace(/\*/g, '.*') + '$', 'i'); // Create regex from wildcard
+function rebuildModelFromInput(modelInput: ModelInput): ParsedModel {
+    initModelState();
+    const parsedModel = buildParsedModel(modelInput);
+    engineState().modelInput = modelInput;
+    const ruleSet = engineState().ruleSet;
+    if (ruleSet) {
+        generateRisks(ruleSet.customRiskRules, ruleSet.skippedRuleIds);
+    }
+    return parsedModel;
+}
 
-        let wildcardMatched = false;
-        for (const generatedRiskId in modelState.generatedRisksBySyntheticId) {
-             if (appliedTracking.has(generatedRiskId)) {
-                continue; // Already matched by an exact entry
-            }
-             if (regex.test(generatedRiskId)) {
-                // console.log(`Wildcard tracking '${wildcardId}' applied to risk: ${generatedRiskId} -> Status: ${tracking.status}`); // Verbose
-                // Mark this risk as handled by a wildcard to avoid double-matching if multiple wildcards fit
-                // This requires modifying the risk or keeping a separate 'handled' set
-                 // For simplicity, we won't prevent double matching here, but a real implementation might need it.
-                 // If modifying risk: modelState.generatedRisksBySyntheticId[generatedRiskId].status = tracking.status;
-                matchedCount++; // Counting potential matches here, could be >1 per wildcard
-                wildcardMatched = true;
-                 // Apply the tracking status (conceptual - see note above)
+function buildRiskRuleDependencyIndex(rules: CustomRiskRule[]): RiskRuleDependencyIndex {
+    const index: RiskRuleDependencyIndex = { rulesByKey: new Map(), undeclaredRules: new Set(), rules };
+    const addKey = (key: string, rule: CustomRiskRule) => {
+        if (!index.rulesByKey.has(key)) index.rulesByKey.set(key, new Set());
+        index.rulesByKey.get(key)!.add(rule);
+    };
+    const addFields = (section: string, fields: string[], rule: CustomRiskRule) => {
+        fields.forEach(field => addKey(`${section}.${field}`, rule));
+        if (fields.length > 0) addKey(`${section}.*`, rule);
+    };
+
+    for (const rule of rules) {
+        const dependencies: RiskRuleDependencies | undefined = rule.dependencies?.();
+        if (!dependencies) {
+            index.undeclaredRules.add(rule);
+            continue;
+        }
+        addFields('technical_assets', dependencies.technicalAssetFields ?? [], rule);
+        addFields('communication_links', dependencies.communicationLinkFields ?? [], rule);
+        addFields('data_assets', dependencies.dataAssetFields ?? [], rule);
+        if (dependencies.raa) {
+            addFields('technical_assets', raaTechnicalAssetFields, rule);
+            addFields('data_assets', raaDataAssetFields, rule);
+        }
+        if (dependencies.trustBoundaries) addKey('trust_boundaries', rule);
+        if (dependencies.sharedRuntimes) addKey('shared_runtimes', rule);
+    }
+    return index;
+}
+
+// Dependency keys (see RiskRuleDependencyIndex) an edit below an existing entity can change
+function dependencyKeysOfEdit(path: (string | number)[]): string[] {
+    const [section, , field] = path.map(String);
+    switch (section) {
+        case 'trust_boundaries':
+        case 'shared_runtimes':
+            return [section];
+        case 'data_assets':
+            return [`data_assets.${field}`];
+        case 'technical_assets':
+            if (field !== 'communication_links') {
+                return [`technical_assets.${field}`];
             }
+            // technical_assets/<title>/communication_links/<link title>/<field>
+            return path.length >= 5
+                ? [`communication_links.${path[4]}`]
+                : ['technical_assets.communication_links', 'communication_links.*'];
+        default:
+            return [];
+    }
+}
+
+function riskRulesAffectedBy(index: RiskRuleDependencyIndex, dependencyKeys: Set<string>): CustomRiskRule[] {
+    if (dependencyKeys.size === 0) return [];
+    const affected = new Set<CustomRiskRule>(index.undeclaredRules);
+    for (const key of dependencyKeys) {
+        index.rulesByKey.get(key)?.forEach(rule => affected.add(rule));
+    }
+    return index.rules.filter(rule => affected.has(rule));
+}
+
+function patchDataAsset(title: string, parsedModel: ParsedModel, changedRaaAssetIds: Set<string>): boolean {
+    const assetInput = engineState().modelInput?.data_assets?.[title];
+    if (!assetInput) return false;
+    const dataAsset = parseDataAsset(title, assetInput, parsedModel);
+    const previous = parsedModel.dataAssets[dataAsset.id];
+    if (!previous || previous.title !== title) return false;
+
+    parsedModel.dataAssets[dataAsset.id] = dataAsset;
+    // The RAA of every asset handling this data depends on its CIA rating
+    for (const techAsset of Object.values(parsedModel.technicalAssets)) {
+        if (techAsset.dataAssetsProcessed.includes(dataAsset.id) || techAsset.dataAssetsStored.includes(dataAsset.id)) {
+            changedRaaAssetIds.add(techAsset.id);
+        }
+    }
+    return true;
+}
+
+function patchTechnicalAsset(title: string, parsedModel: ParsedModel, changedRaaAssetIds: Set<string>): boolean {
+    const assetInput = engineState().modelInput?.technical_assets?.[title];
+    if (!assetInput) return false;
+    const techAsset = parseTechnicalAsset(title, assetInput, parsedModel);
+    const previous = parsedModel.technicalAssets[techAsset.id];
+    if (!previous || previous.title !== title) return false;
+
+    removeOutgoingCommunicationLinks(previous);
+    techAsset.raa = previous.raa;
+    parsedModel.technicalAssets[techAsset.id] = techAsset;
+    parseCommunicationLinks(techAsset, assetInput, parsedModel);
+    changedRaaAssetIds.add(techAsset.id);
+    return true;
+}
+
+function removeOutgoingCommunicationLinks(sourceAsset: TechnicalAsset): void {
+    for (const commLink of sourceAsset.communicationLinks) {
+        if (modelState.communicationLinks[commLink.id] === commLink) {
+            delete modelState.communicationLinks[commLink.id];
         }
-         if (!wildcardMatched) {
-            // This wildcard didn't match any *unmatched* risks
-             // It might have matched already exactly-matched risks, which is harder to track without modifying risks
-             console.warn(`Wildcard risk tracking entry did not match any remaining risks: ${wildcardId}`);
+        const incoming = modelState.incomingTechnicalCommunicationLinksMappedByTargetId[commLink.targetId];
+        if (incoming) {
+            modelState.incomingTechnicalCommunicationLinksMappedByTargetId[commLink.targetId] = incoming.filter(link => link !== commLink);
         }
     }
+}
 
+function patchTrustBoundary(title: string, parsedModel: ParsedModel): boolean {
+    const boundaryInput = engineState().modelInput?.trust_boundaries?.[title];
+    if (!boundaryInput) return false;
+    const previous = parsedModel.trustBoundaries[makeID(boundaryInput.id)];
+    if (!previous || previous.title !== title) return false;
+
+    // Assets placed by the other boundaries still count against the single-boundary check
+    const containingMap = modelState.directContainingTrustBoundaryMappedByTechnicalAssetId;
+    const checklistToAvoidAssetInMultipleBoundaries: Record<string, string> = {};
+    for (const taId in containingMap) {
+        if (containingMap[taId] !== previous) {
+            checklistToAvoidAssetInMultipleBoundaries[taId] = containingMap[taId].id;
+        }
+    }
+    const trustBoundary = parseTrustBoundary(title, boundaryInput, parsedModel, checklistToAvoidAssetInMultipleBoundaries);
 
-    console.log(`Risk tracking validation complete. Matched: ${matchedCount}, Orphaned/Unmatched: ${orphanedCount}`);
+    previous.technicalAssetsInside.forEach(taId => {
+        if (containingMap[taId] === previous) delete containingMap[taId];
+    });
+    parsedModel.trustBoundaries[trustBoundary.id] = trustBoundary;
+    trustBoundary.technicalAssetsInside.forEach(taId => {
+        containingMap[taId] = trustBoundary;
+    });
+    return true;
+}
+
+function patchSharedRuntime(title: string, parsedModel: ParsedModel): boolean {
+    const runtimeInput = engineState().modelInput?.shared_runtimes?.[title];
+    if (!runtimeInput) return false;
+    const sharedRuntime = parseSharedRuntime(title, runtimeInput, parsedModel);
+    const previous = parsedModel.sharedRuntimes[sharedRuntime.id];
+    if (!previous || previous.title !== title) return false;
+
+    const containingMap = modelState.directContainingSharedRuntimeMappedByTechnicalAssetId;
+    previous.technicalAssetsRunning.forEach(taId => {
+        if (containingMap[taId] === previous) delete containingMap[taId];
+    });
+    parsedModel.sharedRuntimes[sharedRuntime.id] = sharedRuntime;
+    sharedRuntime.technicalAssetsRunning.forEach(taId => {
+        containingMap[taId] = sharedRuntime;
+    });
+    return true;
+}
+
+// Replaces the risks of the given rules with a fresh run, leaving all other categories untouched
+function rerunRiskRules(rules: CustomRiskRule[], skippedRuleIds: Set<string>): void {
+    for (const rule of rules) {
+        const category = rule.category();
+        if (skippedRuleIds.has(category.id)) continue;
+        removeRisksOfCategory(category);
+        runRiskRule(rule, category);
+    }
+}
+
+function removeRisksOfCategory(category: RiskCategory): void {
+    const risks = modelState.generatedRisksByCategory.get(category);
+    if (!risks) return;
+    for (const risk of risks) {
+        const lowerId = risk.syntheticId.toLowerCase();
+        // Only drop entries this category owns (duplicates of individual risks were never inserted)
+        if (modelState.generatedRisksBySyntheticId[lowerId] === risk) {
+            delete modelState.generatedRisksBySyntheticId[lowerId];
+        }
+    }
+    modelState.generatedRisksByCategory.delete(category);
+    invalidateRiskIndex();
+}
+
+// Plain-object counterparts of Document.setIn/deleteIn for the retained model input
+function setInModelInput(modelInput: ModelInput, path: (string | number)[], value: unknown): void {
+    let node = modelInput as unknown as Record<string | number, unknown>;
+    for (let i = 0; i < path.length - 1; i++) {
+        const next = node[path[i]];
+        if (next === null || typeof next !== 'object') {
+            node[path[i]] = typeof path[i + 1] === 'number' ? [] : {};
+        }
+        node = node[path[i]] as Record<string | number, unknown>;
+    }
+    node[path[path.length - 1]] = value;
+}
+
+function deleteInModelInput(modelInput: ModelInput, path: (string | number)[]): void {
+    let node: unknown = modelInput;
+    for (let i = 0; i < path.length - 1; i++) {
+        node = (node as Record<string | number, unknown>)[path[i]];
+        if (node === null || typeof node !== 'object') return;
+    }
+    const key = path[path.length - 1];
+    if (Array.isArray(node) && typeof key === 'number') {
+        node.splice(key, 1);
+    } else {
+        delete (node as Record<string | number, unknown>)[key];
+    }
 }
 
 
@@ -934,10 +1462,10 @@ function encodeHTML(str: string): string {
   }
   // Chain the replacements
   return str
-    .replace(/&/g, '&')
-    .replace(/</g, '<')
-    .replace(/>/g, '>')
-    .replace(/"/g, '"')
+    .replace(/&/g, '&amp;')
+    .replace(/</g, '&lt;')
+    .replace(/>/g, '&gt;')
+    .replace(/"/g, '&quot;')
     .replace(/'/g, '&apos;'); 
 }
 
@@ -947,7 +1475,7 @@ function encodeHTML(str: string): string {
 
 
 // Data Asset Diagram: Technical Asset Node (simplified)
-function createTechAssetNodeForDataDiagram(asset: TechnicalAsset): { id: string; attributes: NodeAttributes } {
+function createTechAssetNodeForDataDiagram(asset: TechnicalAsset): { id: string; attributes: DotAttributes } {
     const nodeId = safeDotId(asset.id);
     // Ensure colors are valid strings (hex or standard names)
     // Provide defaults if color functions might not exist or return undefined
@@ -973,24 +1501,24 @@ function createTechAssetNodeForDataDiagram(asset: TechnicalAsset): { id: string;
 
     const fontColor = colors.White ?? '#FFFFFF'; // Use default if White is undefined
 
-    const nodeAttrs: NodeAttributes = {
+    const nodeAttrs: DotAttributes = {
         [_.shape]: 'box',        // Use string 'box'
         [_.style]: 'filled',     // Use string 'filled'
         [_.fillcolor]: fillColor, // Use calculated color string
         [_.color]: fillColor,     // Border color same as fill for this style
         [_.penwidth]: 3.0,
         [_.fontcolor]: fontColor, // Use calculated color string
-        // Use direct HTML string for label
-        [_.label]: `<b>${encodeHTML(asset.title)}</b>`,
+        // HTML-like label
+        [_.label]: html(`<b>${encodeHTML(asset.title)}</b>`),
     };
     return { id: nodeId, attributes: nodeAttrs };
 }
 
 /**
  * Creates attributes for a Data Asset node in the Data Asset Diagram.
- * Corrected for ts-graphviz: uses string literals and direct HTML labels.
+ * Uses string literals and an HTML-like label (see html in dot/dot-writer.ts).
  */
-function createDataAssetNodeModel(asset: DataAsset): { id: string; attributes: NodeAttributes } {
+function createDataAssetNodeModel(asset: DataAsset): { id: string; attributes: DotAttributes } {
      const nodeId = safeDotId(asset.id);
      const defaultColor = '#808080'; // Grey as default
      let fillColor = colors.DarkGray ?? defaultColor; // Use default if DarkGray is undefined
@@ -1008,51 +1536,18 @@ function createDataAssetNodeModel(asset: DataAsset): { id: string; attributes: N
 
      const fontColor = colors.White ?? '#FFFFFF'; // Use default if White is undefined
 
-     const nodeAttrs: NodeAttributes = {
+     const nodeAttrs: DotAttributes = {
          [_.shape]: 'box',        // Use string 'box'
          [_.style]: 'filled',     // Use string 'filled'
          [_.fillcolor]: fillColor, // Use calculated color string
          [_.color]: fillColor,     // Border color same as fill for this style
          [_.penwidth]: 3.0,
          [_.fontcolor]: fontColor, // Use calculated color string
-         // Use direct HTML string for label
-         [_.label]: `<b>${encodeHTML(asset.title)}</b>`,
+         // HTML-like label
+         [_.label]: html(`<b>${encodeHTML(asset.title)}</b>`),
      };
      return { id: nodeId, attributes: nodeAttrs };
 }
-/**
- * Corrects the DOT string output from ts-graphviz for HTML labels
- * by changing "label = <...html...>" (potentially with a semicolon)
- * to the standard "label=<...html...>".
- */
-function fixDotHtmlLabelSyntax(dotString: string): string {
-    // This regex finds "label", optional whitespace, "=", optional whitespace,
-    // then captures the entire <...> HTML tag, and matches an optional trailing semicolon.
-    // It replaces the incorrect assignment with the standard DOT label=<...> syntax.
-    // Handles different root HTML tags like <table>, <font>, <b> etc.
-    // - `label\s*=\s*`: Matches 'label = ' with optional whitespace.
-    // - `(`             : Start capture group 1 (the full HTML tag).
-    //   - `<`           : Matches the opening '<'.
-    //   - `([a-zA-Z]+)` : Capture group 2: the HTML tag name (table, font, etc.).
-    //   - `(?:[^>"]*|"[^"]*")*`: Matches attributes, handling quoted values correctly.
-    //   - `>`           : Matches the closing '>'.
-    //   - `[\s\S]*?`    : Matches content non-greedily.
-    //   - `<\/\2>`      : Matches the corresponding closing tag using backreference \2.
-    // - `)`             : End capture group 1.
-    // - `\s*;?`         : Matches optional whitespace and an optional semicolon.
-    // - `gs`            : Global search, dot matches newline.
-    const regex = /label\s*=\s*(<([a-zA-Z]+)(?:[^>"]*|"[^"]*")*>[\s\S]*?<\/\2>)\s*;?/gs;
-    const correctedDot = dotString.replace(regex, 'label=<$1>');
-
-    if (correctedDot !== dotString) {
-        console.log("Applied DOT HTML label syntax correction.");
-    } else {
-        // Add more logging if it fails to find the pattern
-        // console.warn("DOT HTML label syntax correction did not find any matches.");
-        // console.log("Original DOT snippet causing issues:", dotString.substring(0, 1000)); // Log start of string
-    }
-    return correctedDot;
-}
 // --- Add this function definition within the same scope as
 //     internalGenerateDataFlowDiagramDot_MatchGoodLayout ---
 
@@ -1088,7 +1583,11 @@ function getTrustBoundaryId(
 
 // THE MAIN FUNCTION WITH CORRECTIONS
 
-export function initModelState(): void {
+export function initModelState(context: ModelContext = modelState): void {
+    return withModelContext(context, () => initModelStateInActiveContext());
+}
+
+function initModelStateInActiveContext(): void {
   modelState.parsedModelRoot = undefined;
   modelState.dataAssets = {};
   modelState.technicalAssets = {};
@@ -1098,12 +1597,112 @@ export function initModelState(): void {
   modelState.incomingTechnicalCommunicationLinksMappedByTargetId = {};
   modelState.directContainingTrustBoundaryMappedByTechnicalAssetId = {};
   modelState.directContainingSharedRuntimeMappedByTechnicalAssetId = {};
+  resetTopologyIndexes();
+  invalidateDerivedValues();
+  resetDerivedValueStats();
+  modelState.raaRawScores.clear();
   modelState.generatedRisksByCategory = new Map<RiskCategory, Risk[]>();
   modelState.generatedRisksBySyntheticId = {};
+  invalidateRiskIndex();
   modelState.allSupportedTags = {};
+  engineState().modelInput = null;
   // Add any other state properties that need resetting
   console.log("Model state initialized/reset.");
 }
+// --- Data Flow Diagram DOT, assembled from cached fragments ---
+//
+// Every asset node, link edge and trust boundary subgraph is rendered on its own (see dot/dot-writer.ts)
+// and kept in the model context under the hash of what it is rendered from. After an edit only the
+// fragments of changed entities are rendered again, the DOT itself is just the cached strings joined
+// in diagram order.
+
+interface FragmentStats {
+    rendered: number;
+    reused: number;
+}
+
+function dotFragment(
+    previous: Map<string, DotFragment>,
+    next: Map<string, DotFragment>,
+    id: string,
+    content: unknown, // Everything the rendering depends on
+    render: () => string,
+    stats: FragmentStats,
+): DotFragment {
+    const hash = contentHash(JSON.stringify(content));
+    let fragment = previous.get(id);
+    if (fragment?.hash === hash) {
+        stats.reused++;
+    } else {
+        fragment = { hash, dot: render() };
+        stats.rendered++;
+    }
+    next.set(id, fragment);
+    return fragment;
+}
+
+function dataFlowDiagramClusterAttributes(boundary: TrustBoundary, isNested: boolean, hasChildren: boolean): DotAttributes {
+    return {
+        [_.label]: html(`<table border="0" cellborder="0" cellpadding="0"><tr><td><b>${encodeHTML(boundary.title)}</b> (${encodeHTML(boundary.type)})</td></tr></table>`),
+        [_.fontsize]: 21,
+        [_.style]: boundary.type === TrustBoundaryType.ExecutionEnvironment ? 'dotted' : 'dashed',
+        [_.color]: '#3A52C8',
+        [_.fontcolor]: boundary.type === TrustBoundaryType.ExecutionEnvironment ? '#555555' : '#3A52C8',
+        [_.bgcolor]: boundary.type === TrustBoundaryType.ExecutionEnvironment ? '#FFFFF0' : (isNested ? '#F1F1F1' : '#FAFAFA'),
+        [_.fontname]: 'Verdana',
+        [_.penwidth]: boundary.type === TrustBoundaryType.ExecutionEnvironment ? 4.5 : (hasChildren ? 5.5 : 4.5),
+        [_.forcelabels]: true,
+        [_.outputorder]: 'nodesfirst',
+        [_.margin]: 50.0,
+        [_.dpi]: 20,
+    };
+}
+
+const dataFlowDiagramSpacerAttributes: DotAttributes = {
+    [_.label]: html(`<table border="0" cellborder="0" cellpadding="0" bgcolor="#FFFFFF55"><tr><td><b> </b></td></tr></table>`),
+    [_.style]: 'invis',
+    [_.margin]: 50.0,
+    [_.penwidth]: 6.5,
+    [_.dpi]: 20,
+    [_.outputorder]: 'nodesfirst',
+    [_.color]: "green",
+    [_.fontcolor]: "green",
+    [_.fontsize]: 21,
+};
+
+function dataFlowDiagramEdgeAttributes(link: CommunicationLink): DotAttributes {
+    const edgeAttrs: DotAttributes = {};
+    const suppressBidirectionalArrows = true; // Since we forced ortho
+
+    let readOrWriteHead: string = "normal";
+    let readOrWriteTail: string = "dot";
+    if (link.readonly) {
+        readOrWriteHead = "empty";
+        readOrWriteTail = "odot";
+    }
+    let dirValue: string = 'forward';
+    if (link.isBidirectional?.() && !suppressBidirectionalArrows) {
+        dirValue = 'both';
+    }
+
+    edgeAttrs[_.style] = link.determineArrowLineStyle?.() ?? 'solid';
+    edgeAttrs[_.penwidth] = link.determineArrowPenWidth?.() ?? 1.5;
+    edgeAttrs[_.arrowtail] = readOrWriteTail;
+    edgeAttrs[_.arrowhead] = readOrWriteHead;
+    edgeAttrs[_.dir] = dirValue;
+    edgeAttrs[_.arrowsize] = 2.0;
+    edgeAttrs[_.color] = link.determineArrowColor?.() ?? '#000000';
+    edgeAttrs[_.constraint] = (link.diagramTweakConstraint === false) ? false : true;
+    edgeAttrs[_.weight] = (link.diagramTweakWeight != null && link.diagramTweakWeight > 0) ? link.diagramTweakWeight : 1;
+
+    const suppressEdgeLabels = false;
+    if (!suppressEdgeLabels) {
+        edgeAttrs[_.xlabel] = encodeHTML(link.protocol ?? '');
+        edgeAttrs[_.fontcolor] = link.determineLabelColor?.() ?? '#444444';
+    }
+    return edgeAttrs;
+}
+
 // --- Main Function to Generate DOT - Revised Order ---
 function internalGenerateDataFlowDiagramDot(): string {
     if (!modelState.parsedModelRoot) throw new Error('Model not parsed yet.');
@@ -1115,249 +1714,166 @@ function internalGenerateDataFlowDiagramDot(): string {
     const devNetworkBoundaryId = "1078183243";
     const appNetworkBoundaryId = "1994712798";
 
-    const G = new Digraph('generatedModel', {
-        [_.concentrate]: false, // Match: concentrate=false
-    });
-
-    // --- Hardcoded Global Graph Attributes from "Good" Example ---
-    const graphAttrs: RootGraphAttributes = {
-        [_.labelloc]: 't',
-        [_.fontname]: 'Verdana',
-        [_.fontsize]: 40,
-        [_.outputorder]: 'nodesfirst',
-        [_.dpi]: 20,                 // FORCE DPI
-        [_.splines]: 'ortho',        // FORCE Splines
-        [_.rankdir]: 'TB',           // FORCE Rank Direction
-        [_.nodesep]: 2,              // FORCE Node Separation
-        [_.ranksep]: 2,              // FORCE Rank Separation
-    };
-    if (G.attributes?.graph?.apply) G.attributes.graph.apply(graphAttrs);
-    else Object.entries(graphAttrs).forEach(([key, value]) => G.set(key, value));
-
-    // --- Hardcoded Default Node/Edge Attributes ---
-    const defaultNodeAttrs: NodeAttributes = { [_.fontname]: 'Verdana', [_.fontsize]: 20 };
-    if (G.attributes?.node?.apply) G.attributes.node.apply(defaultNodeAttrs);
-    else G.set('node', defaultNodeAttrs);
+    // Fragments not used by this diagram are dropped with the previous maps
+    const previous = modelState.dataFlowDiagramFragments;
+    const next: DataFlowDiagramFragments = { nodes: new Map(), edges: new Map(), subgraphs: new Map(), clusterContentHashes: {} };
+    const stats: FragmentStats = { rendered: 0, reused: 0 };
 
-    const defaultEdgeAttrs: EdgeAttributes = {
-        [_.shape]: 'none',          // Match: shape="none"
-        [_.fontname]: 'Verdana',
-        [_.fontsize]: 18,
-    };
-    if (G.attributes?.edge?.apply) G.attributes.edge.apply(defaultEdgeAttrs);
-    else G.set('edge', defaultEdgeAttrs);
-
-    // Maps to store created objects
-    const nodeMap = new Map<string, Node>();
-    const visibleSubgraphMap = new Map<string, Subgraph>();
-    const finalSubgraphStructures = new Map<string, Subgraph>();
-    const globalNodes: Node[] = []; // Store Node objects that don't belong to any cluster
+    // --- Root graph with the hardcoded global attributes from the "good" example ---
+    const root = dotFragment(previous.subgraphs, next.subgraphs, '', 'generatedModel', () => new DotWriter()
+        .openGraph('generatedModel', {
+            [_.concentrate]: false,      // Match: concentrate=false
+            [_.labelloc]: 't',
+            [_.fontname]: 'Verdana',
+            [_.fontsize]: 40,
+            [_.outputorder]: 'nodesfirst',
+            [_.dpi]: 20,                 // FORCE DPI
+            [_.splines]: 'ortho',        // FORCE Splines
+            [_.rankdir]: 'TB',           // FORCE Rank Direction
+            [_.nodesep]: 2,              // FORCE Node Separation
+            [_.ranksep]: 2,              // FORCE Rank Separation
+        })
+        .defaults('node', { [_.fontname]: 'Verdana', [_.fontsize]: 20 })
+        .defaults('edge', {
+            [_.shape]: 'none',          // Match: shape="none"
+            [_.fontname]: 'Verdana',
+            [_.fontsize]: 18,
+        })
+        .toString(), stats);
 
     const sortedBoundaryIds = Object.keys(allBoundaries).sort();
     const sortedAssets = Object.values(parsedModel.technicalAssets || {}).sort(sortByTechnicalAssetOrderAndId);
+    const parentBoundaryIds = modelState.parentTrustBoundaryIdMappedByTrustBoundaryId;
 
-    // --- Pass 1: Create VISIBLE Subgraph objects ---
+    // --- Pass 1: Subgraph openings of the VISIBLE (non-empty) boundaries and their spacers ---
+    const clusterIds = new Map<string, string>(); // Boundary ID -> DOT ID of its visible subgraph
+    const clusterOpenings = new Map<string, { subgraphId: string; fragment: DotFragment }[]>(); // Boundary ID -> spacer and visible subgraph
+    const nestedBoundaryIds: Record<string, string[]> = {};
     sortedBoundaryIds.forEach((boundaryId) => {
         const boundary = allBoundaries[boundaryId];
-        if (!boundary) return; // Skip if boundary somehow missing
-        const isNested = !!getParentTrustBoundaryID(boundary, allBoundaries);
         const hasChildren = boundary.trustBoundariesNested?.length > 0;
         const hasAssets = boundary.technicalAssetsInside?.length > 0;
         if (!hasAssets && !hasChildren) return;
 
         const clusterId = `cluster_${safeDotId(boundary.id)}`;
-        const labelHtml = `<<table border="0" cellborder="0" cellpadding="0"><tr><td><b>${encodeHTML(boundary.title)}</b> (${encodeHTML(boundary.type)})</td></tr></table>>`;
-
-        const subgraphAttrs: SubgraphAttributes = {
-            [_.label]: labelHtml,
-            [_.fontsize]: 21,
-            [_.style]: boundary.type === TrustBoundaryType.ExecutionEnvironment ? 'dotted' : 'dashed',
-            [_.color]: '#3A52C8',
-            [_.fontcolor]: boundary.type === TrustBoundaryType.ExecutionEnvironment ? '#555555' : '#3A52C8',
-            [_.bgcolor]: boundary.type === TrustBoundaryType.ExecutionEnvironment ? '#FFFFF0' : (isNested ? '#F1F1F1' : '#FAFAFA'),
-            [_.fontname]: 'Verdana',
-            [_.penwidth]: boundary.type === TrustBoundaryType.ExecutionEnvironment ? 4.5 : (hasChildren ? 5.5 : 4.5),
-            [_.forcelabels]: true,
-            [_.outputorder]: 'nodesfirst',
-            [_.margin]: 50.0,
-            [_.dpi]: 20,
-        };
-
-        const sub = new Subgraph(clusterId);
-        if (typeof sub.apply === 'function') sub.apply(subgraphAttrs);
-        else Object.entries(subgraphAttrs).forEach(([key, value]) => sub.set(key, value));
-        visibleSubgraphMap.set(boundary.id, sub);
+        const subgraphAttrs = dataFlowDiagramClusterAttributes(boundary, parentBoundaryIds[boundaryId] !== undefined, hasChildren);
+        const openings: { subgraphId: string; fragment: DotFragment }[] = [];
+        if (drawSpaceLinesForLayoutUnfortunatelyFurtherSeparatesAllRanks) {
+            const spacerId = `cluster_space_boundary_for_layout_only_1${boundary.id}`;
+            openings.push({ subgraphId: spacerId, fragment: dotFragment(previous.subgraphs, next.subgraphs, spacerId, spacerId,
+                () => subgraphOpening(spacerId, dataFlowDiagramSpacerAttributes), stats) });
+        }
+        openings.push({ subgraphId: clusterId, fragment: dotFragment(previous.subgraphs, next.subgraphs, clusterId, [clusterId, subgraphAttrs],
+            () => subgraphOpening(clusterId, subgraphAttrs), stats) });
+        clusterIds.set(boundaryId, clusterId);
+        clusterOpenings.set(boundaryId, openings);
+    });
+    sortedBoundaryIds.forEach((boundaryId) => {
+        const parentBoundaryId = parentBoundaryIds[boundaryId];
+        if (clusterIds.has(boundaryId) && parentBoundaryId !== undefined && clusterIds.has(parentBoundaryId)) {
+            (nestedBoundaryIds[parentBoundaryId] ??= []).push(boundaryId);
+        }
     });
 
-    // --- Pass 2: Create Node objects AND Add Clustered Nodes ---
+    // --- Pass 2: Nodes, grouped by their visible boundary ---
+    const nodeIds = new Map<string, string>(); // Asset ID -> DOT node ID
+    const nodeBoundaryIds = new Map<string, string>();
+    const nodesByBoundaryId: Record<string, DotFragment[]> = {};
+    const globalNodes: DotFragment[] = []; // Nodes that don't belong to any cluster
     sortedAssets.forEach((asset) => {
         const nodeModel = createTechAssetNodeModel(asset); // Use YOUR function
-        const parentBoundaryId = getTrustBoundaryId(asset, allBoundaries);
-        const parentSubgraph = parentBoundaryId ? visibleSubgraphMap.get(parentBoundaryId) : undefined;
+        const node = dotFragment(previous.nodes, next.nodes, asset.id, nodeModel,
+            () => nodeStatement(nodeModel.id, nodeModel.attributes), stats);
+        nodeIds.set(asset.id, nodeModel.id);
 
-        const graphNode = new Node(nodeModel.id, nodeModel.attributes);
-        nodeMap.set(asset.id, graphNode); // Store Node object
-
-        if (parentSubgraph) {
-            parentSubgraph.addNode(graphNode);
+        const parentBoundaryId = getTrustBoundaryId(asset, allBoundaries);
+        if (parentBoundaryId !== undefined && clusterIds.has(parentBoundaryId)) {
+            (nodesByBoundaryId[parentBoundaryId] ??= []).push(node);
+            nodeBoundaryIds.set(asset.id, parentBoundaryId);
         } else {
-            globalNodes.push(graphNode); // Store global nodes for later addition
+            globalNodes.push(node);
         }
     });
 
-    // --- Pass 3: Create Spacers and Determine Final Structures ---
-     sortedBoundaryIds.forEach((boundaryId) => {
-        const boundary = allBoundaries[boundaryId];
-        if (!boundary) return;
-        const currentVisibleSubgraph = visibleSubgraphMap.get(boundaryId);
-        if (!currentVisibleSubgraph) return; // Skip if empty boundary led to no visible subgraph
-
-        let finalStructure: Subgraph = currentVisibleSubgraph;
-
-        if (drawSpaceLinesForLayoutUnfortunatelyFurtherSeparatesAllRanks && (boundary.technicalAssetsInside?.length > 0 || boundary.trustBoundariesNested?.length > 0)) {
-            const spacerId = `cluster_space_boundary_for_layout_only_1${boundary.id}`;
-            const spacerLabelHtml = `<<table border="0" cellborder="0" cellpadding="0" bgcolor="#FFFFFF55"><tr><td><b> </b></td></tr></table>>`;
-            const spacerAttrs: SubgraphAttributes = {
-                [_.label]: spacerLabelHtml,
-                [_.style]: 'invis',
-                [_.margin]: 50.0,
-                [_.penwidth]: 6.5,
-                [_.dpi]: 20,
-                [_.outputorder]: 'nodesfirst',
-                [_.color]: "green",
-                [_.fontcolor]: "green",
-                [_.fontsize]: 21,
-            };
-            const spacerSub = new Subgraph(spacerId);
-            if (typeof spacerSub.apply === 'function') spacerSub.apply(spacerAttrs);
-            else Object.entries(spacerAttrs).forEach(([key, value]) => spacerSub.set(key, value));
-
-            spacerSub.addSubgraph(currentVisibleSubgraph); // Wrap visible in spacer
-            finalStructure = spacerSub;
-        }
-        finalSubgraphStructures.set(boundary.id, finalStructure);
+    // --- Pass 3: Edges; the hash of each also goes to every cluster containing both ends ---
+    const edges: DotFragment[] = [];
+    const innerEdgeHashes: Record<string, string[]> = {};
+    const ancestorsOf = (assetId: string) => {
+        const boundaryId = nodeBoundaryIds.get(assetId);
+        return boundaryId === undefined ? [] : (modelState.ancestorTrustBoundaryIdsMappedByTrustBoundaryId[boundaryId] ?? [boundaryId]);
+    };
+    sortedAssets.forEach((asset) => {
+        (asset.communicationLinks || []).forEach((link) => {
+            const sourceNodeId = nodeIds.get(link.sourceId);
+            const targetNodeId = nodeIds.get(link.targetId);
+            if (sourceNodeId === undefined || targetNodeId === undefined) {
+                console.warn(`Skipping edge: Cannot find source (${link.sourceId}) or target (${link.targetId}) node object.`);
+                return;
+            }
+            const edgeAttrs = dataFlowDiagramEdgeAttributes(link);
+            const edge = dotFragment(previous.edges, next.edges, link.id, [sourceNodeId, targetNodeId, edgeAttrs],
+                () => edgeStatement(sourceNodeId, targetNodeId, edgeAttrs), stats);
+            edges.push(edge);
+
+            const targetAncestors = ancestorsOf(link.targetId);
+            for (const boundaryId of ancestorsOf(link.sourceId)) {
+                if (targetAncestors.includes(boundaryId)) {
+                    (innerEdgeHashes[boundaryId] ??= []).push(edge.hash);
+                }
+            }
+        });
     });
 
-    // --- Pass 4: Assemble Nested Structures ---
-     sortedBoundaryIds.forEach((boundaryId) => {
-         const boundary = allBoundaries[boundaryId];
-         if (!boundary) return;
-         const finalStructure = finalSubgraphStructures.get(boundaryId);
-         if (!finalStructure) return;
-
-         const parentBoundaryId = getParentTrustBoundaryID(boundary, allBoundaries);
-         const parentFinalStructure = parentBoundaryId ? finalSubgraphStructures.get(parentBoundaryId) : undefined;
-
-         if (parentFinalStructure) {
-             let parentContainer = parentFinalStructure;
-             if (parentFinalStructure.id.startsWith('cluster_space_boundary_for_layout_only_')) {
-                 const subgraphs = parentFinalStructure.subgraphs;
-                 if (subgraphs?.length > 0) { // Check subgraphs exists and has items
-                     parentContainer = subgraphs[0];
-                 } else {
-                     console.warn(`Spacer subgraph ${parentFinalStructure.id} has no inner subgraph.`);
-                 }
-             }
-             // Add the current boundary's final structure to the parent's effective container
-             parentContainer.addSubgraph(finalStructure);
-         }
-         // NOTE: Do NOT add top-level structures to G here. That happens next.
-     });
+    // --- Pass 4: Assemble nested structures; spacers wrap their visible subgraph ---
+    const writer = new DotWriter().raw(root.dot);
+    const visitedBoundaryIds = new Set<string>();
+    const appendCluster = (boundaryId: string): string => {
+        visitedBoundaryIds.add(boundaryId);
+        const openings = clusterOpenings.get(boundaryId)!;
+        const contentHashes = openings.map(opening => opening.fragment.hash);
+        openings.forEach(opening => writer.raw(opening.fragment.dot));
+        for (const node of nodesByBoundaryId[boundaryId] ?? []) {
+            writer.raw(node.dot);
+            contentHashes.push(node.hash);
+        }
+        for (const nestedBoundaryId of nestedBoundaryIds[boundaryId] ?? []) {
+            if (!visitedBoundaryIds.has(nestedBoundaryId)) { // Guard against cyclic nesting
+                contentHashes.push(appendCluster(nestedBoundaryId));
+            }
+        }
+        openings.forEach(() => writer.raw(closingStatement));
+        contentHashes.push(...(innerEdgeHashes[boundaryId] ?? []));
 
+        // Spacer and visible subgraph enclose the same content
+        const clusterContentHash = contentHash(contentHashes.join(','));
+        openings.forEach(opening => next.clusterContentHashes[opening.subgraphId] = clusterContentHash);
+        return clusterContentHash;
+    };
 
-    // --- Pass 5: Add Top-Level Structures to G in Specific Order ---
+    // --- Pass 5: Add Top-Level Structures in Specific Order ---
     console.log("Adding top-level clusters to graph G..."); // Debug log
-
-    // Add Dev Network structure first
-    const devNetworkStructure = finalSubgraphStructures.get(devNetworkBoundaryId);
-    if (devNetworkStructure) {
-        console.log(` - Adding Dev Network structure: ${devNetworkStructure.id}`);
-        G.addSubgraph(devNetworkStructure);
+    if (clusterIds.has(devNetworkBoundaryId)) {
+        appendCluster(devNetworkBoundaryId);
     } else {
         console.warn(`Final structure for Dev Network (ID: ${devNetworkBoundaryId}) not found.`);
     }
-
-    // Add Application Network structure second
-    const appNetworkStructure = finalSubgraphStructures.get(appNetworkBoundaryId);
-    if (appNetworkStructure) {
-        console.log(` - Adding Application Network structure: ${appNetworkStructure.id}`);
-        G.addSubgraph(appNetworkStructure);
+    if (clusterIds.has(appNetworkBoundaryId)) {
+        appendCluster(appNetworkBoundaryId);
     } else {
-         console.warn(`Final structure for Application Network (ID: ${appNetworkBoundaryId}) not found.`);
+        console.warn(`Final structure for Application Network (ID: ${appNetworkBoundaryId}) not found.`);
     }
-
-    // Add any other top-level boundaries *after* the main two
+    // Any other top-level boundaries *after* the main two
     sortedBoundaryIds.forEach(boundaryId => {
-        const boundary = allBoundaries[boundaryId];
-        if (!boundary) return;
-        // Check if it's top-level AND not one of the main two we already added
-        if (!getParentTrustBoundaryID(boundary, allBoundaries) &&
-            boundaryId !== devNetworkBoundaryId &&
-            boundaryId !== appNetworkBoundaryId)
-        {
-            const otherTopLevelStructure = finalSubgraphStructures.get(boundaryId);
-            if (otherTopLevelStructure) {
-                 console.log(` - Adding other top-level structure: ${otherTopLevelStructure.id}`);
-                 G.addSubgraph(otherTopLevelStructure);
-             }
+        if (clusterIds.has(boundaryId) && parentBoundaryIds[boundaryId] === undefined && !visitedBoundaryIds.has(boundaryId)) {
+            appendCluster(boundaryId);
         }
     });
 
-
-    // --- Pass 6: Add Global Nodes to G LAST ---
-    console.log(`Adding ${globalNodes.length} global nodes to graph G...`); // Debug log
-    globalNodes.forEach(node => {
-        console.log(` - Adding global node: ${node.id}`);
-        G.addNode(node);
-    });
-
-    // --- Pass 7: Create Edges ---
-    console.log("Adding edges to graph G..."); // Debug log
-    sortedAssets.forEach((asset) => {
-        (asset.communicationLinks || []).forEach((link) => {
-            const sourceNode = nodeMap.get(link.sourceId);
-            const targetNode = nodeMap.get(link.targetId);
-
-            if (!sourceNode || !targetNode) {
-                console.warn(`Skipping edge: Cannot find source (${link.sourceId}) or target (${link.targetId}) node object.`);
-                return;
-            }
-
-            const edgeAttrs: EdgeAttributes = {};
-            const suppressBidirectionalArrows = true; // Since we forced ortho
-
-            // Copy relevant attributes from "good" example style if possible, else use methods
-             let readOrWriteHead: string = "normal";
-             let readOrWriteTail: string = "dot";
-             if (link.readonly) {
-                 readOrWriteHead = "empty";
-                 readOrWriteTail = "odot";
-             }
-             let dirValue: string = 'forward';
-             if (link.isBidirectional?.() && !suppressBidirectionalArrows) {
-                 dirValue = 'both';
-             }
-
-             edgeAttrs[_.style] = link.determineArrowLineStyle?.() ?? 'solid';
-             edgeAttrs[_.penwidth] = link.determineArrowPenWidth?.() ?? 1.5; // Match good example default?
-             edgeAttrs[_.arrowtail] = readOrWriteTail;
-             edgeAttrs[_.arrowhead] = readOrWriteHead;
-             edgeAttrs[_.dir] = dirValue;
-             edgeAttrs[_.arrowsize] = 2.0; // Match good example
-             edgeAttrs[_.color] = link.determineArrowColor?.() ?? '#000000';
-             edgeAttrs[_.constraint] = (link.diagramTweakConstraint === false) ? false : true; // Match good example default
-             edgeAttrs[_.weight] = (link.diagramTweakWeight != null && link.diagramTweakWeight > 0) ? link.diagramTweakWeight : 1; // Match good example default
-
-             const suppressEdgeLabels = false; // Match good example
-             if (!suppressEdgeLabels) {
-                  edgeAttrs[_.xlabel] = encodeHTML(link.protocol ?? '');
-                  edgeAttrs[_.fontcolor] = link.determineLabelColor?.() ?? '#444444';
-             }
-
-            const edge = new Edge([sourceNode, targetNode], edgeAttrs);
-            G.addEdge(edge);
-        });
-    });
+    // --- Pass 6: Global Nodes LAST, then the edges ---
+    console.log(`Adding ${globalNodes.length} global nodes and ${edges.length} edges to graph G...`); // Debug log
+    globalNodes.forEach(node => writer.raw(node.dot));
+    edges.forEach(edge => writer.raw(edge.dot));
+    writer.raw(closingStatement);
 
     // --- Diagram Tweaks (Keep COMMENTED OUT for testing base layout) ---
     /*
@@ -1365,12 +1881,70 @@ function internalGenerateDataFlowDiagramDot(): string {
     (parsedModel.diagramTweakSameRankAssets || []).forEach((rankSet) => { ... });
     */
 
-    // --- Generate DOT String ---
-    console.log("Generating final DOT string..."); // Debug log
-    const rawDotString = toDot(G);
-    // console.log("Raw DOT:\n", rawDotString); // Optional: Log raw DOT before potential correction
-    const correctedDotString = fixDotHtmlLabelSyntax(rawDotString);
-    return correctedDotString;
+    modelState.dataFlowDiagramFragments = next;
+    console.log(`Data flow diagram DOT: ${stats.rendered} fragments rendered, ${stats.reused} reused.`);
+    return writer.toString();
+}
+
+// DOT subgraph ID -> hash of the cluster's content, as of the last data flow diagram DOT of the context.
+// Clusters with an unchanged hash can keep their previous layout, see reuseUnchangedClusterLayouts.
+export function getDataFlowDiagramClusterHashes(context: ModelContext = modelState): Record<string, string> {
+    return context.dataFlowDiagramFragments.clusterContentHashes;
+}
+
+/**
+ * The clusters, nodes and edges of the data flow diagram with the colors Graphviz draws them in, taken
+ * from the DOT attributes. Lets the editor build the diagram from persisted geometry without a layout,
+ * see backend/layout/diagram-geometry.ts.
+ */
+export function getDataFlowDiagramEntities(context: ModelContext = modelState): DiagramEntities {
+    return withModelContext(context, () => {
+        if (!modelState.parsedModelRoot) throw new Error('Model not parsed yet.');
+        const parsedModel = modelState.parsedModelRoot;
+        // Graphviz only reports pen widths other than its default of 1
+        const strokeWidth = (penwidth: DotValue | undefined) => penwidth === undefined || penwidth === 1 ? null : String(penwidth);
+        const entities: DiagramEntities = { clusters: [], nodes: [], edges: [] };
+
+        for (const boundaryId of Object.keys(parsedModel.trustBoundaries).sort()) {
+            const boundary = parsedModel.trustBoundaries[boundaryId];
+            const hasChildren = boundary.trustBoundariesNested?.length > 0;
+            if (!hasChildren && !(boundary.technicalAssetsInside?.length > 0)) continue;
+            const attributes = dataFlowDiagramClusterAttributes(boundary, modelState.parentTrustBoundaryIdMappedByTrustBoundaryId[boundaryId] !== undefined, hasChildren);
+            entities.clusters.push({
+                name: `cluster_${safeDotId(boundary.id)}`,
+                label: boundary.title,
+                contentHash: modelState.dataFlowDiagramFragments.clusterContentHashes[`cluster_${safeDotId(boundary.id)}`] ?? null,
+                fill: String(attributes[_.bgcolor]),
+                stroke: String(attributes[_.color]),
+                strokeWidth: strokeWidth(attributes[_.penwidth]),
+            });
+        }
+
+        const sortedAssets = Object.values(parsedModel.technicalAssets).sort(sortByTechnicalAssetOrderAndId);
+        for (const asset of sortedAssets) {
+            const nodeModel = createTechAssetNodeModel(asset);
+            entities.nodes.push({
+                name: nodeModel.id,
+                label: asset.title,
+                shape: layoutNodeShape(String(nodeModel.attributes[_.shape])),
+                fill: String(nodeModel.attributes[_.fillcolor]),
+                stroke: String(nodeModel.attributes[_.color]),
+                strokeWidth: strokeWidth(nodeModel.attributes[_.penwidth]),
+            });
+        }
+        for (const asset of sortedAssets) {
+            for (const link of asset.communicationLinks || []) {
+                if (!parsedModel.technicalAssets[link.targetId]) continue;
+                entities.edges.push({
+                    tail: safeDotId(link.sourceId),
+                    head: safeDotId(link.targetId),
+                    label: encodeHTML(link.protocol ?? ''), // As the xlabel Graphviz reports
+                    linkKey: link.title,
+                });
+            }
+        }
+        return entities;
+    });
 }
 /**
  * Generates the DOT string for the Data Asset Diagram.
@@ -1380,13 +1954,8 @@ function internalGenerateDataAssetDiagramDot(): string {
     if (!modelState.parsedModelRoot) throw new Error('Model not parsed yet.');
     const parsedModel = modelState.parsedModelRoot;
 
-    const G = new Digraph('dataAssetDiagram', {
-        // Set graph-level attributes directly or using apply
+    const writer = new DotWriter().openGraph('dataAssetDiagram', {
         [_.concentrate]: true, // Keep this if needed
-    });
-
-    // Apply global graph attributes
-    const graphAttrs: RootGraphAttributes = { // Assuming RootGraphAttributes is the correct type
         [_.dpi]: 120, // Use a reasonable default DPI, Go used 20 which is very low
         [_.fontname]: 'Verdana',
         [_.labelloc]: 'c', // Center graph label if any
@@ -1396,26 +1965,24 @@ function internalGenerateDataAssetDiagramDot(): string {
         [_.nodesep]: 1.0,
         [_.ranksep]: 3.0,
         [_.outputorder]: 'nodesfirst',
-    };
-    G.attributes.graph.apply(graphAttrs);
+    });
 
-    // Apply default node attributes (will be overridden by specific node attributes)
-    const defaultNodeColor = colors.White ?? '#FFFFFF'; // Define default if needed
-    G.attributes.node.apply({
-        [_.fontcolor]: defaultNodeColor,
+    // Default node attributes (overridden by specific node attributes)
+    writer.defaults('node', {
+        [_.fontcolor]: colors.White ?? '#FFFFFF',
         [_.fontname]: 'Verdana',
         [_.fontsize]: 20,
     });
 
-    // Apply default edge attributes
-    G.attributes.edge.apply({
+    // Default edge attributes
+    writer.defaults('edge', {
         // shape: 'none', // Edge shape usually not needed
         [_.fontname]: 'Verdana',
         [_.fontsize]: 18,
     });
 
-    // Keep track of created nodes using ts-graphviz Node objects
-    const nodeMap = new Map<string, Node>();
+    // DOT node IDs by original asset ID
+    const nodeIds = new Map<string, string>();
 
     // --- Create Technical Asset Nodes ---
     const relevantTechAssets = Object.values(parsedModel.technicalAssets)
@@ -1423,12 +1990,9 @@ function internalGenerateDataAssetDiagramDot(): string {
     relevantTechAssets.sort(sortByTechnicalAssetOrderAndId); // Use the sort function
 
     relevantTechAssets.forEach((asset) => {
-        // Use the corrected node creation function
         const nodeModel = createTechAssetNodeForDataDiagram(asset);
-        // Create the actual ts-graphviz Node
-        const graphNode = new Node(nodeModel.id, nodeModel.attributes);
-        nodeMap.set(asset.id, graphNode); // Store by original asset ID for edges
-        G.addNode(graphNode); // Add node to the graph
+        nodeIds.set(asset.id, nodeModel.id);
+        writer.node(nodeModel.id, nodeModel.attributes);
     });
 
     // --- Create Data Asset Nodes ---
@@ -1436,32 +2000,27 @@ function internalGenerateDataAssetDiagramDot(): string {
     dataAssets.sort(sortByDataAssetDataBreachProbabilityAndTitle); // Use the sort function
 
     dataAssets.forEach((asset) => {
-        // Use the corrected node creation function
         const nodeModel = createDataAssetNodeModel(asset);
-        // Create the actual ts-graphviz Node
-        const graphNode = new Node(nodeModel.id, nodeModel.attributes);
-        nodeMap.set(asset.id, graphNode); // Store by original asset ID for edges
-        G.addNode(graphNode); // Add node to the graph
+        nodeIds.set(asset.id, nodeModel.id);
+        writer.node(nodeModel.id, nodeModel.attributes);
     });
 
     // --- Create Edges ---
     relevantTechAssets.forEach((techAsset) => {
-        const targetNode = nodeMap.get(techAsset.id); // Get the target Node object
-        if (!targetNode) {
+        const targetNodeId = nodeIds.get(techAsset.id);
+        if (!targetNodeId) {
             console.warn(`Target technical asset node missing for edges: ${techAsset.id}`);
             return;
         }
 
         // Stored Edges
         (techAsset.dataAssetsStored || []).forEach(dataAssetId => {
-            const sourceNode = nodeMap.get(dataAssetId); // Get the source Node object
-            if (sourceNode) {
-                // Create the ts-graphviz Edge
-                const edge = new Edge([sourceNode, targetNode], {
+            const sourceNodeId = nodeIds.get(dataAssetId);
+            if (sourceNodeId) {
+                writer.edge(sourceNodeId, targetNodeId, {
                     [_.color]: 'blue',
                     [_.style]: 'solid' // Use string 'solid'
                 });
-                G.addEdge(edge);
             } else {
                 console.warn(`Source data asset node missing for stored edge: ${dataAssetId} -> ${techAsset.id}`);
             }
@@ -1471,58 +2030,48 @@ function internalGenerateDataAssetDiagramDot(): string {
         (techAsset.dataAssetsProcessed || []).forEach(dataAssetId => {
             const isStored = (techAsset.dataAssetsStored || []).includes(dataAssetId);
             if (!isStored) {
-                const sourceNode = nodeMap.get(dataAssetId); // Get the source Node object
-                if (sourceNode) {
-                    // Create the ts-graphviz Edge
-                    const edge = new Edge([sourceNode, targetNode], {
+                const sourceNodeId = nodeIds.get(dataAssetId);
+                if (sourceNodeId) {
+                    writer.edge(sourceNodeId, targetNodeId, {
                         [_.color]: '#666666',
                         [_.style]: 'dashed' // Use string 'dashed'
                     });
-                    G.addEdge(edge);
                 } else {
                     console.warn(`Source data asset node missing for processed edge: ${dataAssetId} -> ${techAsset.id}`);
                 }
             }
         });
     });
-    // Generate the potentially incorrect DOT string
-    const rawDotString = toDot(G);
-
-    // Apply the correction function
-    const correctedDotString = fixDotHtmlLabelSyntax(rawDotString);
-
-    // Return the corrected string
-    return correctedDotString;
+    return writer.close().toString();
 }
 
 
 // --- Wrapper Exports for Go WASM Compatibility (defined within main.ts) ---
-export function printDataFlowDiagramGraphvizDOT(): string {
+export function printDataFlowDiagramGraphvizDOT(context: ModelContext = modelState): string {
     console.log("Generating Data Flow DOT string (for WASM export)...");
-    return internalGenerateDataFlowDiagramDot(20); // Use fixed DPI=20 like Go version
+    return withModelContext(context, () => internalGenerateDataFlowDiagramDot(20)); // Use fixed DPI=20 like Go version
 }
-export function printGraphvizDOT(): string {
+export function printGraphvizDOT(context: ModelContext = modelState): string {
     console.log("Generating Data Asset DOT string (for WASM export)...");
-    return internalGenerateDataAssetDiagramDot();
+    return withModelContext(context, () => internalGenerateDataAssetDiagramDot());
 }
 
 // Equivalent to makeTechAssetNode from Go (creates NodeModel, not DOT string)
 /**
  * Creates the ID and attributes object for a Technical Asset node,
- * using ts-graphviz compatible attribute syntax.
+ * with an HTML-like label (see html in dot/dot-writer.ts).
  */
 /**
- * Creates the ID and attributes object for a Technical Asset node,
- * using ts-graphviz compatible attribute syntax.
+ * Creates the ID and attributes object for a Technical Asset node.
  * REVISED to match Go output more closely (explicit shapes, correct padding).
  */
 function createTechAssetNodeModel(
   asset: TechnicalAsset,
   includeRisks: boolean = false, // Keep param if potentially needed later
-): { id: string; attributes: NodeAttributes } {
+): { id: string; attributes: DotAttributes } {
 
   const nodeId = safeDotId(asset.id);
-  const nodeAttrs: NodeAttributes = {}; // Initialize the attributes object
+  const nodeAttrs: DotAttributes = {}; // Initialize the attributes object
 
   // --- Determine Node Shape based on Asset Type ---
   let shape: string;
@@ -1595,7 +2144,7 @@ function createTechAssetNodeModel(
   labelContent += `</td></tr>`;
 
   labelContent += `</table>`;  // Assign the complete HTML string to the label attribute
-  nodeAttrs[_.label] = labelContent;
+  nodeAttrs[_.label] = html(labelContent);
 
   // Return the object structure
   return {
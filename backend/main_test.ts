@@ -0,0 +1,139 @@
+// applyModelEdits against a full parse of the edited YAML: both have to produce the same model
+// and the same risks, whether the edits are patched in or force a rebuild.
+//
+//   deno task test
+
+import * as YAML from 'npm:yaml';
+import { assertEquals } from 'https://deno.land/std@0.224.0/assert/mod.ts';
+import {
+    applyModelEdits, generateRisks, getGeneratedRisks, type ModelEdit, parseModel, printDataFlowDiagramGraphvizDOT, printGraphvizDOT,
+} from './main.ts';
+import { createModelContext, type ModelContext } from './model/types.ts';
+
+// The rules read window.currentSelectedThreatStandard, like in the engine and CLI workers
+const testGlobal = globalThis as unknown as { window: unknown; currentSelectedThreatStandard?: string };
+testGlobal.window = globalThis;
+testGlobal.currentSelectedThreatStandard = 'ORIGINAL';
+
+const modelYaml = await Deno.readTextFile(new URL('./customer_portal_erp_threat_model.yaml', import.meta.url));
+
+// JSON with sorted keys, so patched entries compare equal regardless of insertion order
+function canonical(value: unknown): unknown {
+    if (Array.isArray(value)) return value.map(canonical);
+    if (value instanceof Date) return value.toISOString();
+    if (value && typeof value === 'object') {
+        return Object.fromEntries(Object.keys(value).sort().map(key => [key, canonical((value as Record<string, unknown>)[key])]));
+    }
+    return value;
+}
+
+function risksOf(context: ModelContext): string[] {
+    return [...getGeneratedRisks(context).values()].flat()
+        .map(risk => [risk.syntheticId, risk.severity, risk.exploitationLikelihood, risk.exploitationImpact,
+            risk.dataBreachProbability, risk.dataBreachTechnicalAssetIDs.join(',')].join(' '))
+        .sort();
+}
+
+function analyze(source: string | YAML.Document): ModelContext {
+    const context = createModelContext();
+    parseModel(source, context);
+    generateRisks([], new Set(), context);
+    return context;
+}
+
+function edited(source: string, edits: ModelEdit[]): string {
+    const document = YAML.parseDocument(source);
+    for (const edit of edits) {
+        if (edit.op === 'delete') {
+            document.deleteIn(edit.path);
+        } else {
+            document.setIn(edit.path, edit.value);
+        }
+    }
+    return document.toString();
+}
+
+// `between` runs in another context, e.g. a second model open in the same engine
+function assertSameAsFullParse(edits: ModelEdit[], between: () => void = () => {}): void {
+    const incremental = analyze(modelYaml);
+    between();
+    const patched = applyModelEdits(edits, incremental);
+    const full = analyze(edited(modelYaml, edits));
+
+    assertEquals(canonical(patched), canonical(full.parsedModelRoot));
+    assertEquals(risksOf(incremental), risksOf(full));
+}
+
+Deno.test('applyModelEdits patches technical asset fields like a full parse', () => {
+    assertSameAsFullParse([
+        { op: 'set', path: ['technical_assets', 'Load Balancer', 'internet'], value: true },
+        { op: 'set', path: ['technical_assets', 'Load Balancer', 'encryption'], value: 'transparent' },
+        { op: 'set', path: ['technical_assets', 'Apache Webserver', 'technology'], value: 'web-application' },
+    ]);
+});
+
+Deno.test('applyModelEdits patches data asset CIA ratings like a full parse', () => {
+    assertSameAsFullParse([
+        { op: 'set', path: ['data_assets', 'Customer Accounts', 'confidentiality'], value: 'confidential' },
+        { op: 'set', path: ['data_assets', 'Marketing Material', 'integrity'], value: 'critical' },
+    ]);
+});
+
+Deno.test('applyModelEdits patches communication links and ID lists like a full parse', () => {
+    assertSameAsFullParse([
+        { op: 'set', path: ['technical_assets', 'Load Balancer', 'communication_links', 'Web Application Traffic', 'protocol'], value: 'https' },
+        { op: 'delete', path: ['technical_assets', 'Load Balancer', 'communication_links', 'CMS Content Traffic'] },
+        { op: 'delete', path: ['technical_assets', 'Load Balancer', 'data_assets_processed', 5] },
+    ]);
+});
+
+Deno.test('applyModelEdits patches trust boundaries and risk tracking like a full parse', () => {
+    assertSameAsFullParse([
+        { op: 'set', path: ['trust_boundaries', 'Web DMZ', 'type'], value: 'network-on-prem' },
+        { op: 'set', path: ['risk_tracking', 'missing-hardening@*', 'status'], value: 'accepted' },
+    ]);
+});
+
+Deno.test('applyModelEdits rebuilds like a full parse for new entities and changed IDs', () => {
+    assertSameAsFullParse([
+        {
+            op: 'set',
+            path: ['data_assets', 'Audit Log'],
+            value: {
+                id: 'audit-log', description: 'Audit log', usage: 'devops', origin: 'Company ABC', owner: 'Company ABC',
+                quantity: 'many', confidentiality: 'restricted', integrity: 'critical', availability: 'operational',
+                justification_cia_rating: 'Needed for forensics',
+            },
+        },
+        { op: 'set', path: ['technical_assets', 'Load Balancer', 'data_assets_stored'], value: ['audit-log'] },
+        { op: 'set', path: ['trust_boundaries', 'Web DMZ', 'id'], value: 'web-dmz-2' },
+        { op: 'set', path: ['trust_boundaries', 'Application Network', 'trust_boundaries_nested', 0], value: 'web-dmz-2' },
+    ]);
+});
+
+Deno.test('applyModelEdits keeps RAA scores apart from other contexts with the same asset IDs', () => {
+    // Same asset IDs, other RAA inputs: its raw scores must not be reused for the edited model
+    const otherYaml = edited(modelYaml, [
+        { op: 'set', path: ['technical_assets', 'Backoffice ERP System', 'internet'], value: true },
+        { op: 'set', path: ['technical_assets', 'Customer Contract Database', 'confidentiality'], value: 'public' },
+    ]);
+    assertSameAsFullParse([
+        { op: 'set', path: ['technical_assets', 'Apache Webserver', 'multi_tenant'], value: true },
+    ], () => analyze(otherYaml));
+});
+
+Deno.test('diagram DOT encodes titles inside HTML-like labels', () => {
+    const context = analyze(modelYaml);
+    const model = context.parsedModelRoot!;
+    model.trustBoundaries['web-dmz'].title = 'Web & <DMZ>';
+    model.technicalAssets['apache-webserver'].title = 'Apache "2" & Co';
+    model.dataAssets['customer-accounts'].title = 'Accounts <PII>';
+
+    for (const dot of [printDataFlowDiagramGraphvizDOT(context), printGraphvizDOT(context)]) {
+        assertEquals(dot.match(/&(?!amp;|lt;|gt;|quot;|apos;)/g), null);
+        assertEquals(['<DMZ>', 'Apache "2"', '<PII>'].some(raw => dot.includes(raw)), false);
+    }
+    assertEquals(printDataFlowDiagramGraphvizDOT(context).includes('Web &amp; &lt;DMZ&gt;'), true);
+    assertEquals(printGraphvizDOT(context).includes('Apache &quot;2&quot; &amp; Co'), true);
+    assertEquals(printGraphvizDOT(context).includes('Accounts &lt;PII&gt;'), true);
+});
@@ -0,0 +1,123 @@
+// Validates model input without building the model: the structure against schema.json (see
+// schema-validator.generated.ts) plus the ID and reference rules parseModel enforces. Unlike
+// parseModel, which stops at the first problem, every error is reported.
+
+import { makeID, validIdSyntax } from './types.ts';
+import { type SchemaError, validateModelSchema } from './schema-validator.generated.ts';
+
+export type ModelValidationError = SchemaError;
+
+type Entries = Record<string, Record<string, unknown>>;
+
+function isObject(value: unknown): value is Record<string, unknown> {
+    return typeof value === 'object' && value !== null && !Array.isArray(value);
+}
+
+// JSON Pointer of the given keys, like the schema errors use
+function pointer(...keys: (string | number)[]): string {
+    return keys.map(key => '/' + String(key).replace(/~/g, '~0').replace(/\//g, '~1')).join('');
+}
+
+function entriesOf(model: Record<string, unknown>, section: string): Entries {
+    const entries = model[section];
+    return (isObject(entries) ? entries : {}) as Entries;
+}
+
+// IDs of one section as parseModel derives them; ill-typed entries are left to the schema errors
+function collectIds(model: Record<string, unknown>, section: string, errors: ModelValidationError[]): Set<string> {
+    const ids = new Set<string>();
+    const entries = entriesOf(model, section);
+    for (const title in entries) {
+        const entry = entries[title];
+        if (!isObject(entry) || typeof entry.id !== 'string') continue;
+        const id = makeID(entry.id);
+        if (!validIdSyntax.test(id)) {
+            errors.push({ path: pointer(section, title, 'id'), message: `invalid ID syntax (only letters, numbers, and hyphen allowed): ${entry.id}` });
+        } else if (ids.has(id)) {
+            errors.push({ path: pointer(section, title, 'id'), message: `duplicate ID: ${id}` });
+        }
+        ids.add(id);
+    }
+    return ids;
+}
+
+function checkReferences(
+    entry: Record<string, unknown>,
+    property: string,
+    ids: Set<string>,
+    kind: string,
+    path: string[],
+    errors: ModelValidationError[],
+    normalize: (id: string) => string = id => id,
+): void {
+    const references = entry[property];
+    if (!Array.isArray(references)) return;
+    references.forEach((reference, i) => {
+        if (typeof reference === 'string' && !ids.has(normalize(reference))) {
+            errors.push({ path: pointer(...path, property, i), message: `unknown ${kind}: ${reference}` });
+        }
+    });
+}
+
+function validateModelReferences(model: Record<string, unknown>, errors: ModelValidationError[]): void {
+    const dataAssetIds = collectIds(model, 'data_assets', errors);
+    const techAssetIds = collectIds(model, 'technical_assets', errors);
+    const trustBoundaryIds = collectIds(model, 'trust_boundaries', errors);
+    collectIds(model, 'shared_runtimes', errors);
+
+    const techAssets = entriesOf(model, 'technical_assets');
+    for (const title in techAssets) {
+        const asset = techAssets[title];
+        if (!isObject(asset)) continue;
+        checkReferences(asset, 'data_assets_processed', dataAssetIds, 'data asset', ['technical_assets', title], errors);
+        checkReferences(asset, 'data_assets_stored', dataAssetIds, 'data asset', ['technical_assets', title], errors);
+        const links = isObject(asset.communication_links) ? asset.communication_links as Entries : {};
+        for (const linkTitle in links) {
+            const link = links[linkTitle];
+            if (!isObject(link)) continue;
+            const path = ['technical_assets', title, 'communication_links', linkTitle];
+            if (typeof link.target === 'string' && !techAssetIds.has(makeID(link.target))) {
+                errors.push({ path: pointer(...path, 'target'), message: `unknown technical asset: ${link.target}` });
+            }
+            checkReferences(link, 'data_assets_sent', dataAssetIds, 'data asset', path, errors);
+            checkReferences(link, 'data_assets_received', dataAssetIds, 'data asset', path, errors);
+        }
+    }
+
+    const boundaryOfAsset = new Map<string, string>(); // Technical asset ID -> trust boundary title
+    const trustBoundaries = entriesOf(model, 'trust_boundaries');
+    for (const title in trustBoundaries) {
+        const boundary = trustBoundaries[title];
+        if (!isObject(boundary)) continue;
+        checkReferences(boundary, 'technical_assets_inside', techAssetIds, 'technical asset', ['trust_boundaries', title], errors);
+        checkReferences(boundary, 'trust_boundaries_nested', trustBoundaryIds, 'trust boundary', ['trust_boundaries', title], errors, makeID);
+        const inside = Array.isArray(boundary.technical_assets_inside) ? boundary.technical_assets_inside : [];
+        inside.forEach((assetId, i) => {
+            if (typeof assetId !== 'string') return;
+            const other = boundaryOfAsset.get(assetId);
+            if (other !== undefined && other !== title) {
+                errors.push({ path: pointer('trust_boundaries', title, 'technical_assets_inside', i), message: `technical asset ${assetId} is already inside trust boundary '${other}'` });
+            }
+            boundaryOfAsset.set(assetId, title);
+        });
+    }
+
+    const sharedRuntimes = entriesOf(model, 'shared_runtimes');
+    for (const title in sharedRuntimes) {
+        const runtime = sharedRuntimes[title];
+        if (!isObject(runtime)) continue;
+        checkReferences(runtime, 'technical_assets_running', techAssetIds, 'technical asset', ['shared_runtimes', title], errors);
+    }
+}
+
+/**
+ * Checks parsed model input (e.g. Document.toJS()) in linear time and returns all errors,
+ * schema violations first.
+ */
+export function validateModelInput(model: unknown): ModelValidationError[] {
+    const errors = validateModelSchema(model);
+    if (isObject(model)) {
+        validateModelReferences(model, errors);
+    }
+    return errors;
+}
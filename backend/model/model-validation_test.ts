@@ -0,0 +1,121 @@
+// validateModelInput on a minimal valid model and on known-bad variants of it: every problem is
+// reported with the JSON Pointer of the offending value.
+//
+//   deno task test
+
+import { assertEquals } from 'https://deno.land/std@0.224.0/assert/mod.ts';
+import { type ModelValidationError, validateModelInput } from './model-validation.ts';
+
+// deno-lint-ignore no-explicit-any
+type Model = Record<string, any>;
+
+function dataAsset(id: string) {
+    return {
+        id, description: id, usage: 'business', quantity: 'few',
+        confidentiality: 'confidential', integrity: 'critical', availability: 'important',
+    };
+}
+
+function technicalAsset(id: string, communicationLinks: Model = {}) {
+    return {
+        id, description: id, type: 'process', usage: 'business', used_as_client_by_human: false, out_of_scope: false,
+        size: 'service', technology: 'web-server', internet: false, machine: 'container', encryption: 'none',
+        owner: 'Company XYZ', confidentiality: 'internal', integrity: 'important', availability: 'important',
+        multi_tenant: false, redundant: false, custom_developed_parts: true,
+        data_assets_processed: ['customer-accounts'], data_assets_stored: [], data_formats_accepted: ['json'],
+        communication_links: communicationLinks,
+    };
+}
+
+function trustBoundary(id: string, inside: string[], nested: string[] = []) {
+    return { id, description: id, type: 'network-on-prem', technical_assets_inside: inside, trust_boundaries_nested: nested };
+}
+
+function validModel(): Model {
+    return {
+        threagile_version: '1.0.0',
+        title: 'Validation Test Model',
+        author: { name: 'Tester' },
+        business_criticality: 'important',
+        tags_available: [],
+        data_assets: {
+            'Customer Accounts': dataAsset('customer-accounts'),
+            'Audit Log': dataAsset('audit-log'),
+        },
+        technical_assets: {
+            'Web Server': technicalAsset('web-server', {
+                'Database Traffic': {
+                    target: 'database', description: 'Queries', protocol: 'jdbc-encrypted', authentication: 'credentials',
+                    authorization: 'technical-user', vpn: false, ip_filtered: false, readonly: false, usage: 'business',
+                    data_assets_sent: ['customer-accounts'], data_assets_received: ['customer-accounts'],
+                },
+            }),
+            'Database': technicalAsset('database'),
+        },
+        trust_boundaries: {
+            'DMZ': trustBoundary('dmz', ['web-server']),
+            'Backend': trustBoundary('backend', ['database'], ['dmz']),
+        },
+        shared_runtimes: {
+            'Cluster': { id: 'cluster', description: 'Cluster', technical_assets_running: ['web-server', 'database'] },
+        },
+    };
+}
+
+function errorsOf(change: (model: Model) => void): ModelValidationError[] {
+    const model = validModel();
+    change(model);
+    return validateModelInput(model);
+}
+
+Deno.test('validateModelInput accepts a valid model', () => {
+    assertEquals(validateModelInput(validModel()), []);
+});
+
+Deno.test('validateModelInput reports schema violations', () => {
+    assertEquals(validateModelInput('not a model'), [{ path: '', message: 'must be object' }]);
+    assertEquals(errorsOf(model => {
+        delete model.title;
+        model.data_assets['Audit Log'].confidentiality = 'secret';
+        delete model.technical_assets['Database'].technology;
+    }), [
+        { path: '', message: 'missing required property title' },
+        { path: '/data_assets/Audit Log/confidentiality', message: 'must be one of "public", "internal", "restricted", "confidential", "strictly-confidential"' },
+        { path: '/technical_assets/Database', message: 'missing required property technology' },
+    ]);
+});
+
+Deno.test('validateModelInput reports duplicate and invalid IDs', () => {
+    assertEquals(errorsOf(model => {
+        model.data_assets['Audit Log'].id = 'customer-accounts';
+        model.shared_runtimes['Cluster'].id = '***'; // Nothing left after makeID
+    }), [
+        { path: '/data_assets/Audit Log/id', message: 'duplicate ID: customer-accounts' },
+        { path: '/shared_runtimes/Cluster/id', message: 'invalid ID syntax (only letters, numbers, and hyphen allowed): ***' },
+    ]);
+});
+
+Deno.test('validateModelInput reports unknown references', () => {
+    assertEquals(errorsOf(model => {
+        const webServer = model.technical_assets['Web Server'];
+        webServer.data_assets_stored = ['audit-log', 'session-store'];
+        webServer.communication_links['Database Traffic'].target = 'data-warehouse';
+        webServer.communication_links['Database Traffic'].data_assets_received = ['reports'];
+        model.trust_boundaries['Backend'].trust_boundaries_nested = ['Internet'];
+        model.shared_runtimes['Cluster'].technical_assets_running.push('cache');
+    }), [
+        { path: '/technical_assets/Web Server/data_assets_stored/1', message: 'unknown data asset: session-store' },
+        { path: '/technical_assets/Web Server/communication_links/Database Traffic/target', message: 'unknown technical asset: data-warehouse' },
+        { path: '/technical_assets/Web Server/communication_links/Database Traffic/data_assets_received/0', message: 'unknown data asset: reports' },
+        { path: '/trust_boundaries/Backend/trust_boundaries_nested/0', message: 'unknown trust boundary: Internet' },
+        { path: '/shared_runtimes/Cluster/technical_assets_running/2', message: 'unknown technical asset: cache' },
+    ]);
+});
+
+Deno.test('validateModelInput reports technical assets inside several trust boundaries', () => {
+    assertEquals(errorsOf(model => {
+        model.trust_boundaries['Backend'].technical_assets_inside.push('web-server');
+    }), [
+        { path: '/trust_boundaries/Backend/technical_assets_inside/1', message: "technical asset web-server is already inside trust boundary 'DMZ'" },
+    ]);
+});
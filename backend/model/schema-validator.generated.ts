@@ -0,0 +1,2201 @@
+// AUTO-GENERATED from schema.json by generate_schema_validator.ts, do not edit.
+// Run `deno task generate-validator` after changing the schema.
+// deno-lint-ignore-file no-explicit-any
+
+// path is a JSON Pointer into the model, e.g. /technical_assets/Web Server/type
+export interface SchemaError {
+    path: string;
+    message: string;
+}
+
+function isObject(value: unknown): value is Record<string, any> {
+    return typeof value === "object" && value !== null && !Array.isArray(value);
+}
+
+function childPath(path: string, key: string): string {
+    return key.includes("/") || key.includes("~") ? path + "/" + key.replace(/~/g, "~0").replace(/\//g, "~1") : path + "/" + key;
+}
+
+const enum0 = new Set<unknown>(["archive","operational","important","critical","mission-critical"]);
+const enum1 = new Set<unknown>(["business","devops"]);
+const enum2 = new Set<unknown>(["very-few","few","many","very-many"]);
+const enum3 = new Set<unknown>(["public","internal","restricted","confidential","strictly-confidential"]);
+const enum4 = new Set<unknown>(["external-entity","process","datastore"]);
+const enum5 = new Set<unknown>(["system","service","application","component"]);
+const enum6 = new Set<unknown>(["unknown-technology","client-system","browser","desktop","mobile-app","devops-client","web-server","web-application","application-server","database","file-server","local-file-system","erp","cms","web-service-rest","web-service-soap","ejb","search-index","search-engine","service-registry","reverse-proxy","load-balancer","build-pipeline","sourcecode-repository","artifact-registry","code-inspection-platform","monitoring","ldap-server","container-platform","batch-processing","event-listener","identity-provider","identity-store-ldap","identity-store-database","tool","cli","task","function","gateway","iot-device","message-queue","stream-processing","service-mesh","data-lake","report-engine","ai","mail-server","vault","hsm","waf","ids","ips","scheduler","mainframe","block-storage","library"]);
+const enum7 = new Set<unknown>(["physical","virtual","container","serverless"]);
+const enum8 = new Set<unknown>(["none","transparent","data-with-symmetric-shared-key","data-with-asymmetric-shared-key","data-with-enduser-individual-key"]);
+const enum9 = new Set<unknown>(["json","xml","serialization","file","csv"]);
+const enum10 = new Set<unknown>(["unknown-protocol","http","https","ws","wss","reverse-proxy-web-protocol","reverse-proxy-web-protocol-encrypted","mqtt","jdbc","jdbc-encrypted","odbc","odbc-encrypted","sql-access-protocol","sql-access-protocol-encrypted","nosql-access-protocol","nosql-access-protocol-encrypted","binary","binary-encrypted","text","text-encrypted","ssh","ssh-tunnel","smtp","smtp-encrypted","pop3","pop3-encrypted","imap","imap-encrypted","ftp","ftps","sftp","scp","ldap","ldaps","jms","nfs","smb","smb-encrypted","local-file-access","nrpe","xmpp","iiop","iiop-encrypted","jrmp","jrmp-encrypted","in-process-library-call","container-spawning"]);
+const enum11 = new Set<unknown>(["none","credentials","session-id","token","client-certificate","two-factor","externalized"]);
+const enum12 = new Set<unknown>(["none","technical-user","enduser-identity-propagation"]);
+const enum13 = new Set<unknown>(["network-on-prem","network-dedicated-hoster","network-virtual-lan","network-cloud-provider","network-cloud-security-group","network-policy-namespace-isolation","execution-environment"]);
+const enum14 = new Set<unknown>(["business-side","architecture","development","operations"]);
+const enum15 = new Set<unknown>(["spoofing","tampering","repudiation","information-disclosure","denial-of-service","elevation-of-privilege"]);
+const enum16 = new Set<unknown>(["low","medium","elevated","high","critical"]);
+const enum17 = new Set<unknown>(["unlikely","likely","very-likely","frequent"]);
+const enum18 = new Set<unknown>(["low","medium","high","very-high"]);
+const enum19 = new Set<unknown>(["improbable","possible","probable"]);
+const enum20 = new Set<unknown>(["unchecked","in-discussion","accepted","in-progress","mitigated","false-positive"]);
+const enum21 = new Set<unknown>(["","ortho","spline","polyline","false","curved"]);
+
+function validate0(value: any, path: string, errors: SchemaError[]): void {
+    if (!(isObject(value))) {
+        errors.push({ path, message: "must be object" });
+        return;
+    }
+    if (value["threagile_version"] === undefined) {
+        errors.push({ path, message: "missing required property threagile_version" });
+    }
+    if (value["title"] === undefined) {
+        errors.push({ path, message: "missing required property title" });
+    }
+    if (value["author"] === undefined) {
+        errors.push({ path, message: "missing required property author" });
+    }
+    if (value["business_criticality"] === undefined) {
+        errors.push({ path, message: "missing required property business_criticality" });
+    }
+    if (value["tags_available"] === undefined) {
+        errors.push({ path, message: "missing required property tags_available" });
+    }
+    if (value["data_assets"] === undefined) {
+        errors.push({ path, message: "missing required property data_assets" });
+    }
+    if (value["technical_assets"] === undefined) {
+        errors.push({ path, message: "missing required property technical_assets" });
+    }
+    if (value["shared_runtimes"] === undefined) {
+        errors.push({ path, message: "missing required property shared_runtimes" });
+    }
+    if (value["threagile_version"] !== undefined) {
+        validate1(value["threagile_version"], path + "/threagile_version", errors);
+    }
+    if (value["title"] !== undefined) {
+        validate2(value["title"], path + "/title", errors);
+    }
+    if (value["date"] !== undefined) {
+        validate3(value["date"], path + "/date", errors);
+    }
+    if (value["author"] !== undefined) {
+        validate4(value["author"], path + "/author", errors);
+    }
+    if (value["management_summary_comment"] !== undefined) {
+        validate7(value["management_summary_comment"], path + "/management_summary_comment", errors);
+    }
+    if (value["business_criticality"] !== undefined) {
+        validate8(value["business_criticality"], path + "/business_criticality", errors);
+    }
+    if (value["business_overview"] !== undefined) {
+        validate9(value["business_overview"], path + "/business_overview", errors);
+    }
+    if (value["technical_overview"] !== undefined) {
+        validate12(value["technical_overview"], path + "/technical_overview", errors);
+    }
+    if (value["questions"] !== undefined) {
+        validate15(value["questions"], path + "/questions", errors);
+    }
+    if (value["abuse_cases"] !== undefined) {
+        validate16(value["abuse_cases"], path + "/abuse_cases", errors);
+    }
+    if (value["security_requirements"] !== undefined) {
+        validate17(value["security_requirements"], path + "/security_requirements", errors);
+    }
+    if (value["tags_available"] !== undefined) {
+        validate18(value["tags_available"], path + "/tags_available", errors);
+    }
+    if (value["data_assets"] !== undefined) {
+        validate20(value["data_assets"], path + "/data_assets", errors);
+    }
+    if (value["technical_assets"] !== undefined) {
+        validate34(value["technical_assets"], path + "/technical_assets", errors);
+    }
+    if (value["trust_boundaries"] !== undefined) {
+        validate84(value["trust_boundaries"], path + "/trust_boundaries", errors);
+    }
+    if (value["shared_runtimes"] !== undefined) {
+        validate95(value["shared_runtimes"], path + "/shared_runtimes", errors);
+    }
+    if (value["individual_risk_categories"] !== undefined) {
+        validate103(value["individual_risk_categories"], path + "/individual_risk_categories", errors);
+    }
+    if (value["risk_tracking"] !== undefined) {
+        validate133(value["risk_tracking"], path + "/risk_tracking", errors);
+    }
+    if (value["diagram_tweak_suppress_edge_labels"] !== undefined) {
+        validate140(value["diagram_tweak_suppress_edge_labels"], path + "/diagram_tweak_suppress_edge_labels", errors);
+    }
+    if (value["diagram_tweak_layout_left_to_right"] !== undefined) {
+        validate141(value["diagram_tweak_layout_left_to_right"], path + "/diagram_tweak_layout_left_to_right", errors);
+    }
+    if (value["diagram_tweak_edge_layout"] !== undefined) {
+        validate142(value["diagram_tweak_edge_layout"], path + "/diagram_tweak_edge_layout", errors);
+    }
+    if (value["diagram_tweak_nodesep"] !== undefined) {
+        validate143(value["diagram_tweak_nodesep"], path + "/diagram_tweak_nodesep", errors);
+    }
+    if (value["diagram_tweak_ranksep"] !== undefined) {
+        validate144(value["diagram_tweak_ranksep"], path + "/diagram_tweak_ranksep", errors);
+    }
+    if (value["diagram_tweak_invisible_connections_between_assets"] !== undefined) {
+        validate145(value["diagram_tweak_invisible_connections_between_assets"], path + "/diagram_tweak_invisible_connections_between_assets", errors);
+    }
+    if (value["diagram_tweak_same_rank_assets"] !== undefined) {
+        validate147(value["diagram_tweak_same_rank_assets"], path + "/diagram_tweak_same_rank_assets", errors);
+    }
+    if (value["perimeta_diagram"] !== undefined) {
+        validate149(value["perimeta_diagram"], path + "/perimeta_diagram", errors);
+    }
+}
+
+function validate1(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+}
+
+function validate2(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+}
+
+function validate3(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string" || value === null)) {
+        errors.push({ path, message: "must be string or null" });
+        return;
+    }
+    if (typeof value === "string" && !(/^\d{4}-\d{2}-\d{2}$/.test(value))) {
+        errors.push({ path, message: "must be a date" });
+    }
+}
+
+function validate4(value: any, path: string, errors: SchemaError[]): void {
+    if (!(isObject(value))) {
+        errors.push({ path, message: "must be object" });
+        return;
+    }
+    if (value["name"] === undefined) {
+        errors.push({ path, message: "missing required property name" });
+    }
+    if (value["name"] !== undefined) {
+        validate5(value["name"], path + "/name", errors);
+    }
+    if (value["homepage"] !== undefined) {
+        validate6(value["homepage"], path + "/homepage", errors);
+    }
+}
+
+function validate5(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string" || value === null)) {
+        errors.push({ path, message: "must be string or null" });
+        return;
+    }
+}
+
+function validate6(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string" || value === null)) {
+        errors.push({ path, message: "must be string or null" });
+        return;
+    }
+}
+
+function validate7(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string" || value === null)) {
+        errors.push({ path, message: "must be string or null" });
+        return;
+    }
+}
+
+function validate8(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+    if (!enum0.has(value)) {
+        errors.push({ path, message: "must be one of \"archive\", \"operational\", \"important\", \"critical\", \"mission-critical\"" });
+    }
+}
+
+function validate9(value: any, path: string, errors: SchemaError[]): void {
+    if (!(isObject(value))) {
+        errors.push({ path, message: "must be object" });
+        return;
+    }
+    if (value["description"] !== undefined) {
+        validate10(value["description"], path + "/description", errors);
+    }
+    if (value["images"] !== undefined) {
+        validate11(value["images"], path + "/images", errors);
+    }
+}
+
+function validate10(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string" || value === null)) {
+        errors.push({ path, message: "must be string or null" });
+        return;
+    }
+}
+
+function validate11(value: any, path: string, errors: SchemaError[]): void {
+    if (!(Array.isArray(value) || value === null)) {
+        errors.push({ path, message: "must be array or null" });
+        return;
+    }
+    if (Array.isArray(value)) {
+        const seen = new Set<unknown>();
+        for (let i = 0; i < value.length; i++) {
+            const item = typeof value[i] === "object" ? JSON.stringify(value[i]) : value[i];
+            if (seen.has(item)) errors.push({ path: path + "/" + i, message: "is a duplicate" });
+            seen.add(item);
+        }
+    }
+}
+
+function validate12(value: any, path: string, errors: SchemaError[]): void {
+    if (!(isObject(value))) {
+        errors.push({ path, message: "must be object" });
+        return;
+    }
+    if (value["description"] !== undefined) {
+        validate13(value["description"], path + "/description", errors);
+    }
+    if (value["images"] !== undefined) {
+        validate14(value["images"], path + "/images", errors);
+    }
+}
+
+function validate13(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string" || value === null)) {
+        errors.push({ path, message: "must be string or null" });
+        return;
+    }
+}
+
+function validate14(value: any, path: string, errors: SchemaError[]): void {
+    if (!(Array.isArray(value) || value === null)) {
+        errors.push({ path, message: "must be array or null" });
+        return;
+    }
+    if (Array.isArray(value)) {
+        const seen = new Set<unknown>();
+        for (let i = 0; i < value.length; i++) {
+            const item = typeof value[i] === "object" ? JSON.stringify(value[i]) : value[i];
+            if (seen.has(item)) errors.push({ path: path + "/" + i, message: "is a duplicate" });
+            seen.add(item);
+        }
+    }
+}
+
+function validate15(value: any, path: string, errors: SchemaError[]): void {
+    if (!(isObject(value) || value === null)) {
+        errors.push({ path, message: "must be object or null" });
+        return;
+    }
+    if (Array.isArray(value)) {
+        const seen = new Set<unknown>();
+        for (let i = 0; i < value.length; i++) {
+            const item = typeof value[i] === "object" ? JSON.stringify(value[i]) : value[i];
+            if (seen.has(item)) errors.push({ path: path + "/" + i, message: "is a duplicate" });
+            seen.add(item);
+        }
+    }
+}
+
+function validate16(value: any, path: string, errors: SchemaError[]): void {
+    if (!(isObject(value) || value === null)) {
+        errors.push({ path, message: "must be object or null" });
+        return;
+    }
+    if (Array.isArray(value)) {
+        const seen = new Set<unknown>();
+        for (let i = 0; i < value.length; i++) {
+            const item = typeof value[i] === "object" ? JSON.stringify(value[i]) : value[i];
+            if (seen.has(item)) errors.push({ path: path + "/" + i, message: "is a duplicate" });
+            seen.add(item);
+        }
+    }
+}
+
+function validate17(value: any, path: string, errors: SchemaError[]): void {
+    if (!(isObject(value) || value === null)) {
+        errors.push({ path, message: "must be object or null" });
+        return;
+    }
+    if (Array.isArray(value)) {
+        const seen = new Set<unknown>();
+        for (let i = 0; i < value.length; i++) {
+            const item = typeof value[i] === "object" ? JSON.stringify(value[i]) : value[i];
+            if (seen.has(item)) errors.push({ path: path + "/" + i, message: "is a duplicate" });
+            seen.add(item);
+        }
+    }
+}
+
+function validate18(value: any, path: string, errors: SchemaError[]): void {
+    if (!(Array.isArray(value) || value === null)) {
+        errors.push({ path, message: "must be array or null" });
+        return;
+    }
+    if (Array.isArray(value)) {
+        const seen = new Set<unknown>();
+        for (let i = 0; i < value.length; i++) {
+            validate19(value[i], path + "/" + i, errors);
+            const item = typeof value[i] === "object" ? JSON.stringify(value[i]) : value[i];
+            if (seen.has(item)) errors.push({ path: path + "/" + i, message: "is a duplicate" });
+            seen.add(item);
+        }
+    }
+}
+
+function validate19(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+}
+
+function validate20(value: any, path: string, errors: SchemaError[]): void {
+    if (!(isObject(value))) {
+        errors.push({ path, message: "must be object" });
+        return;
+    }
+    for (const key in value) {
+        validate21(value[key], childPath(path, key), errors);
+    }
+    if (Array.isArray(value)) {
+        const seen = new Set<unknown>();
+        for (let i = 0; i < value.length; i++) {
+            const item = typeof value[i] === "object" ? JSON.stringify(value[i]) : value[i];
+            if (seen.has(item)) errors.push({ path: path + "/" + i, message: "is a duplicate" });
+            seen.add(item);
+        }
+    }
+}
+
+function validate21(value: any, path: string, errors: SchemaError[]): void {
+    if (!(isObject(value))) {
+        errors.push({ path, message: "must be object" });
+        return;
+    }
+    if (value["id"] === undefined) {
+        errors.push({ path, message: "missing required property id" });
+    }
+    if (value["description"] === undefined) {
+        errors.push({ path, message: "missing required property description" });
+    }
+    if (value["usage"] === undefined) {
+        errors.push({ path, message: "missing required property usage" });
+    }
+    if (value["quantity"] === undefined) {
+        errors.push({ path, message: "missing required property quantity" });
+    }
+    if (value["confidentiality"] === undefined) {
+        errors.push({ path, message: "missing required property confidentiality" });
+    }
+    if (value["integrity"] === undefined) {
+        errors.push({ path, message: "missing required property integrity" });
+    }
+    if (value["availability"] === undefined) {
+        errors.push({ path, message: "missing required property availability" });
+    }
+    if (value["id"] !== undefined) {
+        validate22(value["id"], path + "/id", errors);
+    }
+    if (value["description"] !== undefined) {
+        validate23(value["description"], path + "/description", errors);
+    }
+    if (value["usage"] !== undefined) {
+        validate24(value["usage"], path + "/usage", errors);
+    }
+    if (value["tags"] !== undefined) {
+        validate25(value["tags"], path + "/tags", errors);
+    }
+    if (value["origin"] !== undefined) {
+        validate27(value["origin"], path + "/origin", errors);
+    }
+    if (value["owner"] !== undefined) {
+        validate28(value["owner"], path + "/owner", errors);
+    }
+    if (value["quantity"] !== undefined) {
+        validate29(value["quantity"], path + "/quantity", errors);
+    }
+    if (value["confidentiality"] !== undefined) {
+        validate30(value["confidentiality"], path + "/confidentiality", errors);
+    }
+    if (value["integrity"] !== undefined) {
+        validate31(value["integrity"], path + "/integrity", errors);
+    }
+    if (value["availability"] !== undefined) {
+        validate32(value["availability"], path + "/availability", errors);
+    }
+    if (value["justification_cia_rating"] !== undefined) {
+        validate33(value["justification_cia_rating"], path + "/justification_cia_rating", errors);
+    }
+}
+
+function validate22(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+}
+
+function validate23(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string" || value === null)) {
+        errors.push({ path, message: "must be string or null" });
+        return;
+    }
+}
+
+function validate24(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+    if (!enum1.has(value)) {
+        errors.push({ path, message: "must be one of \"business\", \"devops\"" });
+    }
+}
+
+function validate25(value: any, path: string, errors: SchemaError[]): void {
+    if (!(Array.isArray(value) || value === null)) {
+        errors.push({ path, message: "must be array or null" });
+        return;
+    }
+    if (Array.isArray(value)) {
+        const seen = new Set<unknown>();
+        for (let i = 0; i < value.length; i++) {
+            validate26(value[i], path + "/" + i, errors);
+            const item = typeof value[i] === "object" ? JSON.stringify(value[i]) : value[i];
+            if (seen.has(item)) errors.push({ path: path + "/" + i, message: "is a duplicate" });
+            seen.add(item);
+        }
+    }
+}
+
+function validate26(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+}
+
+function validate27(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string" || value === null)) {
+        errors.push({ path, message: "must be string or null" });
+        return;
+    }
+}
+
+function validate28(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string" || value === null)) {
+        errors.push({ path, message: "must be string or null" });
+        return;
+    }
+}
+
+function validate29(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+    if (!enum2.has(value)) {
+        errors.push({ path, message: "must be one of \"very-few\", \"few\", \"many\", \"very-many\"" });
+    }
+}
+
+function validate30(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+    if (!enum3.has(value)) {
+        errors.push({ path, message: "must be one of \"public\", \"internal\", \"restricted\", \"confidential\", \"strictly-confidential\"" });
+    }
+}
+
+function validate31(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+    if (!enum0.has(value)) {
+        errors.push({ path, message: "must be one of \"archive\", \"operational\", \"important\", \"critical\", \"mission-critical\"" });
+    }
+}
+
+function validate32(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+    if (!enum0.has(value)) {
+        errors.push({ path, message: "must be one of \"archive\", \"operational\", \"important\", \"critical\", \"mission-critical\"" });
+    }
+}
+
+function validate33(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string" || value === null)) {
+        errors.push({ path, message: "must be string or null" });
+        return;
+    }
+}
+
+function validate34(value: any, path: string, errors: SchemaError[]): void {
+    if (!(isObject(value))) {
+        errors.push({ path, message: "must be object" });
+        return;
+    }
+    for (const key in value) {
+        validate35(value[key], childPath(path, key), errors);
+    }
+    if (Array.isArray(value)) {
+        const seen = new Set<unknown>();
+        for (let i = 0; i < value.length; i++) {
+            const item = typeof value[i] === "object" ? JSON.stringify(value[i]) : value[i];
+            if (seen.has(item)) errors.push({ path: path + "/" + i, message: "is a duplicate" });
+            seen.add(item);
+        }
+    }
+}
+
+function validate35(value: any, path: string, errors: SchemaError[]): void {
+    if (!(isObject(value))) {
+        errors.push({ path, message: "must be object" });
+        return;
+    }
+    if (value["id"] === undefined) {
+        errors.push({ path, message: "missing required property id" });
+    }
+    if (value["description"] === undefined) {
+        errors.push({ path, message: "missing required property description" });
+    }
+    if (value["type"] === undefined) {
+        errors.push({ path, message: "missing required property type" });
+    }
+    if (value["usage"] === undefined) {
+        errors.push({ path, message: "missing required property usage" });
+    }
+    if (value["used_as_client_by_human"] === undefined) {
+        errors.push({ path, message: "missing required property used_as_client_by_human" });
+    }
+    if (value["out_of_scope"] === undefined) {
+        errors.push({ path, message: "missing required property out_of_scope" });
+    }
+    if (value["size"] === undefined) {
+        errors.push({ path, message: "missing required property size" });
+    }
+    if (value["technology"] === undefined) {
+        errors.push({ path, message: "missing required property technology" });
+    }
+    if (value["internet"] === undefined) {
+        errors.push({ path, message: "missing required property internet" });
+    }
+    if (value["machine"] === undefined) {
+        errors.push({ path, message: "missing required property machine" });
+    }
+    if (value["encryption"] === undefined) {
+        errors.push({ path, message: "missing required property encryption" });
+    }
+    if (value["owner"] === undefined) {
+        errors.push({ path, message: "missing required property owner" });
+    }
+    if (value["confidentiality"] === undefined) {
+        errors.push({ path, message: "missing required property confidentiality" });
+    }
+    if (value["integrity"] === undefined) {
+        errors.push({ path, message: "missing required property integrity" });
+    }
+    if (value["availability"] === undefined) {
+        errors.push({ path, message: "missing required property availability" });
+    }
+    if (value["multi_tenant"] === undefined) {
+        errors.push({ path, message: "missing required property multi_tenant" });
+    }
+    if (value["redundant"] === undefined) {
+        errors.push({ path, message: "missing required property redundant" });
+    }
+    if (value["custom_developed_parts"] === undefined) {
+        errors.push({ path, message: "missing required property custom_developed_parts" });
+    }
+    if (value["data_assets_processed"] === undefined) {
+        errors.push({ path, message: "missing required property data_assets_processed" });
+    }
+    if (value["data_assets_stored"] === undefined) {
+        errors.push({ path, message: "missing required property data_assets_stored" });
+    }
+    if (value["data_formats_accepted"] === undefined) {
+        errors.push({ path, message: "missing required property data_formats_accepted" });
+    }
+    if (value["communication_links"] === undefined) {
+        errors.push({ path, message: "missing required property communication_links" });
+    }
+    if (value["id"] !== undefined) {
+        validate36(value["id"], path + "/id", errors);
+    }
+    if (value["description"] !== undefined) {
+        validate37(value["description"], path + "/description", errors);
+    }
+    if (value["type"] !== undefined) {
+        validate38(value["type"], path + "/type", errors);
+    }
+    if (value["usage"] !== undefined) {
+        validate39(value["usage"], path + "/usage", errors);
+    }
+    if (value["used_as_client_by_human"] !== undefined) {
+        validate40(value["used_as_client_by_human"], path + "/used_as_client_by_human", errors);
+    }
+    if (value["out_of_scope"] !== undefined) {
+        validate41(value["out_of_scope"], path + "/out_of_scope", errors);
+    }
+    if (value["justification_out_of_scope"] !== undefined) {
+        validate42(value["justification_out_of_scope"], path + "/justification_out_of_scope", errors);
+    }
+    if (value["size"] !== undefined) {
+        validate43(value["size"], path + "/size", errors);
+    }
+    if (value["technology"] !== undefined) {
+        validate44(value["technology"], path + "/technology", errors);
+    }
+    if (value["tags"] !== undefined) {
+        validate45(value["tags"], path + "/tags", errors);
+    }
+    if (value["internet"] !== undefined) {
+        validate47(value["internet"], path + "/internet", errors);
+    }
+    if (value["machine"] !== undefined) {
+        validate48(value["machine"], path + "/machine", errors);
+    }
+    if (value["encryption"] !== undefined) {
+        validate49(value["encryption"], path + "/encryption", errors);
+    }
+    if (value["owner"] !== undefined) {
+        validate50(value["owner"], path + "/owner", errors);
+    }
+    if (value["confidentiality"] !== undefined) {
+        validate51(value["confidentiality"], path + "/confidentiality", errors);
+    }
+    if (value["integrity"] !== undefined) {
+        validate52(value["integrity"], path + "/integrity", errors);
+    }
+    if (value["availability"] !== undefined) {
+        validate53(value["availability"], path + "/availability", errors);
+    }
+    if (value["justification_cia_rating"] !== undefined) {
+        validate54(value["justification_cia_rating"], path + "/justification_cia_rating", errors);
+    }
+    if (value["multi_tenant"] !== undefined) {
+        validate55(value["multi_tenant"], path + "/multi_tenant", errors);
+    }
+    if (value["redundant"] !== undefined) {
+        validate56(value["redundant"], path + "/redundant", errors);
+    }
+    if (value["custom_developed_parts"] !== undefined) {
+        validate57(value["custom_developed_parts"], path + "/custom_developed_parts", errors);
+    }
+    if (value["data_assets_processed"] !== undefined) {
+        validate58(value["data_assets_processed"], path + "/data_assets_processed", errors);
+    }
+    if (value["data_assets_stored"] !== undefined) {
+        validate60(value["data_assets_stored"], path + "/data_assets_stored", errors);
+    }
+    if (value["data_formats_accepted"] !== undefined) {
+        validate62(value["data_formats_accepted"], path + "/data_formats_accepted", errors);
+    }
+    if (value["diagram_tweak_order"] !== undefined) {
+        validate64(value["diagram_tweak_order"], path + "/diagram_tweak_order", errors);
+    }
+    if (value["communication_links"] !== undefined) {
+        validate65(value["communication_links"], path + "/communication_links", errors);
+    }
+}
+
+function validate36(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+}
+
+function validate37(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string" || value === null)) {
+        errors.push({ path, message: "must be string or null" });
+        return;
+    }
+}
+
+function validate38(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+    if (!enum4.has(value)) {
+        errors.push({ path, message: "must be one of \"external-entity\", \"process\", \"datastore\"" });
+    }
+}
+
+function validate39(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+    if (!enum1.has(value)) {
+        errors.push({ path, message: "must be one of \"business\", \"devops\"" });
+    }
+}
+
+function validate40(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "boolean")) {
+        errors.push({ path, message: "must be boolean" });
+        return;
+    }
+}
+
+function validate41(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "boolean")) {
+        errors.push({ path, message: "must be boolean" });
+        return;
+    }
+}
+
+function validate42(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string" || value === null)) {
+        errors.push({ path, message: "must be string or null" });
+        return;
+    }
+}
+
+function validate43(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+    if (!enum5.has(value)) {
+        errors.push({ path, message: "must be one of \"system\", \"service\", \"application\", \"component\"" });
+    }
+}
+
+function validate44(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+    if (!enum6.has(value)) {
+        errors.push({ path, message: "must be one of \"unknown-technology\", \"client-system\", \"browser\", \"desktop\", \"mobile-app\", \"devops-client\", \"web-server\", \"web-application\", \"application-server\", \"database\", \"file-server\", \"local-file-system\", \"erp\", \"cms\", \"web-service-rest\", \"web-service-soap\", \"ejb\", \"search-index\", \"search-engine\", \"service-registry\", \"reverse-proxy\", \"load-balancer\", \"build-pipeline\", \"sourcecode-repository\", \"artifact-registry\", \"code-inspection-platform\", \"monitoring\", \"ldap-server\", \"container-platform\", \"batch-processing\", \"event-listener\", \"identity-provider\", \"identity-store-ldap\", \"identity-store-database\", \"tool\", \"cli\", \"task\", \"function\", \"gateway\", \"iot-device\", \"message-queue\", \"stream-processing\", \"service-mesh\", \"data-lake\", \"report-engine\", \"ai\", \"mail-server\", \"vault\", \"hsm\", \"waf\", \"ids\", \"ips\", \"scheduler\", \"mainframe\", \"block-storage\", \"library\"" });
+    }
+}
+
+function validate45(value: any, path: string, errors: SchemaError[]): void {
+    if (!(Array.isArray(value) || value === null)) {
+        errors.push({ path, message: "must be array or null" });
+        return;
+    }
+    if (Array.isArray(value)) {
+        const seen = new Set<unknown>();
+        for (let i = 0; i < value.length; i++) {
+            validate46(value[i], path + "/" + i, errors);
+            const item = typeof value[i] === "object" ? JSON.stringify(value[i]) : value[i];
+            if (seen.has(item)) errors.push({ path: path + "/" + i, message: "is a duplicate" });
+            seen.add(item);
+        }
+    }
+}
+
+function validate46(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+}
+
+function validate47(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "boolean")) {
+        errors.push({ path, message: "must be boolean" });
+        return;
+    }
+}
+
+function validate48(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+    if (!enum7.has(value)) {
+        errors.push({ path, message: "must be one of \"physical\", \"virtual\", \"container\", \"serverless\"" });
+    }
+}
+
+function validate49(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+    if (!enum8.has(value)) {
+        errors.push({ path, message: "must be one of \"none\", \"transparent\", \"data-with-symmetric-shared-key\", \"data-with-asymmetric-shared-key\", \"data-with-enduser-individual-key\"" });
+    }
+}
+
+function validate50(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string" || value === null)) {
+        errors.push({ path, message: "must be string or null" });
+        return;
+    }
+}
+
+function validate51(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+    if (!enum3.has(value)) {
+        errors.push({ path, message: "must be one of \"public\", \"internal\", \"restricted\", \"confidential\", \"strictly-confidential\"" });
+    }
+}
+
+function validate52(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+    if (!enum0.has(value)) {
+        errors.push({ path, message: "must be one of \"archive\", \"operational\", \"important\", \"critical\", \"mission-critical\"" });
+    }
+}
+
+function validate53(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+    if (!enum0.has(value)) {
+        errors.push({ path, message: "must be one of \"archive\", \"operational\", \"important\", \"critical\", \"mission-critical\"" });
+    }
+}
+
+function validate54(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string" || value === null)) {
+        errors.push({ path, message: "must be string or null" });
+        return;
+    }
+}
+
+function validate55(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "boolean")) {
+        errors.push({ path, message: "must be boolean" });
+        return;
+    }
+}
+
+function validate56(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "boolean")) {
+        errors.push({ path, message: "must be boolean" });
+        return;
+    }
+}
+
+function validate57(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "boolean")) {
+        errors.push({ path, message: "must be boolean" });
+        return;
+    }
+}
+
+function validate58(value: any, path: string, errors: SchemaError[]): void {
+    if (!(Array.isArray(value) || value === null)) {
+        errors.push({ path, message: "must be array or null" });
+        return;
+    }
+    if (Array.isArray(value)) {
+        const seen = new Set<unknown>();
+        for (let i = 0; i < value.length; i++) {
+            validate59(value[i], path + "/" + i, errors);
+            const item = typeof value[i] === "object" ? JSON.stringify(value[i]) : value[i];
+            if (seen.has(item)) errors.push({ path: path + "/" + i, message: "is a duplicate" });
+            seen.add(item);
+        }
+    }
+}
+
+function validate59(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+}
+
+function validate60(value: any, path: string, errors: SchemaError[]): void {
+    if (!(Array.isArray(value) || value === null)) {
+        errors.push({ path, message: "must be array or null" });
+        return;
+    }
+    if (Array.isArray(value)) {
+        const seen = new Set<unknown>();
+        for (let i = 0; i < value.length; i++) {
+            validate61(value[i], path + "/" + i, errors);
+            const item = typeof value[i] === "object" ? JSON.stringify(value[i]) : value[i];
+            if (seen.has(item)) errors.push({ path: path + "/" + i, message: "is a duplicate" });
+            seen.add(item);
+        }
+    }
+}
+
+function validate61(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+}
+
+function validate62(value: any, path: string, errors: SchemaError[]): void {
+    if (!(Array.isArray(value) || value === null)) {
+        errors.push({ path, message: "must be array or null" });
+        return;
+    }
+    if (Array.isArray(value)) {
+        const seen = new Set<unknown>();
+        for (let i = 0; i < value.length; i++) {
+            validate63(value[i], path + "/" + i, errors);
+            const item = typeof value[i] === "object" ? JSON.stringify(value[i]) : value[i];
+            if (seen.has(item)) errors.push({ path: path + "/" + i, message: "is a duplicate" });
+            seen.add(item);
+        }
+    }
+}
+
+function validate63(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+    if (!enum9.has(value)) {
+        errors.push({ path, message: "must be one of \"json\", \"xml\", \"serialization\", \"file\", \"csv\"" });
+    }
+}
+
+function validate64(value: any, path: string, errors: SchemaError[]): void {
+    if (!(Number.isInteger(value))) {
+        errors.push({ path, message: "must be integer" });
+        return;
+    }
+}
+
+function validate65(value: any, path: string, errors: SchemaError[]): void {
+    if (!(isObject(value) || value === null)) {
+        errors.push({ path, message: "must be object or null" });
+        return;
+    }
+    if (isObject(value)) {
+        for (const key in value) {
+            validate66(value[key], childPath(path, key), errors);
+        }
+    }
+    if (Array.isArray(value)) {
+        const seen = new Set<unknown>();
+        for (let i = 0; i < value.length; i++) {
+            const item = typeof value[i] === "object" ? JSON.stringify(value[i]) : value[i];
+            if (seen.has(item)) errors.push({ path: path + "/" + i, message: "is a duplicate" });
+            seen.add(item);
+        }
+    }
+}
+
+function validate66(value: any, path: string, errors: SchemaError[]): void {
+    if (!(isObject(value))) {
+        errors.push({ path, message: "must be object" });
+        return;
+    }
+    if (value["target"] === undefined) {
+        errors.push({ path, message: "missing required property target" });
+    }
+    if (value["description"] === undefined) {
+        errors.push({ path, message: "missing required property description" });
+    }
+    if (value["protocol"] === undefined) {
+        errors.push({ path, message: "missing required property protocol" });
+    }
+    if (value["authentication"] === undefined) {
+        errors.push({ path, message: "missing required property authentication" });
+    }
+    if (value["authorization"] === undefined) {
+        errors.push({ path, message: "missing required property authorization" });
+    }
+    if (value["vpn"] === undefined) {
+        errors.push({ path, message: "missing required property vpn" });
+    }
+    if (value["ip_filtered"] === undefined) {
+        errors.push({ path, message: "missing required property ip_filtered" });
+    }
+    if (value["readonly"] === undefined) {
+        errors.push({ path, message: "missing required property readonly" });
+    }
+    if (value["usage"] === undefined) {
+        errors.push({ path, message: "missing required property usage" });
+    }
+    if (value["data_assets_sent"] === undefined) {
+        errors.push({ path, message: "missing required property data_assets_sent" });
+    }
+    if (value["data_assets_received"] === undefined) {
+        errors.push({ path, message: "missing required property data_assets_received" });
+    }
+    if (value["target"] !== undefined) {
+        validate67(value["target"], path + "/target", errors);
+    }
+    if (value["description"] !== undefined) {
+        validate68(value["description"], path + "/description", errors);
+    }
+    if (value["protocol"] !== undefined) {
+        validate69(value["protocol"], path + "/protocol", errors);
+    }
+    if (value["authentication"] !== undefined) {
+        validate70(value["authentication"], path + "/authentication", errors);
+    }
+    if (value["authorization"] !== undefined) {
+        validate71(value["authorization"], path + "/authorization", errors);
+    }
+    if (value["tags"] !== undefined) {
+        validate72(value["tags"], path + "/tags", errors);
+    }
+    if (value["vpn"] !== undefined) {
+        validate74(value["vpn"], path + "/vpn", errors);
+    }
+    if (value["ip_filtered"] !== undefined) {
+        validate75(value["ip_filtered"], path + "/ip_filtered", errors);
+    }
+    if (value["readonly"] !== undefined) {
+        validate76(value["readonly"], path + "/readonly", errors);
+    }
+    if (value["usage"] !== undefined) {
+        validate77(value["usage"], path + "/usage", errors);
+    }
+    if (value["data_assets_sent"] !== undefined) {
+        validate78(value["data_assets_sent"], path + "/data_assets_sent", errors);
+    }
+    if (value["data_assets_received"] !== undefined) {
+        validate80(value["data_assets_received"], path + "/data_assets_received", errors);
+    }
+    if (value["diagram_tweak_weight"] !== undefined) {
+        validate82(value["diagram_tweak_weight"], path + "/diagram_tweak_weight", errors);
+    }
+    if (value["diagram_tweak_constraint"] !== undefined) {
+        validate83(value["diagram_tweak_constraint"], path + "/diagram_tweak_constraint", errors);
+    }
+}
+
+function validate67(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+}
+
+function validate68(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string" || value === null)) {
+        errors.push({ path, message: "must be string or null" });
+        return;
+    }
+}
+
+function validate69(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+    if (!enum10.has(value)) {
+        errors.push({ path, message: "must be one of \"unknown-protocol\", \"http\", \"https\", \"ws\", \"wss\", \"reverse-proxy-web-protocol\", \"reverse-proxy-web-protocol-encrypted\", \"mqtt\", \"jdbc\", \"jdbc-encrypted\", \"odbc\", \"odbc-encrypted\", \"sql-access-protocol\", \"sql-access-protocol-encrypted\", \"nosql-access-protocol\", \"nosql-access-protocol-encrypted\", \"binary\", \"binary-encrypted\", \"text\", \"text-encrypted\", \"ssh\", \"ssh-tunnel\", \"smtp\", \"smtp-encrypted\", \"pop3\", \"pop3-encrypted\", \"imap\", \"imap-encrypted\", \"ftp\", \"ftps\", \"sftp\", \"scp\", \"ldap\", \"ldaps\", \"jms\", \"nfs\", \"smb\", \"smb-encrypted\", \"local-file-access\", \"nrpe\", \"xmpp\", \"iiop\", \"iiop-encrypted\", \"jrmp\", \"jrmp-encrypted\", \"in-process-library-call\", \"container-spawning\"" });
+    }
+}
+
+function validate70(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+    if (!enum11.has(value)) {
+        errors.push({ path, message: "must be one of \"none\", \"credentials\", \"session-id\", \"token\", \"client-certificate\", \"two-factor\", \"externalized\"" });
+    }
+}
+
+function validate71(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+    if (!enum12.has(value)) {
+        errors.push({ path, message: "must be one of \"none\", \"technical-user\", \"enduser-identity-propagation\"" });
+    }
+}
+
+function validate72(value: any, path: string, errors: SchemaError[]): void {
+    if (!(Array.isArray(value) || value === null)) {
+        errors.push({ path, message: "must be array or null" });
+        return;
+    }
+    if (Array.isArray(value)) {
+        const seen = new Set<unknown>();
+        for (let i = 0; i < value.length; i++) {
+            validate73(value[i], path + "/" + i, errors);
+            const item = typeof value[i] === "object" ? JSON.stringify(value[i]) : value[i];
+            if (seen.has(item)) errors.push({ path: path + "/" + i, message: "is a duplicate" });
+            seen.add(item);
+        }
+    }
+}
+
+function validate73(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+}
+
+function validate74(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "boolean")) {
+        errors.push({ path, message: "must be boolean" });
+        return;
+    }
+}
+
+function validate75(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "boolean")) {
+        errors.push({ path, message: "must be boolean" });
+        return;
+    }
+}
+
+function validate76(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "boolean")) {
+        errors.push({ path, message: "must be boolean" });
+        return;
+    }
+}
+
+function validate77(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+    if (!enum1.has(value)) {
+        errors.push({ path, message: "must be one of \"business\", \"devops\"" });
+    }
+}
+
+function validate78(value: any, path: string, errors: SchemaError[]): void {
+    if (!(Array.isArray(value) || value === null)) {
+        errors.push({ path, message: "must be array or null" });
+        return;
+    }
+    if (Array.isArray(value)) {
+        const seen = new Set<unknown>();
+        for (let i = 0; i < value.length; i++) {
+            validate79(value[i], path + "/" + i, errors);
+            const item = typeof value[i] === "object" ? JSON.stringify(value[i]) : value[i];
+            if (seen.has(item)) errors.push({ path: path + "/" + i, message: "is a duplicate" });
+            seen.add(item);
+        }
+    }
+}
+
+function validate79(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+}
+
+function validate80(value: any, path: string, errors: SchemaError[]): void {
+    if (!(Array.isArray(value) || value === null)) {
+        errors.push({ path, message: "must be array or null" });
+        return;
+    }
+    if (Array.isArray(value)) {
+        const seen = new Set<unknown>();
+        for (let i = 0; i < value.length; i++) {
+            validate81(value[i], path + "/" + i, errors);
+            const item = typeof value[i] === "object" ? JSON.stringify(value[i]) : value[i];
+            if (seen.has(item)) errors.push({ path: path + "/" + i, message: "is a duplicate" });
+            seen.add(item);
+        }
+    }
+}
+
+function validate81(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+}
+
+function validate82(value: any, path: string, errors: SchemaError[]): void {
+    if (!(Number.isInteger(value))) {
+        errors.push({ path, message: "must be integer" });
+        return;
+    }
+}
+
+function validate83(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "boolean")) {
+        errors.push({ path, message: "must be boolean" });
+        return;
+    }
+}
+
+function validate84(value: any, path: string, errors: SchemaError[]): void {
+    if (!(isObject(value))) {
+        errors.push({ path, message: "must be object" });
+        return;
+    }
+    for (const key in value) {
+        validate85(value[key], childPath(path, key), errors);
+    }
+    if (Array.isArray(value)) {
+        const seen = new Set<unknown>();
+        for (let i = 0; i < value.length; i++) {
+            const item = typeof value[i] === "object" ? JSON.stringify(value[i]) : value[i];
+            if (seen.has(item)) errors.push({ path: path + "/" + i, message: "is a duplicate" });
+            seen.add(item);
+        }
+    }
+}
+
+function validate85(value: any, path: string, errors: SchemaError[]): void {
+    if (!(isObject(value))) {
+        errors.push({ path, message: "must be object" });
+        return;
+    }
+    if (value["id"] === undefined) {
+        errors.push({ path, message: "missing required property id" });
+    }
+    if (value["description"] === undefined) {
+        errors.push({ path, message: "missing required property description" });
+    }
+    if (value["type"] === undefined) {
+        errors.push({ path, message: "missing required property type" });
+    }
+    if (value["technical_assets_inside"] === undefined) {
+        errors.push({ path, message: "missing required property technical_assets_inside" });
+    }
+    if (value["trust_boundaries_nested"] === undefined) {
+        errors.push({ path, message: "missing required property trust_boundaries_nested" });
+    }
+    if (value["id"] !== undefined) {
+        validate86(value["id"], path + "/id", errors);
+    }
+    if (value["description"] !== undefined) {
+        validate87(value["description"], path + "/description", errors);
+    }
+    if (value["type"] !== undefined) {
+        validate88(value["type"], path + "/type", errors);
+    }
+    if (value["tags"] !== undefined) {
+        validate89(value["tags"], path + "/tags", errors);
+    }
+    if (value["technical_assets_inside"] !== undefined) {
+        validate91(value["technical_assets_inside"], path + "/technical_assets_inside", errors);
+    }
+    if (value["trust_boundaries_nested"] !== undefined) {
+        validate93(value["trust_boundaries_nested"], path + "/trust_boundaries_nested", errors);
+    }
+}
+
+function validate86(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+}
+
+function validate87(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string" || value === null)) {
+        errors.push({ path, message: "must be string or null" });
+        return;
+    }
+}
+
+function validate88(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+    if (!enum13.has(value)) {
+        errors.push({ path, message: "must be one of \"network-on-prem\", \"network-dedicated-hoster\", \"network-virtual-lan\", \"network-cloud-provider\", \"network-cloud-security-group\", \"network-policy-namespace-isolation\", \"execution-environment\"" });
+    }
+}
+
+function validate89(value: any, path: string, errors: SchemaError[]): void {
+    if (!(Array.isArray(value) || value === null)) {
+        errors.push({ path, message: "must be array or null" });
+        return;
+    }
+    if (Array.isArray(value)) {
+        const seen = new Set<unknown>();
+        for (let i = 0; i < value.length; i++) {
+            validate90(value[i], path + "/" + i, errors);
+            const item = typeof value[i] === "object" ? JSON.stringify(value[i]) : value[i];
+            if (seen.has(item)) errors.push({ path: path + "/" + i, message: "is a duplicate" });
+            seen.add(item);
+        }
+    }
+}
+
+function validate90(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+}
+
+function validate91(value: any, path: string, errors: SchemaError[]): void {
+    if (!(Array.isArray(value) || value === null)) {
+        errors.push({ path, message: "must be array or null" });
+        return;
+    }
+    if (Array.isArray(value)) {
+        const seen = new Set<unknown>();
+        for (let i = 0; i < value.length; i++) {
+            validate92(value[i], path + "/" + i, errors);
+            const item = typeof value[i] === "object" ? JSON.stringify(value[i]) : value[i];
+            if (seen.has(item)) errors.push({ path: path + "/" + i, message: "is a duplicate" });
+            seen.add(item);
+        }
+    }
+}
+
+function validate92(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+}
+
+function validate93(value: any, path: string, errors: SchemaError[]): void {
+    if (!(Array.isArray(value) || value === null)) {
+        errors.push({ path, message: "must be array or null" });
+        return;
+    }
+    if (Array.isArray(value)) {
+        const seen = new Set<unknown>();
+        for (let i = 0; i < value.length; i++) {
+            validate94(value[i], path + "/" + i, errors);
+            const item = typeof value[i] === "object" ? JSON.stringify(value[i]) : value[i];
+            if (seen.has(item)) errors.push({ path: path + "/" + i, message: "is a duplicate" });
+            seen.add(item);
+        }
+    }
+}
+
+function validate94(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+}
+
+function validate95(value: any, path: string, errors: SchemaError[]): void {
+    if (!(isObject(value))) {
+        errors.push({ path, message: "must be object" });
+        return;
+    }
+    for (const key in value) {
+        validate96(value[key], childPath(path, key), errors);
+    }
+    if (Array.isArray(value)) {
+        const seen = new Set<unknown>();
+        for (let i = 0; i < value.length; i++) {
+            const item = typeof value[i] === "object" ? JSON.stringify(value[i]) : value[i];
+            if (seen.has(item)) errors.push({ path: path + "/" + i, message: "is a duplicate" });
+            seen.add(item);
+        }
+    }
+}
+
+function validate96(value: any, path: string, errors: SchemaError[]): void {
+    if (!(isObject(value))) {
+        errors.push({ path, message: "must be object" });
+        return;
+    }
+    if (value["id"] === undefined) {
+        errors.push({ path, message: "missing required property id" });
+    }
+    if (value["description"] === undefined) {
+        errors.push({ path, message: "missing required property description" });
+    }
+    if (value["technical_assets_running"] === undefined) {
+        errors.push({ path, message: "missing required property technical_assets_running" });
+    }
+    if (value["id"] !== undefined) {
+        validate97(value["id"], path + "/id", errors);
+    }
+    if (value["description"] !== undefined) {
+        validate98(value["description"], path + "/description", errors);
+    }
+    if (value["tags"] !== undefined) {
+        validate99(value["tags"], path + "/tags", errors);
+    }
+    if (value["technical_assets_running"] !== undefined) {
+        validate101(value["technical_assets_running"], path + "/technical_assets_running", errors);
+    }
+}
+
+function validate97(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+}
+
+function validate98(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string" || value === null)) {
+        errors.push({ path, message: "must be string or null" });
+        return;
+    }
+}
+
+function validate99(value: any, path: string, errors: SchemaError[]): void {
+    if (!(Array.isArray(value) || value === null)) {
+        errors.push({ path, message: "must be array or null" });
+        return;
+    }
+    if (Array.isArray(value)) {
+        const seen = new Set<unknown>();
+        for (let i = 0; i < value.length; i++) {
+            validate100(value[i], path + "/" + i, errors);
+            const item = typeof value[i] === "object" ? JSON.stringify(value[i]) : value[i];
+            if (seen.has(item)) errors.push({ path: path + "/" + i, message: "is a duplicate" });
+            seen.add(item);
+        }
+    }
+}
+
+function validate100(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+}
+
+function validate101(value: any, path: string, errors: SchemaError[]): void {
+    if (!(Array.isArray(value) || value === null)) {
+        errors.push({ path, message: "must be array or null" });
+        return;
+    }
+    if (Array.isArray(value)) {
+        const seen = new Set<unknown>();
+        for (let i = 0; i < value.length; i++) {
+            validate102(value[i], path + "/" + i, errors);
+            const item = typeof value[i] === "object" ? JSON.stringify(value[i]) : value[i];
+            if (seen.has(item)) errors.push({ path: path + "/" + i, message: "is a duplicate" });
+            seen.add(item);
+        }
+    }
+}
+
+function validate102(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+}
+
+function validate103(value: any, path: string, errors: SchemaError[]): void {
+    if (!(isObject(value) || value === null)) {
+        errors.push({ path, message: "must be object or null" });
+        return;
+    }
+    if (isObject(value)) {
+        for (const key in value) {
+            validate104(value[key], childPath(path, key), errors);
+        }
+    }
+    if (Array.isArray(value)) {
+        const seen = new Set<unknown>();
+        for (let i = 0; i < value.length; i++) {
+            const item = typeof value[i] === "object" ? JSON.stringify(value[i]) : value[i];
+            if (seen.has(item)) errors.push({ path: path + "/" + i, message: "is a duplicate" });
+            seen.add(item);
+        }
+    }
+}
+
+function validate104(value: any, path: string, errors: SchemaError[]): void {
+    if (!(isObject(value))) {
+        errors.push({ path, message: "must be object" });
+        return;
+    }
+    if (value["id"] === undefined) {
+        errors.push({ path, message: "missing required property id" });
+    }
+    if (value["description"] === undefined) {
+        errors.push({ path, message: "missing required property description" });
+    }
+    if (value["impact"] === undefined) {
+        errors.push({ path, message: "missing required property impact" });
+    }
+    if (value["asvs"] === undefined) {
+        errors.push({ path, message: "missing required property asvs" });
+    }
+    if (value["cheat_sheet"] === undefined) {
+        errors.push({ path, message: "missing required property cheat_sheet" });
+    }
+    if (value["action"] === undefined) {
+        errors.push({ path, message: "missing required property action" });
+    }
+    if (value["mitigation"] === undefined) {
+        errors.push({ path, message: "missing required property mitigation" });
+    }
+    if (value["check"] === undefined) {
+        errors.push({ path, message: "missing required property check" });
+    }
+    if (value["function"] === undefined) {
+        errors.push({ path, message: "missing required property function" });
+    }
+    if (value["stride"] === undefined) {
+        errors.push({ path, message: "missing required property stride" });
+    }
+    if (value["detection_logic"] === undefined) {
+        errors.push({ path, message: "missing required property detection_logic" });
+    }
+    if (value["risk_assessment"] === undefined) {
+        errors.push({ path, message: "missing required property risk_assessment" });
+    }
+    if (value["false_positives"] === undefined) {
+        errors.push({ path, message: "missing required property false_positives" });
+    }
+    if (value["model_failure_possible_reason"] === undefined) {
+        errors.push({ path, message: "missing required property model_failure_possible_reason" });
+    }
+    if (value["cwe"] === undefined) {
+        errors.push({ path, message: "missing required property cwe" });
+    }
+    if (value["risks_identified"] === undefined) {
+        errors.push({ path, message: "missing required property risks_identified" });
+    }
+    if (value["id"] !== undefined) {
+        validate105(value["id"], path + "/id", errors);
+    }
+    if (value["description"] !== undefined) {
+        validate106(value["description"], path + "/description", errors);
+    }
+    if (value["impact"] !== undefined) {
+        validate107(value["impact"], path + "/impact", errors);
+    }
+    if (value["asvs"] !== undefined) {
+        validate108(value["asvs"], path + "/asvs", errors);
+    }
+    if (value["cheat_sheet"] !== undefined) {
+        validate109(value["cheat_sheet"], path + "/cheat_sheet", errors);
+    }
+    if (value["action"] !== undefined) {
+        validate110(value["action"], path + "/action", errors);
+    }
+    if (value["mitigation"] !== undefined) {
+        validate111(value["mitigation"], path + "/mitigation", errors);
+    }
+    if (value["check"] !== undefined) {
+        validate112(value["check"], path + "/check", errors);
+    }
+    if (value["function"] !== undefined) {
+        validate113(value["function"], path + "/function", errors);
+    }
+    if (value["stride"] !== undefined) {
+        validate114(value["stride"], path + "/stride", errors);
+    }
+    if (value["detection_logic"] !== undefined) {
+        validate115(value["detection_logic"], path + "/detection_logic", errors);
+    }
+    if (value["risk_assessment"] !== undefined) {
+        validate116(value["risk_assessment"], path + "/risk_assessment", errors);
+    }
+    if (value["false_positives"] !== undefined) {
+        validate117(value["false_positives"], path + "/false_positives", errors);
+    }
+    if (value["model_failure_possible_reason"] !== undefined) {
+        validate118(value["model_failure_possible_reason"], path + "/model_failure_possible_reason", errors);
+    }
+    if (value["cwe"] !== undefined) {
+        validate119(value["cwe"], path + "/cwe", errors);
+    }
+    if (value["risks_identified"] !== undefined) {
+        validate120(value["risks_identified"], path + "/risks_identified", errors);
+    }
+}
+
+function validate105(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+}
+
+function validate106(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string" || value === null)) {
+        errors.push({ path, message: "must be string or null" });
+        return;
+    }
+}
+
+function validate107(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+}
+
+function validate108(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+}
+
+function validate109(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+}
+
+function validate110(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+}
+
+function validate111(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+}
+
+function validate112(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+}
+
+function validate113(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+    if (!enum14.has(value)) {
+        errors.push({ path, message: "must be one of \"business-side\", \"architecture\", \"development\", \"operations\"" });
+    }
+}
+
+function validate114(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+    if (!enum15.has(value)) {
+        errors.push({ path, message: "must be one of \"spoofing\", \"tampering\", \"repudiation\", \"information-disclosure\", \"denial-of-service\", \"elevation-of-privilege\"" });
+    }
+}
+
+function validate115(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+}
+
+function validate116(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+}
+
+function validate117(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+}
+
+function validate118(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "boolean")) {
+        errors.push({ path, message: "must be boolean" });
+        return;
+    }
+}
+
+function validate119(value: any, path: string, errors: SchemaError[]): void {
+    if (!(Number.isInteger(value))) {
+        errors.push({ path, message: "must be integer" });
+        return;
+    }
+}
+
+function validate120(value: any, path: string, errors: SchemaError[]): void {
+    if (!(isObject(value))) {
+        errors.push({ path, message: "must be object" });
+        return;
+    }
+    for (const key in value) {
+        validate121(value[key], childPath(path, key), errors);
+    }
+    if (Array.isArray(value)) {
+        const seen = new Set<unknown>();
+        for (let i = 0; i < value.length; i++) {
+            const item = typeof value[i] === "object" ? JSON.stringify(value[i]) : value[i];
+            if (seen.has(item)) errors.push({ path: path + "/" + i, message: "is a duplicate" });
+            seen.add(item);
+        }
+    }
+}
+
+function validate121(value: any, path: string, errors: SchemaError[]): void {
+    if (!(isObject(value))) {
+        errors.push({ path, message: "must be object" });
+        return;
+    }
+    if (value["severity"] !== undefined) {
+        validate122(value["severity"], path + "/severity", errors);
+    }
+    if (value["exploitation_likelihood"] !== undefined) {
+        validate123(value["exploitation_likelihood"], path + "/exploitation_likelihood", errors);
+    }
+    if (value["exploitation_impact"] !== undefined) {
+        validate124(value["exploitation_impact"], path + "/exploitation_impact", errors);
+    }
+    if (value["data_breach_probability"] !== undefined) {
+        validate125(value["data_breach_probability"], path + "/data_breach_probability", errors);
+    }
+    if (value["data_breach_technical_assets"] !== undefined) {
+        validate126(value["data_breach_technical_assets"], path + "/data_breach_technical_assets", errors);
+    }
+    if (value["most_relevant_data_asset"] !== undefined) {
+        validate128(value["most_relevant_data_asset"], path + "/most_relevant_data_asset", errors);
+    }
+    if (value["most_relevant_technical_asset"] !== undefined) {
+        validate129(value["most_relevant_technical_asset"], path + "/most_relevant_technical_asset", errors);
+    }
+    if (value["most_relevant_communication_link"] !== undefined) {
+        validate130(value["most_relevant_communication_link"], path + "/most_relevant_communication_link", errors);
+    }
+    if (value["most_relevant_trust_boundary"] !== undefined) {
+        validate131(value["most_relevant_trust_boundary"], path + "/most_relevant_trust_boundary", errors);
+    }
+    if (value["most_relevant_shared_runtime"] !== undefined) {
+        validate132(value["most_relevant_shared_runtime"], path + "/most_relevant_shared_runtime", errors);
+    }
+}
+
+function validate122(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+    if (!enum16.has(value)) {
+        errors.push({ path, message: "must be one of \"low\", \"medium\", \"elevated\", \"high\", \"critical\"" });
+    }
+}
+
+function validate123(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+    if (!enum17.has(value)) {
+        errors.push({ path, message: "must be one of \"unlikely\", \"likely\", \"very-likely\", \"frequent\"" });
+    }
+}
+
+function validate124(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+    if (!enum18.has(value)) {
+        errors.push({ path, message: "must be one of \"low\", \"medium\", \"high\", \"very-high\"" });
+    }
+}
+
+function validate125(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+    if (!enum19.has(value)) {
+        errors.push({ path, message: "must be one of \"improbable\", \"possible\", \"probable\"" });
+    }
+}
+
+function validate126(value: any, path: string, errors: SchemaError[]): void {
+    if (!(Array.isArray(value) || value === null)) {
+        errors.push({ path, message: "must be array or null" });
+        return;
+    }
+    if (Array.isArray(value)) {
+        const seen = new Set<unknown>();
+        for (let i = 0; i < value.length; i++) {
+            validate127(value[i], path + "/" + i, errors);
+            const item = typeof value[i] === "object" ? JSON.stringify(value[i]) : value[i];
+            if (seen.has(item)) errors.push({ path: path + "/" + i, message: "is a duplicate" });
+            seen.add(item);
+        }
+    }
+}
+
+function validate127(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+}
+
+function validate128(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string" || value === null)) {
+        errors.push({ path, message: "must be string or null" });
+        return;
+    }
+}
+
+function validate129(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string" || value === null)) {
+        errors.push({ path, message: "must be string or null" });
+        return;
+    }
+}
+
+function validate130(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string" || value === null)) {
+        errors.push({ path, message: "must be string or null" });
+        return;
+    }
+}
+
+function validate131(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string" || value === null)) {
+        errors.push({ path, message: "must be string or null" });
+        return;
+    }
+}
+
+function validate132(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string" || value === null)) {
+        errors.push({ path, message: "must be string or null" });
+        return;
+    }
+}
+
+function validate133(value: any, path: string, errors: SchemaError[]): void {
+    if (!(isObject(value) || value === null)) {
+        errors.push({ path, message: "must be object or null" });
+        return;
+    }
+    if (isObject(value)) {
+        for (const key in value) {
+            validate134(value[key], childPath(path, key), errors);
+        }
+    }
+    if (Array.isArray(value)) {
+        const seen = new Set<unknown>();
+        for (let i = 0; i < value.length; i++) {
+            const item = typeof value[i] === "object" ? JSON.stringify(value[i]) : value[i];
+            if (seen.has(item)) errors.push({ path: path + "/" + i, message: "is a duplicate" });
+            seen.add(item);
+        }
+    }
+}
+
+function validate134(value: any, path: string, errors: SchemaError[]): void {
+    if (!(isObject(value))) {
+        errors.push({ path, message: "must be object" });
+        return;
+    }
+    if (value["status"] === undefined) {
+        errors.push({ path, message: "missing required property status" });
+    }
+    if (value["justification"] === undefined) {
+        errors.push({ path, message: "missing required property justification" });
+    }
+    if (value["ticket"] === undefined) {
+        errors.push({ path, message: "missing required property ticket" });
+    }
+    if (value["date"] === undefined) {
+        errors.push({ path, message: "missing required property date" });
+    }
+    if (value["checked_by"] === undefined) {
+        errors.push({ path, message: "missing required property checked_by" });
+    }
+    if (value["status"] !== undefined) {
+        validate135(value["status"], path + "/status", errors);
+    }
+    if (value["justification"] !== undefined) {
+        validate136(value["justification"], path + "/justification", errors);
+    }
+    if (value["ticket"] !== undefined) {
+        validate137(value["ticket"], path + "/ticket", errors);
+    }
+    if (value["date"] !== undefined) {
+        validate138(value["date"], path + "/date", errors);
+    }
+    if (value["checked_by"] !== undefined) {
+        validate139(value["checked_by"], path + "/checked_by", errors);
+    }
+}
+
+function validate135(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+    if (!enum20.has(value)) {
+        errors.push({ path, message: "must be one of \"unchecked\", \"in-discussion\", \"accepted\", \"in-progress\", \"mitigated\", \"false-positive\"" });
+    }
+}
+
+function validate136(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string" || value === null)) {
+        errors.push({ path, message: "must be string or null" });
+        return;
+    }
+}
+
+function validate137(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string" || value === null)) {
+        errors.push({ path, message: "must be string or null" });
+        return;
+    }
+}
+
+function validate138(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string" || value === null)) {
+        errors.push({ path, message: "must be string or null" });
+        return;
+    }
+    if (typeof value === "string" && !(/^\d{4}-\d{2}-\d{2}$/.test(value))) {
+        errors.push({ path, message: "must be a date" });
+    }
+}
+
+function validate139(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string" || value === null)) {
+        errors.push({ path, message: "must be string or null" });
+        return;
+    }
+}
+
+function validate140(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "boolean" || value === null)) {
+        errors.push({ path, message: "must be boolean or null" });
+        return;
+    }
+}
+
+function validate141(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "boolean" || value === null)) {
+        errors.push({ path, message: "must be boolean or null" });
+        return;
+    }
+}
+
+function validate142(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string" || value === null)) {
+        errors.push({ path, message: "must be string or null" });
+        return;
+    }
+    if (!enum21.has(value)) {
+        errors.push({ path, message: "must be one of \"\", \"ortho\", \"spline\", \"polyline\", \"false\", \"curved\"" });
+    }
+}
+
+function validate143(value: any, path: string, errors: SchemaError[]): void {
+    if (!(Number.isInteger(value) || value === null)) {
+        errors.push({ path, message: "must be integer or null" });
+        return;
+    }
+}
+
+function validate144(value: any, path: string, errors: SchemaError[]): void {
+    if (!(Number.isInteger(value) || value === null)) {
+        errors.push({ path, message: "must be integer or null" });
+        return;
+    }
+}
+
+function validate145(value: any, path: string, errors: SchemaError[]): void {
+    if (!(Array.isArray(value) || value === null)) {
+        errors.push({ path, message: "must be array or null" });
+        return;
+    }
+    if (Array.isArray(value)) {
+        const seen = new Set<unknown>();
+        for (let i = 0; i < value.length; i++) {
+            validate146(value[i], path + "/" + i, errors);
+            const item = typeof value[i] === "object" ? JSON.stringify(value[i]) : value[i];
+            if (seen.has(item)) errors.push({ path: path + "/" + i, message: "is a duplicate" });
+            seen.add(item);
+        }
+    }
+}
+
+function validate146(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+}
+
+function validate147(value: any, path: string, errors: SchemaError[]): void {
+    if (!(Array.isArray(value) || value === null)) {
+        errors.push({ path, message: "must be array or null" });
+        return;
+    }
+    if (Array.isArray(value)) {
+        const seen = new Set<unknown>();
+        for (let i = 0; i < value.length; i++) {
+            validate148(value[i], path + "/" + i, errors);
+            const item = typeof value[i] === "object" ? JSON.stringify(value[i]) : value[i];
+            if (seen.has(item)) errors.push({ path: path + "/" + i, message: "is a duplicate" });
+            seen.add(item);
+        }
+    }
+}
+
+function validate148(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "string")) {
+        errors.push({ path, message: "must be string" });
+        return;
+    }
+}
+
+function validate149(value: any, path: string, errors: SchemaError[]): void {
+    if (!(isObject(value) || value === null)) {
+        errors.push({ path, message: "must be object or null" });
+        return;
+    }
+    if (isObject(value)) {
+        if (value["technical_assets"] !== undefined) {
+            validate150(value["technical_assets"], path + "/technical_assets", errors);
+        }
+        if (value["trust_boundaries"] !== undefined) {
+            validate153(value["trust_boundaries"], path + "/trust_boundaries", errors);
+        }
+        if (value["communication_links"] !== undefined) {
+            validate156(value["communication_links"], path + "/communication_links", errors);
+        }
+    }
+}
+
+function validate150(value: any, path: string, errors: SchemaError[]): void {
+    if (!(isObject(value))) {
+        errors.push({ path, message: "must be object" });
+        return;
+    }
+    for (const key in value) {
+        validate151(value[key], childPath(path, key), errors);
+    }
+}
+
+function validate151(value: any, path: string, errors: SchemaError[]): void {
+    if (!(Array.isArray(value))) {
+        errors.push({ path, message: "must be array" });
+        return;
+    }
+    if (value.length < 4) errors.push({ path, message: "must have at least 4 items" });
+    if (value.length > 4) errors.push({ path, message: "must have at most 4 items" });
+    for (let i = 0; i < value.length; i++) {
+        validate152(value[i], path + "/" + i, errors);
+    }
+}
+
+function validate152(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "number")) {
+        errors.push({ path, message: "must be number" });
+        return;
+    }
+}
+
+function validate153(value: any, path: string, errors: SchemaError[]): void {
+    if (!(isObject(value))) {
+        errors.push({ path, message: "must be object" });
+        return;
+    }
+    for (const key in value) {
+        validate154(value[key], childPath(path, key), errors);
+    }
+}
+
+function validate154(value: any, path: string, errors: SchemaError[]): void {
+    if (!(Array.isArray(value))) {
+        errors.push({ path, message: "must be array" });
+        return;
+    }
+    if (value.length < 4) errors.push({ path, message: "must have at least 4 items" });
+    if (value.length > 4) errors.push({ path, message: "must have at most 4 items" });
+    for (let i = 0; i < value.length; i++) {
+        validate155(value[i], path + "/" + i, errors);
+    }
+}
+
+function validate155(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "number")) {
+        errors.push({ path, message: "must be number" });
+        return;
+    }
+}
+
+function validate156(value: any, path: string, errors: SchemaError[]): void {
+    if (!(isObject(value))) {
+        errors.push({ path, message: "must be object" });
+        return;
+    }
+    for (const key in value) {
+        validate157(value[key], childPath(path, key), errors);
+    }
+}
+
+function validate157(value: any, path: string, errors: SchemaError[]): void {
+    if (!(isObject(value))) {
+        errors.push({ path, message: "must be object" });
+        return;
+    }
+    for (const key in value) {
+        validate158(value[key], childPath(path, key), errors);
+    }
+}
+
+function validate158(value: any, path: string, errors: SchemaError[]): void {
+    if (!(Array.isArray(value))) {
+        errors.push({ path, message: "must be array" });
+        return;
+    }
+    for (let i = 0; i < value.length; i++) {
+        validate159(value[i], path + "/" + i, errors);
+    }
+}
+
+function validate159(value: any, path: string, errors: SchemaError[]): void {
+    if (!(Array.isArray(value))) {
+        errors.push({ path, message: "must be array" });
+        return;
+    }
+    if (value.length < 2) errors.push({ path, message: "must have at least 2 items" });
+    if (value.length > 2) errors.push({ path, message: "must have at most 2 items" });
+    for (let i = 0; i < value.length; i++) {
+        validate160(value[i], path + "/" + i, errors);
+    }
+}
+
+function validate160(value: any, path: string, errors: SchemaError[]): void {
+    if (!(typeof value === "number")) {
+        errors.push({ path, message: "must be number" });
+        return;
+    }
+}
+
+// Checks a parsed model against schema.json and returns every violation, in document order
+export function validateModelSchema(model: unknown): SchemaError[] {
+    const errors: SchemaError[] = [];
+    validate0(model, "", errors);
+    return errors;
+}
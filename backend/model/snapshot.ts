@@ -0,0 +1,764 @@
+// Compact binary snapshot of a parsed model and its generated risks. It is what the engine worker
+// hands to the editor (as a transferable ArrayBuffer) and what the model cache stores, so neither
+// has to structured clone or JSON serialize the object graph, and loading one skips the YAML parse.
+//
+// Layout, all integers are unsigned LEB128 varints:
+//   magic "PMSN", version
+//   string table: count, the UTF-16 length of every string, then all strings concatenated as
+//                 UTF-8 (byte length, bytes), so they are en- and decoded in one go. Each string is stored once.
+//   body: model fields, data assets, technical assets (with their communication links), trust
+//         boundaries, shared runtimes, risk tracking, risks grouped by category, risks per technical asset
+// Strings are written as their table index, enum values as their position in the enum, references
+// to model elements as the element's position in its section. Free-form parts (author, overviews,
+// questions, ...) use a small tagged encoding. Bump SNAPSHOT_VERSION whenever the layout changes.
+
+import {
+    Authentication,
+    Authorization,
+    CommunicationLink,
+    Confidentiality,
+    Criticality,
+    DataAsset,
+    DataBreachProbability,
+    DataFormat,
+    EncryptionStyle,
+    type ParsedModel,
+    Protocol,
+    Quantity,
+    Risk,
+    type RiskCategory,
+    RiskExploitationImpact,
+    RiskExploitationLikelihood,
+    RiskFunction,
+    RiskSeverity,
+    RiskStatus,
+    type RiskTracking,
+    SharedRuntime,
+    STRIDE,
+    TechnicalAsset,
+    TechnicalAssetMachine,
+    TechnicalAssetSize,
+    TechnicalAssetTechnology,
+    TechnicalAssetType,
+    TrustBoundary,
+    TrustBoundaryType,
+    Usage,
+} from './types.ts';
+
+export const SNAPSHOT_VERSION = 2;
+
+const magic = [0x50, 0x4d, 0x53, 0x4e]; // "PMSN"
+
+export interface ModelSnapshot {
+    parsedModel: ParsedModel;
+    risksByCategory: Map<RiskCategory, Risk[]>;
+    risksByTechnicalAssetId: Record<string, Risk[]>; // Same Risk objects as in risksByCategory
+}
+
+// Tags of the free-form value encoding
+enum Tag { Undefined, Null, False, True, Number, String, Array, Object, Date }
+
+type Enum = Record<string, string>;
+
+// Values of an enum in declaration order and their positions, the position is what gets written
+const enumValues = new Map<Enum, string[]>();
+const enumPositions = new Map<Enum, Map<string, number>>();
+function valuesOf(enumType: Enum): string[] {
+    let values = enumValues.get(enumType);
+    if (!values) {
+        values = Object.values(enumType);
+        enumValues.set(enumType, values);
+    }
+    return values;
+}
+function positionsOf(enumType: Enum): Map<string, number> {
+    let positions = enumPositions.get(enumType);
+    if (!positions) {
+        positions = new Map(valuesOf(enumType).map((value, i) => [value, i]));
+        enumPositions.set(enumType, positions);
+    }
+    return positions;
+}
+
+class SnapshotWriter {
+    private bytes = new Uint8Array(1 << 16);
+    private view = new DataView(this.bytes.buffer);
+    private length = 0;
+    private strings = new Map<string, number>();
+
+    private reserve(count: number): void {
+        if (this.length + count > this.bytes.length) {
+            const grown = new Uint8Array(Math.max(this.bytes.length * 2, this.length + count));
+            grown.set(this.bytes.subarray(0, this.length));
+            this.bytes = grown;
+            this.view = new DataView(grown.buffer);
+        }
+    }
+
+    uint(value: number): void {
+        this.reserve(8);
+        while (value >= 0x80) {
+            this.bytes[this.length++] = (value % 0x80) | 0x80;
+            value = Math.floor(value / 0x80);
+        }
+        this.bytes[this.length++] = value;
+    }
+
+    bool(value: boolean): void {
+        this.reserve(1);
+        this.bytes[this.length++] = value ? 1 : 0;
+    }
+
+    float(value: number): void {
+        this.reserve(8);
+        this.view.setFloat64(this.length, value, true);
+        this.length += 8;
+    }
+
+    // The string table stores the UTF-16 length of each entry, so anything else that reaches here
+    // (e.g. a numeric ticket in risk tracking) is stored as its text rather than shifting the table
+    string(value: string): void {
+        if (typeof value !== 'string') {
+            value = value === undefined || value === null ? '' : String(value);
+        }
+        let index = this.strings.get(value);
+        if (index === undefined) {
+            index = this.strings.size;
+            this.strings.set(value, index);
+        }
+        this.uint(index);
+    }
+
+    stringList(values: string[]): void {
+        this.uint(values.length);
+        values.forEach(value => this.string(value));
+    }
+
+    // Position + 1 in the enum, 0 followed by the string for values outside of it (unparsed input)
+    enumValue(enumType: Enum, value: string): void {
+        const index = positionsOf(enumType).get(value);
+        this.uint(index === undefined ? 0 : index + 1);
+        if (index === undefined) {
+            this.string(String(value));
+        }
+    }
+
+    // 0 for none, 1 followed by the ID for IDs that aren't in the section, position + 2 otherwise
+    ref(indexes: Map<string, number>, id: string | undefined): void {
+        if (id === undefined) {
+            this.uint(0);
+            return;
+        }
+        const index = indexes.get(id);
+        this.uint(index === undefined ? 1 : index + 2);
+        if (index === undefined) {
+            this.string(id);
+        }
+    }
+
+    refs(indexes: Map<string, number>, ids: string[]): void {
+        this.uint(ids.length);
+        ids.forEach(id => this.ref(indexes, id));
+    }
+
+    value(value: unknown): void {
+        if (value === undefined) {
+            this.uint(Tag.Undefined);
+        } else if (value === null) {
+            this.uint(Tag.Null);
+        } else if (typeof value === 'boolean') {
+            this.uint(value ? Tag.True : Tag.False);
+        } else if (typeof value === 'number') {
+            this.uint(Tag.Number);
+            this.float(value);
+        } else if (typeof value === 'string') {
+            this.uint(Tag.String);
+            this.string(value);
+        } else if (Array.isArray(value)) {
+            this.uint(Tag.Array);
+            this.uint(value.length);
+            value.forEach(item => this.value(item));
+        } else if (value instanceof Date) {
+            this.uint(Tag.Date);
+            this.float(value.getTime());
+        } else if (typeof value === 'object') {
+            const entries = Object.entries(value);
+            this.uint(Tag.Object);
+            this.uint(entries.length);
+            for (const [key, item] of entries) {
+                this.string(key);
+                this.value(item);
+            }
+        } else {
+            throw new Error(`Model snapshot can't store a value of type ${typeof value}.`);
+        }
+    }
+
+    // Header and string table, followed by the body written so far
+    finish(): ArrayBuffer {
+        const head = new SnapshotWriter();
+        head.bytes.set(magic);
+        head.length = magic.length;
+        head.uint(SNAPSHOT_VERSION);
+        head.uint(this.strings.size);
+        for (const value of this.strings.keys()) {
+            head.uint(value.length);
+        }
+        const utf8 = new TextEncoder().encode([...this.strings.keys()].join(''));
+        head.uint(utf8.length);
+        const buffer = new Uint8Array(head.length + utf8.length + this.length);
+        buffer.set(head.bytes.subarray(0, head.length));
+        buffer.set(utf8, head.length);
+        buffer.set(this.bytes.subarray(0, this.length), head.length + utf8.length);
+        return buffer.buffer;
+    }
+}
+
+class SnapshotReader {
+    private bytes: Uint8Array;
+    private view: DataView;
+    private offset = 0;
+    private strings: string[] = [];
+
+    constructor(buffer: ArrayBuffer) {
+        this.bytes = new Uint8Array(buffer);
+        this.view = new DataView(buffer);
+        if (magic.some((byte, i) => this.bytes[i] !== byte)) {
+            throw new Error("Not a model snapshot.");
+        }
+        this.offset = magic.length;
+        const version = this.uint();
+        if (version !== SNAPSHOT_VERSION) {
+            throw new Error(`Unsupported model snapshot version ${version}, expected ${SNAPSHOT_VERSION}.`);
+        }
+        const lengths = new Array<number>(this.uint());
+        for (let i = 0; i < lengths.length; i++) {
+            lengths[i] = this.uint();
+        }
+        const byteLength = this.uint();
+        const text = new TextDecoder().decode(this.bytes.subarray(this.offset, this.offset + byteLength));
+        this.offset += byteLength;
+        this.strings = new Array(lengths.length);
+        for (let i = 0, start = 0; i < lengths.length; start += lengths[i++]) {
+            this.strings[i] = text.slice(start, start + lengths[i]);
+        }
+    }
+
+    uint(): number {
+        let value = 0;
+        let factor = 1;
+        let byte: number;
+        do {
+            if (this.offset >= this.bytes.length) {
+                throw new Error("Model snapshot is truncated.");
+            }
+            byte = this.bytes[this.offset++];
+            value += (byte & 0x7f) * factor;
+            factor *= 0x80;
+        } while (byte & 0x80);
+        return value;
+    }
+
+    bool(): boolean {
+        return this.bytes[this.offset++] === 1;
+    }
+
+    float(): number {
+        const value = this.view.getFloat64(this.offset, true);
+        this.offset += 8;
+        return value;
+    }
+
+    string(): string {
+        const index = this.uint();
+        if (index >= this.strings.length) {
+            throw new Error(`Model snapshot refers to unknown string ${index}.`);
+        }
+        return this.strings[index];
+    }
+
+    stringList(): string[] {
+        const values = new Array<string>(this.uint());
+        for (let i = 0; i < values.length; i++) {
+            values[i] = this.string();
+        }
+        return values;
+    }
+
+    enumValue<E extends string>(enumType: Enum): E {
+        const index = this.uint();
+        return (index === 0 ? this.string() : valuesOf(enumType)[index - 1]) as E;
+    }
+
+    ref(ids: string[]): string | undefined {
+        const index = this.uint();
+        return index === 0 ? undefined : index === 1 ? this.string() : ids[index - 2];
+    }
+
+    refs(ids: string[]): string[] {
+        const values = new Array<string>(this.uint());
+        for (let i = 0; i < values.length; i++) {
+            values[i] = this.ref(ids)!;
+        }
+        return values;
+    }
+
+    value(): unknown {
+        const tag = this.uint();
+        switch (tag) {
+            case Tag.Undefined: return undefined;
+            case Tag.Null: return null;
+            case Tag.False: return false;
+            case Tag.True: return true;
+            case Tag.Number: return this.float();
+            case Tag.String: return this.string();
+            case Tag.Date: return new Date(this.float());
+            case Tag.Array: {
+                const items = new Array<unknown>(this.uint());
+                for (let i = 0; i < items.length; i++) {
+                    items[i] = this.value();
+                }
+                return items;
+            }
+            case Tag.Object: {
+                const object: Record<string, unknown> = {};
+                for (let count = this.uint(); count > 0; count--) {
+                    const key = this.string();
+                    object[key] = this.value();
+                }
+                return object;
+            }
+            default:
+                throw new Error(`Model snapshot contains an unknown value tag ${tag}.`);
+        }
+    }
+}
+
+// Position of every element ID of a section, in the order the section is written
+function indexesOf(ids: string[]): Map<string, number> {
+    return new Map(ids.map((id, i) => [id, i]));
+}
+
+function writeRiskCategory(writer: SnapshotWriter, category: RiskCategory): void {
+    for (const text of [category.id, category.title, category.description, category.impact, category.asvs,
+        category.cheatSheet, category.action, category.mitigation, category.check, category.detectionLogic,
+        category.riskAssessment, category.falsePositives]) {
+        writer.string(text ?? '');
+    }
+    writer.enumValue(RiskFunction, category.function);
+    writer.enumValue(STRIDE, category.stride);
+    writer.bool(category.modelFailurePossibleReason);
+    writer.float(category.cwe);
+}
+
+function readRiskCategory(reader: SnapshotReader): RiskCategory {
+    return {
+        id: reader.string(),
+        title: reader.string(),
+        description: reader.string(),
+        impact: reader.string(),
+        asvs: reader.string(),
+        cheatSheet: reader.string(),
+        action: reader.string(),
+        mitigation: reader.string(),
+        check: reader.string(),
+        detectionLogic: reader.string(),
+        riskAssessment: reader.string(),
+        falsePositives: reader.string(),
+        function: reader.enumValue(RiskFunction),
+        stride: reader.enumValue(STRIDE),
+        modelFailurePossibleReason: reader.bool(),
+        cwe: reader.float(),
+    };
+}
+
+/**
+ * Encodes a parsed model and its generated risks (see getGeneratedRisks and
+ * getRisksByTechnicalAssetId) into a snapshot that readModelSnapshot restores.
+ */
+export function writeModelSnapshot(snapshot: ModelSnapshot): ArrayBuffer {
+    const { parsedModel: model, risksByCategory, risksByTechnicalAssetId } = snapshot;
+    const writer = new SnapshotWriter();
+
+    const dataAssets = Object.values(model.dataAssets);
+    const technicalAssets = Object.values(model.technicalAssets);
+    const trustBoundaries = Object.values(model.trustBoundaries);
+    const sharedRuntimes = Object.values(model.sharedRuntimes);
+    const communicationLinks = technicalAssets.flatMap(techAsset => techAsset.communicationLinks);
+    const dataAssetIndexes = indexesOf(dataAssets.map(dataAsset => dataAsset.id));
+    const techAssetIndexes = indexesOf(technicalAssets.map(techAsset => techAsset.id));
+    const trustBoundaryIndexes = indexesOf(trustBoundaries.map(trustBoundary => trustBoundary.id));
+    const sharedRuntimeIndexes = indexesOf(sharedRuntimes.map(sharedRuntime => sharedRuntime.id));
+    const linkIndexes = indexesOf(communicationLinks.map(link => link.id));
+
+    writer.value(model.author);
+    writer.string(model.title);
+    writer.value(model.date);
+    writer.string(model.managementSummaryComment);
+    writer.value(model.businessOverview);
+    writer.value(model.technicalOverview);
+    writer.enumValue(Criticality, model.businessCriticality);
+    writer.value(model.securityRequirements);
+    writer.value(model.questions);
+    writer.value(model.abuseCases);
+    writer.stringList(model.tagsAvailable);
+    writer.float(model.diagramTweakNodesep);
+    writer.float(model.diagramTweakRanksep);
+    writer.string(model.diagramTweakEdgeLayout);
+    writer.bool(model.diagramTweakSuppressEdgeLabels);
+    writer.bool(model.diagramTweakLayoutLeftToRight);
+    writer.value(model.diagramTweakInvisibleConnectionsBetweenAssets);
+    writer.value(model.diagramTweakSameRankAssets);
+
+    // The sections' keys are the element IDs, so only the elements are written
+    writer.uint(dataAssets.length);
+    for (const dataAsset of dataAssets) {
+        writer.string(dataAsset.id);
+        writer.string(dataAsset.title);
+        writer.string(dataAsset.description);
+        writer.enumValue(Usage, dataAsset.usage);
+        writer.stringList(dataAsset.tags);
+        writer.string(dataAsset.origin);
+        writer.string(dataAsset.owner);
+        writer.enumValue(Quantity, dataAsset.quantity);
+        writer.enumValue(Confidentiality, dataAsset.confidentiality);
+        writer.enumValue(Criticality, dataAsset.integrity);
+        writer.enumValue(Criticality, dataAsset.availability);
+        writer.string(dataAsset.justificationCiaRating);
+    }
+
+    // IDs first, communication links refer to technical assets written after them
+    writer.uint(technicalAssets.length);
+    technicalAssets.forEach(techAsset => writer.string(techAsset.id));
+    for (const techAsset of technicalAssets) {
+        writer.string(techAsset.title);
+        writer.string(techAsset.description);
+        writer.enumValue(Usage, techAsset.usage);
+        writer.enumValue(TechnicalAssetType, techAsset.type);
+        writer.enumValue(TechnicalAssetSize, techAsset.size);
+        writer.enumValue(TechnicalAssetTechnology, techAsset.technology);
+        writer.enumValue(TechnicalAssetMachine, techAsset.machine);
+        for (const flag of [techAsset.internet, techAsset.multiTenant, techAsset.redundant, techAsset.customDevelopedParts,
+            techAsset.outOfScope, techAsset.usedAsClientByHuman]) {
+            writer.bool(flag);
+        }
+        writer.enumValue(EncryptionStyle, techAsset.encryption);
+        writer.string(techAsset.justificationOutOfScope);
+        writer.string(techAsset.owner);
+        writer.enumValue(Confidentiality, techAsset.confidentiality);
+        writer.enumValue(Criticality, techAsset.integrity);
+        writer.enumValue(Criticality, techAsset.availability);
+        writer.string(techAsset.justificationCiaRating);
+        writer.stringList(techAsset.tags);
+        writer.refs(dataAssetIndexes, techAsset.dataAssetsProcessed);
+        writer.refs(dataAssetIndexes, techAsset.dataAssetsStored);
+        writer.uint(techAsset.dataFormatsAccepted.length);
+        techAsset.dataFormatsAccepted.forEach(format => writer.enumValue(DataFormat, format));
+        writer.float(techAsset.diagramTweakOrder);
+        writer.float(techAsset.raa);
+
+        writer.uint(techAsset.communicationLinks.length);
+        for (const link of techAsset.communicationLinks) {
+            writer.string(link.id);
+            writer.ref(techAssetIndexes, link.sourceId);
+            writer.ref(techAssetIndexes, link.targetId);
+            writer.string(link.title);
+            writer.string(link.description);
+            writer.enumValue(Protocol, link.protocol);
+            writer.stringList(link.tags);
+            writer.bool(link.vpn);
+            writer.bool(link.ipFiltered);
+            writer.bool(link.readonly);
+            writer.enumValue(Authentication, link.authentication);
+            writer.enumValue(Authorization, link.authorization);
+            writer.enumValue(Usage, link.usage);
+            writer.refs(dataAssetIndexes, link.dataAssetsSent);
+            writer.refs(dataAssetIndexes, link.dataAssetsReceived);
+            writer.float(link.diagramTweakWeight);
+            writer.bool(link.diagramTweakConstraint);
+        }
+    }
+
+    writer.uint(trustBoundaries.length);
+    trustBoundaries.forEach(trustBoundary => writer.string(trustBoundary.id));
+    for (const trustBoundary of trustBoundaries) {
+        writer.string(trustBoundary.title);
+        writer.string(trustBoundary.description);
+        writer.enumValue(TrustBoundaryType, trustBoundary.type);
+        writer.stringList(trustBoundary.tags);
+        writer.refs(techAssetIndexes, trustBoundary.technicalAssetsInside);
+        writer.refs(trustBoundaryIndexes, trustBoundary.trustBoundariesNested);
+    }
+
+    writer.uint(sharedRuntimes.length);
+    for (const sharedRuntime of sharedRuntimes) {
+        writer.string(sharedRuntime.id);
+        writer.string(sharedRuntime.title);
+        writer.string(sharedRuntime.description);
+        writer.stringList(sharedRuntime.tags);
+        writer.refs(techAssetIndexes, sharedRuntime.technicalAssetsRunning);
+    }
+
+    const individualCategories = Object.values(model.individualRiskCategories);
+    writer.uint(individualCategories.length);
+    individualCategories.forEach(category => writeRiskCategory(writer, category));
+
+    const riskTracking = Object.values(model.riskTracking);
+    writer.uint(riskTracking.length);
+    for (const tracking of riskTracking) {
+        writer.string(tracking.syntheticRiskId);
+        writer.string(tracking.justification);
+        writer.string(tracking.ticket);
+        writer.string(tracking.checkedBy);
+        writer.enumValue(RiskStatus, tracking.status);
+        writer.value(tracking.date);
+    }
+
+    // Individual categories are referenced by their position, so they stay the same objects as in the model
+    const individualCategoryIndexes = new Map(individualCategories.map((category, i) => [category, i]));
+    const riskIndexes = new Map<Risk, number>();
+    writer.uint(risksByCategory.size);
+    for (const [category, risks] of risksByCategory) {
+        const individual = individualCategoryIndexes.get(category);
+        writer.uint(individual === undefined ? 0 : individual + 1);
+        if (individual === undefined) {
+            writeRiskCategory(writer, category);
+        }
+        writer.uint(risks.length);
+        for (const risk of risks) {
+            riskIndexes.set(risk, riskIndexes.size);
+            writer.string(risk.categoryId);
+            writer.enumValue(RiskSeverity, risk.severity);
+            writer.enumValue(RiskExploitationLikelihood, risk.exploitationLikelihood);
+            writer.enumValue(RiskExploitationImpact, risk.exploitationImpact);
+            writer.string(risk.title);
+            writer.string(risk.syntheticId);
+            writer.ref(dataAssetIndexes, risk.mostRelevantDataAssetId);
+            writer.ref(techAssetIndexes, risk.mostRelevantTechnicalAssetId);
+            writer.ref(trustBoundaryIndexes, risk.mostRelevantTrustBoundaryId);
+            writer.ref(sharedRuntimeIndexes, risk.mostRelevantSharedRuntimeId);
+            writer.ref(linkIndexes, risk.mostRelevantCommunicationLinkId);
+            writer.enumValue(DataBreachProbability, risk.dataBreachProbability);
+            writer.refs(techAssetIndexes, risk.dataBreachTechnicalAssetIDs);
+        }
+    }
+
+    const assetRisks = Object.entries(risksByTechnicalAssetId);
+    writer.uint(assetRisks.length);
+    for (const [techAssetId, risks] of assetRisks) {
+        writer.ref(techAssetIndexes, techAssetId);
+        writer.uint(risks.length);
+        for (const risk of risks) {
+            const index = riskIndexes.get(risk);
+            if (index === undefined) {
+                throw new Error(`Risk ${risk.syntheticId} of technical asset ${techAssetId} is missing in the risks by category.`);
+            }
+            writer.uint(index);
+        }
+    }
+
+    return writer.finish();
+}
+
+/**
+ * Restores what writeModelSnapshot encoded. Model elements and risks come back as instances of
+ * their classes; their methods work once the model is the engine's active one, as after parseModel.
+ */
+export function readModelSnapshot(buffer: ArrayBuffer): ModelSnapshot {
+    const reader = new SnapshotReader(buffer);
+
+    const model = {
+        author: reader.value(),
+        title: reader.string(),
+        date: reader.value(),
+        managementSummaryComment: reader.string(),
+        businessOverview: reader.value(),
+        technicalOverview: reader.value(),
+        businessCriticality: reader.enumValue(Criticality),
+        securityRequirements: reader.value(),
+        questions: reader.value(),
+        abuseCases: reader.value(),
+        tagsAvailable: reader.stringList(),
+        diagramTweakNodesep: reader.float(),
+        diagramTweakRanksep: reader.float(),
+        diagramTweakEdgeLayout: reader.string(),
+        diagramTweakSuppressEdgeLabels: reader.bool(),
+        diagramTweakLayoutLeftToRight: reader.bool(),
+        diagramTweakInvisibleConnectionsBetweenAssets: reader.value(),
+        diagramTweakSameRankAssets: reader.value(),
+        dataAssets: {},
+        technicalAssets: {},
+        trustBoundaries: {},
+        sharedRuntimes: {},
+        individualRiskCategories: {},
+        riskTracking: {},
+    } as ParsedModel;
+
+    const dataAssetIds: string[] = [];
+    for (let count = reader.uint(); count > 0; count--) {
+        const dataAsset: DataAsset = Object.create(DataAsset.prototype);
+        dataAsset.id = reader.string();
+        dataAsset.title = reader.string();
+        dataAsset.description = reader.string();
+        dataAsset.usage = reader.enumValue(Usage);
+        dataAsset.tags = reader.stringList();
+        dataAsset.origin = reader.string();
+        dataAsset.owner = reader.string();
+        dataAsset.quantity = reader.enumValue(Quantity);
+        dataAsset.confidentiality = reader.enumValue(Confidentiality);
+        dataAsset.integrity = reader.enumValue(Criticality);
+        dataAsset.availability = reader.enumValue(Criticality);
+        dataAsset.justificationCiaRating = reader.string();
+        model.dataAssets[dataAsset.id] = dataAsset;
+        dataAssetIds.push(dataAsset.id);
+    }
+
+    const techAssetIds = new Array<string>(reader.uint());
+    for (let i = 0; i < techAssetIds.length; i++) {
+        techAssetIds[i] = reader.string();
+    }
+    const linkIds: string[] = [];
+    for (const id of techAssetIds) {
+        const techAsset: TechnicalAsset = Object.create(TechnicalAsset.prototype);
+        techAsset.id = id;
+        techAsset.title = reader.string();
+        techAsset.description = reader.string();
+        techAsset.usage = reader.enumValue(Usage);
+        techAsset.type = reader.enumValue(TechnicalAssetType);
+        techAsset.size = reader.enumValue(TechnicalAssetSize);
+        techAsset.technology = reader.enumValue(TechnicalAssetTechnology);
+        techAsset.machine = reader.enumValue(TechnicalAssetMachine);
+        techAsset.internet = reader.bool();
+        techAsset.multiTenant = reader.bool();
+        techAsset.redundant = reader.bool();
+        techAsset.customDevelopedParts = reader.bool();
+        techAsset.outOfScope = reader.bool();
+        techAsset.usedAsClientByHuman = reader.bool();
+        techAsset.encryption = reader.enumValue(EncryptionStyle);
+        techAsset.justificationOutOfScope = reader.string();
+        techAsset.owner = reader.string();
+        techAsset.confidentiality = reader.enumValue(Confidentiality);
+        techAsset.integrity = reader.enumValue(Criticality);
+        techAsset.availability = reader.enumValue(Criticality);
+        techAsset.justificationCiaRating = reader.string();
+        techAsset.tags = reader.stringList();
+        techAsset.dataAssetsProcessed = reader.refs(dataAssetIds);
+        techAsset.dataAssetsStored = reader.refs(dataAssetIds);
+        techAsset.dataFormatsAccepted = new Array<DataFormat>(reader.uint());
+        for (let i = 0; i < techAsset.dataFormatsAccepted.length; i++) {
+            techAsset.dataFormatsAccepted[i] = reader.enumValue(DataFormat);
+        }
+        techAsset.diagramTweakOrder = reader.float();
+        techAsset.raa = reader.float();
+
+        techAsset.communicationLinks = new Array<CommunicationLink>(reader.uint());
+        for (let i = 0; i < techAsset.communicationLinks.length; i++) {
+            const link: CommunicationLink = Object.create(CommunicationLink.prototype);
+            link.id = reader.string();
+            link.sourceId = reader.ref(techAssetIds)!;
+            link.targetId = reader.ref(techAssetIds)!;
+            link.title = reader.string();
+            link.description = reader.string();
+            link.protocol = reader.enumValue(Protocol);
+            link.tags = reader.stringList();
+            link.vpn = reader.bool();
+            link.ipFiltered = reader.bool();
+            link.readonly = reader.bool();
+            link.authentication = reader.enumValue(Authentication);
+            link.authorization = reader.enumValue(Authorization);
+            link.usage = reader.enumValue(Usage);
+            link.dataAssetsSent = reader.refs(dataAssetIds);
+            link.dataAssetsReceived = reader.refs(dataAssetIds);
+            link.diagramTweakWeight = reader.float();
+            link.diagramTweakConstraint = reader.bool();
+            techAsset.communicationLinks[i] = link;
+            linkIds.push(link.id);
+        }
+        model.technicalAssets[id] = techAsset;
+    }
+
+    const trustBoundaryIds = new Array<string>(reader.uint());
+    for (let i = 0; i < trustBoundaryIds.length; i++) {
+        trustBoundaryIds[i] = reader.string();
+    }
+    for (const id of trustBoundaryIds) {
+        const trustBoundary: TrustBoundary = Object.create(TrustBoundary.prototype);
+        trustBoundary.id = id;
+        trustBoundary.title = reader.string();
+        trustBoundary.description = reader.string();
+        trustBoundary.type = reader.enumValue(TrustBoundaryType);
+        trustBoundary.tags = reader.stringList();
+        trustBoundary.technicalAssetsInside = reader.refs(techAssetIds);
+        trustBoundary.trustBoundariesNested = reader.refs(trustBoundaryIds);
+        model.trustBoundaries[id] = trustBoundary;
+    }
+
+    const sharedRuntimeIds: string[] = [];
+    for (let count = reader.uint(); count > 0; count--) {
+        const sharedRuntime: SharedRuntime = Object.create(SharedRuntime.prototype);
+        sharedRuntime.id = reader.string();
+        sharedRuntime.title = reader.string();
+        sharedRuntime.description = reader.string();
+        sharedRuntime.tags = reader.stringList();
+        sharedRuntime.technicalAssetsRunning = reader.refs(techAssetIds);
+        model.sharedRuntimes[sharedRuntime.id] = sharedRuntime;
+        sharedRuntimeIds.push(sharedRuntime.id);
+    }
+
+    const individualCategories = new Array<RiskCategory>(reader.uint());
+    for (let i = 0; i < individualCategories.length; i++) {
+        individualCategories[i] = readRiskCategory(reader);
+        model.individualRiskCategories[individualCategories[i].id] = individualCategories[i];
+    }
+
+    for (let count = reader.uint(); count > 0; count--) {
+        const tracking: RiskTracking = {
+            syntheticRiskId: reader.string(),
+            justification: reader.string(),
+            ticket: reader.string(),
+            checkedBy: reader.string(),
+            status: reader.enumValue(RiskStatus),
+            date: reader.value() as Date,
+        };
+        model.riskTracking[tracking.syntheticRiskId] = tracking;
+    }
+
+    const risksByCategory = new Map<RiskCategory, Risk[]>();
+    const allRisks: Risk[] = [];
+    for (let count = reader.uint(); count > 0; count--) {
+        const individual = reader.uint();
+        const category = individual === 0 ? readRiskCategory(reader) : individualCategories[individual - 1];
+        const risks = new Array<Risk>(reader.uint());
+        for (let i = 0; i < risks.length; i++) {
+            const risk: Risk = Object.create(Risk.prototype);
+            risk.categoryId = reader.string();
+            risk.severity = reader.enumValue(RiskSeverity);
+            risk.exploitationLikelihood = reader.enumValue(RiskExploitationLikelihood);
+            risk.exploitationImpact = reader.enumValue(RiskExploitationImpact);
+            risk.title = reader.string();
+            risk.syntheticId = reader.string();
+            risk.mostRelevantDataAssetId = reader.ref(dataAssetIds);
+            risk.mostRelevantTechnicalAssetId = reader.ref(techAssetIds);
+            risk.mostRelevantTrustBoundaryId = reader.ref(trustBoundaryIds);
+            risk.mostRelevantSharedRuntimeId = reader.ref(sharedRuntimeIds);
+            risk.mostRelevantCommunicationLinkId = reader.ref(linkIds);
+            risk.dataBreachProbability = reader.enumValue(DataBreachProbability);
+            risk.dataBreachTechnicalAssetIDs = reader.refs(techAssetIds);
+            risks[i] = risk;
+            allRisks.push(risk);
+        }
+        risksByCategory.set(category, risks);
+    }
+
+    const risksByTechnicalAssetId: Record<string, Risk[]> = {};
+    for (let count = reader.uint(); count > 0; count--) {
+        const techAssetId = reader.ref(techAssetIds)!;
+        const risks = new Array<Risk>(reader.uint());
+        for (let i = 0; i < risks.length; i++) {
+            risks[i] = allRisks[reader.uint()];
+        }
+        risksByTechnicalAssetId[techAssetId] = risks;
+    }
+
+    return { parsedModel: model, risksByCategory, risksByTechnicalAssetId };
+}
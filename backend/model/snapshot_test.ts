@@ -0,0 +1,94 @@
+// writeModelSnapshot → readModelSnapshot has to restore the model and risks it was given, including
+// values that are not strings where the model declares strings (the string table must stay aligned).
+//
+//   deno task test
+
+import * as YAML from 'npm:yaml';
+import { assertEquals, assertStrictEquals } from 'https://deno.land/std@0.224.0/assert/mod.ts';
+import { generateRisks, getGeneratedRisks, parseModel } from '../main.ts';
+import { readModelSnapshot, writeModelSnapshot } from './snapshot.ts';
+import { createModelContext, getRisksByTechnicalAssetId, type ModelContext, withModelContext } from './types.ts';
+
+// The rules read window.currentSelectedThreatStandard, like in the engine and CLI workers
+const testGlobal = globalThis as unknown as { window: unknown; currentSelectedThreatStandard?: string };
+testGlobal.window = globalThis;
+testGlobal.currentSelectedThreatStandard = 'ORIGINAL';
+
+const modelYaml = await Deno.readTextFile(new URL('../customer_portal_erp_threat_model.yaml', import.meta.url));
+
+// JSON with sorted keys; class instances restored via Object.create compare like the parsed ones
+function canonical(value: unknown): unknown {
+    if (Array.isArray(value)) return value.map(canonical);
+    if (value instanceof Date) return value.toISOString();
+    if (value && typeof value === 'object') {
+        return Object.fromEntries(Object.keys(value).sort().map(key => [key, canonical((value as Record<string, unknown>)[key])]));
+    }
+    return value;
+}
+
+function analyze(source: string): ModelContext {
+    const context = createModelContext();
+    parseModel(source, context);
+    generateRisks([], new Set(), context);
+    return context;
+}
+
+function roundTrip(context: ModelContext) {
+    return readModelSnapshot(writeModelSnapshot({
+        parsedModel: context.parsedModelRoot!,
+        risksByCategory: getGeneratedRisks(context),
+        risksByTechnicalAssetId: withModelContext(context, getRisksByTechnicalAssetId),
+    }));
+}
+
+function risksOf(risksByCategory: Map<{ id: string }, { syntheticId: string; title: string; severity: string }[]>): string[] {
+    return [...risksByCategory].flatMap(([category, risks]) =>
+        risks.map(risk => [category.id, risk.syntheticId, risk.title, risk.severity].join(' '))).sort();
+}
+
+Deno.test('snapshot round trip restores the parsed model and risks', () => {
+    const context = analyze(modelYaml);
+    const restored = roundTrip(context);
+
+    assertEquals(canonical(restored.parsedModel), canonical(context.parsedModelRoot));
+    assertEquals(risksOf(restored.risksByCategory), risksOf(getGeneratedRisks(context)));
+    assertEquals(
+        Object.keys(restored.risksByTechnicalAssetId).sort(),
+        Object.keys(withModelContext(context, getRisksByTechnicalAssetId)).sort(),
+    );
+});
+
+Deno.test('snapshot round trip stores non-string values as text without shifting later strings', () => {
+    const context = analyze(modelYaml);
+    const model = context.parsedModelRoot!;
+    const tracking = model.riskTracking['untrusted-deserialization@erp-system'];
+    const dataAsset = model.dataAssets['customer-accounts'];
+    const techAsset = model.technicalAssets['erp-system'];
+    // As they would arrive from YAML or an edit that bypassed the parser's normalization
+    Object.assign(tracking, { ticket: 12345 });
+    Object.assign(dataAsset, { owner: 42, description: true });
+    Object.assign(techAsset, { owner: null, description: undefined });
+
+    const restored = roundTrip(context);
+
+    assertStrictEquals(restored.parsedModel.riskTracking['untrusted-deserialization@erp-system'].ticket, '12345');
+    assertStrictEquals(restored.parsedModel.dataAssets['customer-accounts'].owner, '42');
+    assertStrictEquals(restored.parsedModel.dataAssets['customer-accounts'].description, 'true');
+    assertStrictEquals(restored.parsedModel.technicalAssets['erp-system'].owner, '');
+    assertStrictEquals(restored.parsedModel.technicalAssets['erp-system'].description, '');
+
+    Object.assign(tracking, { ticket: '12345' });
+    Object.assign(dataAsset, { owner: '42', description: 'true' });
+    Object.assign(techAsset, { owner: '', description: '' });
+    assertEquals(canonical(restored.parsedModel), canonical(model));
+    assertEquals(risksOf(restored.risksByCategory), risksOf(getGeneratedRisks(context)));
+});
+
+Deno.test('parseModel reads numeric risk tracking tickets as text', () => {
+    const document = YAML.parseDocument(modelYaml);
+    document.setIn(['risk_tracking', 'untrusted-deserialization@erp-system', 'ticket'], 12345);
+    const context = analyze(document.toString());
+
+    assertStrictEquals(context.parsedModelRoot!.riskTracking['untrusted-deserialization@erp-system'].ticket, '12345');
+    assertStrictEquals(roundTrip(context).parsedModel.riskTracking['untrusted-deserialization@erp-system'].ticket, '12345');
+});
@@ -35,39 +35,239 @@ export function parseDataFormat(value: string | undefined): DataFormat | undefin
     // If no match was found after checking all keys
     return undefined;
 }
-interface ModelState {
+
+// Everything the engine knows about one model. Several contexts can be alive at once; the engine
+// works on the active one (modelState), see withModelContext.
+export interface ModelContext {
     parsedModelRoot: ParsedModel | null;
     communicationLinks: Record<string, CommunicationLink>;
     incomingTechnicalCommunicationLinksMappedByTargetId: Record<string, CommunicationLink[]>;
     directContainingTrustBoundaryMappedByTechnicalAssetId: Record<string, TrustBoundary>;
     directContainingSharedRuntimeMappedByTechnicalAssetId: Record<string, SharedRuntime>;
+    // Topology indexes, see indexTrustBoundaryNesting, indexSharedRuntimeMembership and indexDataAssetUsage
+    parentTrustBoundaryIdMappedByTrustBoundaryId: Record<string, string>;
+    ancestorTrustBoundaryIdsMappedByTrustBoundaryId: Record<string, string[]>; // Including the boundary itself
+    sharedRuntimesMappedByTechnicalAssetId: Record<string, SharedRuntime[]>;
+    processingTechnicalAssetsMappedByDataAssetId: Record<string, TechnicalAsset[]>; // Sorted by title
+    storingTechnicalAssetsMappedByDataAssetId: Record<string, TechnicalAsset[]>; // Sorted by title
+    sendingCommunicationLinksMappedByDataAssetId: Record<string, CommunicationLink[]>; // Sorted by title
+    receivingCommunicationLinksMappedByDataAssetId: Record<string, CommunicationLink[]>; // Sorted by title
     generatedRisksByCategory: Map<RiskCategory, Risk[]>; // Using Map for object keys
     generatedRisksBySyntheticId: Record<string, Risk>;
+    riskIndex: RiskIndex | null; // Built on first query after the risks or the risk tracking changed
+    riskTrackingResolution: RiskTrackingResolution | null; // Resolved together with riskIndex, see getRiskTrackingResolution
     allSupportedTags: Record<string, boolean>;
+    // Memo of derived values like getHighestConfidentiality, see memoizeDerivedValue
+    derivedValues: WeakMap<object, Map<string, unknown>>;
+    derivedValueStats: { hits: number; misses: number };
+    // Un-normalized RAA score per technical asset ID from the last RAA run, see raa/multifactor/multi.ts
+    raaRawScores: Map<string, number>;
+    // DOT of the data flow diagram per entity, kept across parses and edits of the model
+    dataFlowDiagramFragments: DataFlowDiagramFragments;
+}
+
+// A piece of DOT and the hash of what it was rendered from, see contentHash
+export interface DotFragment {
+    hash: string;
+    dot: string;
+}
+
+export interface DataFlowDiagramFragments {
+    nodes: Map<string, DotFragment>; // By technical asset ID
+    edges: Map<string, DotFragment>; // By communication link ID
+    subgraphs: Map<string, DotFragment>; // Opening part of each subgraph by its DOT ID, '' for the root graph
+    clusterContentHashes: Record<string, string>; // By DOT subgraph ID, covering everything drawn inside the cluster
+}
+
+// Multi-key lookup over generatedRisksBySyntheticId, see getRiskIndex
+interface RiskIndex {
+    all: Risk[];
+    byTechnicalAssetId: Record<string, Risk[]>; // Technical assets named in the synthetic ID or most relevant
+    byMostRelevantTechnicalAssetId: Record<string, Risk[]>;
+    byDataBreachTechnicalAssetId: Record<string, Risk[]>;
+    byCategoryId: Record<string, Risk[]>;
+    bySeverity: Record<string, Risk[]>;
+    byStatus: Record<string, Risk[]>; // Risk tracking status, defaulting to unchecked
+}
+
+// Risk tracking entries matched against the generated risks, see resolveRiskTracking
+export interface RiskTrackingResolution {
+    trackingBySyntheticRiskId: Record<string, RiskTracking>; // Keyed like generatedRisksBySyntheticId
+    matchedCount: number;
+    orphanedIds: string[]; // Exact tracking IDs without a generated risk
+    unmatchedWildcardIds: string[]; // Wildcard tracking IDs that matched no risk left over by the others
+}
+
+export function createModelContext(): ModelContext {
+    return {
+        parsedModelRoot: null,
+        communicationLinks: {},
+        incomingTechnicalCommunicationLinksMappedByTargetId: {},
+        directContainingTrustBoundaryMappedByTechnicalAssetId: {},
+        directContainingSharedRuntimeMappedByTechnicalAssetId: {},
+        parentTrustBoundaryIdMappedByTrustBoundaryId: {},
+        ancestorTrustBoundaryIdsMappedByTrustBoundaryId: {},
+        sharedRuntimesMappedByTechnicalAssetId: {},
+        processingTechnicalAssetsMappedByDataAssetId: {},
+        storingTechnicalAssetsMappedByDataAssetId: {},
+        sendingCommunicationLinksMappedByDataAssetId: {},
+        receivingCommunicationLinksMappedByDataAssetId: {},
+        generatedRisksByCategory: new Map<RiskCategory, Risk[]>(),
+        generatedRisksBySyntheticId: {},
+        riskIndex: null,
+        riskTrackingResolution: null,
+        allSupportedTags: {},
+        derivedValues: new WeakMap<object, Map<string, unknown>>(),
+        derivedValueStats: { hits: 0, misses: 0 },
+        raaRawScores: new Map<string, number>(),
+        dataFlowDiagramFragments: { nodes: new Map(), edges: new Map(), subgraphs: new Map(), clusterContentHashes: {} },
+    };
 }
 
-export const modelState: ModelState = {
-    parsedModelRoot: null,
-    communicationLinks: {},
-    incomingTechnicalCommunicationLinksMappedByTargetId: {},
-    directContainingTrustBoundaryMappedByTechnicalAssetId: {},
-    directContainingSharedRuntimeMappedByTechnicalAssetId: {},
-    generatedRisksByCategory: new Map<RiskCategory, Risk[]>(),
-    generatedRisksBySyntheticId: {},
-    allSupportedTags: {},
-};
+// The active model context. Rules, RAA and the entity methods read it implicitly, so entities of
+// another context must be queried inside withModelContext of that context.
+export let modelState: ModelContext = createModelContext();
+
+/**
+ * Runs fn with the given context as the active one and restores the previous context afterwards,
+ * also when fn throws. fn must be synchronous: the engine never awaits while a context is active,
+ * which lets any number of models share one engine and be served interleaved.
+ */
+export function withModelContext<T>(context: ModelContext, fn: () => T): T {
+    if (context === modelState) {
+        return fn();
+    }
+    const previous = modelState;
+    modelState = context;
+    try {
+        return fn();
+    } finally {
+        modelState = previous;
+    }
+}
 
 export function initModelState(): void {
     modelState.communicationLinks = {};
     modelState.incomingTechnicalCommunicationLinksMappedByTargetId = {};
     modelState.directContainingTrustBoundaryMappedByTechnicalAssetId = {};
     modelState.directContainingSharedRuntimeMappedByTechnicalAssetId = {};
+    resetTopologyIndexes();
+    invalidateDerivedValues();
+    resetDerivedValueStats();
     modelState.generatedRisksByCategory = new Map<RiskCategory, Risk[]>();
     modelState.generatedRisksBySyntheticId = {};
+    modelState.riskIndex = null;
+    modelState.riskTrackingResolution = null;
     modelState.allSupportedTags = {};
     // Note: parsedModelRoot is typically loaded later
 }
 
+export function resetTopologyIndexes(): void {
+    modelState.parentTrustBoundaryIdMappedByTrustBoundaryId = {};
+    modelState.ancestorTrustBoundaryIdsMappedByTrustBoundaryId = {};
+    modelState.sharedRuntimesMappedByTechnicalAssetId = {};
+    modelState.processingTechnicalAssetsMappedByDataAssetId = {};
+    modelState.storingTechnicalAssetsMappedByDataAssetId = {};
+    modelState.sendingCommunicationLinksMappedByDataAssetId = {};
+    modelState.receivingCommunicationLinksMappedByDataAssetId = {};
+}
+
+// Parent and ancestor chain of every trust boundary; rebuild after trust boundaries change
+export function indexTrustBoundaryNesting(trustBoundaries: Record<string, TrustBoundary>): void {
+    const parents: Record<string, string> = {};
+    for (const candidate of Object.values(trustBoundaries)) {
+        for (const nestedId of candidate.trustBoundariesNested) {
+            if (!(nestedId in parents)) { // First nesting boundary wins, as with the former scan
+                parents[nestedId] = candidate.id;
+            }
+        }
+    }
+    const ancestors: Record<string, string[]> = {};
+    for (const id in trustBoundaries) {
+        const chain = [id];
+        let parentId = parents[id];
+        while (parentId !== undefined && !chain.includes(parentId)) { // Stop on cyclic nesting
+            chain.push(parentId);
+            parentId = parents[parentId];
+        }
+        ancestors[id] = chain;
+    }
+    modelState.parentTrustBoundaryIdMappedByTrustBoundaryId = parents;
+    modelState.ancestorTrustBoundaryIdsMappedByTrustBoundaryId = ancestors;
+}
+
+// All shared runtimes each technical asset runs on; rebuild after shared runtimes change
+export function indexSharedRuntimeMembership(sharedRuntimes: Record<string, SharedRuntime>): void {
+    const membership: Record<string, SharedRuntime[]> = {};
+    for (const sharedRuntime of Object.values(sharedRuntimes)) {
+        for (const taId of sharedRuntime.technicalAssetsRunning) {
+            (membership[taId] ??= []).push(sharedRuntime);
+        }
+    }
+    modelState.sharedRuntimesMappedByTechnicalAssetId = membership;
+}
+
+// Technical assets and communication links using each data asset; rebuild after technical assets
+// (which own the communication links) change
+export function indexDataAssetUsage(technicalAssets: Record<string, TechnicalAsset>, communicationLinks: Record<string, CommunicationLink>): void {
+    const processing: Record<string, TechnicalAsset[]> = {};
+    const storing: Record<string, TechnicalAsset[]> = {};
+    const sending: Record<string, CommunicationLink[]> = {};
+    const receiving: Record<string, CommunicationLink[]> = {};
+    const addUnique = <T>(index: Record<string, T[]>, dataAssetIds: string[], item: T) => {
+        for (const dataAssetId of new Set(dataAssetIds)) {
+            (index[dataAssetId] ??= []).push(item);
+        }
+    };
+    for (const techAsset of Object.values(technicalAssets)) {
+        addUnique(processing, techAsset.dataAssetsProcessed, techAsset);
+        addUnique(storing, techAsset.dataAssetsStored, techAsset);
+    }
+    for (const commLink of Object.values(communicationLinks)) {
+        addUnique(sending, commLink.dataAssetsSent, commLink);
+        addUnique(receiving, commLink.dataAssetsReceived, commLink);
+    }
+    Object.values(processing).forEach(list => list.sort(sortByTechnicalAssetTitle));
+    Object.values(storing).forEach(list => list.sort(sortByTechnicalAssetTitle));
+    Object.values(sending).forEach(list => list.sort(sortByTechnicalCommunicationLinkTitle));
+    Object.values(receiving).forEach(list => list.sort(sortByTechnicalCommunicationLinkTitle));
+    modelState.processingTechnicalAssetsMappedByDataAssetId = processing;
+    modelState.storingTechnicalAssetsMappedByDataAssetId = storing;
+    modelState.sendingCommunicationLinksMappedByDataAssetId = sending;
+    modelState.receivingCommunicationLinksMappedByDataAssetId = receiving;
+}
+
+// Per-parse memo of derived values like getHighestConfidentiality, keyed by the model object.
+// Cleared via invalidateDerivedValues whenever the model changes.
+export function memoizeDerivedValue<T>(owner: object, name: string, compute: () => T): T {
+    let values = modelState.derivedValues.get(owner);
+    if (!values) {
+        values = new Map<string, unknown>();
+        modelState.derivedValues.set(owner, values);
+    }
+    if (values.has(name)) {
+        modelState.derivedValueStats.hits++;
+        return values.get(name) as T;
+    }
+    modelState.derivedValueStats.misses++;
+    const value = compute();
+    values.set(name, value);
+    return value;
+}
+
+export function invalidateDerivedValues(): void {
+    modelState.derivedValues = new WeakMap<object, Map<string, unknown>>();
+}
+
+export function getDerivedValueStats(): { hits: number; misses: number; hitRate: number } {
+    const { hits, misses } = modelState.derivedValueStats;
+    return { hits, misses, hitRate: hits + misses > 0 ? hits / (hits + misses) : 0 };
+}
+
+export function resetDerivedValueStats(): void {
+    modelState.derivedValueStats = { hits: 0, misses: 0 };
+}
+
 export function addToListOfSupportedTags(tags: string[]): void {
     for (const tag of tags) {
         modelState.allSupportedTags[tag] = true;
@@ -76,11 +276,25 @@ export function addToListOfSupportedTags(tags: string[]): void {
 
 // === Interfaces and Enums ===
 
+// Parts of the model a risk rule reads. Fields are the YAML keys of the input sections, so the
+// engine can match them against edit paths and only re-run the rules an edit can affect. Built-in
+// rules return theirs from an exported Dependencies(), listing every field their GenerateRisks
+// reads; an edit to a field that isn't listed doesn't re-run the rule.
+export interface RiskRuleDependencies {
+    technicalAssetFields?: string[];
+    communicationLinkFields?: string[];
+    dataAssetFields?: string[];
+    trustBoundaries?: boolean; // Any trust boundary field, including nesting and the assets inside
+    sharedRuntimes?: boolean;  // Any shared runtime field, including the assets running on it
+    raa?: boolean;             // Relative attacker attractiveness of the technical assets
+}
+
 // Go interface CustomRiskRule
 export interface CustomRiskRule {
     category(): RiskCategory;
     supportedTags(): string[];
     generateRisks(): Risk[];
+    dependencies?(): RiskRuleDependencies; // Rules without a declaration are re-run after every edit
 }
 
 // === Helper Functions ===
@@ -105,11 +319,28 @@ export function normalizeTag(tag: string): string {
     return tag.trim().toLowerCase();
 }
 
+// Regular Expression for ID validation (similar to Go's)
+export const validIdSyntax = /^[A-Za-z0-9\-]+$/;
+
 export function makeID(val: string): string {
     const reg = /[^A-Za-z0-9]+/g;
     return val.toLowerCase().replace(reg, "-").replace(/^-+|-+$/g, '').trim();
 }
 
+// Fast non-cryptographic hash (cyrb53) of a string as hex, for change detection of cached renderings
+export function contentHash(text: string): string {
+    let h1 = 0xdeadbeef;
+    let h2 = 0x41c6ce57;
+    for (let i = 0; i < text.length; i++) {
+        const ch = text.charCodeAt(i);
+        h1 = Math.imul(h1 ^ ch, 2654435761);
+        h2 = Math.imul(h2 ^ ch, 1597334677);
+    }
+    h1 = Math.imul(h1 ^ (h1 >>> 16), 2246822507) ^ Math.imul(h2 ^ (h2 >>> 13), 3266489909);
+    h2 = Math.imul(h2 ^ (h2 >>> 16), 2246822507) ^ Math.imul(h1 ^ (h1 >>> 13), 3266489909);
+    return (4294967296 * (2097151 & h2) + (h1 >>> 0)).toString(16);
+}
+
 // Contains tells whether an array contains an element
 export function contains(arr: string[], x: string): boolean {
     return arr.includes(x);
@@ -1038,120 +1269,46 @@ export class DataAsset {
 
      isDataBreachPotentialStillAtRisk(): boolean {
         if (!modelState.parsedModelRoot) return false;
-         return getFilteredByStillAtRisk().some(risk =>
-            risk.dataBreachTechnicalAssetIDs.some(techAssetId => {
-                const asset = modelState.parsedModelRoot!.technicalAssets[techAssetId];
-                return asset && (contains(asset.dataAssetsProcessed, this.id) || contains(asset.dataAssetsStored, this.id));
-            })
-        );
+        return reduceToOnlyStillAtRisk(getDataBreachRisksOfDataAsset(this.id)).length > 0;
     }
 
     getIdentifiedDataBreachProbability(): DataBreachProbability {
         if (!modelState.parsedModelRoot) return DataBreachProbability.Improbable;
-        let highestProbability = DataBreachProbability.Improbable;
-        for (const risk of getAllRisks()) {
-            for (const techAssetId of risk.dataBreachTechnicalAssetIDs) {
-                const asset = modelState.parsedModelRoot!.technicalAssets[techAssetId];
-                if (asset && (contains(asset.dataAssetsProcessed, this.id) || contains(asset.dataAssetsStored, this.id))) {
-                     if (risk.dataBreachProbability > highestProbability) { // Assumes string enum order is correct!
-                        highestProbability = risk.dataBreachProbability;
-                        if (highestProbability === DataBreachProbability.Probable) return highestProbability; // Max possible
-                    }
-                    break; // Check next risk once asset match found
-                }
-            }
-        }
-        return highestProbability;
+        return getHighestDataBreachProbability(getDataBreachRisksOfDataAsset(this.id));
     }
 
      getIdentifiedDataBreachProbabilityStillAtRisk(): DataBreachProbability {
         if (!modelState.parsedModelRoot) return DataBreachProbability.Improbable;
-        let highestProbability = DataBreachProbability.Improbable;
-         for (const risk of getFilteredByStillAtRisk()) {
-            for (const techAssetId of risk.dataBreachTechnicalAssetIDs) {
-                 const asset = modelState.parsedModelRoot!.technicalAssets[techAssetId];
-                 if (asset && (contains(asset.dataAssetsProcessed, this.id) || contains(asset.dataAssetsStored, this.id))) {
-                     if (risk.dataBreachProbability > highestProbability) { // Assumes string enum order is correct!
-                        highestProbability = risk.dataBreachProbability;
-                        if (highestProbability === DataBreachProbability.Probable) return highestProbability; // Max possible
-                    }
-                    break; // Check next risk once asset match found
-                }
-            }
-        }
-        return highestProbability;
+        return getHighestDataBreachProbability(reduceToOnlyStillAtRisk(getDataBreachRisksOfDataAsset(this.id)));
     }
 
     getIdentifiedDataBreachProbabilityRisksStillAtRisk(): Risk[] {
         if (!modelState.parsedModelRoot) return [];
-        const result: Risk[] = [];
-        const addedRiskIds = new Set<string>();
-         for (const risk of getFilteredByStillAtRisk()) {
-            for (const techAssetId of risk.dataBreachTechnicalAssetIDs) {
-                 const asset = modelState.parsedModelRoot!.technicalAssets[techAssetId];
-                 if (asset && (contains(asset.dataAssetsProcessed, this.id) || contains(asset.dataAssetsStored, this.id))) {
-                     if (!addedRiskIds.has(risk.syntheticId)) {
-                         result.push(risk);
-                         addedRiskIds.add(risk.syntheticId);
-                     }
-                    break; // Check next risk once asset match found
-                }
-            }
-        }
-        return result;
+        return reduceToOnlyStillAtRisk(getDataBreachRisksOfDataAsset(this.id));
     }
 
      getIdentifiedDataBreachProbabilityRisks(): Risk[] {
          if (!modelState.parsedModelRoot) return [];
-        const result: Risk[] = [];
-        const addedRiskIds = new Set<string>();
-        for (const risk of getAllRisks()) {
-            for (const techAssetId of risk.dataBreachTechnicalAssetIDs) {
-                 const asset = modelState.parsedModelRoot!.technicalAssets[techAssetId];
-                 if (asset && (contains(asset.dataAssetsProcessed, this.id) || contains(asset.dataAssetsStored, this.id))) {
-                    if (!addedRiskIds.has(risk.syntheticId)) {
-                        result.push(risk);
-                        addedRiskIds.add(risk.syntheticId);
-                    }
-                    break; // Check next risk once asset match found
-                }
-            }
-        }
-        return result;
+        return getDataBreachRisksOfDataAsset(this.id);
     }
 
 
     // --- Relationship methods ---
+    // Served from the indexes built by indexDataAssetUsage
     getProcessedByTechnicalAssetsSorted(): TechnicalAsset[] {
-        if (!modelState.parsedModelRoot?.technicalAssets) return [];
-        const result = Object.values(modelState.parsedModelRoot.technicalAssets)
-            .filter(asset => contains(asset.dataAssetsProcessed, this.id));
-        result.sort(sortByTechnicalAssetTitle);
-        return result;
+        return [...(modelState.processingTechnicalAssetsMappedByDataAssetId[this.id] ?? [])];
     }
 
     getStoredByTechnicalAssetsSorted(): TechnicalAsset[] {
-         if (!modelState.parsedModelRoot?.technicalAssets) return [];
-        const result = Object.values(modelState.parsedModelRoot.technicalAssets)
-            .filter(asset => contains(asset.dataAssetsStored, this.id));
-        result.sort(sortByTechnicalAssetTitle);
-        return result;
+        return [...(modelState.storingTechnicalAssetsMappedByDataAssetId[this.id] ?? [])];
     }
 
     getSentViaCommLinksSorted(): CommunicationLink[] {
-        if (!modelState.communicationLinks) return [];
-        const result = Object.values(modelState.communicationLinks)
-            .filter(link => contains(link.dataAssetsSent, this.id));
-        result.sort(sortByTechnicalCommunicationLinkTitle); // Assuming Title exists and is comparable
-        return result;
+        return [...(modelState.sendingCommunicationLinksMappedByDataAssetId[this.id] ?? [])];
     }
 
     getReceivedViaCommLinksSorted(): CommunicationLink[] {
-         if (!modelState.communicationLinks) return [];
-        const result = Object.values(modelState.communicationLinks)
-             .filter(link => contains(link.dataAssetsReceived, this.id));
-        result.sort(sortByTechnicalCommunicationLinkTitle); // Assuming Title exists and is comparable
-        return result;
+        return [...(modelState.receivingCommunicationLinksMappedByDataAssetId[this.id] ?? [])];
     }
 }
 
@@ -1232,44 +1389,50 @@ export class CommunicationLink {
 
     getHighestConfidentiality(): Confidentiality {
          if (!modelState.parsedModelRoot?.dataAssets) return Confidentiality.Public;
-        let highest = Confidentiality.Public;
-        const checkAsset = (assetId: string) => {
-            const dataAsset = modelState.parsedModelRoot!.dataAssets[assetId];
-            if (dataAsset && dataAsset.confidentiality > highest) {
-                highest = dataAsset.confidentiality;
-            }
-        };
-        this.dataAssetsSent.forEach(checkAsset);
-        this.dataAssetsReceived.forEach(checkAsset);
-        return highest;
+        return memoizeDerivedValue(this, 'highestConfidentiality', () => {
+            let highest = Confidentiality.Public;
+            const checkAsset = (assetId: string) => {
+                const dataAsset = modelState.parsedModelRoot!.dataAssets[assetId];
+                if (dataAsset && dataAsset.confidentiality > highest) {
+                    highest = dataAsset.confidentiality;
+                }
+            };
+            this.dataAssetsSent.forEach(checkAsset);
+            this.dataAssetsReceived.forEach(checkAsset);
+            return highest;
+        });
     }
 
     getHighestIntegrity(): Criticality {
         if (!modelState.parsedModelRoot?.dataAssets) return Criticality.Archive;
-        let highest = Criticality.Archive;
-        const checkAsset = (assetId: string) => {
-            const dataAsset = modelState.parsedModelRoot!.dataAssets[assetId];
-            if (dataAsset && dataAsset.integrity > highest) {
-                highest = dataAsset.integrity;
-            }
-        };
-        this.dataAssetsSent.forEach(checkAsset);
-        this.dataAssetsReceived.forEach(checkAsset);
-        return highest;
+        return memoizeDerivedValue(this, 'highestIntegrity', () => {
+            let highest = Criticality.Archive;
+            const checkAsset = (assetId: string) => {
+                const dataAsset = modelState.parsedModelRoot!.dataAssets[assetId];
+                if (dataAsset && dataAsset.integrity > highest) {
+                    highest = dataAsset.integrity;
+                }
+            };
+            this.dataAssetsSent.forEach(checkAsset);
+            this.dataAssetsReceived.forEach(checkAsset);
+            return highest;
+        });
     }
 
      getHighestAvailability(): Criticality {
         if (!modelState.parsedModelRoot?.dataAssets) return Criticality.Archive;
-        let highest = Criticality.Archive;
-        const checkAsset = (assetId: string) => {
-            const dataAsset = modelState.parsedModelRoot!.dataAssets[assetId];
-            if (dataAsset && dataAsset.availability > highest) {
-                highest = dataAsset.availability;
-            }
-        };
-        this.dataAssetsSent.forEach(checkAsset);
-        this.dataAssetsReceived.forEach(checkAsset);
-        return highest;
+        return memoizeDerivedValue(this, 'highestAvailability', () => {
+            let highest = Criticality.Archive;
+            const checkAsset = (assetId: string) => {
+                const dataAsset = modelState.parsedModelRoot!.dataAssets[assetId];
+                if (dataAsset && dataAsset.availability > highest) {
+                    highest = dataAsset.availability;
+                }
+            };
+            this.dataAssetsSent.forEach(checkAsset);
+            this.dataAssetsReceived.forEach(checkAsset);
+            return highest;
+        });
     }
 
     getDataAssetsSentSorted(): DataAsset[] {
@@ -1430,8 +1593,8 @@ export class TechnicalAsset {
             return true;
         }
         // Check shared runtimes
-        for (const sr of Object.values(modelState.parsedModelRoot.sharedRuntimes)) {
-             if (contains(sr.technicalAssetsRunning, this.id) && sr.isTaggedWithAny(...tags)) {
+        for (const sr of modelState.sharedRuntimesMappedByTechnicalAssetId[this.id] ?? []) {
+             if (sr.isTaggedWithAny(...tags)) {
                  return true;
              }
         }
@@ -1489,44 +1652,50 @@ export class TechnicalAsset {
 
     getHighestConfidentiality(): Confidentiality {
          if (!modelState.parsedModelRoot?.dataAssets) return this.confidentiality;
-        let highest = this.confidentiality;
-        const checkAsset = (assetId: string) => {
-            const dataAsset = modelState.parsedModelRoot!.dataAssets[assetId];
-            if (dataAsset && dataAsset.confidentiality > highest) {
-                highest = dataAsset.confidentiality;
-            }
-        };
-        this.dataAssetsProcessed.forEach(checkAsset);
-        this.dataAssetsStored.forEach(checkAsset);
-        return highest;
+        return memoizeDerivedValue(this, 'highestConfidentiality', () => {
+            let highest = this.confidentiality;
+            const checkAsset = (assetId: string) => {
+                const dataAsset = modelState.parsedModelRoot!.dataAssets[assetId];
+                if (dataAsset && dataAsset.confidentiality > highest) {
+                    highest = dataAsset.confidentiality;
+                }
+            };
+            this.dataAssetsProcessed.forEach(checkAsset);
+            this.dataAssetsStored.forEach(checkAsset);
+            return highest;
+        });
     }
 
     getHighestIntegrity(): Criticality {
         if (!modelState.parsedModelRoot?.dataAssets) return this.integrity;
-        let highest = this.integrity;
-        const checkAsset = (assetId: string) => {
-            const dataAsset = modelState.parsedModelRoot!.dataAssets[assetId];
-            if (dataAsset && dataAsset.integrity > highest) {
-                highest = dataAsset.integrity;
-            }
-        };
-        this.dataAssetsProcessed.forEach(checkAsset);
-        this.dataAssetsStored.forEach(checkAsset);
-        return highest;
+        return memoizeDerivedValue(this, 'highestIntegrity', () => {
+            let highest = this.integrity;
+            const checkAsset = (assetId: string) => {
+                const dataAsset = modelState.parsedModelRoot!.dataAssets[assetId];
+                if (dataAsset && dataAsset.integrity > highest) {
+                    highest = dataAsset.integrity;
+                }
+            };
+            this.dataAssetsProcessed.forEach(checkAsset);
+            this.dataAssetsStored.forEach(checkAsset);
+            return highest;
+        });
     }
 
      getHighestAvailability(): Criticality {
         if (!modelState.parsedModelRoot?.dataAssets) return this.availability;
-        let highest = this.availability;
-        const checkAsset = (assetId: string) => {
-            const dataAsset = modelState.parsedModelRoot!.dataAssets[assetId];
-            if (dataAsset && dataAsset.availability > highest) {
-                highest = dataAsset.availability;
-            }
-        };
-        this.dataAssetsProcessed.forEach(checkAsset);
-        this.dataAssetsStored.forEach(checkAsset);
-        return highest;
+        return memoizeDerivedValue(this, 'highestAvailability', () => {
+            let highest = this.availability;
+            const checkAsset = (assetId: string) => {
+                const dataAsset = modelState.parsedModelRoot!.dataAssets[assetId];
+                if (dataAsset && dataAsset.availability > highest) {
+                    highest = dataAsset.availability;
+                }
+            };
+            this.dataAssetsProcessed.forEach(checkAsset);
+            this.dataAssetsStored.forEach(checkAsset);
+            return highest;
+        });
     }
 
 
@@ -1589,12 +1758,7 @@ export class TechnicalAsset {
             return [];
         }
 
-        // Iterate through all generated risks
-        for (const risk of Object.values(modelState.generatedRisksBySyntheticId)) {
-             if (risk.mostRelevantTechnicalAssetId === this.id) {
-                 resultingRisks.push(risk);
-             }
-        }
+        resultingRisks.push(...(getRiskIndex().byMostRelevantTechnicalAssetId[this.id] ?? []));
 
         // Sort by severity (descending) then title (ascending)
         resultingRisks.sort(sortByRiskSeverity);
@@ -1740,11 +1904,9 @@ export class TrustBoundary {
          if (this.isTaggedWithAny(...tags)) {
              return true;
          }
-         const parentId = this.getParentTrustBoundaryID();
-         if (parentId && modelState.parsedModelRoot?.trustBoundaries[parentId]?.isTaggedWithAnyTraversingUp(...tags)) {
-             return true;
-         }
-         return false;
+         const trustBoundaries = modelState.parsedModelRoot?.trustBoundaries ?? {};
+         const ancestorIds = modelState.ancestorTrustBoundaryIdsMappedByTrustBoundaryId[this.id] ?? [];
+         return ancestorIds.some(id => id !== this.id && !!trustBoundaries[id]?.isTaggedWithAny(...tags));
      }
 
 
@@ -1761,75 +1923,66 @@ export class TrustBoundary {
         }
     }
 
+    // Served from the indexes built by indexTrustBoundaryNesting
     getParentTrustBoundaryID(): string | undefined {
-        if (!modelState.parsedModelRoot?.trustBoundaries) return undefined;
-        for (const candidate of Object.values(modelState.parsedModelRoot.trustBoundaries)) {
-            if (contains(candidate.trustBoundariesNested, this.id)) {
-                return candidate.id;
-            }
-        }
-        return undefined;
+        return modelState.parentTrustBoundaryIdMappedByTrustBoundaryId[this.id];
     }
 
      // Get all ancestor IDs, including self
     getAllParentTrustBoundaryIDs(): string[] {
-        const result: string[] = [];
-        this._addTrustBoundaryIDsRecursively(result);
-        return result;
-    }
-
-    private _addTrustBoundaryIDsRecursively(result: string[]): void {
-        result.push(this.id);
-        const parentID = this.getParentTrustBoundaryID();
-        if (parentID) {
-            modelState.parsedModelRoot?.trustBoundaries[parentID]?._addTrustBoundaryIDsRecursively(result);
-        }
+        return [...(modelState.ancestorTrustBoundaryIdsMappedByTrustBoundaryId[this.id] ?? [this.id])];
     }
 
 
     getHighestConfidentiality(): Confidentiality {
          if (!modelState.parsedModelRoot?.technicalAssets) return Confidentiality.Public;
-        let highest = Confidentiality.Public;
-        for (const id of this.recursivelyAllTechnicalAssetIDsInside()) {
-            const techAsset = modelState.parsedModelRoot.technicalAssets[id];
-            if (techAsset) {
-                const assetConf = techAsset.getHighestConfidentiality();
-                if (assetConf > highest) {
-                    highest = assetConf;
+        return memoizeDerivedValue(this, 'highestConfidentiality', () => {
+            let highest = Confidentiality.Public;
+            for (const id of this.recursivelyAllTechnicalAssetIDsInside()) {
+                const techAsset = modelState.parsedModelRoot!.technicalAssets[id];
+                if (techAsset) {
+                    const assetConf = techAsset.getHighestConfidentiality();
+                    if (assetConf > highest) {
+                        highest = assetConf;
+                    }
                 }
             }
-        }
-        return highest;
+            return highest;
+        });
     }
 
      getHighestIntegrity(): Criticality {
          if (!modelState.parsedModelRoot?.technicalAssets) return Criticality.Archive;
-        let highest = Criticality.Archive;
-         for (const id of this.recursivelyAllTechnicalAssetIDsInside()) {
-            const techAsset = modelState.parsedModelRoot.technicalAssets[id];
-            if (techAsset) {
-                const assetInteg = techAsset.getHighestIntegrity();
-                 if (assetInteg > highest) {
-                    highest = assetInteg;
+        return memoizeDerivedValue(this, 'highestIntegrity', () => {
+            let highest = Criticality.Archive;
+             for (const id of this.recursivelyAllTechnicalAssetIDsInside()) {
+                const techAsset = modelState.parsedModelRoot!.technicalAssets[id];
+                if (techAsset) {
+                    const assetInteg = techAsset.getHighestIntegrity();
+                     if (assetInteg > highest) {
+                        highest = assetInteg;
+                    }
                 }
             }
-        }
-        return highest;
+            return highest;
+        });
     }
 
     getHighestAvailability(): Criticality {
         if (!modelState.parsedModelRoot?.technicalAssets) return Criticality.Archive;
-        let highest = Criticality.Archive;
-        for (const id of this.recursivelyAllTechnicalAssetIDsInside()) {
-            const techAsset = modelState.parsedModelRoot.technicalAssets[id];
-             if (techAsset) {
-                const assetAvail = techAsset.getHighestAvailability();
-                if (assetAvail > highest) {
-                    highest = assetAvail;
+        return memoizeDerivedValue(this, 'highestAvailability', () => {
+            let highest = Criticality.Archive;
+            for (const id of this.recursivelyAllTechnicalAssetIDsInside()) {
+                const techAsset = modelState.parsedModelRoot!.technicalAssets[id];
+                 if (techAsset) {
+                    const assetAvail = techAsset.getHighestAvailability();
+                    if (assetAvail > highest) {
+                        highest = assetAvail;
+                    }
                 }
             }
-        }
-        return highest;
+            return highest;
+        });
     }
 
 }
@@ -1859,47 +2012,53 @@ export class SharedRuntime {
 
      getHighestConfidentiality(): Confidentiality {
          if (!modelState.parsedModelRoot?.technicalAssets) return Confidentiality.Public;
-        let highest = Confidentiality.Public;
-        for (const id of this.technicalAssetsRunning) {
-            const techAsset = modelState.parsedModelRoot.technicalAssets[id];
-             if (techAsset) {
-                const assetConf = techAsset.getHighestConfidentiality();
-                if (assetConf > highest) {
-                    highest = assetConf;
+        return memoizeDerivedValue(this, 'highestConfidentiality', () => {
+            let highest = Confidentiality.Public;
+            for (const id of this.technicalAssetsRunning) {
+                const techAsset = modelState.parsedModelRoot!.technicalAssets[id];
+                 if (techAsset) {
+                    const assetConf = techAsset.getHighestConfidentiality();
+                    if (assetConf > highest) {
+                        highest = assetConf;
+                    }
                 }
             }
-        }
-        return highest;
+            return highest;
+        });
     }
 
     getHighestIntegrity(): Criticality {
         if (!modelState.parsedModelRoot?.technicalAssets) return Criticality.Archive;
-        let highest = Criticality.Archive;
-        for (const id of this.technicalAssetsRunning) {
-            const techAsset = modelState.parsedModelRoot.technicalAssets[id];
-            if (techAsset) {
-                 const assetInteg = techAsset.getHighestIntegrity();
-                if (assetInteg > highest) {
-                    highest = assetInteg;
+        return memoizeDerivedValue(this, 'highestIntegrity', () => {
+            let highest = Criticality.Archive;
+            for (const id of this.technicalAssetsRunning) {
+                const techAsset = modelState.parsedModelRoot!.technicalAssets[id];
+                if (techAsset) {
+                     const assetInteg = techAsset.getHighestIntegrity();
+                    if (assetInteg > highest) {
+                        highest = assetInteg;
+                    }
                 }
             }
-        }
-        return highest;
+            return highest;
+        });
     }
 
     getHighestAvailability(): Criticality {
          if (!modelState.parsedModelRoot?.technicalAssets) return Criticality.Archive;
-        let highest = Criticality.Archive;
-        for (const id of this.technicalAssetsRunning) {
-            const techAsset = modelState.parsedModelRoot.technicalAssets[id];
-            if (techAsset) {
-                const assetAvail = techAsset.getHighestAvailability();
-                 if (assetAvail > highest) {
-                    highest = assetAvail;
+        return memoizeDerivedValue(this, 'highestAvailability', () => {
+            let highest = Criticality.Archive;
+            for (const id of this.technicalAssetsRunning) {
+                const techAsset = modelState.parsedModelRoot!.technicalAssets[id];
+                if (techAsset) {
+                    const assetAvail = techAsset.getHighestAvailability();
+                     if (assetAvail > highest) {
+                        highest = assetAvail;
+                    }
                 }
             }
-        }
-        return highest;
+            return highest;
+        });
     }
 
     getTechnicalAssetWithHighestRAA(): TechnicalAsset | undefined {
@@ -1996,7 +2155,11 @@ export class Risk {
 
     // Get tracking info (requires modelState.parsedModelRoot)
     getRiskTracking(): RiskTracking | undefined {
-        return modelState.parsedModelRoot?.riskTracking[this.syntheticId];
+        if (!modelState.parsedModelRoot) {
+            return undefined;
+        }
+        return getRiskTrackingResolution().trackingBySyntheticRiskId[this.syntheticId.toLowerCase()]
+            ?? modelState.parsedModelRoot.riskTracking[this.syntheticId];
     }
 
      getRiskTrackingStatusDefaultingUnchecked(): RiskStatus {
@@ -2004,7 +2167,7 @@ export class Risk {
     }
 
      isRiskTracked(): boolean {
-        return !!modelState.parsedModelRoot?.riskTracking[this.syntheticId];
+        return !!this.getRiskTracking();
     }
 
     // Method to create a shallow clone (deep copy for category is handled in Go version, maybe less critical here if category is looked up)
@@ -2033,24 +2196,7 @@ export class Risk {
     toJSON(): object {
         const category = this.getCategory();
         return {
-            category: category ? { // Marshal category details if found
-                id: category.id,
-                title: category.title,
-                description: category.description,
-                impact: category.impact,
-                asvs: category.asvs,
-                cheat_sheet: category.cheatSheet,
-                action: category.action,
-                mitigation: category.mitigation,
-                check: category.check,
-                detection_logic: category.detectionLogic,
-                risk_assessment: category.riskAssessment,
-                false_positives: category.falsePositives,
-                function: category.function,
-                stride: category.stride,
-                model_failure_possible_reason: category.modelFailurePossibleReason,
-                cwe: category.cwe,
-            } : this.categoryId, // Fallback to just ID if category not found
+            category: category ? marshalRiskCategory(category) : this.categoryId, // Fallback to just ID if category not found
             risk_status: this.getRiskTrackingStatusDefaultingUnchecked(),
             severity: this.severity,
             exploitation_likelihood: this.exploitationLikelihood,
@@ -2069,6 +2215,28 @@ export class Risk {
 }
 
 
+// Category details as written to risks.json (Go's RiskCategory JSON tags)
+export function marshalRiskCategory(category: RiskCategory): object {
+    return {
+        id: category.id,
+        title: category.title,
+        description: category.description,
+        impact: category.impact,
+        asvs: category.asvs,
+        cheat_sheet: category.cheatSheet,
+        action: category.action,
+        mitigation: category.mitigation,
+        check: category.check,
+        detection_logic: category.detectionLogic,
+        risk_assessment: category.riskAssessment,
+        false_positives: category.falsePositives,
+        function: category.function,
+        stride: category.stride,
+        model_failure_possible_reason: category.modelFailurePossibleReason,
+        cwe: category.cwe,
+    };
+}
+
 export interface RiskTracking {
     syntheticRiskId: string; // Link back to the Risk
     justification: string;
@@ -2498,8 +2666,208 @@ export function getTotalRiskCount(): number {
 }
 
 export function getAllRisks(): Risk[] {
-    // Use the synthetic ID map for a flat list
-    return Object.values(modelState.generatedRisksBySyntheticId);
+    return [...getRiskIndex().all];
+}
+
+// Call whenever generatedRisksBySyntheticId or the parsed risk tracking changes
+export function invalidateRiskIndex(): void {
+    modelState.riskIndex = null;
+    modelState.riskTrackingResolution = null;
+}
+
+export function getRiskTrackingResolution(): RiskTrackingResolution {
+    if (!modelState.riskTrackingResolution) {
+        modelState.riskTrackingResolution = resolveRiskTracking(
+            modelState.parsedModelRoot?.riskTracking ?? {}, modelState.generatedRisksBySyntheticId);
+    }
+    return modelState.riskTrackingResolution;
+}
+
+/**
+ * Matches the risk tracking entries against the generated risks in one pass over the risks.
+ * Exact entries take precedence; the wildcard entries are compiled into a single
+ * RiskTrackingMatcher, where several of them match a risk the first declared one wins.
+ */
+function resolveRiskTracking(riskTracking: Record<string, RiskTracking>, risksBySyntheticId: Record<string, Risk>): RiskTrackingResolution {
+    const resolution: RiskTrackingResolution = { trackingBySyntheticRiskId: {}, matchedCount: 0, orphanedIds: [], unmatchedWildcardIds: [] };
+    const wildcardIds: string[] = [];
+    for (const trackingId in riskTracking) {
+        if (trackingId.includes('*')) {
+            wildcardIds.push(trackingId);
+            continue;
+        }
+        const lowerId = trackingId.toLowerCase();
+        if (risksBySyntheticId[lowerId]) {
+            resolution.trackingBySyntheticRiskId[lowerId] = riskTracking[trackingId];
+            resolution.matchedCount++;
+        } else {
+            resolution.orphanedIds.push(trackingId);
+        }
+    }
+
+    if (wildcardIds.length > 0) {
+        const matcher = new RiskTrackingMatcher(wildcardIds);
+        const unmatched = new Set(wildcardIds);
+        for (const lowerId in risksBySyntheticId) {
+            if (resolution.trackingBySyntheticRiskId[lowerId]) {
+                continue; // Already tracked by an exact entry
+            }
+            const wildcardId = matcher.match(lowerId);
+            if (wildcardId !== undefined) {
+                resolution.trackingBySyntheticRiskId[lowerId] = riskTracking[wildcardId];
+                resolution.matchedCount++;
+                unmatched.delete(wildcardId);
+            }
+        }
+        resolution.unmatchedWildcardIds = [...unmatched];
+    }
+    return resolution;
+}
+
+interface RiskTrackingTrieNode {
+    literalChildren: Map<string, RiskTrackingTrieNode>;
+    wildcardChildren: { segment: RegExp; node: RiskTrackingTrieNode }[];
+    trackingIds: string[]; // Wildcard tracking IDs ending at this node
+}
+
+function newRiskTrackingTrieNode(): RiskTrackingTrieNode {
+    return { literalChildren: new Map(), wildcardChildren: [], trackingIds: [] };
+}
+
+/**
+ * Segment trie over wildcard risk tracking IDs. As in Threagile, IDs are compared case-insensitively
+ * per '@'-separated segment and '*' matches one or more characters within a segment, never the '@'.
+ * Patterns sharing a prefix share its nodes, so a risk ID is matched against all of them at once.
+ */
+export class RiskTrackingMatcher {
+    private root = newRiskTrackingTrieNode();
+    private declarationOrder = new Map<string, number>();
+
+    constructor(wildcardIds: string[]) {
+        wildcardIds.forEach((wildcardId, order) => {
+            this.declarationOrder.set(wildcardId, order);
+            let node = this.root;
+            for (const segment of wildcardId.trim().toLowerCase().split('@')) {
+                node = segment.includes('*') ? this.wildcardChild(node, segment) : this.literalChild(node, segment);
+            }
+            node.trackingIds.push(wildcardId);
+        });
+    }
+
+    // Returns the first declared wildcard tracking ID matching the synthetic risk ID
+    match(syntheticRiskId: string): string | undefined {
+        const segments = syntheticRiskId.toLowerCase().split('@');
+        let best: string | undefined;
+        const visit = (node: RiskTrackingTrieNode, depth: number): void => {
+            if (depth === segments.length) {
+                for (const trackingId of node.trackingIds) {
+                    if (best === undefined || this.declarationOrder.get(trackingId)! < this.declarationOrder.get(best)!) {
+                        best = trackingId;
+                    }
+                }
+                return;
+            }
+            const literal = node.literalChildren.get(segments[depth]);
+            if (literal) {
+                visit(literal, depth + 1);
+            }
+            for (const child of node.wildcardChildren) {
+                if (child.segment.test(segments[depth])) {
+                    visit(child.node, depth + 1);
+                }
+            }
+        };
+        visit(this.root, 0);
+        return best;
+    }
+
+    private literalChild(node: RiskTrackingTrieNode, segment: string): RiskTrackingTrieNode {
+        let child = node.literalChildren.get(segment);
+        if (!child) {
+            child = newRiskTrackingTrieNode();
+            node.literalChildren.set(segment, child);
+        }
+        return child;
+    }
+
+    private wildcardChild(node: RiskTrackingTrieNode, segment: string): RiskTrackingTrieNode {
+        const source = '^' + segment.split('*').map(part => part.replace(/[.+?^${}()|[\]\\]/g, '\\$&')).join('.+') + '$';
+        let child = node.wildcardChildren.find(candidate => candidate.segment.source === source);
+        if (!child) {
+            child = { segment: new RegExp(source), node: newRiskTrackingTrieNode() };
+            node.wildcardChildren.push(child);
+        }
+        return child.node;
+    }
+}
+
+export function getRiskIndex(): RiskIndex {
+    if (!modelState.riskIndex) {
+        modelState.riskIndex = buildRiskIndex(Object.values(modelState.generatedRisksBySyntheticId));
+    }
+    return modelState.riskIndex;
+}
+
+function buildRiskIndex(risks: Risk[]): RiskIndex {
+    const index: RiskIndex = {
+        all: risks, byTechnicalAssetId: {}, byMostRelevantTechnicalAssetId: {}, byDataBreachTechnicalAssetId: {},
+        byCategoryId: {}, bySeverity: {}, byStatus: {},
+    };
+    const technicalAssets = modelState.parsedModelRoot?.technicalAssets ?? {};
+    const add = (map: Record<string, Risk[]>, key: string, risk: Risk) => {
+        (map[key] ??= []).push(risk);
+    };
+    for (const risk of risks) {
+        add(index.byCategoryId, risk.categoryId, risk);
+        add(index.bySeverity, risk.severity, risk);
+        add(index.byStatus, risk.getRiskTrackingStatusDefaultingUnchecked(), risk);
+        new Set(risk.dataBreachTechnicalAssetIDs).forEach(taId => add(index.byDataBreachTechnicalAssetId, taId, risk));
+
+        // Synthetic IDs are "<category>@<id>@<id>...", communication link IDs inside them "<source>-><target>@<protocol>"
+        const assetIds = new Set<string>();
+        for (const part of risk.syntheticId.split('@').flatMap(segment => segment.split('->'))) {
+            if (technicalAssets[part]) assetIds.add(part);
+        }
+        if (risk.mostRelevantTechnicalAssetId) {
+            assetIds.add(risk.mostRelevantTechnicalAssetId);
+            add(index.byMostRelevantTechnicalAssetId, risk.mostRelevantTechnicalAssetId, risk);
+        }
+        assetIds.forEach(taId => add(index.byTechnicalAssetId, taId, risk));
+    }
+    return index;
+}
+
+// Risks of the given technical asset, as listed by the editor's inspection panel
+export function getRisksOfTechnicalAsset(technicalAssetId: string): Risk[] {
+    return [...(getRiskIndex().byTechnicalAssetId[technicalAssetId] ?? [])];
+}
+
+export function getRisksByTechnicalAssetId(): Record<string, Risk[]> {
+    return getRiskIndex().byTechnicalAssetId;
+}
+
+function getHighestDataBreachProbability(risks: Risk[]): DataBreachProbability {
+    let highestProbability = DataBreachProbability.Improbable;
+    for (const risk of risks) {
+        if (risk.dataBreachProbability > highestProbability) { // Assumes string enum order is correct!
+            highestProbability = risk.dataBreachProbability;
+        }
+    }
+    return highestProbability;
+}
+
+// Risks that could leak the given data asset, via the technical assets processing or storing it
+function getDataBreachRisksOfDataAsset(dataAssetId: string): Risk[] {
+    const index = getRiskIndex();
+    const result = new Set<Risk>();
+    const assets = [
+        ...(modelState.processingTechnicalAssetsMappedByDataAssetId[dataAssetId] ?? []),
+        ...(modelState.storingTechnicalAssetsMappedByDataAssetId[dataAssetId] ?? []),
+    ];
+    for (const asset of assets) {
+        index.byDataBreachTechnicalAssetId[asset.id]?.forEach(risk => result.add(risk));
+    }
+    return [...result];
 }
 
 export function flattenRiskMap(risksByCat: Map<RiskCategory, Risk[]>): Risk[] {
@@ -2517,55 +2885,66 @@ export function filterRisks(predicate: (risk: Risk) => boolean): Risk[] {
 }
 
 export function getFilteredByStillAtRisk(): Risk[] {
-    return filterRisks(risk => isRiskStatusStillAtRisk(risk.getRiskTrackingStatusDefaultingUnchecked()));
+    const index = getRiskIndex();
+    return Object.values(RiskStatus)
+        .filter(status => isRiskStatusStillAtRisk(status))
+        .flatMap(status => index.byStatus[status] ?? []);
 }
 
 export function getFilteredByRiskTrackingUnchecked(): Risk[] {
-     return filterRisks(risk => risk.getRiskTrackingStatusDefaultingUnchecked() === RiskStatus.Unchecked);
+     return [...(getRiskIndex().byStatus[RiskStatus.Unchecked] ?? [])];
 }
 export function getFilteredByRiskTrackingInDiscussion(): Risk[] {
-     return filterRisks(risk => risk.getRiskTrackingStatusDefaultingUnchecked() === RiskStatus.InDiscussion);
+     return [...(getRiskIndex().byStatus[RiskStatus.InDiscussion] ?? [])];
 }
 export function getFilteredByRiskTrackingAccepted(): Risk[] {
-     return filterRisks(risk => risk.getRiskTrackingStatusDefaultingUnchecked() === RiskStatus.Accepted);
+     return [...(getRiskIndex().byStatus[RiskStatus.Accepted] ?? [])];
 }
 export function getFilteredByRiskTrackingInProgress(): Risk[] {
-     return filterRisks(risk => risk.getRiskTrackingStatusDefaultingUnchecked() === RiskStatus.InProgress);
+     return [...(getRiskIndex().byStatus[RiskStatus.InProgress] ?? [])];
 }
 export function getFilteredByRiskTrackingMitigated(): Risk[] {
-     return filterRisks(risk => risk.getRiskTrackingStatusDefaultingUnchecked() === RiskStatus.Mitigated);
+     return [...(getRiskIndex().byStatus[RiskStatus.Mitigated] ?? [])];
 }
 export function getFilteredByRiskTrackingFalsePositive(): Risk[] {
-     return filterRisks(risk => risk.getRiskTrackingStatusDefaultingUnchecked() === RiskStatus.FalsePositive);
+     return [...(getRiskIndex().byStatus[RiskStatus.FalsePositive] ?? [])];
 }
 
 export function getFilteredByOnlyCriticalRisks(): Risk[] {
-    return filterRisks(risk => risk.severity === RiskSeverity.Critical);
+    return [...(getRiskIndex().bySeverity[RiskSeverity.Critical] ?? [])];
 }
 export function getFilteredByOnlyHighRisks(): Risk[] {
-     return filterRisks(risk => risk.severity === RiskSeverity.High);
+     return [...(getRiskIndex().bySeverity[RiskSeverity.High] ?? [])];
 }
 export function getFilteredByOnlyElevatedRisks(): Risk[] {
-     return filterRisks(risk => risk.severity === RiskSeverity.Elevated);
+     return [...(getRiskIndex().bySeverity[RiskSeverity.Elevated] ?? [])];
 }
 export function getFilteredByOnlyMediumRisks(): Risk[] {
-     return filterRisks(risk => risk.severity === RiskSeverity.Medium);
+     return [...(getRiskIndex().bySeverity[RiskSeverity.Medium] ?? [])];
 }
 export function getFilteredByOnlyLowRisks(): Risk[] {
-     return filterRisks(risk => risk.severity === RiskSeverity.Low);
+     return [...(getRiskIndex().bySeverity[RiskSeverity.Low] ?? [])];
 }
 
 export function getFilteredByOnlyBusinessSide(): Risk[] {
-    return filterRisks(risk => risk.getCategory()?.function === RiskFunction.BusinessSide);
+    return getRisksOfFunction(RiskFunction.BusinessSide);
 }
 export function getFilteredByOnlyArchitecture(): Risk[] {
-     return filterRisks(risk => risk.getCategory()?.function === RiskFunction.Architecture);
+     return getRisksOfFunction(RiskFunction.Architecture);
 }
 export function getFilteredByOnlyDevelopment(): Risk[] {
-     return filterRisks(risk => risk.getCategory()?.function === RiskFunction.Development);
+     return getRisksOfFunction(RiskFunction.Development);
 }
 export function getFilteredByOnlyOperation(): Risk[] {
-     return filterRisks(risk => risk.getCategory()?.function === RiskFunction.Operations);
+     return getRisksOfFunction(RiskFunction.Operations);
+}
+
+function getRisksOfFunction(riskFunction: RiskFunction): Risk[] {
+    const index = getRiskIndex();
+    const categories = modelState.parsedModelRoot?.individualRiskCategories ?? {};
+    return Object.keys(index.byCategoryId)
+        .filter(categoryId => categories[categoryId]?.function === riskFunction)
+        .flatMap(categoryId => index.byCategoryId[categoryId]);
 }
 
 export function filterByModelFailures(risksByCat: Map<RiskCategory, Risk[]>): Map<RiskCategory, Risk[]> {
@@ -2639,7 +3018,7 @@ export function getOverallRiskStatistics(): RiskStatistics {
         },
     };
 
-    for (const risk of getAllRisks()) {
+    for (const risk of getRiskIndex().all) {
         const status = risk.getRiskTrackingStatusDefaultingUnchecked();
         if (stats.risks[risk.severity]) { // Type guard
             stats.risks[risk.severity][status]++;
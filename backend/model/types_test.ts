@@ -0,0 +1,83 @@
+// RiskTrackingMatcher against a linear scan over the wildcard patterns: one pattern at a time,
+// in declaration order, with '*' matching within a single '@'-separated segment.
+//
+//   deno task test
+
+import { assertEquals } from 'https://deno.land/std@0.224.0/assert/mod.ts';
+import { generateRisks, getGeneratedRisks, parseModel } from '../main.ts';
+import { createModelContext, RiskTrackingMatcher } from './types.ts';
+
+// The rules read window.currentSelectedThreatStandard, like in the engine and CLI workers
+const testGlobal = globalThis as unknown as { window: unknown; currentSelectedThreatStandard?: string };
+testGlobal.window = globalThis;
+testGlobal.currentSelectedThreatStandard = 'ORIGINAL';
+
+function linearMatch(wildcardIds: string[], syntheticRiskId: string): string | undefined {
+    const segments = syntheticRiskId.toLowerCase().split('@');
+    return wildcardIds.find(wildcardId => {
+        const patternSegments = wildcardId.trim().toLowerCase().split('@');
+        return patternSegments.length === segments.length && patternSegments.every((pattern, i) => {
+            const source = pattern.split('*').map(part => part.replace(/[.+?^${}()|[\]\\]/g, '\\$&')).join('.+');
+            return new RegExp('^' + source + '$').test(segments[i]);
+        });
+    });
+}
+
+const modelYaml = await Deno.readTextFile(new URL('../customer_portal_erp_threat_model.yaml', import.meta.url));
+
+function sampleRiskIds(): string[] {
+    const context = createModelContext();
+    parseModel(modelYaml, context);
+    generateRisks([], new Set(), context);
+    return [...getGeneratedRisks(context).values()].flat().map(risk => risk.syntheticId);
+}
+
+Deno.test('RiskTrackingMatcher matches hand-written wildcard IDs like a linear scan', () => {
+    const wildcardIds = [
+        'ldap-injection@*@ldap-auth-server@*',
+        'missing-hardening@*',
+        'Missing-Hardening@erp-*', // Declared after a broader match, never wins
+        'unencrypted-*@*',
+        '*@sql-database',
+        'cross-site-scripting@*-portal',
+        'dos-risky-access-across-trust-boundary@*@*@*',
+        'some-category@a.b*',
+    ];
+    const riskIds = [
+        'ldap-injection@customer-portal@ldap-auth-server@customer-portal>ldap-auth',
+        'LDAP-Injection@erp-system@ldap-auth-server@erp-system>auth',
+        'ldap-injection@ldap-auth-server', // Too few segments
+        'missing-hardening@erp-system',
+        'missing-hardening@',
+        'missing-hardening@erp-system@extra',
+        'unencrypted-asset@sql-database',
+        'unencrypted-communication@apache-webserver>erp',
+        'server-side-request-forgery@sql-database',
+        'cross-site-scripting@customer-portal',
+        'cross-site-scripting@-portal', // '*' needs at least one character
+        'dos-risky-access-across-trust-boundary@a@b@c',
+        'some-category@a.bc',
+        'some-category@axbc', // '.' is literal
+    ];
+
+    const matcher = new RiskTrackingMatcher(wildcardIds);
+    for (const riskId of riskIds) {
+        assertEquals(matcher.match(riskId), linearMatch(wildcardIds, riskId), riskId);
+    }
+    assertEquals(matcher.match('missing-hardening@erp-system'), 'missing-hardening@*');
+    assertEquals(matcher.match('cross-site-scripting@-portal'), undefined);
+});
+
+Deno.test('RiskTrackingMatcher matches generated risk IDs like a linear scan', () => {
+    const riskIds = sampleRiskIds();
+    // Per risk: every segment but the category replaced by '*', and the category as a prefix wildcard
+    const wildcardIds = riskIds.flatMap(riskId => {
+        const [category, ...rest] = riskId.split('@');
+        return [[category, ...rest.map(() => '*')].join('@'), [category.slice(0, 4) + '*', ...rest].join('@')];
+    }).filter((wildcardId, i, all) => all.indexOf(wildcardId) === i);
+
+    const matcher = new RiskTrackingMatcher(wildcardIds);
+    for (const riskId of [...riskIds, 'unknown-category@nothing']) {
+        assertEquals(matcher.match(riskId), linearMatch(wildcardIds, riskId), riskId);
+    }
+});
@@ -0,0 +1,88 @@
+// Splits model YAML into its top-level sections, so a model can be parsed one section at a time
+// (see parseModelInSections) instead of building the syntax tree of the whole document first.
+//
+// This relies on the block mapping layout threat models are written in: every line that starts in
+// column 0 with anything but whitespace, a comment or a sequence entry ("- ", which may be written
+// unindented below its key) begins a new top-level key. Not supported, use parseModel for those:
+// flow style top-level collections, quoted scalars continued in column 0, several documents, and
+// aliases to anchors defined in another section.
+
+import * as YAML from 'npm:yaml';
+
+export interface YamlSection {
+    key: string | null; // The top-level key as written in the first line, null if it couldn't be read from it
+    text: string;
+    line: number; // 1-based line of the key in the whole document
+}
+
+// Plain, double or single quoted key followed by ':'
+const topLevelKeyPattern = /^(?:"((?:[^"\\]|\\.)*)"|'((?:[^']|'')*)'|([^\s#:][^#:\n]*?))\s*:(?:\s|$)/;
+
+function startsSection(line: string): boolean {
+    const first = line.charCodeAt(0);
+    if (Number.isNaN(first) || first === 32 /* space */ || first === 9 /* \t */ || first === 35 /* # */ || first === 10 /* \n */ || first === 13 /* \r */) {
+        return false;
+    }
+    if (first === 45 /* - */ && (line.length === 1 || ' \t\r\n'.includes(line[1]))) {
+        return false; // Unindented sequence entry of the current key
+    }
+    return true;
+}
+
+function keyOf(line: string): string | null {
+    const match = topLevelKeyPattern.exec(line);
+    if (!match) {
+        return null;
+    }
+    if (match[1] !== undefined) {
+        return JSON.parse(`"${match[1]}"`);
+    }
+    return match[2] !== undefined ? match[2].replace(/''/g, "'") : match[3];
+}
+
+/**
+ * Yields the top-level sections of yaml in document order. Sections are found by scanning
+ * line starts only; a section's text is cut out when the next one begins, nothing is parsed.
+ */
+export function* yamlSections(yaml: string): Generator<YamlSection> {
+    let sectionStart = -1;
+    let sectionLine = 0;
+    let line = 0;
+    for (let start = 0; start < yaml.length;) {
+        const newline = yaml.indexOf('\n', start);
+        const end = newline === -1 ? yaml.length : newline + 1;
+        const text = yaml.slice(start, Math.min(end, start + 4)); // Enough to classify the line
+        line++;
+        if (text.startsWith('---') || text.startsWith('...') || text.startsWith('%')) {
+            if (sectionStart !== -1 || text.startsWith('%')) {
+                throw new Error(`Line ${line}: sectioned parsing supports a single YAML document without directives.`);
+            }
+        } else if (startsSection(text)) {
+            if (sectionStart !== -1) {
+                const sectionText = yaml.slice(sectionStart, start);
+                yield { key: keyOf(sectionText), text: sectionText, line: sectionLine };
+            }
+            sectionStart = start;
+            sectionLine = line;
+        }
+        start = end;
+    }
+    if (sectionStart !== -1) {
+        const sectionText = yaml.slice(sectionStart);
+        yield { key: keyOf(sectionText), text: sectionText, line: sectionLine };
+    }
+}
+
+// The key/value pairs of one section, usually exactly one
+export function parseYamlSection(section: YamlSection): Record<string, unknown> {
+    let parsed: unknown;
+    try {
+        parsed = YAML.parse(section.text);
+    } catch (e) {
+        throw new Error(`Failed to parse YAML section '${section.key ?? '?'}' starting at line ${section.line}: ${e instanceof Error ? e.message : String(e)}`);
+    }
+    if (typeof parsed !== 'object' || parsed === null || Array.isArray(parsed)) {
+        throw new Error(`YAML section starting at line ${section.line} is not a top-level mapping entry.`);
+    }
+    return parsed as Record<string, unknown>;
+}
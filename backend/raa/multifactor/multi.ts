@@ -16,9 +16,11 @@ import {
  * Calculates Relative Attacker Attractiveness (RAA) based on CIA, exposure, and characteristics.
  * Assigns a score from 0 to 100.
  *
+ * @param changedAssetIds Optional IDs of the assets whose inputs changed since the last run. Only those
+ *                        are rescored; all others reuse the raw score cached in the active model context.
  * @returns A summary string indicating the algorithm used.
  */
-export function applyRAA(): string {
+export function applyRAA(changedAssetIds?: Set<string>): string {
     const introText = "Calculated RAA based on asset/data CIA, exposure, and characteristics.";
     console.log(introText);
 
@@ -32,66 +34,23 @@ export function applyRAA(): string {
         return "No technical assets found to calculate RAA for.";
     }
 
-    const rawScores: Map<string, number> = new Map();
-    let maxRawScore = 0;
+    // Raw scores of the last run on this model, so incremental runs only rescore changed assets.
+    // The cache is only usable if it covers exactly the current asset set.
+    const rawScoreCache = modelState.raaRawScores;
+    const incremental = changedAssetIds !== undefined &&
+        rawScoreCache.size === assets.length &&
+        assets.every(techAsset => rawScoreCache.has(techAsset.id));
+    if (!incremental) {
+        rawScoreCache.clear();
+    }
 
     // --- First Pass: Calculate Raw Scores ---
+    let maxRawScore = 0;
     for (const techAsset of assets) {
-        // Skip out-of-scope assets - they have no RAA in this context
-        if (techAsset.outOfScope) {
-            rawScores.set(techAsset.id, 0);
-            techAsset.raa = 0; // Explicitly set RAA to 0 for out-of-scope
-            continue;
-        }
-
-        let score = 0;
-
-        // 1. Asset's own CIA Sensitivity (Max ~123 based on enum values * Attractiveness)
-        score += getConfidentialityAttackerAttractivenessForAsset(techAsset.confidentiality);
-        score += getCriticalityAttackerAttractivenessForAsset(techAsset.integrity);
-        score += getCriticalityAttackerAttractivenessForAsset(techAsset.availability);
-
-        // 2. Sensitivity of Data Handled (Max ~76 based on enum values * Attractiveness)
-        // Using the asset's helper methods which find the highest data CIA
-        const highestDataConf = techAsset.getHighestConfidentiality();
-        const highestDataInteg = techAsset.getHighestIntegrity();
-        const highestDataAvail = techAsset.getHighestAvailability();
-
-        score += getConfidentialityAttackerAttractivenessForProcessedOrStoredData(highestDataConf) * 0.8; // Weight data conf slightly less than asset conf
-        score += getCriticalityAttackerAttractivenessForProcessedOrStoredData(highestDataInteg) * 0.8; // Weight data integ slightly less than asset integ
-        score += getCriticalityAttackerAttractivenessForProcessedOrStoredData(highestDataAvail) * 0.5; // Weight data avail less
-
-        // 3. Exposure Factors (Additive points)
-        if (techAsset.internet) {
-            score += 50; // Significant bonus for internet exposure
-        }
-        if (techAsset.usedAsClientByHuman) {
-            score += 25; // Bonus for being a common entry point
-        }
-
-        // 4. Characteristic Factors (Additive points)
-        if (techAsset.multiTenant) {
-            score += 20; // Higher impact if compromised
+        if (!incremental || changedAssetIds!.has(techAsset.id)) {
+            rawScoreCache.set(techAsset.id, calculateRawScore(techAsset));
         }
-        if (techAsset.customDevelopedParts) {
-            score += 15; // Potential for unknown vulnerabilities
-        }
-
-        // 5. Technology Type Boost (Examples)
-        const boostedTech = [
-            TechnicalAssetTechnology.Database, TechnicalAssetTechnology.IdentityProvider, TechnicalAssetTechnology.Vault,
-            TechnicalAssetTechnology.HSM, TechnicalAssetTechnology.WebServer, TechnicalAssetTechnology.WebApplication,
-            TechnicalAssetTechnology.LoadBalancer, TechnicalAssetTechnology.ReverseProxy, TechnicalAssetTechnology.APIGateway // Example
-        ];
-        if (boostedTech.includes(techAsset.technology)) {
-            score += 10;
-        }
-        // Could add more granular boosts/penalties here
-
-        // Ensure score is not negative (shouldn't happen with additive approach)
-        const finalRawScore = Math.max(0, score);
-        rawScores.set(techAsset.id, finalRawScore);
-
+        const finalRawScore = rawScoreCache.get(techAsset.id) ?? 0;
         if (finalRawScore > maxRawScore) {
             maxRawScore = finalRawScore;
         }
@@ -104,7 +63,7 @@ export function applyRAA(): string {
             continue;
         }
 
-        const rawScore = rawScores.get(techAsset.id) ?? 0;
+        const rawScore = rawScoreCache.get(techAsset.id) ?? 0;
 
         if (maxRawScore === 0) {
             techAsset.raa = 0; // Avoid division by zero if all scores are 0
@@ -122,6 +81,61 @@ export function applyRAA(): string {
     return introText;
 }
 
+function calculateRawScore(techAsset: TechnicalAsset): number {
+    // Skip out-of-scope assets - they have no RAA in this context
+    if (techAsset.outOfScope) {
+        techAsset.raa = 0; // Explicitly set RAA to 0 for out-of-scope
+        return 0;
+    }
+
+    let score = 0;
+
+    // 1. Asset's own CIA Sensitivity (Max ~123 based on enum values * Attractiveness)
+    score += getConfidentialityAttackerAttractivenessForAsset(techAsset.confidentiality);
+    score += getCriticalityAttackerAttractivenessForAsset(techAsset.integrity);
+    score += getCriticalityAttackerAttractivenessForAsset(techAsset.availability);
+
+    // 2. Sensitivity of Data Handled (Max ~76 based on enum values * Attractiveness)
+    // Using the asset's helper methods which find the highest data CIA
+    const highestDataConf = techAsset.getHighestConfidentiality();
+    const highestDataInteg = techAsset.getHighestIntegrity();
+    const highestDataAvail = techAsset.getHighestAvailability();
+
+    score += getConfidentialityAttackerAttractivenessForProcessedOrStoredData(highestDataConf) * 0.8; // Weight data conf slightly less than asset conf
+    score += getCriticalityAttackerAttractivenessForProcessedOrStoredData(highestDataInteg) * 0.8; // Weight data integ slightly less than asset integ
+    score += getCriticalityAttackerAttractivenessForProcessedOrStoredData(highestDataAvail) * 0.5; // Weight data avail less
+
+    // 3. Exposure Factors (Additive points)
+    if (techAsset.internet) {
+        score += 50; // Significant bonus for internet exposure
+    }
+    if (techAsset.usedAsClientByHuman) {
+        score += 25; // Bonus for being a common entry point
+    }
+
+    // 4. Characteristic Factors (Additive points)
+    if (techAsset.multiTenant) {
+        score += 20; // Higher impact if compromised
+    }
+    if (techAsset.customDevelopedParts) {
+        score += 15; // Potential for unknown vulnerabilities
+    }
+
+    // 5. Technology Type Boost (Examples)
+    const boostedTech = [
+        TechnicalAssetTechnology.Database, TechnicalAssetTechnology.IdentityProvider, TechnicalAssetTechnology.Vault,
+        TechnicalAssetTechnology.HSM, TechnicalAssetTechnology.WebServer, TechnicalAssetTechnology.WebApplication,
+        TechnicalAssetTechnology.LoadBalancer, TechnicalAssetTechnology.ReverseProxy, TechnicalAssetTechnology.APIGateway // Example
+    ];
+    if (boostedTech.includes(techAsset.technology)) {
+        score += 10;
+    }
+    // Could add more granular boosts/penalties here
+
+    // Ensure score is not negative (shouldn't happen with additive approach)
+    return Math.max(0, score);
+}
+
 // Example Usage (assuming modelState is populated):
 // const summaryFactors = calculateRAAByFactors();
 // console.log(summaryFactors);
@@ -151,10 +151,21 @@ function createRisk(
 
 // !!! ADD THIS EXPORT BLOCK AT THE END !!!
 // Import the interface used in the export block
-import { CustomRiskRule } from '../../../model/types.ts'; // Adjust path if needed!
+import { CustomRiskRule, RiskRuleDependencies } from '../../../../model/types.ts'; // Adjust path if needed!
+
+export function Dependencies(): RiskRuleDependencies {
+    return {
+        technicalAssetFields: [
+            'confidentiality', 'data_assets_processed', 'data_assets_stored', 'encryption', 'integrity',
+            'out_of_scope', 'technology',
+        ],
+        dataAssetFields: ['confidentiality', 'integrity'],
+    };
+}
 
 export const Rule: CustomRiskRule = {
     category: Category,         // Assumes Category function exists in the file
     supportedTags: SupportedTags, // Assumes SupportedTags function exists in the file
     generateRisks: GenerateRisks, // Assumes GenerateRisks function exists in the file
+    dependencies: Dependencies,
 };
@@ -198,10 +198,24 @@ function createRisk(
 
 // !!! ADD THIS EXPORT BLOCK AT THE END !!!
 // Import the interface used in the export block
-import { CustomRiskRule } from '../../../model/types.ts'; // Adjust path if needed!
+import { CustomRiskRule, RiskRuleDependencies } from '../../../../model/types.ts'; // Adjust path if needed!
+
+export function Dependencies(): RiskRuleDependencies {
+    return {
+        technicalAssetFields: [
+            'communication_links', 'confidentiality', 'integrity', 'out_of_scope', 'technology',
+        ],
+        communicationLinkFields: [
+            'authentication', 'data_assets_received', 'data_assets_sent', 'protocol', 'target', 'vpn',
+        ],
+        dataAssetFields: ['confidentiality', 'integrity'],
+        trustBoundaries: true,
+    };
+}
 
 export const Rule: CustomRiskRule = {
     category: Category,         // Assumes Category function exists in the file
     supportedTags: SupportedTags, // Assumes SupportedTags function exists in the file
     generateRisks: GenerateRisks, // Assumes GenerateRisks function exists in the file
+    dependencies: Dependencies,
 };
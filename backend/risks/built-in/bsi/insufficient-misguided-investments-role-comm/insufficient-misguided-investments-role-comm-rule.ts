@@ -171,10 +171,21 @@ export function GenerateRisks(): Risk[] {
 }
 
 // Standard export for Threagile custom risk rules
-import { CustomRiskRule } from '../../../model/types.ts';
+import { CustomRiskRule, RiskRuleDependencies } from '../../../../model/types.ts';
+
+export function Dependencies(): RiskRuleDependencies {
+    return {
+        technicalAssetFields: [
+            'availability', 'confidentiality', 'data_assets_processed', 'data_assets_stored', 'integrity',
+            'out_of_scope', 'tags',
+        ],
+        dataAssetFields: ['availability', 'confidentiality', 'integrity', 'tags'],
+    };
+}
 
 export const Rule: CustomRiskRule = {
     category: Category,
     supportedTags: SupportedTags,
     generateRisks: GenerateRisks,
+    dependencies: Dependencies,
 };
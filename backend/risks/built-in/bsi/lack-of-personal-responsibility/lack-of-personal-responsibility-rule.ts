@@ -157,10 +157,21 @@ function createRiskForTechnicalAsset(technicalAsset: TechnicalAsset, roleTag: st
     return risk;
 }
 
-import { CustomRiskRule } from '../../../model.ts';
+import { CustomRiskRule, RiskRuleDependencies } from '../../../../model/types.ts';
+
+export function Dependencies(): RiskRuleDependencies {
+    return {
+        technicalAssetFields: [
+            'availability', 'confidentiality', 'data_assets_processed', 'data_assets_stored', 'integrity',
+            'out_of_scope', 'tags', 'technology',
+        ],
+        dataAssetFields: ['availability', 'confidentiality', 'integrity', 'tags'],
+    };
+}
 
 export const Rule: CustomRiskRule = {
     category: Category,
     supportedTags: SupportedTags,
     generateRisks: GenerateRisks,
+    dependencies: Dependencies,
 };
@@ -136,10 +136,21 @@ export function GenerateRisks(): Risk[] {
 }
 
 // Standard export for Threagile custom risk rules
-import { CustomRiskRule } from '../../../model.ts'; // Adjust path to Threagile's model definition if necessary
+import { CustomRiskRule, RiskRuleDependencies } from '../../../../model/types.ts'; // Adjust path to Threagile's model definition if necessary
+
+export function Dependencies(): RiskRuleDependencies {
+    return {
+        technicalAssetFields: [
+            'availability', 'confidentiality', 'data_assets_processed', 'data_assets_stored', 'integrity',
+            'out_of_scope',
+        ],
+        dataAssetFields: ['availability', 'confidentiality', 'integrity'],
+    };
+}
 
 export const Rule: CustomRiskRule = {
     category: Category,
     supportedTags: SupportedTags, // Returns an empty array; asset selection logic is self-contained in GenerateRisks.
     generateRisks: GenerateRisks,
+    dependencies: Dependencies,
 };
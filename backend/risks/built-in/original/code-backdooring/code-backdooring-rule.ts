@@ -15,7 +15,6 @@ import {
     modelState, // Access the global model state
     isTechnologyDevelopmentRelevant,
      TechnicalAssetTechnology,
-     TechnicalAsset,
 } from '../../../../model/types.ts'; // Adjust the path back to model.ts as needed
 
 // Define the Category structure adhering to the RiskCategory interface
@@ -184,10 +183,22 @@ function createRisk(technicalAsset: TechnicalAsset, elevatedRisk: boolean): Risk
 
 // !!! ADD THIS EXPORT BLOCK AT THE END !!!
 // Import the interface used in the export block
-import { CustomRiskRule } from '../../../model/types.ts'; // Adjust path if needed!
+import { CustomRiskRule, RiskRuleDependencies } from '../../../../model/types.ts'; // Adjust path if needed!
+
+export function Dependencies(): RiskRuleDependencies {
+    return {
+        technicalAssetFields: [
+            'communication_links', 'confidentiality', 'data_assets_processed', 'data_assets_stored',
+            'integrity', 'internet', 'out_of_scope', 'technology', 'usage',
+        ],
+        communicationLinkFields: ['data_assets_received', 'data_assets_sent', 'target', 'usage', 'vpn'],
+        dataAssetFields: ['confidentiality', 'integrity', 'usage'],
+    };
+}
 
 export const Rule: CustomRiskRule = {
     category: Category,         // Assumes Category function exists in the file
     supportedTags: SupportedTags, // Assumes SupportedTags function exists in the file
     generateRisks: GenerateRisks, // Assumes GenerateRisks function exists in the file
+    dependencies: Dependencies,
 };
@@ -14,7 +14,7 @@ import {
     Criticality,
     TechnicalAssetMachine,
     modelState // Access the global model state
-} from '../../../model/types.ts'; // Adjust the path back to model.ts as needed
+} from '../../../../model/types.ts'; // Adjust the path back to model.ts as needed
 
 // Define the Category structure adhering to the RiskCategory interface
 export const ContainerBaseImageBackdooringCategory: RiskCategory = {
@@ -115,10 +115,21 @@ function createRisk(technicalAsset: TechnicalAsset): Risk {
 
 // !!! ADD THIS EXPORT BLOCK AT THE END !!!
 // Import the interface used in the export block
-import { CustomRiskRule } from '../../../model/types.ts'; // Adjust path if needed!
+import { CustomRiskRule, RiskRuleDependencies } from '../../../../model/types.ts'; // Adjust path if needed!
+
+export function Dependencies(): RiskRuleDependencies {
+    return {
+        technicalAssetFields: [
+            'availability', 'confidentiality', 'data_assets_processed', 'data_assets_stored', 'integrity',
+            'machine', 'out_of_scope',
+        ],
+        dataAssetFields: ['availability', 'confidentiality', 'integrity'],
+    };
+}
 
 export const Rule: CustomRiskRule = {
     category: Category,         // Assumes Category function exists in the file
     supportedTags: SupportedTags, // Assumes SupportedTags function exists in the file
     generateRisks: GenerateRisks, // Assumes GenerateRisks function exists in the file
+    dependencies: Dependencies,
 };
@@ -15,7 +15,7 @@ import {
     TechnicalAssetTechnology,
     TechnicalAssetMachine,
     modelState // Access the global model state
-} from '../../../model/types.ts'; // Adjust the path back to model.ts as needed
+} from '../../../../model/types.ts'; // Adjust the path back to model.ts as needed
 
 // Define the Category structure adhering to the RiskCategory interface
 export const ContainerPlatformEscapeCategory: RiskCategory = {
@@ -139,10 +139,21 @@ if (window.currentSelectedThreatStandard !== 'ORIGINAL') {
 
 // !!! ADD THIS EXPORT BLOCK AT THE END !!!
 // Import the interface used in the export block
-import { CustomRiskRule } from '../../../model/types.ts'; // Adjust path if needed!
+import { CustomRiskRule, RiskRuleDependencies } from '../../../../model/types.ts'; // Adjust path if needed!
+
+export function Dependencies(): RiskRuleDependencies {
+    return {
+        technicalAssetFields: [
+            'availability', 'confidentiality', 'data_assets_processed', 'data_assets_stored', 'integrity',
+            'machine', 'out_of_scope', 'technology',
+        ],
+        dataAssetFields: ['availability', 'confidentiality', 'integrity'],
+    };
+}
 
 export const Rule: CustomRiskRule = {
     category: Category,         // Assumes Category function exists in the file
     supportedTags: SupportedTags, // Assumes SupportedTags function exists in the file
     generateRisks: GenerateRisks, // Assumes GenerateRisks function exists in the file
+    dependencies: Dependencies,
 };
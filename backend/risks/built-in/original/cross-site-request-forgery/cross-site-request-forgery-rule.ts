@@ -16,7 +16,7 @@ import {
     modelState, // Access the global model state
     isTechnologyWebApplication, // Helper for technology check
     isPotentialWebAccessProtocol // Helper for protocol check
-} from '../../../model/types.ts'; // Adjust the path back to model.ts as needed
+} from '../../../../model/types.ts'; // Adjust the path back to model.ts as needed
 
 // Define the Category structure adhering to the RiskCategory interface
 export const CrossSiteRequestForgeryCategory: RiskCategory = {
@@ -132,10 +132,22 @@ function createRisk(technicalAsset: TechnicalAsset, incomingFlow: CommunicationL
 
 // !!! ADD THIS EXPORT BLOCK AT THE END !!!
 // Import the interface used in the export block
-import { CustomRiskRule } from '../../../model/types.ts'; // Adjust path if needed!
+import { CustomRiskRule, RiskRuleDependencies } from '../../../../model/types.ts'; // Adjust path if needed!
+
+export function Dependencies(): RiskRuleDependencies {
+    return {
+        technicalAssetFields: [
+            'communication_links', 'data_assets_processed', 'data_assets_stored', 'integrity',
+            'out_of_scope', 'technology', 'usage',
+        ],
+        communicationLinkFields: ['data_assets_received', 'data_assets_sent', 'protocol', 'target', 'usage'],
+        dataAssetFields: ['integrity', 'usage'],
+    };
+}
 
 export const Rule: CustomRiskRule = {
     category: Category,         // Assumes Category function exists in the file
     supportedTags: SupportedTags, // Assumes SupportedTags function exists in the file
     generateRisks: GenerateRisks, // Assumes GenerateRisks function exists in the file
+    dependencies: Dependencies,
 };
@@ -14,7 +14,7 @@ import {
     Criticality,
     modelState, // Access the global model state
     isTechnologyWebApplication // Helper for technology check
-} from '../../../model/types.ts'; // Adjust the path back to model.ts as needed
+} from '../../../../model/types.ts'; // Adjust the path back to model.ts as needed
 
 // Define the Category structure adhering to the RiskCategory interface
 export const CrossSiteScriptingCategory: RiskCategory = {
@@ -111,10 +111,21 @@ function createRisk(technicalAsset: TechnicalAsset): Risk {
 
 // !!! ADD THIS EXPORT BLOCK AT THE END !!!
 // Import the interface used in the export block
-import { CustomRiskRule } from '../../../model/types.ts'; // Adjust path if needed!
+import { CustomRiskRule, RiskRuleDependencies } from '../../../../model/types.ts'; // Adjust path if needed!
+
+export function Dependencies(): RiskRuleDependencies {
+    return {
+        technicalAssetFields: [
+            'confidentiality', 'data_assets_processed', 'data_assets_stored', 'integrity', 'out_of_scope',
+            'technology',
+        ],
+        dataAssetFields: ['confidentiality', 'integrity'],
+    };
+}
 
 export const Rule: CustomRiskRule = {
     category: Category,         // Assumes Category function exists in the file
     supportedTags: SupportedTags, // Assumes SupportedTags function exists in the file
     generateRisks: GenerateRisks, // Assumes GenerateRisks function exists in the file
+    dependencies: Dependencies,
 };
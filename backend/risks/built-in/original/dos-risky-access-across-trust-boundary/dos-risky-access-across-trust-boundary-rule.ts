@@ -17,7 +17,7 @@ import {
     RiskSeverity, // Used in description text
     isProtocolProcessLocal, // Helper function
     modelState // Access the global model state
-} from '../../../model/types.ts'; // Adjust the path back to model.ts as needed
+} from '../../../../model/types.ts'; // Adjust the path back to model.ts as needed
 
 // Define the Category structure adhering to the RiskCategory interface
 export const DoSRiskyAccessAcrossTrustBoundaryCategory: RiskCategory = {
@@ -175,10 +175,21 @@ function createRisk(
 
 // !!! ADD THIS EXPORT BLOCK AT THE END !!!
 // Import the interface used in the export block
-import { CustomRiskRule } from '../../../model/types.ts'; // Adjust path if needed!
+import { CustomRiskRule, RiskRuleDependencies } from '../../../../model/types.ts'; // Adjust path if needed!
+
+export function Dependencies(): RiskRuleDependencies {
+    return {
+        technicalAssetFields: [
+            'availability', 'communication_links', 'out_of_scope', 'redundant', 'technology', 'usage',
+        ],
+        communicationLinkFields: ['ip_filtered', 'protocol', 'target', 'usage', 'vpn'],
+        trustBoundaries: true,
+    };
+}
 
 export const Rule: CustomRiskRule = {
     category: Category,         // Assumes Category function exists in the file
     supportedTags: SupportedTags, // Assumes SupportedTags function exists in the file
     generateRisks: GenerateRisks, // Assumes GenerateRisks function exists in the file
+    dependencies: Dependencies,
 };
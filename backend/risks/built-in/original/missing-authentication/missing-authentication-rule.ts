@@ -20,7 +20,7 @@ import {
     isProtocolProcessLocal, // Helper
     isTechnologyUnprotectedCommsTolerated, // Helper
     modelState // Access the global model state
-} from '../../../model/types.ts'; // Adjust the path back to model.ts as needed
+} from '../../../../model/types.ts'; // Adjust the path back to model.ts as needed
 
 // Define the Category structure adhering to the RiskCategory interface
 export const MissingAuthenticationCategory: RiskCategory = {
@@ -176,10 +176,24 @@ export function CreateRisk(
 
 // !!! ADD THIS EXPORT BLOCK AT THE END !!!
 // Import the interface used in the export block
-import { CustomRiskRule } from '../../../model/types.ts'; // Adjust path if needed!
+import { CustomRiskRule, RiskRuleDependencies } from '../../../../model/types.ts'; // Adjust path if needed!
+
+export function Dependencies(): RiskRuleDependencies {
+    return {
+        technicalAssetFields: [
+            'availability', 'communication_links', 'confidentiality', 'data_assets_processed',
+            'data_assets_stored', 'integrity', 'multi_tenant', 'out_of_scope', 'technology', 'type',
+        ],
+        communicationLinkFields: [
+            'authentication', 'data_assets_received', 'data_assets_sent', 'protocol', 'target',
+        ],
+        dataAssetFields: ['availability', 'confidentiality', 'integrity'],
+    };
+}
 
 export const Rule: CustomRiskRule = {
     category: Category,         // Assumes Category function exists in the file
     supportedTags: SupportedTags, // Assumes SupportedTags function exists in the file
     generateRisks: GenerateRisks, // Assumes GenerateRisks function exists in the file
+    dependencies: Dependencies,
 };
@@ -21,7 +21,7 @@ import {
     getTechnicalAssetsTaggedWithAny,
     getTrustBoundariesTaggedWithAny,
     getSharedRuntimesTaggedWithAny,
-} from '../../../model/types.ts'; // Adjust the path back to model.ts as needed
+} from '../../../../model/types.ts'; // Adjust the path back to model.ts as needed
 
 // --- Category Definition ---
 export const MissingCloudHardeningCategory: RiskCategory = {
@@ -473,10 +473,23 @@ function createRiskForTechnicalAsset(technicalAsset: TechnicalAsset, prefix: str
 
 // !!! ADD THIS EXPORT BLOCK AT THE END !!!
 // Import the interface used in the export block
-import { CustomRiskRule } from '../../../model/types.ts'; // Adjust path if needed!
+import { CustomRiskRule, RiskRuleDependencies } from '../../../../model/types.ts'; // Adjust path if needed!
+
+export function Dependencies(): RiskRuleDependencies {
+    return {
+        technicalAssetFields: [
+            'availability', 'confidentiality', 'data_assets_processed', 'data_assets_stored', 'integrity',
+            'size', 'tags', 'type',
+        ],
+        dataAssetFields: ['availability', 'confidentiality', 'integrity', 'tags'],
+        trustBoundaries: true,
+        sharedRuntimes: true,
+    };
+}
 
 export const Rule: CustomRiskRule = {
     category: Category,         // Assumes Category function exists in the file
     supportedTags: SupportedTags, // Assumes SupportedTags function exists in the file
     generateRisks: GenerateRisks, // Assumes GenerateRisks function exists in the file
+    dependencies: Dependencies,
 };
@@ -15,7 +15,7 @@ import {
     TechnicalAssetType,
     TechnicalAssetTechnology,
     modelState // Access the global model state
-} from '../../../model/types.ts'; // Adjust the path back to model.ts as needed
+} from '../../../../model/types.ts'; // Adjust the path back to model.ts as needed
 
 // Define constants for RAA limits
 const RAA_LIMIT = 55;
@@ -135,10 +135,22 @@ function createRisk(technicalAsset: TechnicalAsset): Risk {
 
 // !!! ADD THIS EXPORT BLOCK AT THE END !!!
 // Import the interface used in the export block
-import { CustomRiskRule } from '../../../model/types.ts'; // Adjust path if needed!
+import { CustomRiskRule, RiskRuleDependencies } from '../../../../model/types.ts'; // Adjust path if needed!
+
+export function Dependencies(): RiskRuleDependencies {
+    return {
+        technicalAssetFields: [
+            'confidentiality', 'data_assets_processed', 'data_assets_stored', 'integrity', 'out_of_scope',
+            'technology', 'type',
+        ],
+        dataAssetFields: ['confidentiality', 'integrity'],
+        raa: true,
+    };
+}
 
 export const Rule: CustomRiskRule = {
     category: Category,         // Assumes Category function exists in the file
     supportedTags: SupportedTags, // Assumes SupportedTags function exists in the file
     generateRisks: GenerateRisks, // Assumes GenerateRisks function exists in the file
+    dependencies: Dependencies,
 };
@@ -21,7 +21,7 @@ import {
     isTechnologyUsuallyProcessingEnduserRequests, // Helper
     isTechnologyUsuallyAbleToPropagateIdentityToOutgoingTargets, // Helper
     modelState // Access the global model state
-} from '../../../model/types.ts'; // Adjust the path back to model.ts as needed
+} from '../../../../model/types.ts'; // Adjust the path back to model.ts as needed
 
 // Define the Category structure adhering to the RiskCategory interface
 export const MissingIdentityPropagationCategory: RiskCategory = {
@@ -163,10 +163,21 @@ function createRisk(technicalAsset: TechnicalAsset, incomingAccess: Communicatio
 
 // !!! ADD THIS EXPORT BLOCK AT THE END !!!
 // Import the interface used in the export block
-import { CustomRiskRule } from '../../../model/types.ts'; // Adjust path if needed!
+import { CustomRiskRule, RiskRuleDependencies } from '../../../../model/types.ts'; // Adjust path if needed!
+
+export function Dependencies(): RiskRuleDependencies {
+    return {
+        technicalAssetFields: [
+            'availability', 'communication_links', 'confidentiality', 'integrity', 'multi_tenant',
+            'out_of_scope', 'technology', 'type', 'usage',
+        ],
+        communicationLinkFields: ['authentication', 'authorization', 'target', 'usage'],
+    };
+}
 
 export const Rule: CustomRiskRule = {
     category: Category,         // Assumes Category function exists in the file
     supportedTags: SupportedTags, // Assumes SupportedTags function exists in the file
     generateRisks: GenerateRisks, // Assumes GenerateRisks function exists in the file
+    dependencies: Dependencies,
 };
@@ -18,7 +18,7 @@ import {
     isTechnologyIdentityRelated, // Helper
     isTechnologyCloseToHighValueTargetsTolerated, // Helper
     modelState // Access the global model state
-} from '../../../model/types.ts'; // Adjust the path back to model.ts as needed
+} from '../../../../model/types.ts'; // Adjust the path back to model.ts as needed
 
 // Define the Category structure adhering to the RiskCategory interface
 export const MissingIdentityProviderIsolationCategory: RiskCategory = {
@@ -154,10 +154,18 @@ function createRisk(techAsset: TechnicalAsset, moreImpact: boolean, sameExecutio
 
 // !!! ADD THIS EXPORT BLOCK AT THE END !!!
 // Import the interface used in the export block
-import { CustomRiskRule } from '../../../model/types.ts'; // Adjust path if needed!
+import { CustomRiskRule, RiskRuleDependencies } from '../../../../model/types.ts'; // Adjust path if needed!
+
+export function Dependencies(): RiskRuleDependencies {
+    return {
+        technicalAssetFields: ['availability', 'confidentiality', 'integrity', 'out_of_scope', 'technology'],
+        trustBoundaries: true,
+    };
+}
 
 export const Rule: CustomRiskRule = {
     category: Category,         // Assumes Category function exists in the file
     supportedTags: SupportedTags, // Assumes SupportedTags function exists in the file
     generateRisks: GenerateRisks, // Assumes GenerateRisks function exists in the file
+    dependencies: Dependencies,
 };
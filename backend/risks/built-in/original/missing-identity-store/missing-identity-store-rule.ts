@@ -16,7 +16,7 @@ import {
     TechnicalAssetTechnology,
     Authorization, // Import Authorization enum
     modelState // Access the global model state
-} from '../../../model/types.ts'; // Adjust the path back to model.ts as needed
+} from '../../../../model/types.ts'; // Adjust the path back to model.ts as needed
 
 // Define the Category structure adhering to the RiskCategory interface
 export const MissingIdentityStoreCategory: RiskCategory = {
@@ -153,10 +153,22 @@ function createRisk(technicalAsset: TechnicalAsset, impact: RiskExploitationImpa
 
 // !!! ADD THIS EXPORT BLOCK AT THE END !!!
 // Import the interface used in the export block
-import { CustomRiskRule } from '../../../model/types.ts'; // Adjust path if needed!
+import { CustomRiskRule, RiskRuleDependencies } from '../../../../model/types.ts'; // Adjust path if needed!
+
+export function Dependencies(): RiskRuleDependencies {
+    return {
+        technicalAssetFields: [
+            'availability', 'communication_links', 'confidentiality', 'data_assets_processed',
+            'data_assets_stored', 'integrity', 'out_of_scope', 'technology',
+        ],
+        communicationLinkFields: ['authorization', 'data_assets_received', 'data_assets_sent', 'target'],
+        dataAssetFields: ['availability', 'confidentiality', 'integrity'],
+    };
+}
 
 export const Rule: CustomRiskRule = {
     category: Category,         // Assumes Category function exists in the file
     supportedTags: SupportedTags, // Assumes SupportedTags function exists in the file
     generateRisks: GenerateRisks, // Assumes GenerateRisks function exists in the file
+    dependencies: Dependencies,
 };
@@ -19,7 +19,7 @@ import {
     isTechnologyLessProtectedType, // Helper
     isTechnologyCloseToHighValueTargetsTolerated, // Helper
     modelState // Access the global model state
-} from '../../../model/types.ts'; // Adjust the path back to model.ts as needed
+} from '../../../../model/types.ts'; // Adjust the path back to model.ts as needed
 
 // Define constant for RAA limit
 const RAA_LIMIT = 50;
@@ -166,10 +166,21 @@ function createRisk(techAsset: TechnicalAsset, moreRisky: boolean): Risk {
 
 // !!! ADD THIS EXPORT BLOCK AT THE END !!!
 // Import the interface used in the export block
-import { CustomRiskRule } from '../../../model/types.ts'; // Adjust path if needed!
+import { CustomRiskRule, RiskRuleDependencies } from '../../../../model/types.ts'; // Adjust path if needed!
+
+export function Dependencies(): RiskRuleDependencies {
+    return {
+        technicalAssetFields: [
+            'availability', 'confidentiality', 'integrity', 'out_of_scope', 'technology', 'type',
+        ],
+        trustBoundaries: true,
+        raa: true,
+    };
+}
 
 export const Rule: CustomRiskRule = {
     category: Category,         // Assumes Category function exists in the file
     supportedTags: SupportedTags, // Assumes SupportedTags function exists in the file
     generateRisks: GenerateRisks, // Assumes GenerateRisks function exists in the file
+    dependencies: Dependencies,
 };
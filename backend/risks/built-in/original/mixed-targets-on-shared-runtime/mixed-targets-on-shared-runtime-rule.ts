@@ -17,7 +17,7 @@ import {
     isTechnologyExclusivelyFrontendRelated, // Helper
     isTechnologyExclusivelyBackendRelated,  // Helper
     modelState // Access the global model state
-} from '../../../model/types.ts'; // Adjust the path back to model.ts as needed
+} from '../../../../model/types.ts'; // Adjust the path back to model.ts as needed
 
 // Define the Category structure adhering to the RiskCategory interface
 export const MixedTargetsOnSharedRuntimeCategory: RiskCategory = {
@@ -166,10 +166,19 @@ function createRisk(sharedRuntime: SharedRuntime): Risk {
 
 // !!! ADD THIS EXPORT BLOCK AT THE END !!!
 // Import the interface used in the export block
-import { CustomRiskRule } from '../../../model/types.ts'; // Adjust path if needed!
+import { CustomRiskRule, RiskRuleDependencies } from '../../../../model/types.ts'; // Adjust path if needed!
+
+export function Dependencies(): RiskRuleDependencies {
+    return {
+        technicalAssetFields: ['availability', 'confidentiality', 'integrity', 'technology'],
+        trustBoundaries: true,
+        sharedRuntimes: true,
+    };
+}
 
 export const Rule: CustomRiskRule = {
     category: Category,         // Assumes Category function exists in the file
     supportedTags: SupportedTags, // Assumes SupportedTags function exists in the file
     generateRisks: GenerateRisks, // Assumes GenerateRisks function exists in the file
+    dependencies: Dependencies,
 };
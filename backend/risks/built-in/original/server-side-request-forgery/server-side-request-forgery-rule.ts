@@ -17,7 +17,7 @@ import {
     isTechnologyClient, // Helper
     isPotentialWebAccessProtocol, // Helper
     modelState // Access the global model state
-} from '../../../model/types.ts'; // Adjust the path back to model.ts as needed
+} from '../../../../model/types.ts'; // Adjust the path back to model.ts as needed
 
 // Define the Category structure adhering to the RiskCategory interface
 export const ServerSideRequestForgeryCategory: RiskCategory = {
@@ -165,10 +165,23 @@ function createRisk(technicalAsset: TechnicalAsset, outgoingFlow: CommunicationL
 
 // !!! ADD THIS EXPORT BLOCK AT THE END !!!
 // Import the interface used in the export block
-import { CustomRiskRule } from '../../../model/types.ts'; // Adjust path if needed!
+import { CustomRiskRule, RiskRuleDependencies } from '../../../../model/types.ts'; // Adjust path if needed!
+
+export function Dependencies(): RiskRuleDependencies {
+    return {
+        technicalAssetFields: [
+            'communication_links', 'confidentiality', 'data_assets_processed', 'data_assets_stored',
+            'out_of_scope', 'technology', 'type', 'usage',
+        ],
+        communicationLinkFields: ['data_assets_received', 'data_assets_sent', 'protocol', 'target', 'usage'],
+        dataAssetFields: ['confidentiality', 'usage'],
+        trustBoundaries: true,
+    };
+}
 
 export const Rule: CustomRiskRule = {
     category: Category,         // Assumes Category function exists in the file
     supportedTags: SupportedTags, // Assumes SupportedTags function exists in the file
     generateRisks: GenerateRisks, // Assumes GenerateRisks function exists in the file
+    dependencies: Dependencies,
 };
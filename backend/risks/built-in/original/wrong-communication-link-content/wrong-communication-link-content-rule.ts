@@ -16,7 +16,7 @@ import {
     Protocol,
     RiskSeverity, // Used in description
     modelState // Access the global model state
-} from '../../../model/types.ts'; // Adjust the path back to model.ts as needed
+} from '../../../../model/types.ts'; // Adjust the path back to model.ts as needed
 
 // Define the Category structure adhering to the RiskCategory interface
 export const WrongCommunicationLinkContentCategory: RiskCategory = {
@@ -145,10 +145,20 @@ function createRisk(technicalAsset: TechnicalAsset, commLink: CommunicationLink,
 
 // !!! ADD THIS EXPORT BLOCK AT THE END !!!
 // Import the interface used in the export block
-import { CustomRiskRule } from '../../../model/types.ts'; // Adjust path if needed!
+import { CustomRiskRule, RiskRuleDependencies } from '../../../../model/types.ts'; // Adjust path if needed!
+
+export function Dependencies(): RiskRuleDependencies {
+    return {
+        technicalAssetFields: ['communication_links', 'machine', 'technology'],
+        communicationLinkFields: [
+            'data_assets_received', 'data_assets_sent', 'protocol', 'readonly', 'target',
+        ],
+    };
+}
 
 export const Rule: CustomRiskRule = {
     category: Category,         // Assumes Category function exists in the file
     supportedTags: SupportedTags, // Assumes SupportedTags function exists in the file
     generateRisks: GenerateRisks, // Assumes GenerateRisks function exists in the file
+    dependencies: Dependencies,
 };
@@ -15,7 +15,7 @@ import {
     TechnicalAssetMachine, // Import TechnicalAssetMachine enum
     RiskSeverity, // Used in description
     modelState // Access the global model state
-} from '../../../model/types.ts';
+} from '../../../../model/types.ts';
 
 // Define the Category structure adhering to the RiskCategory interface
 export const WrongTrustBoundaryContentCategory: RiskCategory = {
@@ -110,10 +110,18 @@ function createRisk(technicalAsset: TechnicalAsset): Risk {
 
 // !!! ADD THIS EXPORT BLOCK AT THE END !!!
 // Import the interface used in the export block
-import { CustomRiskRule } from '../../../model/types.ts'; // Adjust path if needed!
+import { CustomRiskRule, RiskRuleDependencies } from '../../../../model/types.ts'; // Adjust path if needed!
+
+export function Dependencies(): RiskRuleDependencies {
+    return {
+        technicalAssetFields: ['machine', 'type'],
+        trustBoundaries: true,
+    };
+}
 
 export const Rule: CustomRiskRule = {
     category: Category,         // Assumes Category function exists in the file
     supportedTags: SupportedTags, // Assumes SupportedTags function exists in the file
     generateRisks: GenerateRisks, // Assumes GenerateRisks function exists in the file
+    dependencies: Dependencies,
 };
@@ -0,0 +1,182 @@
+// Main-thread side of the engine worker: wraps the message protocol in promises.
+
+import type { ModelEdit } from '../main.ts';
+import type { ModelInput } from '../model/types.ts';
+import type { ModelValidationError } from '../model/model-validation.ts';
+import type { DiagramLayout } from '../layout/graphviz-layout.ts';
+import { readModelSnapshot } from '../model/snapshot.ts';
+import { EngineRequest, EngineResponse, EngineResult, EngineResultMessage } from './protocol.ts';
+
+export class EngineCancelledError extends Error {
+    constructor(id: number) {
+        super(`Engine request ${id} was cancelled.`);
+        this.name = 'EngineCancelledError';
+    }
+}
+
+export class EngineRequestError extends Error {
+    needsFullParse: boolean;
+
+    constructor(message: string, needsFullParse: boolean) {
+        super(message);
+        this.name = 'EngineRequestError';
+        this.needsFullParse = needsFullParse;
+    }
+}
+
+function currentThreatStandard(): string {
+    return (globalThis as unknown as { currentSelectedThreatStandard?: string }).currentSelectedThreatStandard ?? '';
+}
+
+// Unpacks the model and risks the worker sent as a snapshot
+function engineResultOf(message: EngineResultMessage): EngineResult {
+    const { snapshot, ...result } = message;
+    return { ...result, ...readModelSnapshot(snapshot) };
+}
+
+interface PendingRequest {
+    resolve: (result: EngineResult) => void;
+    reject: (error: Error) => void;
+}
+
+interface PendingValidation {
+    resolve: (errors: ModelValidationError[]) => void;
+    reject: (error: Error) => void;
+}
+
+/**
+ * Every new parse/edits request supersedes the ones still in flight: their promises
+ * reject with EngineCancelledError, so callers only ever render the newest result.
+ */
+export class EngineClient {
+    private worker: Worker;
+    private nextId = 1;
+    private pending = new Map<number, PendingRequest>();
+    private pendingValidations = new Map<number, PendingValidation>(); // Independent of the parse/edits requests
+    private modelThreatStandard: string | null = null; // Standard the worker's current model was analyzed with
+
+    constructor(workerUrl: string | URL) {
+        this.worker = new Worker(workerUrl, { type: 'module' });
+        this.worker.onmessage = (event: MessageEvent<EngineResponse>) => this.handleResponse(event.data);
+        this.worker.onerror = (event: ErrorEvent) => {
+            console.error("Engine worker failed:", event.message);
+            this.rejectAll(new EngineRequestError(event.message, true));
+        };
+    }
+
+    // Full parse, RAA and risk generation of the given model YAML; with diagram set the
+    // result also carries the data flow diagram DOT. modelInput is the plain object of the YAML
+    // if the caller has parsed it already, the worker then skips its own parse.
+    analyzeYaml(yaml: string, diagram = false, modelInput?: ModelInput): Promise<EngineResult> {
+        const threatStandard = currentThreatStandard();
+        this.modelThreatStandard = threatStandard;
+        return this.send({ id: this.nextId++, type: 'parse', yaml, modelInput, threatStandard, diagram });
+    }
+
+    // Applies path edits to the model of the last successful analyzeYaml call
+    applyEdits(edits: ModelEdit[]): Promise<EngineResult> {
+        const threatStandard = currentThreatStandard();
+        if (threatStandard !== this.modelThreatStandard) {
+            // The set of active rules changed, only a full parse regenerates all of them
+            this.cancel();
+            return Promise.reject(new EngineRequestError("Threat standard changed since the last parse.", true));
+        }
+        return this.send({ id: this.nextId++, type: 'edits', edits, threatStandard });
+    }
+
+    // Checks a model (YAML text or its parsed plain JS) against schema.json and its ID references
+    // without parsing it into the engine; cheap enough to run on every edit. Resolves with all
+    // errors, empty if there are none. A newer validation supersedes the one still in flight.
+    validate(model: string | ModelInput): Promise<ModelValidationError[]> {
+        for (const [id, validation] of this.pendingValidations) {
+            validation.reject(new EngineCancelledError(id));
+        }
+        this.pendingValidations.clear();
+        const id = this.nextId++;
+        const request: EngineRequest = typeof model === 'string'
+            ? { id, type: 'validate', yaml: model }
+            : { id, type: 'validate', modelInput: model };
+        return new Promise<ModelValidationError[]>((resolve, reject) => {
+            this.pendingValidations.set(id, { resolve, reject });
+            this.worker.postMessage(request);
+        });
+    }
+
+    // Stores the data flow diagram layout with the cached result of analyzeYaml, so the
+    // next load of the same model can skip the Graphviz layout as well
+    cacheLayout(cacheKey: string, dataFlowDiagramLayout: DiagramLayout): void {
+        this.worker.postMessage({ id: this.nextId++, type: 'cache-layout', cacheKey, dataFlowDiagramLayout } as EngineRequest);
+    }
+
+    // Cancels all requests that are still in flight
+    cancel(): void {
+        for (const id of [...this.pending.keys()]) {
+            this.worker.postMessage({ id: this.nextId++, type: 'cancel', targetId: id } as EngineRequest);
+            this.settle(id)?.reject(new EngineCancelledError(id));
+        }
+    }
+
+    // Makes the worker forget its model, the next applyEdits then asks for a full parse
+    reset(): void {
+        this.modelThreatStandard = null;
+        this.worker.postMessage({ id: this.nextId++, type: 'reset' } as EngineRequest);
+    }
+
+    private send(request: EngineRequest): Promise<EngineResult> {
+        this.cancel();
+        return new Promise<EngineResult>((resolve, reject) => {
+            this.pending.set(request.id, { resolve, reject });
+            this.worker.postMessage(request);
+        });
+    }
+
+    private handleResponse(response: EngineResponse): void {
+        const validation = this.pendingValidations.get(response.id);
+        if (validation) {
+            this.pendingValidations.delete(response.id);
+            if (response.type === 'validation') {
+                validation.resolve(response.errors);
+            } else {
+                validation.reject(new EngineRequestError(response.type === 'error' ? response.message : "Validation failed.", false));
+            }
+            return;
+        }
+        const request = this.settle(response.id);
+        if (!request) {
+            return; // Already cancelled on this side
+        }
+        switch (response.type) {
+            case 'result':
+                try {
+                    request.resolve(engineResultOf(response.result));
+                } catch (e) {
+                    request.reject(new EngineRequestError(e instanceof Error ? e.message : String(e), true));
+                }
+                break;
+            case 'cancelled':
+                request.reject(new EngineCancelledError(response.id));
+                break;
+            case 'error':
+                request.reject(new EngineRequestError(response.message, response.needsFullParse));
+                break;
+            case 'validation':
+                break; // Only sent for validate requests
+        }
+    }
+
+    private settle(id: number): PendingRequest | undefined {
+        const request = this.pending.get(id);
+        this.pending.delete(id);
+        return request;
+    }
+
+    private rejectAll(error: Error): void {
+        for (const id of [...this.pending.keys()]) {
+            this.settle(id)?.reject(error);
+        }
+        for (const validation of this.pendingValidations.values()) {
+            validation.reject(error);
+        }
+        this.pendingValidations.clear();
+    }
+}
@@ -0,0 +1,219 @@
+/// <reference lib="webworker" />
+// Hosts the risk engine off the UI thread. Built to dist/engine.worker.js (see build.ts).
+
+import {
+    parseModel,
+    applyRAAMethod,
+    generateRisks,
+    applyModelEdits,
+    hasIncrementalModel,
+    getGeneratedRisks,
+    initModelState,
+    printDataFlowDiagramGraphvizDOT,
+    getDataFlowDiagramClusterHashes,
+    getDataFlowDiagramEntities,
+    getRuleSetVersion,
+    ModelSource,
+} from '../main.ts';
+import * as YAML from 'npm:yaml';
+import { getOverallRiskStatistics, getRisksByTechnicalAssetId, ParsedModel } from '../model/types.ts';
+import { ModelValidationError, validateModelInput } from '../model/model-validation.ts';
+import { SNAPSHOT_VERSION, writeModelSnapshot } from '../model/snapshot.ts';
+import { ModelCache, modelCacheKey } from '../cache/model-cache.ts';
+import { IndexedDbCacheStore } from '../cache/indexeddb-store.ts';
+import { EngineRequest, EngineResponse, EngineResultMessage } from './protocol.ts';
+
+type WorkRequest = Extract<EngineRequest, { type: 'parse' | 'edits' }>;
+type ParseRequest = Extract<EngineRequest, { type: 'parse' }>;
+type ValidateRequest = Extract<EngineRequest, { type: 'validate' }>;
+
+// The rules read window.currentSelectedThreatStandard, which doesn't exist in a worker scope
+const workerGlobal = self as unknown as { window: unknown; currentSelectedThreatStandard?: string };
+workerGlobal.window = self;
+
+const queue: WorkRequest[] = [];
+const cancelledIds = new Set<number>();
+let drainScheduled = false;
+
+// Results of full parses keyed by YAML content, rule set and threat standard, see backend/cache
+const modelCache = typeof indexedDB !== 'undefined'
+    ? new ModelCache<EngineResultMessage>(new IndexedDbCacheStore<EngineResultMessage>('perimeta-model-cache'))
+    : null;
+// Model of the last parse answered from the cache; the engine model is only built once edits need it
+let deferredModel: ModelSource | null = null;
+
+function respond(response: EngineResponse, transfer: Transferable[] = []): void {
+    self.postMessage(response, transfer);
+}
+
+self.onmessage = (event: MessageEvent<EngineRequest>) => {
+    const request = event.data;
+    switch (request.type) {
+        case 'cancel':
+            cancelledIds.add(request.targetId);
+            return;
+        case 'reset':
+            initModelState();
+            deferredModel = null;
+            return;
+        case 'validate':
+            // Answered right away, it doesn't touch the engine model and must not wait for a queued parse
+            try {
+                respond({ id: request.id, type: 'validation', errors: validate(request) });
+            } catch (e) {
+                respond({ id: request.id, type: 'error', message: e instanceof Error ? e.message : String(e), needsFullParse: false });
+            }
+            return;
+        case 'cache-layout':
+            modelCache?.update(request.cacheKey, result => ({ ...result, dataFlowDiagramLayout: request.dataFlowDiagramLayout }));
+            return;
+        default:
+            queue.push(request);
+            scheduleDrain();
+    }
+};
+
+// Requests are handled one per task, so cancel messages that arrived during a
+// long computation are seen before the next request starts. A drain stays scheduled
+// while it waits for the model cache.
+function scheduleDrain(): void {
+    if (!drainScheduled && queue.length > 0) {
+        drainScheduled = true;
+        setTimeout(drainQueue, 0);
+    }
+}
+
+async function drainQueue(): Promise<void> {
+    // A full parse makes everything queued before it obsolete
+    const lastParse = queue.map(request => request.type).lastIndexOf('parse');
+    if (lastParse > 0) {
+        queue.splice(0, lastParse).forEach(request => finishCancelled(request.id));
+    }
+
+    const request = queue.shift()!;
+    let respondingId = request.id;
+    workerGlobal.currentSelectedThreatStandard = request.threatStandard;
+    try {
+        if (request.type === 'parse') {
+            if (cancelledIds.has(request.id)) {
+                // Later edits must not be applied to whatever model was loaded before
+                initModelState();
+                deferredModel = null;
+                finishCancelled(request.id);
+            } else {
+                await analyze(request);
+            }
+        } else {
+            // Edits are deltas and have to be applied even when their result is no
+            // longer wanted; consecutive batches are merged into one engine call.
+            const batch = [request];
+            while (queue.length > 0 && queue[0].type === 'edits') {
+                batch.push(queue.shift() as typeof request);
+            }
+            const last = batch.pop()!;
+            respondingId = last.id;
+            batch.forEach(superseded => finishCancelled(superseded.id));
+            if (!hasIncrementalModel() && deferredModel !== null) {
+                buildModel(deferredModel);
+            }
+            deferredModel = null;
+            if (!hasIncrementalModel()) {
+                respond({ id: last.id, type: 'error', message: "Model not parsed. Send a full parse first.", needsFullParse: true });
+            } else {
+                const parsedModel = applyModelEdits([...batch, last].flatMap(edits => edits.edits));
+                finish(last.id, parsedModel);
+            }
+            cancelledIds.delete(last.id);
+        }
+    } catch (e) {
+        console.error("Engine request failed:", e);
+        respond({ id: respondingId, type: 'error', message: e instanceof Error ? e.message : String(e), needsFullParse: !hasIncrementalModel() });
+        cancelledIds.delete(respondingId);
+    }
+    drainScheduled = false;
+    scheduleDrain();
+}
+
+async function analyze(request: ParseRequest): Promise<void> {
+    deferredModel = null;
+    const cacheKey = modelCache
+        ? await modelCacheKey(request.yaml, `${request.threatStandard}:${getRuleSetVersion()}:snapshot-${SNAPSHOT_VERSION}`)
+        : undefined;
+    const cached = cacheKey ? await modelCache!.get(cacheKey) : undefined;
+    if (cached && (!request.diagram || cached.dataFlowDiagramDot !== undefined)) {
+        console.log(`Model cache hit ${cacheKey}, skipping parse and risk generation.`);
+        // The engine model no longer matches the editor, later edits rebuild it from the YAML
+        initModelState();
+        deferredModel = request.modelInput ?? request.yaml;
+        finishResult(request.id, { ...cached, fromCache: true });
+        return;
+    }
+
+    const parsedModel = buildModel(request.modelInput ?? request.yaml);
+    const result = engineResult(parsedModel, request.diagram ? printDataFlowDiagramGraphvizDOT() : undefined);
+    result.cacheKey = cacheKey;
+    // The response transfers the snapshot, the cache keeps a copy
+    const cacheEntry = cacheKey ? { ...result, snapshot: result.snapshot.slice(0) } : undefined;
+    finishResult(request.id, result);
+    if (cacheEntry) {
+        await modelCache!.put(cacheKey!, cacheEntry);
+    }
+}
+
+function validate(request: ValidateRequest): ModelValidationError[] {
+    if (request.modelInput !== undefined) {
+        return validateModelInput(request.modelInput);
+    }
+    const doc = YAML.parseDocument(request.yaml ?? '');
+    if (doc.errors.length > 0) {
+        return doc.errors.map(error => ({ path: '', message: error.message }));
+    }
+    return validateModelInput(doc.toJS());
+}
+
+function buildModel(modelSource: ModelSource): ParsedModel {
+    const parsedModel = parseModel(modelSource);
+    applyRAAMethod();
+    generateRisks();
+    return parsedModel;
+}
+
+function finish(id: number, parsedModel: ParsedModel): void {
+    if (cancelledIds.has(id)) {
+        finishCancelled(id);
+        return;
+    }
+    finishResult(id, engineResult(parsedModel));
+}
+
+function finishResult(id: number, result: EngineResultMessage): void {
+    if (cancelledIds.delete(id)) {
+        respond({ id, type: 'cancelled' });
+        return;
+    }
+    respond({ id, type: 'result', result }, [result.snapshot]);
+}
+
+function engineResult(parsedModel: ParsedModel, dataFlowDiagramDot?: string): EngineResultMessage {
+    const raa: Record<string, number> = {};
+    for (const techAsset of Object.values(parsedModel.technicalAssets)) {
+        raa[techAsset.id] = techAsset.raa;
+    }
+    return {
+        snapshot: writeModelSnapshot({
+            parsedModel,
+            risksByCategory: getGeneratedRisks(),
+            risksByTechnicalAssetId: getRisksByTechnicalAssetId(),
+        }),
+        raa,
+        statistics: getOverallRiskStatistics(),
+        dataFlowDiagramDot,
+        dataFlowDiagramClusterHashes: dataFlowDiagramDot !== undefined ? getDataFlowDiagramClusterHashes() : undefined,
+        dataFlowDiagramEntities: dataFlowDiagramDot !== undefined ? getDataFlowDiagramEntities() : undefined,
+    };
+}
+
+function finishCancelled(id: number): void {
+    cancelledIds.delete(id);
+    respond({ id, type: 'cancelled' });
+}
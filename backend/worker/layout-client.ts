@@ -0,0 +1,67 @@
+// Main-thread side of the layout worker: wraps the message protocol in promises.
+
+import type { DiagramLayout } from '../layout/graphviz-layout.ts';
+import { EngineCancelledError } from './engine-client.ts';
+import { LayoutRequest, LayoutResponse } from './layout-protocol.ts';
+
+interface PendingLayout {
+    resolve: (layout: DiagramLayout) => void;
+    reject: (error: Error) => void;
+    onProgress?: (percent: number, message: string) => void;
+}
+
+/**
+ * A new layout supersedes the one still in flight: its promise rejects with
+ * EngineCancelledError, so only the newest import renders.
+ */
+export class LayoutClient {
+    private worker: Worker;
+    private nextId = 1;
+    private pending = new Map<number, PendingLayout>();
+
+    constructor(workerUrl: string | URL) {
+        this.worker = new Worker(workerUrl, { type: 'module' });
+        this.worker.onmessage = (event: MessageEvent<LayoutResponse>) => this.handleResponse(event.data);
+        this.worker.onerror = (event: ErrorEvent) => {
+            console.error("Layout worker failed:", event.message);
+            for (const id of [...this.pending.keys()]) {
+                this.settle(id)?.reject(new Error(event.message));
+            }
+        };
+    }
+
+    // Lays out the DOT with Graphviz' dot engine; onProgress receives 0-100 for this layout.
+    // Clusters whose hash in clusterHashes matches the previous layout keep their arrangement.
+    layout(dot: string, clusterHashes: Record<string, string> = {}, onProgress?: (percent: number, message: string) => void): Promise<DiagramLayout> {
+        for (const id of [...this.pending.keys()]) {
+            this.settle(id)?.reject(new EngineCancelledError(id));
+        }
+        const request: LayoutRequest = { id: this.nextId++, type: 'layout', dot, clusterHashes };
+        return new Promise<DiagramLayout>((resolve, reject) => {
+            this.pending.set(request.id, { resolve, reject, onProgress });
+            this.worker.postMessage(request);
+        });
+    }
+
+    private handleResponse(response: LayoutResponse): void {
+        if (response.type === 'progress') {
+            this.pending.get(response.id)?.onProgress?.(response.percent, response.message);
+            return;
+        }
+        const request = this.settle(response.id);
+        if (!request) {
+            return; // Superseded
+        }
+        if (response.type === 'result') {
+            request.resolve(JSON.parse(new TextDecoder().decode(response.layout)) as DiagramLayout);
+        } else {
+            request.reject(new Error(response.message));
+        }
+    }
+
+    private settle(id: number): PendingLayout | undefined {
+        const request = this.pending.get(id);
+        this.pending.delete(id);
+        return request;
+    }
+}
@@ -0,0 +1,9 @@
+// Message types exchanged between the editor and the layout worker
+
+// clusterHashes: content hash by DOT subgraph ID, see getDataFlowDiagramClusterHashes
+export type LayoutRequest = { id: number; type: 'layout'; dot: string; clusterHashes: Record<string, string> };
+
+export type LayoutResponse =
+    | { id: number; type: 'progress'; percent: number; message: string } // percent of the layout request, 0-100
+    | { id: number; type: 'result'; layout: ArrayBuffer } // UTF-8 JSON of a DiagramLayout, transferred
+    | { id: number; type: 'error'; message: string };
@@ -0,0 +1,56 @@
+/// <reference lib="webworker" />
+// Runs the Graphviz layout off the UI thread. Built to dist/layout.worker.js (see build.ts).
+
+import { instance, Viz } from '@viz-js/viz';
+import { DiagramLayout, readGraphvizJsonLayout, reuseUnchangedClusterLayouts } from '../layout/graphviz-layout.ts';
+import { LayoutRequest, LayoutResponse } from './layout-protocol.ts';
+
+// Compiling the Graphviz WASM module is the slow part of the first layout, it is kept for all later ones
+let viz: Promise<Viz> | null = null;
+// The last layout, unchanged DOT reuses it whole and unchanged clusters keep their arrangement
+let previous: { dot: string; layout: DiagramLayout } | null = null;
+
+function respond(response: LayoutResponse, transfer: Transferable[] = []): void {
+    self.postMessage(response, { transfer });
+}
+
+function progress(id: number, percent: number, message: string): void {
+    respond({ id, type: 'progress', percent, message });
+}
+
+function sendLayout(id: number, layout: DiagramLayout): void {
+    // Encoded once here, the buffer is moved to the editor instead of structured-cloning the layout
+    const encoded = new TextEncoder().encode(JSON.stringify(layout));
+    respond({ id, type: 'result', layout: encoded.buffer }, [encoded.buffer]);
+}
+
+self.onmessage = async (event: MessageEvent<LayoutRequest>) => {
+    const request = event.data;
+    try {
+        if (previous?.dot === request.dot) {
+            console.log("Diagram unchanged, reusing the previous layout.");
+            sendLayout(request.id, previous.layout);
+            return;
+        }
+        if (!viz) {
+            progress(request.id, 0, 'Starting Graphviz...');
+            viz = instance();
+            viz.catch(() => { viz = null; }); // Retry on the next request
+        }
+        const renderer = await viz;
+
+        progress(request.id, 10, 'Laying out diagram...');
+        const json = renderer.renderJSON(request.dot, { engine: 'dot' });
+
+        progress(request.id, 80, 'Reading diagram geometry...');
+        const layout = readGraphvizJsonLayout(json, request.clusterHashes);
+        if (previous) {
+            console.log(`Kept the previous layout of ${reuseUnchangedClusterLayouts(previous.layout, layout)} unchanged cluster(s).`);
+        }
+        previous = { dot: request.dot, layout };
+        sendLayout(request.id, layout);
+    } catch (e) {
+        console.error("Diagram layout failed:", e);
+        respond({ id: request.id, type: 'error', message: e instanceof Error ? e.message : String(e) });
+    }
+};
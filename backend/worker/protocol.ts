@@ -0,0 +1,44 @@
+// Message types exchanged between the editor and the engine worker
+
+import type { ModelEdit } from '../main.ts';
+import type { ModelInput, ParsedModel, Risk, RiskCategory, RiskStatistics } from '../model/types.ts';
+import type { DiagramLayout } from '../layout/graphviz-layout.ts';
+import type { DiagramEntities } from '../layout/diagram-geometry.ts';
+import type { ModelValidationError } from '../model/model-validation.ts';
+
+// threatStandard mirrors window.currentSelectedThreatStandard, which the rules check to select themselves.
+// A parse request may carry the model input the editor already parsed from yaml (Document.toJS()),
+// then the worker doesn't parse it again and uses yaml only for the cache key.
+export type EngineRequest =
+    | { id: number; type: 'parse'; yaml: string; modelInput?: ModelInput; threatStandard: string; diagram?: boolean } // Full parse of a model
+    | { id: number; type: 'edits'; edits: ModelEdit[]; threatStandard: string } // Path edits against the last parsed model
+    | { id: number; type: 'validate'; yaml?: string; modelInput?: ModelInput } // Schema and reference check only, no parse
+    | { id: number; type: 'cancel'; targetId: number } // Drop the result of a queued/running request
+    | { id: number; type: 'cache-layout'; cacheKey: string; dataFlowDiagramLayout: DiagramLayout } // Add the diagram layout to a cached result
+    | { id: number; type: 'reset' };                 // Forget the current model (see restartWasm)
+
+export interface EngineResult {
+    parsedModel: ParsedModel;
+    risksByCategory: Map<RiskCategory, Risk[]>;
+    risksByTechnicalAssetId: Record<string, Risk[]>; // Same Risk objects as in risksByCategory
+    raa: Record<string, number>; // Keyed by technical asset ID
+    statistics: RiskStatistics;
+    dataFlowDiagramDot?: string; // Only for parse requests with diagram set
+    dataFlowDiagramClusterHashes?: Record<string, string>; // With dataFlowDiagramDot, see getDataFlowDiagramClusterHashes
+    dataFlowDiagramEntities?: DiagramEntities; // With dataFlowDiagramDot, for diagrams opened from persisted geometry
+    dataFlowDiagramLayout?: DiagramLayout; // Only on cache hits it was stored for via 'cache-layout'
+    cacheKey?: string; // Model cache key of parse results
+    fromCache?: boolean;
+}
+
+// A result as it crosses the worker boundary and sits in the model cache: the model and its risks
+// travel as one transferable snapshot (see model/snapshot.ts) instead of a structured clone
+export type EngineResultMessage = Omit<EngineResult, 'parsedModel' | 'risksByCategory' | 'risksByTechnicalAssetId'> & {
+    snapshot: ArrayBuffer;
+};
+
+export type EngineResponse =
+    | { id: number; type: 'result'; result: EngineResultMessage }
+    | { id: number; type: 'validation'; errors: ModelValidationError[] } // Answer to 'validate', empty if the model is valid
+    | { id: number; type: 'cancelled' }
+    | { id: number; type: 'error'; message: string; needsFullParse: boolean };
@@ -16,8 +16,13 @@ try {
         // Use importMapURL to explicitly point to your import map file
         importMapURL: importMapURL.href,
     })],
-    entryPoints: ["./app.js"], // Your application entry point
-    outfile: "./dist/bundle.js", // Output bundle
+    // Application bundle plus the risk engine and layout workers (loaded via new Worker(), so they need their own files)
+    entryPoints: {
+        "bundle": "./app.js",
+        "engine.worker": "./backend/worker/engine-worker.ts",
+        "layout.worker": "./backend/worker/layout-worker.ts",
+    },
+    outdir: "./dist", // Output bundles: dist/bundle.js, dist/engine.worker.js, dist/layout.worker.js
     bundle: true,
     format: "esm", // Output format
     sourcemap: true, // Generate sourcemaps
@@ -0,0 +1,205 @@
+// generate_schema_validator.ts
+// Compiles schema.json into straight-line TypeScript checks, so models can be validated in one
+// pass without interpreting the schema at runtime. Run `deno task generate-validator` after
+// changing the schema.
+//
+// Supported keywords: type, enum, format (date), properties, required, additionalProperties,
+// items, minItems, maxItems, uniqueItems. Annotations (description, title, ...) are ignored.
+
+const SCHEMA_PATH = "./schema.json";
+const OUTPUT_PATH = "./backend/model/schema-validator.generated.ts";
+
+interface Schema {
+  type?: string | string[];
+  enum?: unknown[];
+  format?: string;
+  properties?: Record<string, Schema>;
+  required?: string[];
+  additionalProperties?: boolean | Schema;
+  items?: Schema;
+  minItems?: number;
+  maxItems?: number;
+  uniqueItems?: boolean;
+}
+
+const typeChecks: Record<string, string> = {
+  string: `typeof value === "string"`,
+  number: `typeof value === "number"`,
+  integer: `Number.isInteger(value)`,
+  boolean: `typeof value === "boolean"`,
+  null: `value === null`,
+  array: `Array.isArray(value)`,
+  object: `isObject(value)`,
+};
+
+const formatChecks: Record<string, string> = {
+  date: `/^\\d{4}-\\d{2}-\\d{2}$/.test(value)`,
+};
+
+const declarations: string[] = [];
+const declarationNames = new Map<string, string>(); // Identical sets are declared once
+const functions: string[] = [];
+
+function declareSet(prefix: string, type: string, values: unknown[]): string {
+  const initializer = `new Set<${type}>(${JSON.stringify(values)})`;
+  let name = declarationNames.get(initializer);
+  if (!name) {
+    name = `${prefix}${declarations.length}`;
+    declarations.push(`const ${name} = ${initializer};`);
+    declarationNames.set(initializer, name);
+  }
+  return name;
+}
+
+function compileSchema(schema: Schema): string {
+  const name = `validate${functions.length}`;
+  functions.push(""); // Reserve the slot, nested schemas are compiled in between
+  const index = functions.length - 1;
+  const lines: string[] = [];
+
+  const types = schema.type === undefined ? [] : Array.isArray(schema.type) ? schema.type : [schema.type];
+  for (const type of types) {
+    if (!(type in typeChecks)) throw new Error(`Unsupported type in schema: ${type}`);
+  }
+  if (types.length > 0) {
+    lines.push(`if (!(${types.map(type => typeChecks[type]).join(" || ")})) {`);
+    lines.push(`    errors.push({ path, message: ${JSON.stringify(`must be ${types.join(" or ")}`)} });`);
+    lines.push(`    return;`);
+    lines.push(`}`);
+  }
+
+  if (schema.enum) {
+    const values = declareSet("enum", "unknown", schema.enum);
+    lines.push(`if (!${values}.has(value)) {`);
+    lines.push(`    errors.push({ path, message: ${JSON.stringify(`must be one of ${schema.enum.map(value => JSON.stringify(value)).join(", ")}`)} });`);
+    lines.push(`}`);
+  }
+
+  if (schema.format) {
+    if (!(schema.format in formatChecks)) throw new Error(`Unsupported format in schema: ${schema.format}`);
+    lines.push(`if (typeof value === "string" && !(${formatChecks[schema.format]})) {`);
+    lines.push(`    errors.push({ path, message: ${JSON.stringify(`must be a ${schema.format}`)} });`);
+    lines.push(`}`);
+  }
+
+  // Keyword checks that only apply to one type; the guard is left out if the type check implies it
+  const forType = (type: string, check: string, body: string[]) => {
+    if (types.length === 1 && types[0] === type) {
+      lines.push(...body.map(line => line.slice(4)));
+    } else {
+      lines.push(`if (${check}) {`, ...body, `}`);
+    }
+  };
+
+  if (schema.properties || schema.required || schema.additionalProperties !== undefined) {
+    const lines: string[] = [];
+    for (const property of schema.required ?? []) {
+      lines.push(`    if (value[${JSON.stringify(property)}] === undefined) {`);
+      lines.push(`        errors.push({ path, message: ${JSON.stringify(`missing required property ${property}`)} });`);
+      lines.push(`    }`);
+    }
+    const properties = Object.entries(schema.properties ?? {});
+    for (const [property, propertySchema] of properties) {
+      const validate = compileSchema(propertySchema);
+      lines.push(`    if (value[${JSON.stringify(property)}] !== undefined) {`);
+      lines.push(`        ${validate}(value[${JSON.stringify(property)}], path + ${JSON.stringify("/" + pointerSegment(property))}, errors);`);
+      lines.push(`    }`);
+    }
+    const additional = schema.additionalProperties;
+    if (additional !== undefined && additional !== true) {
+      const validate = additional === false ? null : compileSchema(additional);
+      lines.push(`    for (const key in value) {`);
+      if (properties.length > 0) {
+        const known = declareSet("properties", "string", properties.map(([property]) => property));
+        lines.push(`        if (${known}.has(key)) continue;`);
+      }
+      lines.push(validate
+        ? `        ${validate}(value[key], childPath(path, key), errors);`
+        : `        errors.push({ path: childPath(path, key), message: "is not allowed here" });`);
+      lines.push(`    }`);
+    }
+    forType("object", "isObject(value)", lines);
+  }
+
+  if (schema.items || schema.minItems !== undefined || schema.maxItems !== undefined || schema.uniqueItems) {
+    const lines: string[] = [];
+    if (schema.minItems !== undefined) {
+      lines.push(`    if (value.length < ${schema.minItems}) errors.push({ path, message: "must have at least ${schema.minItems} items" });`);
+    }
+    if (schema.maxItems !== undefined) {
+      lines.push(`    if (value.length > ${schema.maxItems}) errors.push({ path, message: "must have at most ${schema.maxItems} items" });`);
+    }
+    if (schema.uniqueItems) {
+      lines.push(`    const seen = new Set<unknown>();`);
+    }
+    const validate = schema.items ? compileSchema(schema.items) : null;
+    if (validate || schema.uniqueItems) {
+      lines.push(`    for (let i = 0; i < value.length; i++) {`);
+      if (validate) {
+        lines.push(`        ${validate}(value[i], path + "/" + i, errors);`);
+      }
+      if (schema.uniqueItems) {
+        lines.push(`        const item = typeof value[i] === "object" ? JSON.stringify(value[i]) : value[i];`);
+        lines.push(`        if (seen.has(item)) errors.push({ path: path + "/" + i, message: "is a duplicate" });`);
+        lines.push(`        seen.add(item);`);
+      }
+      lines.push(`    }`);
+    }
+    forType("array", "Array.isArray(value)", lines);
+  }
+
+  functions[index] = [
+    `function ${name}(value: any, path: string, errors: SchemaError[]): void {`,
+    ...lines.map(line => `    ${line}`),
+    `}`,
+  ].join("\n");
+  return name;
+}
+
+// JSON Pointer escaping of a key (RFC 6901)
+function pointerSegment(key: string): string {
+  return key.replace(/~/g, "~0").replace(/\//g, "~1");
+}
+
+function generate(schema: Schema): string {
+  const root = compileSchema(schema);
+  return `// AUTO-GENERATED from schema.json by generate_schema_validator.ts, do not edit.
+// Run \`deno task generate-validator\` after changing the schema.
+// deno-lint-ignore-file no-explicit-any
+
+// path is a JSON Pointer into the model, e.g. /technical_assets/Web Server/type
+export interface SchemaError {
+    path: string;
+    message: string;
+}
+
+function isObject(value: unknown): value is Record<string, any> {
+    return typeof value === "object" && value !== null && !Array.isArray(value);
+}
+
+function childPath(path: string, key: string): string {
+    return key.includes("/") || key.includes("~") ? path + "/" + key.replace(/~/g, "~0").replace(/\\//g, "~1") : path + "/" + key;
+}
+
+${declarations.join("\n")}
+
+${functions.join("\n\n")}
+
+// Checks a parsed model against schema.json and returns every violation, in document order
+export function validateModelSchema(model: unknown): SchemaError[] {
+    const errors: SchemaError[] = [];
+    ${root}(model, "", errors);
+    return errors;
+}
+`;
+}
+
+async function main() {
+  console.log(`Reading schema from: ${SCHEMA_PATH}`);
+  const schema = JSON.parse(await Deno.readTextFile(SCHEMA_PATH));
+  const code = generate(schema);
+  await Deno.writeTextFile(OUTPUT_PATH, code);
+  console.log(`Wrote ${functions.length} validation functions to ${OUTPUT_PATH}`);
+}
+
+await main();
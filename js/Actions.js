@@ -23,6 +23,79 @@ function generateRandomId(prefix, totalLength) {
   }
   return prefix + randomPart.substring(0, totalLength - prefix.length);
 }
+/**
+ * Collects the geometry of the diagram cells for the perimeta_diagram section of the YAML export
+ * (see backend/layout/diagram-geometry.ts): technical asset and trust boundary boxes by key and
+ * communication link waypoints, in absolute coordinates.
+ *
+ * @param {mxGraph} graph The graph holding the diagram.
+ * @param {YAML.Document} doc The document the section is created for.
+ * @returns {YAML.YAMLMap} The section, with one flow-style line per box and per source asset's links.
+ */
+function collectDiagramGeometry(graph, doc) {
+  const model = graph.getModel();
+  const round = (n) => Math.round(n * 100) / 100;
+  // Cell geometries are relative to their parent
+  const originOf = (cell) => {
+    let x = 0, y = 0;
+    for (let parent = model.getParent(cell); parent; parent = model.getParent(parent)) {
+      const parentGeometry = model.getGeometry(parent);
+      if (parentGeometry && model.isVertex(parent)) {
+        x += parentGeometry.x;
+        y += parentGeometry.y;
+      }
+    }
+    return { x, y };
+  };
+  const geometry = { technical_assets: {}, trust_boundaries: {}, communication_links: {} };
+  for (const cell of Object.values(model.cells || {})) {
+    const cellGeometry = model.getGeometry(cell);
+    if (!cellGeometry) {
+      continue;
+    }
+    const origin = originOf(cell);
+    const box = [round(origin.x + cellGeometry.x), round(origin.y + cellGeometry.y), round(cellGeometry.width), round(cellGeometry.height)];
+    if (model.isVertex(cell) && cell.technicalAsset && cell.technicalAsset.key) {
+      geometry.technical_assets[cell.technicalAsset.key] = box;
+    } else if (model.isVertex(cell) && cell.trust_boundarieskey) {
+      geometry.trust_boundaries[cell.trust_boundarieskey] = box;
+    } else if (model.isEdge(cell) && cell.communicationAssetKey && cell.source && cell.source.technicalAsset && cell.source.technicalAsset.key) {
+      const links = (geometry.communication_links[cell.source.technicalAsset.key] ??= {});
+      links[cell.communicationAssetKey] = (cellGeometry.points || []).map(point => [round(origin.x + point.x), round(origin.y + point.y)]);
+    }
+  }
+
+  const section = doc.createNode(geometry);
+  for (const pair of section.items) {
+    for (const entity of pair.value.items) {
+      entity.value.flow = true;
+    }
+  }
+  return section;
+}
+/**
+ * Runs the schema and reference validation of the engine worker on the model (YAML text or
+ * its plain JS) and returns all errors as an HTML list for the error dialogs, or an empty
+ * string if there are none.
+ */
+async function describeModelValidationErrors(model) {
+  let errors;
+  try {
+    errors = await window.threagileEngine.validate(model);
+  } catch (error) {
+    return "";
+  }
+  if (errors.length === 0) {
+    return "";
+  }
+  const maxShown = 25;
+  const items = errors.slice(0, maxShown).map(error =>
+    `<li><code>${mxUtils.htmlEntities(error.path || "/")}</code> ${mxUtils.htmlEntities(error.message)}</li>`);
+  if (errors.length > maxShown) {
+    items.push(`<li>... and ${errors.length - maxShown} more</li>`);
+  }
+  return `<br/><strong>${errors.length} validation error(s):</strong><ul style="text-align: left; max-height: 200px; overflow: auto;">${items.join("")}</ul>`;
+}
 /**
  * Normalizes list-like properties within trust boundaries in a YAML Document object.
  * Specifically ensures 'technical_assets_inside' and 'trust_boundaries_nested'
@@ -104,40 +177,7 @@ function Actions(editorUi) {
   this.actions = new Object();
   this.init();
 }
-function camelToSnakeCase(str) {
-  return str
-    .replace(/[A-Z]/g, (letter) => `_${letter.toLowerCase()}`)
-    .replace(/^_/, "");
-}
-
 function handleImportAFile(xml, filename) {}
-function keysToSnakeCase(obj, depth = 0) {
-  if (typeof obj !== "object" || obj === null) return obj;
-
-  if (Array.isArray(obj)) {
-    return obj.map((item) => keysToSnakeCase(item, depth));
-  }
-
-  const recurseKeys = [
-    "DataAssets",
-    "TechnicalAssets",
-    "TrustBoundaries",
-    "SharedRuntime",
-    "RiskTracking",
-  ];
-  return Object.keys(obj).reduce((accum, key) => {
-    const newKey = camelToSnakeCase(key);
-    if (depth < 2 && typeof obj[key] === "object" && obj[key] !== null) {
-      accum[newKey] = keysToSnakeCase(
-        obj[key],
-        recurseKeys.includes(newKey) ? depth + 1 : depth
-      );
-    } else {
-      accum[newKey] = obj[key];
-    }
-    return accum;
-  }, {});
-}
 
 /**
  * Adds the default actions.
@@ -245,7 +285,7 @@ Actions.prototype.init = function () {
 
 
     window.openFile.setConsumer(
-      mxUtils.bind(this, function (xml, filename) {
+      mxUtils.bind(this, async function (xml, filename) {
 	let eventsEnabled = graph.isEventsEnabled();
         graph.setEventsEnabled(false);
 
@@ -258,20 +298,46 @@ Actions.prototype.init = function () {
          if (filename.endsWith(".yaml")) {
           const loadingBar = createLoadingBar();
        const startTime = performance.now();
+              let persistedGeometry = null;
+              let modelInput; // The parsed document as plain JS, so the engine worker doesn't parse the YAML again
+              let modelYaml = xml; // The YAML without the diagram geometry, moving a box must not change the cache key
                 try {
                 graph.model.threagile = normalizeTrustBoundaryListsOnDocument(YAML.parseDocument(xml));
+                // Saved diagram geometry is not part of the model, the export writes it again
+                let geometrySection = graph.model.threagile.get(window.diagramGeometrySection);
+                persistedGeometry = window.readDiagramGeometry(geometrySection && geometrySection.toJSON ? geometrySection.toJSON() : geometrySection);
+                graph.model.threagile.delete(window.diagramGeometrySection);
+                // From here on model edits are undoable along with the graph changes
+                editor.logThreagileEdits(graph.model.threagile);
+                if (graph.model.threagile.errors.length === 0) {
+                  modelInput = graph.model.threagile.toJS();
+                  modelYaml = graph.model.threagile.toString();
+                }
               } catch (error) {
                 setTimeout(loadingBar.hideLoadingBar, 500);
                 console.error("Can not parse: ", error);
               }
-              let jsonObj;
+              let cachedLayout, cacheKey; // Diagram layout of a cached result, key to store a fresh one under
+              let clusterHashes, diagramEntities;
               try {
-                let temp= window.parseModelViaString(xml);
-                if (temp && !temp.technicalAssets && temp.includes("$$__ERROR__$$")) {
-                  
-                  setTimeout(loadingBar.hideLoadingBar, 500);
+                // Parsing and risk generation run in the engine worker, the data flow
+                // diagram DOT comes back with the result
+                const result = await window.threagileEngine.analyzeYaml(modelYaml, true, modelInput);
+                dot = result.dataFlowDiagramDot;
+                clusterHashes = result.dataFlowDiagramClusterHashes;
+                diagramEntities = result.dataFlowDiagramEntities;
+                cachedLayout = result.dataFlowDiagramLayout;
+                cacheKey = result.cacheKey;
+              } catch (error) {
+                setTimeout(loadingBar.hideLoadingBar, 500);
+                if (error.name === 'EngineCancelledError') {
+                  return; // Superseded by a newer engine request
+                }
+                console.error("Couldn't parse JSON-Object: ", error);
 
-                  let errorMessage = temp.split("$$__ERROR__$$")[1];  // Extract the error message
+                  let errorMessage = error.message;
+                  // The parse stops at the first problem, the validator reports all of them
+                  errorMessage += await describeModelValidationErrors(modelInput ?? xml);
 
 Swal.fire({
     title: '<span style="color: #333; font-family: Arial, sans-serif;">Error Detected!</span>',
@@ -313,35 +379,8 @@ Swal.fire({
     }
 });
 
-                
-                
-                  return;
-              }
-                //jsonObj = JSON.parse(temp);
-                jsonObj = temp;
-
-
-
-
-
-
-
-
-
-
-
-
-              } catch (error) {
-                console.error("Couldn't parse JSON-Object: ", error);
-                setTimeout(loadingBar.hideLoadingBar, 500);
-
-                alert("Error while parsing JSON-Object: " + error);
-                
                 return;
               }
-              dot = window.printDataFlowDiagramGraphvizDOT();
-              let dotJson = window.DOTParser(dot);
-              jsonObj = keysToSnakeCase(jsonObj);
 
 
               let cnt = 0;
@@ -354,593 +393,186 @@ Swal.fire({
 
               let cells = [];
               let nodeIdMap = {};
-              var vizInstance = window.Viz();
-              function applyTransform(coord, scale, translate) {
-                return (coord * scale) + translate;
+              // Entities with saved geometry keep it; Graphviz is only needed for the others
+              let persisted = persistedGeometry && diagramEntities
+                ? window.layoutFromDiagramGeometry(diagramEntities, persistedGeometry)
+                : null;
+              let layoutPromise;
+              if (persisted && persisted.unplaced === 0) {
+                console.log("Every diagram entity has saved geometry, skipping the Graphviz layout.");
+                layoutPromise = Promise.resolve(persisted.layout);
+              } else {
+                // Graphviz runs in the layout worker, the loading bar keeps repainting meanwhile
+                layoutPromise = (cachedLayout
+                  ? Promise.resolve(cachedLayout)
+                  : window.graphvizLayout.layout(dot, clusterHashes, function (percent, message) {
+                      loadingBar.updateProgress(30 + percent * 0.3, message);
+                    })
+                ).then(function (layout) {
+                  if (!cachedLayout && cacheKey) {
+                    window.threagileEngine.cacheLayout(cacheKey, layout);
+                  }
+                  if (persisted) {
+                    console.log(`Laying out ${persisted.unplaced} diagram entities without saved geometry.`);
+                    return window.mergePersistedLayout(layout, persisted.layout);
+                  }
+                  return layout;
+                });
               }
-              vizInstance
-                .then(function (vizRendererObject) {
-
-                  const svg = vizRendererObject.renderString(dot, { 
-                        format: "svg",
-                        engine: "dot"
-                    });
-                  let parser = new DOMParser();
-                  let svgDoc = parser.parseFromString(svg, "image/svg+xml");
+              layoutPromise
+                .then(function (layout) {
+                  const defaultStrokeWidth = 2; // Default stroke width
+                  const strokeWidthOf = (box) =>
+                    box.strokeWidth === null ? defaultStrokeWidth : box.strokeWidth;
 
+                  let style = graph.getStylesheet().getDefaultEdgeStyle();
+                  style[mxConstants.STYLE_EDGE] = mxEdgeStyle.TopToBottom;
 
-
-                            
-                  //NEw
-
-                  let edgeSVGs = svgDoc.querySelectorAll(".edge");
-                  let nodes = svgDoc.querySelectorAll(".node");
-                  let coordinates = {};
-                  graph.getModel().clear();
-                  let clusters = svgDoc.querySelectorAll(".cluster");
-
-
-		              graph.getModel().beginUpdate();
-                  for (var i = 0; i < clusters.length; i++) {
-                    let cluster = clusters[i];
-                    let polygon = cluster.querySelector("polygon");
-                    let points = polygon.getAttribute("points");
-                    let title = cluster.querySelector("title").textContent;
-                    let titleCluster = cluster.querySelector(
-                      'text[font-weight="bold"]'
-                    );
-                    let fill = polygon.getAttribute("fill");
-                    let stroke = polygon.getAttribute("stroke");
-                    let strokeWidth = polygon.getAttribute("stroke-width");
-                    
-                    let coordinatesArray = points
-                      .split(" ")
-                      .map(function (point) {
-                        var coords = point.split(",");
-                        var x = parseFloat(coords[0]);
-                        var y = parseFloat(coords[1]);
-                        return { x: x, y: y };
-                      });
-                    
-                   /*
-                      let coordinatesArray = points.split(" ").map(point => {
-                        var coords = point.split(",");
-                        var x = applyTransform(parseFloat(coords[0]), scale, translateX);
-                        var y = applyTransform(parseFloat(coords[1]), scale, translateY);
-                        return { x, y };
-                      });
-                      */
-                    let minX = Math.min.apply(
-                      null,
-                      coordinatesArray.map((coord) => coord.x)
-                    );
-                    let maxX = Math.max.apply(
-                      null,
-                      coordinatesArray.map((coord) => coord.x)
-                    );
-                    let minY = Math.min.apply(
-                      null,
-                      coordinatesArray.map((coord) => coord.y)
-                    );
-                    let maxY = Math.max.apply(
-                      null,
-                      coordinatesArray.map((coord) => coord.y)
-                    );
-
-                 
-
-                    let width = maxX - minX;
-                    let height = maxY - minY;
-                    if (!title.includes("space_boundary")) {
-                      let textWithCoords = ` (x: ${minX}, y: ${minY}) width: ${width} height: ${height}`;
-                      let clusterStyle =
-                        mxConstants.STYLE_SHAPE +
-                        "=rectangle;dashed=1;verticalAlign=top;fontStyle=1;fontSize=18;fillColor=" +
-                        fill +
-                        ";strokeColor=" +
-                        stroke +
-                        ";strokeWidth=" +
-                        strokeWidth;
-                      let clusterVertex = graph.insertVertex(
-                        null,
-                        titleCluster.textContent,
-                        titleCluster.textContent,
-                        minX,
-                        minY,
-                        width,
-                        height,
-                        clusterStyle
-                      );
-                      clusterVertex.setConnectable(false);
-                    if (titleCluster.textContent) {
-                        clusterVertex.trust_boundarieskey = titleCluster.textContent;
-                    }	
-
+                  // The cells are built detached from the model and added in a single change
+                  // (see Graph.replaceCells), instead of one insertVertex/insertEdge each
+                  let cells = [];
+                  for (const cluster of layout.clusters) {
+                    if (cluster.name.includes("space_boundary")) {
+                      continue;
                     }
-                  }
-                  for (var i = 0; i < nodes.length; i++) {
-                    let node = nodes[i];
-                    let nodeId = node.getAttribute("id");
-                    let nodeTitle = node.querySelector("title").textContent;
-
-                    let paths = node.querySelectorAll("path");
-                    let is3DCylinder = paths.length === 2;
-                    if (node.querySelector("ellipse") != null) {
-                      let ellipse = node.querySelector("ellipse");
-                      let cx = parseFloat(ellipse.getAttribute("cx"));
-                      let cy = parseFloat(ellipse.getAttribute("cy"));
-                      let rx = parseFloat(ellipse.getAttribute("rx"));
-                      let ry = parseFloat(ellipse.getAttribute("ry"));
-                      let fill = ellipse.getAttribute("fill");
-                      let stroke = ellipse.getAttribute("stroke");
-                      let strokeWidth = ellipse.getAttribute("stroke-width");
-
-                      let x = cx - rx;
-                      let y = cy - ry;
-
-                      let width = 2 * rx;
-                      let height = 2 * ry;
-
-                      coordinates[nodeId] = {
-                        x: x,
-                        y: y,
-                        width: width,
-                        height: height,
-                        nodeTitle: nodeTitle,
-                        shape: "ellipse",
-                        fill: fill,
-                        stroke: stroke,
-                        strokeWidth: strokeWidth,
-                      };
-                    } else if (node.querySelector("polygon") != null) {
-                      let points = node
-                        .querySelector("polygon")
-                        .getAttribute("points");
-                      let polygon = node.querySelector("polygon");
-                      let coordinatesArray = points
-                        .split(" ")
-                        .map(function (point) {
-                          let coords = point.split(",");
-                          let x = parseFloat(coords[0]);
-                          let y = parseFloat(coords[1]);
-                          return { x: x, y: y };
-                        });
-                      let fill = polygon.getAttribute("fill");
-                      let stroke = polygon.getAttribute("stroke");
-                      let strokeWidth = polygon.getAttribute("stroke-width");
-                      let minX = Math.min.apply(
-                        null,
-                        coordinatesArray.map((coord) => coord.x)
-                      );
-                      let maxX = Math.max.apply(
-                        null,
-                        coordinatesArray.map((coord) => coord.x)
-                      );
-                      let minY = Math.min.apply(
-                        null,
-                        coordinatesArray.map((coord) => coord.y)
-                      );
-                      let maxY = Math.max.apply(
-                        null,
-                        coordinatesArray.map((coord) => coord.y)
-                      );
-
-                      let width = maxX - minX;
-                      let height = maxY - minY;
-                      console.log(maxY);
-                      coordinates[nodeId] = {
-                        x: minX,
-                        y: minY,
-                        width: width,
-                        height: height,
-                        nodeTitle: nodeTitle,
-                        shape: "hexagon",
-                        fill: fill,
-                        stroke: stroke,
-                        strokeWidth: strokeWidth,
-                      };
-                    } else if (is3DCylinder) {
-                      let firstPath = paths[0];
-                      let d = firstPath.getAttribute("d");
-                      // Updated regex to correctly handle negative values and decimal points
-                      let values = d.match(/-?[0-9]*\.?[0-9]+/g);
-                      let valuesFloat = values.map(parseFloat);
-                      
-                      // Initialize variables to find the bounds of the path
-                      let minX = Infinity, maxX = -Infinity, minY = Infinity, maxY = -Infinity;
-                      
-                      // Loop through all extracted values assuming pairs of x, y coordinates
-                      for (let i = 0; i < valuesFloat.length; i += 2) {
-                        let x = valuesFloat[i];
-                        let y = valuesFloat[i + 1];
-                        minX = Math.min(minX, x);
-                        maxX = Math.max(maxX, x);
-                        minY = Math.min(minY, y);
-                        maxY = Math.max(maxY, y);
-                      }
-                      
-                      // Calculate width and height based on min and max values
-                      let width = maxX - minX;
-                      let height = maxY - minY;
-                      
-                      // Extract other attributes
-                      let fill = firstPath.getAttribute("fill");
-                      let stroke = firstPath.getAttribute("stroke");
-                      let strokeWidth = firstPath.getAttribute("stroke-width");
-                      
-                      coordinates[nodeId] = {
-                        x: minX, // Changed to minX for correct positioning
-                        y: minY, // Changed to minY for correct positioning
-                        width: width,
-                        height: height,
-                        nodeTitle: nodeTitle,
-                        shape: "datastore",
-                        fill: fill,
-                        stroke: stroke,
-                        strokeWidth: strokeWidth,
-                      };
-                      
+                    let clusterStyle =
+                      mxConstants.STYLE_SHAPE +
+                      "=rectangle;dashed=1;verticalAlign=top;fontStyle=1;fontSize=18;fillColor=" +
+                      cluster.fill +
+                      ";strokeColor=" +
+                      cluster.stroke +
+                      ";strokeWidth=" +
+                      cluster.strokeWidth;
+                    let clusterVertex = new mxCell(
+                      cluster.label,
+                      new mxGeometry(cluster.x, cluster.y, cluster.width, cluster.height),
+                      clusterStyle
+                    );
+                    clusterVertex.setId(cluster.label);
+                    clusterVertex.setVertex(true);
+                    clusterVertex.setConnectable(false);
+                    if (cluster.label) {
+                      clusterVertex.trust_boundarieskey = cluster.label;
                     }
+                    cells.push(clusterVertex);
                   }
 
+                  loadingBar.updateProgress(60, 'Loading technical_assets...');
+                  // Titles are measured on one canvas, mxUtils.getSizeForString lays out a DOM node per call
+                  const measureContext = document.createElement("canvas").getContext("2d");
+                  measureContext.font = "12px " + mxConstants.DEFAULT_FONTFAMILY;
+                  const titleHeight = Math.round(12 * mxConstants.LINE_HEIGHT);
+                  const padding = 20;
+                  for (const node of layout.nodes) {
+                    let style =
+                      "shape=" +
+                      node.shape +
+                      ";fontStyle=1;fontSize=18;shadow=1;fillColor=" +
+                      node.fill +
+                      ";strokeColor=" +
+                      node.stroke +
+                      ";strokeWidth=" +
+                      strokeWidthOf(node);
+                    // Make room for the title
+                    let titleWidth = Math.ceil(measureContext.measureText(node.label).width);
+                    let vertex = new mxCell(
+                      node.label,
+                      new mxGeometry(
+                        node.x,
+                        node.y,
+                        Math.max(node.width, titleWidth + padding),
+                        Math.max(node.height, titleHeight + padding)
+                      ),
+                      style
+                    );
+                    vertex.setVertex(true);
+                    vertex.technicalAsset = {};
+                    vertex.technicalAsset["id"] = graph.model.threagile.getIn(["technical_assets", node.label, "id"]);
+                    vertex.technicalAsset["key"] = node.label;
+                    nodeIdMap[node.name] = vertex;
+                    cells.push(vertex);
+                  }
 
-                  let style = graph.getStylesheet().getDefaultEdgeStyle();
-                  style[mxConstants.STYLE_EDGE] = mxEdgeStyle.TopToBottom;
+                  // Plain JS communication links by source asset key, converted once per asset
+                  let linksDataBySource = new Map();
+                  for (const layoutEdge of layout.edges) {
+                    let sourceTitle = layoutEdge.tail;
+                    let targetTitle = layoutEdge.head;
+                    let dotEdgeProtocol = layoutEdge.label;
+                    if (!dotEdgeProtocol) {
+                      console.warn("DOT edge missing 'xlabel' (or 'label') for protocol, cannot reliably match to communication link. Skipping:", sourceTitle, "->", targetTitle);
+                      continue;
+                    }
 
-                  let parent = graph.getDefaultParent();
-
-                           const defaultStrokeWidth = 2; // Default stroke width
-
-                  for (let nodeId in coordinates) {
-                      let nodeCoords = coordinates[nodeId];
-
-                      let minX, minY, maxX, maxY;
-
-                      if (Array.isArray(nodeCoords)) {
-                        minX = Math.min.apply(
-                          null,
-                          nodeCoords.map((coord) => coord.x)
-                        );
-                        maxX = Math.max.apply(
-                          null,
-                          nodeCoords.map((coord) => coord.x)
-                        );
-                        minY = Math.min.apply(
-                          null,
-                          nodeCoords.map((coord) => coord.y)
-                        );
-                        maxY = Math.max.apply(
-                          null,
-                          nodeCoords.map((coord) => coord.y)
-                        );
-                      } else {
-                        minX = nodeCoords.x;
-                        minY = nodeCoords.y;
-                        maxX = nodeCoords.x + nodeCoords.width;
-                        maxY = nodeCoords.y + nodeCoords.height;
-                      }
-                      console.log(nodeCoords);
-//TODO: graph.getPageSize().height, we should focus on minY, i guess, the conversation does not work correctly
-                      let nodeElement = svgDoc.querySelector("#" + nodeId);
-                      let paths = nodeElement.querySelectorAll("path");
-                      let textElement = nodeElement.querySelector(
-                        'text[font-weight="bold"]'
-                      );
-
-                      if (!textElement) {
-                        textElement = nodeElement.querySelector(
-                          'text[text-anchor="start"]'
-                        );
+                    // Validate node IDs - Ensure corresponding vertices exist in our map
+                    if (!(sourceTitle in nodeIdMap) || !(targetTitle in nodeIdMap)) {
+                      console.warn("Invalid edge source or target title found in layout, skipping:", sourceTitle, "->", targetTitle);
+                      continue;
+                    }
+                    let sourceVertex = nodeIdMap[sourceTitle];
+                    let targetVertex = nodeIdMap[targetTitle];
+
+                    // Find the communication link in the Threagile model by target and protocol
+                    let matchingCommLinkKey = undefined;
+                    if (sourceVertex.technicalAsset?.key && targetVertex.technicalAsset?.id) {
+                      let sourceAssetKey = sourceVertex.technicalAsset.key;
+                      let targetAssetId = targetVertex.technicalAsset.id;
+                      if (!linksDataBySource.has(sourceAssetKey)) {
+                        let allLinksForSource = graph.model.threagile.getIn(["technical_assets", sourceAssetKey, "communication_links"]);
+                        linksDataBySource.set(sourceAssetKey, allLinksForSource ? allLinksForSource.toJSON() : null);
                       }
-                      let text = textElement.textContent;
-                      let is3DCylinder = paths.length === 2;
-                      console.log(text);
-                      console.log(nodeCoords);
-                      let vertex;
-                      if (is3DCylinder) {
-                        let widthScaleFactor = 2.0;
-                        let heightScaleFactor = 0.07;
-                    
-                        let strokeWith = nodeCoords.strokeWidth===null? defaultStrokeWidth: nodeCoords.strokeWidth;
-                        // Create a 3D cylinder vertex
-                        let style =
-                          "shape=datastore;fontStyle=1;fontSize=18;shadow=1;fillColor=" +
-                          nodeCoords.fill +
-                          ";strokeColor=" +
-                          nodeCoords.stroke +
-                          ";strokeWidth=" +
-                          strokeWith;
-
-                          vertex = graph.insertVertex(
-                            parent,
-                            null,
-                            text,
-                            minX,
-                            minY,
-                            Math.abs(maxX - minX),
-                            Math.abs(maxY - minY),
-                            style
-                          );
-                          vertex.technicalAsset = {}; 
-                          vertex.technicalAsset["id"] = graph.model.threagile.getIn(["technical_assets",vertex.value,"id"]);
-                          vertex.technicalAsset["key"] = vertex.value;
-              } else if (nodeCoords.shape === "ellipse") {
-                        let widthScaleFactor = 0.6;
-                        let heightScaleFactor = 0.6;
-                                 let strokeWith = nodeCoords.strokeWidth===null? defaultStrokeWidth: nodeCoords.strokeWidth;
-
-                        let style =
-                          "shape=ellipse;fontStyle=1;fontSize=18;shadow=1;fillColor=" +
-                          nodeCoords.fill +
-                          ";strokeColor=" +
-                          nodeCoords.stroke +
-                          ";strokeWidth=" +
-                          strokeWith;
-
-                        vertex = graph.insertVertex(
-                          parent,
-                          null,
-                          text,
-                          minX,
-                          minY,
-                          Math.abs(maxX - minX),
-                          Math.abs(maxY - minY),
-                          style
-                        );
-                        vertex.technicalAsset = {}; 
-                        vertex.technicalAsset["id"] = graph.model.threagile.getIn(["technical_assets",vertex.value,"id"]);
-                        vertex.technicalAsset["key"] = vertex.value;
+                      let linksData = linksDataBySource.get(sourceAssetKey);
+
+                      if (linksData) {
+                        matchingCommLinkKey = Object.keys(linksData).find(commLinkKey => {
+                          const link = linksData[commLinkKey];
+                          return link.target === targetAssetId &&
+                                 link.protocol?.toLowerCase() === dotEdgeProtocol.toLowerCase();
+                        });
+                        if (!matchingCommLinkKey) {
+                          console.warn(`Could not find matching communication link in Threagile model for ${sourceAssetKey} -> ${targetAssetId} with protocol '${dotEdgeProtocol}'`);
+                        }
                       } else {
-                        let widthScaleFactor = 0.6;
-                        let heightScaleFactor = 0.6;
-                  
-                        let strokeWith = nodeCoords.strokeWidth===null? defaultStrokeWidth: nodeCoords.strokeWidth;
-                        
-
-                        let style =
-                          "shape=hexagon;fontStyle=1;fontSize=18;shadow=1;fillColor=" +
-                          nodeCoords.fill +
-                          ";strokeColor=" +
-                          nodeCoords.stroke +
-                          ";strokeWidth=" +
-                          strokeWith;
-
-                        vertex = graph.insertVertex(
-                          parent,
-                          null,
-                          text,
-                          minX,
-                          minY,
-                          Math.abs(maxX - minX),
-                          Math.abs(maxY - minY),
-                          style
-                        );
-                        vertex.technicalAsset = {}; 
-                        vertex.technicalAsset["id"] = graph.model.threagile.getIn(["technical_assets",vertex.value,"id"]);
-                        vertex.technicalAsset["key"] = vertex.value;
+                        console.warn("No communication_links found in model for source asset:", sourceAssetKey);
                       }
-                      loadingBar.updateProgress(60, 'Loading technical_assets...');
-
-                        
-                      vertex.setVertex(true);  
-                      nodeIdMap[nodeCoords.nodeTitle] = vertex;
-	
-                      let bounds = graph.getCellGeometry(vertex);
-                      let textWidth = mxUtils.getSizeForString(
-                        text,
-                        12,
-                        mxConstants.DEFAULT_FONTFAMILY
-                      ).width;
-                      let textHeight = mxUtils.getSizeForString(
-                        text,
-                        12,
-                        mxConstants.DEFAULT_FONTFAMILY
-                      ).height;
-
-                      let padding = 20;
-                      if (bounds.width < textWidth + padding) {
-                        bounds.width = textWidth + padding;
-                      }
-                      if (bounds.height < textHeight + padding) {
-                        bounds.height = textHeight + padding;
-                      }
-                      graph.resizeCell(vertex, bounds);
+                    } else {
+                      console.warn("Source or target vertex missing technicalAsset data for edge matching:", sourceTitle, "->", targetTitle);
                     }
-	
-
-
 
+                    let edgeGeometry = new mxGeometry();
+                    edgeGeometry.relative = true;
+                    // Waypoints from the spline control points
+                    if (layoutEdge.points.length > 0) {
+                      edgeGeometry.points = layoutEdge.points.map(point => new mxPoint(point.x, point.y));
+                    }
+                    let edge = new mxCell(dotEdgeProtocol, edgeGeometry, "edgeStyle=orthogonalEdgeStyle;");
+                    edge.setEdge(true);
+                    edge.setTerminal(sourceVertex, true);
+                    edge.setTerminal(targetVertex, false);
+                    if (matchingCommLinkKey) {
+                      edge.communicationAssetKey = matchingCommLinkKey;
+                      edge.communicationAsset = graph.model.threagile.getIn(["technical_assets", sourceVertex.technicalAsset.key, "communication_links", matchingCommLinkKey]);
+                    } else {
+                      edge.error_no_match = true;
+                      console.error(`Failed to associate Threagile data to edge: ${sourceTitle} -> ${targetTitle} (${dotEdgeProtocol})`);
+                    }
+                    cells.push(edge);
+                  }
 
-                    // Get the main graph object first
-                    const mainGraphObject = dotJson.children?.[0];
-
-                    // Filter the children of the main graph object
-                    const edgeStmts = mainGraphObject?.children?.filter(
-                        (child) => child.type === 'Edge' // Use the correct type value 'Edge'
-                    ) ?? [];                  // Now iterate over ALL edge statements from the DOT file
-                    edgeStmts.forEach((edgeStmt, index) => {
-                        // --- CORRECTED NODE ACCESS ---
-                        // Use optional chaining for safety in case structure is unexpected
-                        let sourceTitle = edgeStmt.targets?.[0]?.id?.value;
-                        let targetTitle = edgeStmt.targets?.[1]?.id?.value;
-
-                        // Check if source/target titles were successfully extracted
-                        if (!sourceTitle || !targetTitle) {
-                            console.warn("Could not extract source or target ID from edge statement:", edgeStmt);
-                            return; // Skip this edge if IDs are missing
-                        }
-
-                        let edgeStyle = "edgeStyle=orthogonalEdgeStyle;"; // Base style
-
-                        // --- CORRECTED ATTRIBUTE ACCESS ---
-                        // Attributes are in the 'children' array of the Edge statement
-                        const attributes = edgeStmt.children?.filter(child => child.type === 'Attribute') ?? [];
-
-                        // Find the 'xlabel' attribute
-                        const xlabelAttr = attributes.find(attr => attr.key?.value === 'xlabel');
-                        let dotEdgeProtocol = xlabelAttr?.value?.value; // Get the actual value string
-
-                        if (!dotEdgeProtocol) {
-                            // If no xlabel, check if there's a regular 'label' (less common for edges, but possible)
-                            const labelAttr = attributes.find(attr => attr.key?.value === 'label');
-                            dotEdgeProtocol = labelAttr?.value?.value; // Fallback to 'label' if 'xlabel' is missing
-
-                            if (!dotEdgeProtocol) {
-                                 console.warn("DOT edge statement missing 'xlabel' (or 'label') for protocol, cannot reliably match to communication link. Skipping:", edgeStmt);
-                                 return; // Skip if we can't identify the protocol
-                            } else {
-                                console.log(`Using 'label' attribute as protocol for edge: ${sourceTitle} -> ${targetTitle}`);
-                            }
-                        }
-
-                        // Clean up potential quotes (parser usually handles this, but safer)
-                        dotEdgeProtocol = dotEdgeProtocol.replace(/^"(.*)"$/, '$1').replace(/^<.*>$/, ''); // Remove quotes and HTML tags if present
-
-                        console.log(`Processing DOT edge: ${sourceTitle} -> ${targetTitle} with protocol: ${dotEdgeProtocol}`);
-
-                        // --- REST OF YOUR EDGE PROCESSING LOGIC (using sourceTitle, targetTitle, dotEdgeProtocol) ---
-
-                        // Validate node IDs - Ensure corresponding vertices exist in our map
-                        if (
-                          !(sourceTitle in nodeIdMap) ||
-                          !(targetTitle in nodeIdMap)
-                        ) {
-                          console.warn("Invalid edge source or target title found in DOT edge statement, skipping:", sourceTitle, "->", targetTitle);
-                          return; // Skip this edge statement
-                        }
-
-                        // Get source and target vertices
-                        let sourceVertex = nodeIdMap[sourceTitle];
-                        let targetVertex = nodeIdMap[targetTitle];
-
-                        // Find the specific communication link in the Threagile model...
-                        // (Your existing logic for matching using dotEdgeProtocol seems correct here)
-                        let matchingCommLinkKey = undefined;
-                        let matchingCommLinkData = undefined;
-
-                        if (sourceVertex.technicalAsset?.key && targetVertex.technicalAsset?.id) {
-                            let sourceAssetKey = sourceVertex.technicalAsset.key;
-                            let targetAssetId = targetVertex.technicalAsset.id;
-                            let allLinksForSource = graph.model.threagile.getIn(["technical_assets", sourceAssetKey, "communication_links"]);
-
-                            if (allLinksForSource) {
-                                let linksData = allLinksForSource.toJSON(); // Convert to plain JS object/map
-
-                                // Find the key of the link matching target AND protocol
-                                matchingCommLinkKey = Object.keys(linksData).find(commLinkKey => {
-                                    const link = linksData[commLinkKey];
-                                    // Case-insensitive comparison for protocol might be safer
-                                    return link.target === targetAssetId &&
-                                           link.protocol?.toLowerCase() === dotEdgeProtocol.toLowerCase();
-                                });
-
-                                if (matchingCommLinkKey) {
-                                    matchingCommLinkData = linksData[matchingCommLinkKey];
-                                    console.log(`Matched DOT edge protocol '${dotEdgeProtocol}' to comm link key: ${matchingCommLinkKey}`);
-                                } else {
-                                    console.warn(`Could not find matching communication link in Threagile model for ${sourceAssetKey} -> ${targetAssetId} with protocol '${dotEdgeProtocol}'`);
-                                }
-                            } else {
-                                console.warn("No communication_links found in model for source asset:", sourceAssetKey);
-                            }
-                        } else {
-                             console.warn("Source or target vertex missing technicalAsset data for edge matching:", sourceTitle, "->", targetTitle);
-                        }
-
-                        // Create a NEW mxGraph edge...
-                        let edge = graph.insertEdge(
-                          parent,
-                          null,
-                          dotEdgeProtocol,
-                          sourceVertex,
-                          targetVertex,
-                          edgeStyle
-                        );
-
-                        // Associate the SPECIFIC matched communication link data...
-                        if (matchingCommLinkKey && matchingCommLinkData) {
-                             edge.communicationAssetKey = matchingCommLinkKey;
-                             edge.communicationAsset    = graph.model.threagile.getIn(["technical_assets", sourceVertex.technicalAsset.key, "communication_links", matchingCommLinkKey]);
-                        } else {
-                            edge.error_no_match = true;
-                            console.error(`Failed to associate Threagile data to edge: ${sourceTitle} -> ${targetTitle} (${dotEdgeProtocol})`);
-                        }
-
-
-                        // Apply Waypoints (Geometry)...
-                        // (Your existing logic for finding the SVG path and applying points seems okay,
-                        // but double-check the SVG matching logic if needed)
-                        let pathPoints = undefined;
-                        edgeSVGs.forEach((edgeSVG) => {
-                            let svgTitle = edgeSVG.querySelector("title")?.textContent;
-                            let pathElement = edgeSVG.querySelector("path");
-                            let textElements = edgeSVG.querySelectorAll("text");
-                            let svgEdgeLabel = '';
-                            if (textElements && textElements.length > 0) {
-                                svgEdgeLabel = textElements[0].textContent;
-                            }
-                            let potentialSvgTitle = `${sourceTitle}->${targetTitle}`;
-                            if (svgTitle === potentialSvgTitle && svgEdgeLabel.toLowerCase() === dotEdgeProtocol.toLowerCase() && pathElement) {
-                                let svgPath = pathElement.getAttribute("d");
-                                if (svgPath) {
-                                   let pointsStr = svgPath.match(/([MC L])([^MC L]+)/g);
-                                   if (pointsStr) {
-                                       pointsStr.shift();
-                                       if (pointsStr.length > 0 && !pointsStr[pointsStr.length - 1].includes(',')) {
-                                           pointsStr.pop();
-                                       }
-                                       pathPoints = pointsStr.map(pointString => {
-                                            let coords = pointString.trim().split(/[ ,]+/);
-                                            let x = parseFloat(coords[0]);
-                                            let y = parseFloat(coords[1]);
-                                            return new mxPoint(x, y);
-                                        }).filter(pt => !isNaN(pt.x) && !isNaN(pt.y));
-                                   }
-                                }
-                                return;
-                            }
-                        });
-
-                        if (pathPoints && pathPoints.length > 0) {
-                            let edgeGeometry = edge.getGeometry();
-                            if (!edgeGeometry) {
-                                edgeGeometry = new mxGeometry();
-                                edgeGeometry.relative = true;
-                            }
-                            edgeGeometry = edgeGeometry.clone();
-                            edgeGeometry.points = pathPoints;
-                            graph.getModel().setGeometry(edge, edgeGeometry);
-                            console.log(`Applied waypoints to edge: ${sourceTitle} -> ${targetTitle} (${dotEdgeProtocol})`);
-                        } else {
-                           console.log(`No specific waypoints found/applied for edge: ${sourceTitle} -> ${targetTitle} (${dotEdgeProtocol})`);
-                        }
+                  // One model change, one CHANGE event for the format panel and one view validation
+                  graph.replaceCells(cells);
 
-                    }); // End of edgeStmts.forEach
                   const endTime = performance.now();
-                    console.log(`Call to doSomething took ${endTime - startTime} milliseconds.`);
-                    loadingBar.updateProgress(100, 'Import complete.');
-                    setTimeout(loadingBar.hideLoadingBar, 500);
-
-
-                    let cells = graph.getModel().cells;
-                    for (let id in cells) {
-                      let cell = cells[id];
-                      if (cell.technicalAsset) {
-                        if (cell.technicalAsset.communication_links) {
-                          delete cell.technicalAsset.communication_links;
-                        }
-                      }
-                    }
-               
-            		graph.getModel().endUpdate();
-		            graph.fit();
-                graph.refresh();
-                graph.view.revalidate();
-
+                  console.log(`Import of ${layout.nodes.length} assets and ${layout.edges.length} links took ${endTime - startTime} milliseconds.`);
+                  loadingBar.updateProgress(100, 'Import complete.');
+                  setTimeout(loadingBar.hideLoadingBar, 500);
+                  graph.fit();
                 })
                 .catch(function (error) {
                   setTimeout(loadingBar.hideLoadingBar, 500);
-                  console.error(error);
+                  if (error.name !== 'EngineCancelledError') {
+                    console.error(error);
+                  }
                 });
           } else {
             var doc = mxUtils.parseXml(xml);
@@ -7,6 +7,7 @@ import  {
     generateUniquekeyData
 }
 from './Utils.js';
+import {modelStoreOf} from './ModelStore.js';
 
 export const AssetFormatPanel = function (format, editorUi, container) {
   BaseFormatPanel.call(this, format, editorUi, container);
@@ -553,6 +554,7 @@ let createChangeListener = function (selectDropdown, propertySelect) {
                                 cell.value= adjustedValue;
                                 let restoreIntegrity = self.editorUi.editor.graph.model.threagile.toString();
                                 self.editorUi.editor.graph.model.threagile =  YAML.parseDocument(restoreIntegrity);
+                                self.editorUi.editor.logThreagileEdits(self.editorUi.editor.graph.model.threagile);
                                 edges.forEach(function (edge) {
                                 let newassetPathCom = ["technical_assets", assetId.key, "communication_links", edge.communicationAssetKey];
                                     edge.communicationAsset= self.editorUi.editor.graph.model.threagile.getIn(newassetPathCom);
@@ -840,16 +842,9 @@ else if (property === "tags" && propertyType === "array") {
     }
   }
 
-  let idsData = [];
-  // Iterate over the Map and create table rows
-  let diagramData = self.editorUi.editor.graph.model.threagile.getIn(["data_assets"]);
-  
-  if (diagramData) {
-    diagramData = self.editorUi.editor.graph.model.threagile.getIn([ "data_assets"]).toJSON();
-    Object.keys(diagramData).forEach(function(key) {
-      idsData.push(key); 
-  });
-  }
+  // Keys of the data assets, looked up by ID in the model store instead of converting the section
+  let store = modelStoreOf(self.editorUi.editor.graph.model.threagile);
+  let idsData = [...store.keys("data_assets")];
 
 let assetId = self.editorUi.editor.graph.getSelectionCell().technicalAsset;
 
@@ -863,18 +858,10 @@ sentSection.appendChild(document.createElement("br"));
 
 if(assetId)
 {
-  let arr = self.editorUi.editor.graph.model.threagile.getIn(["technical_assets", assetId.key, "data_assets_processed"]);
-  // diagramData has multiple objects those have ids, arr is an arry of ids find the keys of diagramData from the arr ids
-  
+  let arr = store.entry("technical_assets", assetId.key)?.data_assets_processed;
   if(arr)
     {
-      if (typeof arr.toJSON === 'function') {
-        arr = arr.toJSON();
-    } 
-    let matchingKeys = Object.keys(diagramData)
-    .filter(key => arr.includes(diagramData[key].id))  // Filter keys where their object's id is in arr
-    .map(key => key);  // Map to the keys themselves
-    inputElement.value = matchingKeys;
+    inputElement.value = store.keysOfIds("data_assets", arr);
   }
 }
 
@@ -909,19 +896,10 @@ receivedSecion.appendChild(document.createElement("br"));
 
 if(assetId)
   {
-    let arr = self.editorUi.editor.graph.model.threagile.getIn(["technical_assets", assetId.key, "data_assets_stored"]);
-   
-    // diagramData has multiple objects those have ids, arr is an arry of ids find the keys of diagramData from the arr ids
+    let arr = store.entry("technical_assets", assetId.key)?.data_assets_stored;
     if(arr)
       {
-    
-        if (typeof arr.toJSON === 'function') {
-          arr = arr.toJSON();
-      } 
-        let matchingKeys = Object.keys(diagramData)
-      .filter(key => arr.includes(diagramData[key].id))  // Filter keys where their object's id is in arr
-      .map(key => key);  // Map to the keys themselves
-      inputElement2.value = matchingKeys;
+      inputElement2.value = store.keysOfIds("data_assets", arr);
     }
   }
 
@@ -948,7 +926,7 @@ tagify2.on('add', onAddTagStored)      .on('focus', onTagifyFocusBlur)
 function onAddTagPro(e){
   let proAssetID = self.editorUi.editor.graph.getSelectionCell().technicalAsset;;
   const model = self.editorUi.editor.graph.model.threagile;
-  let dataId = model.getIn(["data_assets", e.detail.data.value, "id"]);
+  let dataId = modelStoreOf(model).idOf("data_assets", e.detail.data.value);
 
   let dataAssetsProcessed = model.getIn(["technical_assets", proAssetID.key, "data_assets_processed"]) || [];
   if (typeof dataAssetsProcessed.toJSON === 'function') {
@@ -965,7 +943,7 @@ function onRemoveTagPro(e){
   let proassetKey = self.editorUi.editor.graph.getSelectionCell().technicalAsset;;
 
   const model = self.editorUi.editor.graph.model.threagile;
-  let dataId = model.getIn(["data_assets", e.detail.data.value, "id"]);
+  let dataId = modelStoreOf(model).idOf("data_assets", e.detail.data.value);
   let dataAssetsProcessed = model.getIn(["technical_assets", proassetKey.key, "data_assets_processed"]) || [];
   if (typeof dataAssetsProcessed.toJSON === 'function') {
     dataAssetsProcessed= dataAssetsProcessed.toJSON();
@@ -984,7 +962,7 @@ function onRemoveTagStored(e) {
   let id = self.editorUi.editor.graph.getSelectionCell().technicalAsset;;
 
   const model = self.editorUi.editor.graph.model.threagile;
-  let dataId = model.getIn(["data_assets", e.detail.data.value, "id"]);
+  let dataId = modelStoreOf(model).idOf("data_assets", e.detail.data.value);
   let dataAssetsStored = model.getIn(["technical_assets", id.key, "data_assets_stored"]) || [];
   if (typeof dataAssetsStored.toJSON === 'function') {
     dataAssetsStored= dataAssetsStored.toJSON();
@@ -1006,7 +984,7 @@ function onAddTagStored(e) {
   let id = self.editorUi.editor.graph.getSelectionCell().technicalAsset;;
 
   const model = self.editorUi.editor.graph.model.threagile;
-  let dataId = model.getIn(["data_assets", e.detail.data.value, "id"]);
+  let dataId = modelStoreOf(model).idOf("data_assets", e.detail.data.value);
   let dataAssetsStored = model.getIn(["technical_assets", id.key, "data_assets_stored"]) || [];
   if (typeof dataAssetsStored.toJSON === 'function') {
     dataAssetsStored= dataAssetsStored.toJSON();
@@ -1,5 +1,6 @@
 import {BaseFormatPanel} from './BaseFormatPanel.js';
 import  {createSection, restartWasm,generateUniquekeyData} from './Utils.js';
+import {modelStoreOf} from './ModelStore.js';
 
 export const BoundaryFormatPanel = function (format, editorUi, container) {
   BaseFormatPanel.call(this, format, editorUi, container);
@@ -405,7 +406,7 @@ BoundaryFormatPanel.prototype.addBoundaryMenuDynamic = function (
         cellValue.style.padding = "8px";
         cellValue.style.width = "200px";
         row.appendChild(cellValue);
-        let id = self.editorUi.editor.graph.model.threagile.getIn(["technical_assets",cellValue.textContent,"id"])
+        let id = modelStoreOf(self.editorUi.editor.graph.model.threagile).idOf("technical_assets", cellValue.textContent);
         technicalAssetsArray.push(id);
         table.appendChild(row);
       }
@@ -442,7 +443,7 @@ BoundaryFormatPanel.prototype.addBoundaryMenuDynamic = function (
     cellValue.style.width = "200px";
     cellValue.style.boxSizing = "border-box";
     row.appendChild(cellValue);
-    let id = self.editorUi.editor.graph.model.threagile.getIn(["trust_boundaries",cellValue.textContent,"id"])
+    let id = modelStoreOf(self.editorUi.editor.graph.model.threagile).idOf("trust_boundaries", cellValue.textContent);
     rectanglesArray.push(id);
     nestedTable.appendChild(row);
   });
@@ -1,5 +1,6 @@
 import {BaseFormatPanel} from './BaseFormatPanel.js';
 import  {createSection,restartWasm,generateUniquekeyData} from './Utils.js';
+import {modelStoreOf} from './ModelStore.js';
 
 export const CommunicationFormatPanel = function (format, editorUi, container) {
   BaseFormatPanel.call(this, format, editorUi, container);
@@ -431,6 +432,7 @@ CommunicationFormatPanel.prototype.addCommunicationMenuDynamic = function (
                       cell.communicationAsset = self.editorUi.editor.graph.model.threagile.getIn(newassetPath);
                       let restoreIntegrity    = self.editorUi.editor.graph.model.threagile.toString();
                       self.editorUi.editor.graph.model.threagile =  YAML.parseDocument(restoreIntegrity);
+                      self.editorUi.editor.logThreagileEdits(self.editorUi.editor.graph.model.threagile);
                     }else{
                      self.editorUi.editor.graph.model.threagile.setIn(["technical_assets", cell.source.technicalAsset.key,"communication_links",cell.communicationAssetKey, property], newValue);
                   }
@@ -503,17 +505,8 @@ CommunicationFormatPanel.prototype.addCommunicationMenuDynamic = function (
   for (let sectionName in sections) {
     container.appendChild(sections[sectionName]);
   }
-  let tmpData = self.editorUi.editor.graph.model.threagile.getIn(["data_assets"]);
-  var diagramData = tmpData===  undefined ?[]: tmpData;
-  if(typeof diagramData.toJSON === 'function') {
-    diagramData= diagramData.toJSON();
-    }
-   
-  let idsData = [];
-  Object.keys(diagramData).forEach(function (property) {
-      idsData.push(property);
-    });
-  
+  let store = modelStoreOf(self.editorUi.editor.graph.model.threagile);
+  let idsData = [...store.keys("data_assets")];
 
   let inputElement = document.createElement("input");
   inputElement.id = "data_send_tagify";
@@ -532,20 +525,7 @@ CommunicationFormatPanel.prototype.addCommunicationMenuDynamic = function (
     cell &&
     commAsset.data_assets_sent
   ) {
-    let matches = [];
-    inputElement.value = commAsset.data_assets_sent;
-    for (let key in diagramData) {
-      if (diagramData.hasOwnProperty(key)) {
-        let item = diagramData[key];
-        for (let id of commAsset.data_assets_sent) {
-          if (item.id === id) {
-            matches.push(key);  
-            break; 
-          }
-        }
-      }
-    }
-      inputElement.value = matches;
+      inputElement.value = store.keysOfIds("data_assets", commAsset.data_assets_sent);
   } // Append it to body (or any other container)
   sentSection.appendChild(inputElement);
   
@@ -561,13 +541,13 @@ CommunicationFormatPanel.prototype.addCommunicationMenuDynamic = function (
       },
     });
     function addComSent(e){
-      let dataId= diagramData[e.detail.data.value].id;
+      let dataId= modelStoreOf(self.editorUi.editor.graph.model.threagile).idOf("data_assets", e.detail.data.value);
       commAsset.data_assets_sent.push(dataId);
       self.editorUi.editor.graph.model.threagile.setIn(["technical_assets", self.editorUi.editor.graph.getSelectionCells()[0].source.technicalAsset.key,"communication_links",cell.communicationAssetKey, "data_assets_sent"],commAsset.data_assets_sent );
 
     }
     function removeComSent(e){
-      let dataId= diagramData[e.detail.data.value].id;
+      let dataId= modelStoreOf(self.editorUi.editor.graph.model.threagile).idOf("data_assets", e.detail.data.value);
       commAsset.data_assets_sent = commAsset.data_assets_sent.filter(asset => asset !== dataId);
       self.editorUi.editor.graph.model.threagile.setIn(["technical_assets", self.editorUi.editor.graph.getSelectionCells()[0].source.technicalAsset.key,"communication_links",cell.communicationAssetKey, "data_assets_sent"],commAsset.data_assets_sent );
 
@@ -585,19 +565,7 @@ CommunicationFormatPanel.prototype.addCommunicationMenuDynamic = function (
     cell &&
     commAsset.data_assets_received
   ) {
-    let matches = [];
-    for (let key in diagramData) {
-      if (diagramData.hasOwnProperty(key)) {
-        let item = diagramData[key];
-        for (let id of commAsset.data_assets_received) {
-          if (item.id === id) {
-            matches.push(key);  
-            break; 
-          }
-        }
-      }
-    }
-      inputElement2.value = matches;
+      inputElement2.value = store.keysOfIds("data_assets", commAsset.data_assets_received);
   } 
   receivedSecion.appendChild(inputElement2);
   let tinput2 = document.querySelector('input[name="input-custom-dropdown"]');
@@ -611,12 +579,12 @@ CommunicationFormatPanel.prototype.addCommunicationMenuDynamic = function (
       },
     });
     function addComReceived(e){
-      let dataId= diagramData[e.detail.data.value].id;
+      let dataId= modelStoreOf(self.editorUi.editor.graph.model.threagile).idOf("data_assets", e.detail.data.value);
       commAsset.data_assets_received.push(dataId);
       self.editorUi.editor.graph.model.threagile.setIn(["technical_assets", self.editorUi.editor.graph.getSelectionCells()[0].source.technicalAsset.key,"communication_links",cell.communicationAssetKey,"data_assets_received"],commAsset.data_assets_received );
     }
     function removeComReceived(e){
-      let dataId= diagramData[e.detail.data.value].id;
+      let dataId= modelStoreOf(self.editorUi.editor.graph.model.threagile).idOf("data_assets", e.detail.data.value);
     commAsset.data_assets_received = commAsset.data_assets_received.filter(asset => asset !== dataId);
       self.editorUi.editor.graph.model.threagile.setIn(["technical_assets", self.editorUi.editor.graph.getSelectionCells()[0].source.technicalAsset.key,"communication_links",cell.communicationAssetKey,"data_assets_received"],commAsset.data_assets_received );
 
@@ -6,6 +6,7 @@ import  {
     generateRandomId,
     generateUniquedataId
 } from './Utils.js';
+import {modelStoreOf} from './ModelStore.js';
 
 
 export const DiagramFormatPanel = function (format, editorUi, container) {
@@ -17,269 +18,17 @@ mxUtils.extend(DiagramFormatPanel, BaseFormatPanel);
 
 DiagramFormatPanel.prototype.init = function () {
 /**
- * Removes occurrences of a specific ID from a collection (JS Array or YAML Sequence).
- * Uses eemeli/yaml methods (.get, .delete) for YAML Sequences, accessing the .value
- * property of Scalar nodes for comparison. Modifies the collection IN PLACE.
+ * Removes a data asset ID from the processed/stored lists of the technical assets and the
+ * sent/received lists of their communication links. Only the references are visited, looked up
+ * in the model store's reverse index; the items are deleted through the Document API.
+ * Risk tracking entries are kept.
  *
- * @param {Array|object} arr - The collection to modify (original JS Array or YAML Sequence object from the model).
- * @param {string} idToRemove - The ID string value to search for and remove.
- * @param {string} path - The location of this collection in the model (for logging).
- */
-function removeIdFromArray(arr, idToRemove, path) {
-    // 1. Handle null or undefined input
-    if (!arr) {
-        // console.log(`    Skipping removal for path "${path}": Collection is null or undefined.`);
-        return;
-    }
-
-    let removed = false;
-
-    // 2. Handle standard JavaScript Arrays (assuming direct string values)
-    if (Array.isArray(arr)) {
-        // console.log(`    Checking JS Array at path "${path}" for removal of "${idToRemove}"`);
-        // Iterate backwards to safely remove elements using splice
-        for (let i = arr.length - 1; i >= 0; i--) {
-            if (arr[i] === idToRemove) {
-                console.log(`      Removing ID at ${path}[${i}]: "${idToRemove}" (JS Array)`);
-                arr.splice(i, 1); // Remove element at index i
-                removed = true;
-            }
-        }
-    }
-    // 3. Handle YAML Sequences (using eemeli/yaml API)
-    //    Check for properties/methods typical of YAMLSeq from 'yaml' library.
-    else if (typeof arr.get === 'function' && typeof arr.delete === 'function' && Array.isArray(arr.items)) {
-        // console.log(`    Checking YAML Sequence at path "${path}" for removal of "${idToRemove}"`);
-        // Iterate backwards to safely remove elements using .delete(index)
-        // Use the length of the underlying items array for the loop boundary
-        for (let i = arr.items.length - 1; i >= 0; i--) {
-            // Use .get(index) to retrieve the *Node object* or value
-            const currentNodeOrValue = arr.get(i);
-
-            // Determine the actual value to compare
-            // Check if it's a Node with a 'value' property (like Scalar) or just the value itself
-            let currentValue;
-            if (currentNodeOrValue && typeof currentNodeOrValue === 'object' && currentNodeOrValue.hasOwnProperty('value')) {
-                // It's likely a Scalar or similar Node from 'yaml'
-                 currentValue = currentNodeOrValue.value;
-                 // Ensure we are comparing against the actual value, not the Node itself
-                 // The original code had a potential bug here: it compared currentNode === oldId
-                 // which might fail if currentNode is a Scalar object. It should have been currentNode.value === oldId
-            } else {
-                // It might be a direct value if the sequence holds primitives directly
-                // or if .get() resolved the node to its value automatically in some cases.
-                currentValue = currentNodeOrValue;
-            }
-
-
-            // Compare the determined value with the ID to remove
-            if (currentValue === idToRemove) {
-                console.log(`      Removing ID at ${path}[${i}]: Value "${idToRemove}" (YAML Seq)`);
-
-                // Use .delete(index) to remove the item from the YAML sequence IN PLACE.
-                arr.delete(i);
-                removed = true;
-            }
-        }
-    }
-     // 4. Handle other potential collection types (add specific checks if needed)
-     //    Attempting generic sequence removal if API matches
-     else if (typeof arr.get === 'function' && typeof arr.delete === 'function' && typeof arr.size === 'number') {
-         console.warn(`    Path "${path}": Attempting removal in map-like sequence for "${idToRemove}". Logic assumes sequence behavior.`);
-          // Iterate backwards assuming sequence-like indexing
-          // Note: .size might not reflect indices directly if keys aren't 0..N-1
-          // This part is heuristic and might fail depending on the actual object type.
-          // A more robust solution would require knowing the exact type or structure.
-          // We'll iterate based on presumed indices up to size - 1 if possible,
-          // but a safer approach might be needed. Let's stick to the known .items.length if available,
-          // otherwise this branch might be unreliable for removal.
-          // *Correction*: The original logic checked arr.items.length. If that's not present, iterating
-          // based on .size for deletion by index is risky. Let's refine this branch.
-          // *Revision*: If it has get/delete/size but not items, it's less likely a standard sequence.
-          // Maybe iterate keys if possible? Or just log a more specific warning.
-          // Let's keep the warning strong and avoid potentially incorrect deletions.
-         console.warn(`    Path "${path}": Encountered map-like structure with get/delete/size but no 'items' array. Cannot reliably perform indexed removal. Skipping removal for this specific type.`);
-         // Removed the potentially incorrect backwards loop for this case.
-     }
-    // 5. Log if type is unsupported
-    else {
-        console.warn(`    Skipping removal for path "${path}": Unsupported collection type or structure for removal. Type: ${typeof arr}`, arr);
-        return;
-    }
-
-    // Optional: Log if no changes were made
-    // if (!removed) {
-    //     console.log(`    No instances of "${idToRemove}" found to remove in ${path}`);
-    // }
-}
-/**
- * Removes all known references to a data asset ID from relevant arrays/sequences
- * throughout the Threagile model.
- * Handles technical assets (processed/stored data), top-level communication links (sent/received data),
- * and nested communication links (sent/received data). Modifies the model IN PLACE.
- * NOTE: Does not currently modify risk_tracking entries.
- *
- * @param {object} model - The parsed Threagile model object (likely a YAML Document or YAMLMap).
- * @param {string} idToRemove - The data asset ID to remove from arrays/sequences.
+ * @param {YAML.Document} model - The Threagile model Document.
+ * @param {string} idToRemove - The data asset ID to remove.
  */
 function removeReferences(model, idToRemove) {
-    console.log(`>>> Starting reference removal for Data Asset ID: ${idToRemove}`);
-
-    // Helper to check if a value is a YAML Sequence or JS Array we can work with
-    const isProcessableArray = (val) => {
-        // Check for standard JS Array
-        if (Array.isArray(val)) {
-            return true;
-        }
-        // Check for eemeli/yaml Sequence (needs .get and .delete)
-        if (val && typeof val.get === 'function' && typeof val.delete === 'function' && Array.isArray(val.items)) {
-            return true;
-        }
-        return false;
-    };
-
-    // --- 1. Process Technical Assets ---
-    if (model.has("technical_assets")) {
-        const techAssetsYAML = model.get("technical_assets"); // Get the YAMLMap/Object
-
-        // Check if it's iterable (might be null or not the expected type)
-        if (techAssetsYAML && typeof techAssetsYAML.toJSON === 'function') {
-            const techAssetsJS = techAssetsYAML.toJSON(); // Convert to plain JS for iteration keys
-
-            Object.keys(techAssetsJS).forEach(assetKey => { // Iterate using keys from JS version
-                console.log(`  Checking Technical Asset: [${assetKey}] for removal of "${idToRemove}"`);
-                const assetYAML = techAssetsYAML.get(assetKey); // <<< Get the ORIGINAL YAML object for this asset
-
-                if (!assetYAML) {
-                     console.warn(`    Skipping asset [${assetKey}]: Could not retrieve original YAML object.`);
-                     return; // Continue to next asset key
-                }
-
-                // 1a. Check data processed/stored (pass the original YAML sequence/array)
-                if (assetYAML.has("data_assets_processed")) {
-                    const processedSeq = assetYAML.get("data_assets_processed");
-                    if (isProcessableArray(processedSeq)) {
-                        // Use removeIdFromArray instead of updateIdInArray
-                        removeIdFromArray(processedSeq, idToRemove, `technical_assets[${assetKey}].data_assets_processed`);
-                    } else if (processedSeq) {
-                        console.warn(`    Skipping removal in technical_assets[${assetKey}].data_assets_processed: Not a processable array/sequence.`);
-                    }
-                }
-                if (assetYAML.has("data_assets_stored")) {
-                     const storedSeq = assetYAML.get("data_assets_stored");
-                     if (isProcessableArray(storedSeq)) {
-                         // Use removeIdFromArray instead of updateIdInArray
-                         removeIdFromArray(storedSeq, idToRemove, `technical_assets[${assetKey}].data_assets_stored`);
-                     } else if (storedSeq) {
-                        console.warn(`    Skipping removal in technical_assets[${assetKey}].data_assets_stored: Not a processable array/sequence.`);
-                     }
-                }
-
-                // 1b. Check nested communication links
-                if (assetYAML.has("communication_links")) {
-                    const nestedCommLinksYAML = assetYAML.get("communication_links"); // Original YAML Map/Object for links
-
-                    if (nestedCommLinksYAML && typeof nestedCommLinksYAML.toJSON === 'function') {
-                        const nestedCommLinksJS = nestedCommLinksYAML.toJSON(); // JS version for keys
-                         console.log(`    Checking Nested Communication Links within [${assetKey}] for removal of "${idToRemove}"...`);
-
-                        Object.keys(nestedCommLinksJS).forEach(linkKey => {
-                             console.log(`      Checking Nested Link: [${linkKey}]`);
-                             const linkYAML = nestedCommLinksYAML.get(linkKey); // <<< Get ORIGINAL YAML Link object
-
-                             if (!linkYAML) {
-                                console.warn(`      Skipping nested link [${linkKey}]: Could not retrieve original YAML object.`);
-                                return; // Continue to next link key
-                             }
-
-                             if (linkYAML.has("data_assets_sent")) {
-                                 const sentSeq = linkYAML.get("data_assets_sent");
-                                 if (isProcessableArray(sentSeq)) {
-                                     // Use removeIdFromArray
-                                     removeIdFromArray(sentSeq, idToRemove, `technical_assets[${assetKey}].communication_links[${linkKey}].data_assets_sent`);
-                                 } else if (sentSeq) {
-                                    console.warn(`      Skipping removal in ...communication_links[${linkKey}].data_assets_sent: Not a processable array/sequence.`);
-                                 }
-                             }
-                             if (linkYAML.has("data_assets_received")) {
-                                 const receivedSeq = linkYAML.get("data_assets_received");
-                                  if (isProcessableArray(receivedSeq)) {
-                                     // Use removeIdFromArray
-                                     removeIdFromArray(receivedSeq, idToRemove, `technical_assets[${assetKey}].communication_links[${linkKey}].data_assets_received`);
-                                  } else if (receivedSeq) {
-                                     console.warn(`      Skipping removal in ...communication_links[${linkKey}].data_assets_received: Not a processable array/sequence.`);
-                                  }
-                             }
-                        });
-                    }
-                }
-            });
-        } else {
-             console.warn(`Could not iterate over 'technical_assets' for removal: Not a recognized YAML collection or is null.`);
-        }
-    } else {
-        console.log("  No 'technical_assets' section found, skipping removal within.");
-    }
-
-    // --- 2. Process TOP-LEVEL Communication Links ---
-    if (model.has("communication_links")) {
-        const topLevelCommLinksYAML = model.get("communication_links"); // YAML Map/Object
-
-        if (topLevelCommLinksYAML && typeof topLevelCommLinksYAML.toJSON === 'function') {
-             const topLevelCommLinksJS = topLevelCommLinksYAML.toJSON(); // JS version for keys
-             console.log(`  Checking Top-Level Communication Links for removal of "${idToRemove}"...`);
-
-             Object.keys(topLevelCommLinksJS).forEach(linkKey => {
-                 console.log(`    Checking Top-Level Link: [${linkKey}]`);
-                 const linkYAML = topLevelCommLinksYAML.get(linkKey); // <<< Get ORIGINAL YAML Link object
-
-                  if (!linkYAML) {
-                    console.warn(`    Skipping top-level link [${linkKey}]: Could not retrieve original YAML object.`);
-                    return; // Continue to next link key
-                  }
-
-                 if (linkYAML.has("data_assets_sent")) {
-                     const sentSeq = linkYAML.get("data_assets_sent");
-                     if (isProcessableArray(sentSeq)) {
-                         // Use removeIdFromArray
-                         removeIdFromArray(sentSeq, idToRemove, `communication_links[${linkKey}].data_assets_sent`);
-                     } else if (sentSeq) {
-                        console.warn(`    Skipping removal in communication_links[${linkKey}].data_assets_sent: Not a processable array/sequence.`);
-                     }
-                 }
-                 if (linkYAML.has("data_assets_received")) {
-                      const receivedSeq = linkYAML.get("data_assets_received");
-                      if (isProcessableArray(receivedSeq)) {
-                         // Use removeIdFromArray
-                         removeIdFromArray(receivedSeq, idToRemove, `communication_links[${linkKey}].data_assets_received`);
-                      } else if (receivedSeq) {
-                         console.warn(`    Skipping removal in communication_links[${linkKey}].data_assets_received: Not a processable array/sequence.`);
-                      }
-                 }
-             });
-        } else {
-             console.warn(`Could not iterate over 'communication_links' for removal: Not a recognized YAML collection or is null.`);
-        }
-    } else {
-        console.log("  No top-level 'communication_links' section found, skipping removal within.");
-    }
-
-    // --- 3. Process Risk Tracking ---
-    if (model.has("risk_tracking")) {
-        console.log(`  Checking 'risk_tracking': Removal logic for risk keys containing "${idToRemove}" is NOT IMPLEMENTED.`);
-        // NOTE: Removing items from risk_tracking might require different logic,
-        // e.g., removing entire key-value pairs if the key contains the ID.
-        // This is more complex than removing an ID from a list of strings.
-        // const riskTrackingYAML = model.get("risk_tracking");
-        // if (riskTrackingYAML && typeof riskTrackingYAML.toJSON === 'function') {
-        //     // Implement logic here if needed, e.g., iterate keys and check if idToRemove is part of the key string.
-        //     // Be careful: Removing items from a map while iterating requires care.
-        // }
-    } else {
-        console.log("  No 'risk_tracking' section found.");
-    }
-
-    console.log(`>>> Reference removal finished for ID: ${idToRemove}`);
+    const removed = modelStoreOf(model).removeId("data_assets", idToRemove);
+    console.log(`Removed ${removed.length} references to data asset ${idToRemove}`);
 }
   var ui = this.editorUi;
   var editor = ui.editor;
@@ -324,7 +73,7 @@ if (
     typeof this.editorUi.editor.graph.model.threagile.getIn(["data_assets"]) !==
       "undefined"
   ) {
-    let data_assets_map = graph.model.threagile.getIn(["data_assets"]).toJSON();
+    let store = modelStoreOf(graph.model.threagile);
 
     function interpolateColorForRisks(minColor, maxColor, minVal, maxVal, val) {
       function interpolate(start, end, step) {
@@ -390,11 +139,14 @@ if (
     const highRiskColor = [255, 0, 0]; // Red
     
 
-    Object.entries(data_assets_map).forEach(([property, value]) => {
+    store.keys("data_assets").forEach((property) => {
+      let value = store.entry("data_assets", property);
       let data_asset = this.editorUi.editor.graph.model.threagile.getIn(["data_assets", property]);
         
         
-        var clonedMenu = this.addDataMenu(this.createPanel(), property);
+        // The menu of a data asset is only built when it is first expanded, a long list of
+        // data assets creates just the headers
+        var clonedMenu = this.createPanel();
         let orginalProperty = property; 
         property = property +":";
         clonedMenu.id = property;
@@ -404,7 +156,6 @@ if (
         listItem.style.padding = "8px";
         listItem.style.borderBottom = "1px solid #ccc";
         listItem.dataset.visible = "false"; 
-        var parentNode = clonedMenu.childNodes[0];
         let riskScore = 0;
         console.log(value.quantity);
 
@@ -421,6 +172,9 @@ if (
           riskScore += mapRiskLevel(value.integrity, 'integrity');
         if(value.availability!== undefined)
           riskScore *= mapRiskLevel(value.availability, 'availability');
+        let fillMenu = () => {
+        this.addDataMenu(clonedMenu, orginalProperty);
+        var parentNode = clonedMenu.childNodes[0];
         for (var key in value) {
           if (value.hasOwnProperty(key)) {
             var childNode = value[key];
@@ -464,6 +218,7 @@ if (
             }
           }
         }
+        };
         var textContainer = document.createElement("div");
         textContainer.style.display = "flex";
         textContainer.style.alignItems = "center";
@@ -500,7 +255,7 @@ if (
             const uiListItem = xButton.parentNode.parentNode; // The <li> or equivalent UI element
             const uiList = uiListItem.parentNode; // The <ul> or equivalent UI element
             const model = graph.model; // Get the Threagile model object
-            const dataAssetIdToDeleteID = model.threagile.getIn(["data_assets",dataAssetKeyToDelete],true).toJSON().id;
+            const dataAssetIdToDeleteID = modelStoreOf(model.threagile).idOf("data_assets", dataAssetKeyToDelete);
             if (!model || !model.threagile) { // Ensure model and its data exist
                 console.error("Threagile model data not found!");
                 Swal.fire({
@@ -513,12 +268,12 @@ if (
 
             // --- 2. Find Direct Dependencies (Simplified: Data Assets using '<<') ---
             const dependents = [];
-            const dataAssets = model.threagile.toJSON().data_assets || {}; // Access data within the model structure
+            const dataAssetStore = modelStoreOf(model.threagile); // Entries are converted one by one, not the whole model
 
-            for (const assetId in dataAssets) {
+            for (const assetId of dataAssetStore.keys("data_assets")) {
                 if (assetId === dataAssetKeyToDelete) continue; // Skip self
 
-                const asset = dataAssets[assetId];
+                const asset = dataAssetStore.entry("data_assets", assetId);
                 // Check for '<<' anchor reference (string or object format)
                 if (asset && asset['<<']) {
                     let referencedId = '';
@@ -763,6 +518,10 @@ if (
               arrowIcon.style.transform = "rotate(270deg)";
               xButton.style.display = "inline-block";
               clonedMenu.style.display = "block";
+              if (fillMenu != null) {
+                fillMenu();
+                fillMenu = null;
+              }
           } else {
             listItem.style.backgroundColor = initialColor;
             listItem.dataset.initialColor = initialColor;
@@ -848,75 +607,6 @@ addButton.onmouseout = function() {
 
 DiagramFormatPanel.prototype.addDataMenu = function (container,UUID = undefined) {
 
-/**
- * Updates occurrences of oldId with newId within a collection (JS Array or YAML Sequence).
- * Uses eemeli/yaml methods (.get, .set) for YAML Sequences, accessing the .value
- * property of Scalar nodes for comparison. Modifies the collection IN PLACE.
- *
- * @param {Array|object} arr - The collection to update (original JS Array or YAML Sequence object from the model).
- * @param {string} oldId - The ID string value to search for.
- * @param {string} newId - The new ID string value to replace with.
- * @param {string} path - The location of this collection in the model (for logging).
- */
-function updateIdInArray(arr, oldId, newId, path) {
-    // 1. Handle null or undefined input
-    if (!arr) {
-        // console.log(`    Skipping update for path "${path}": Collection is null or undefined.`);
-        return;
-    }
-
-    let updated = false;
-
-    // 2. Handle standard JavaScript Arrays (assuming direct string values)
-    if (Array.isArray(arr)) {
-        // console.log(`    Checking JS Array at path "${path}"`);
-        for (let i = 0; i < arr.length; i++) {
-            if (arr[i] === oldId) {
-                console.log(`      Updating ID at ${path}[${i}]: "${oldId}" -> "${newId}" (JS Array)`);
-                arr[i] = newId; // Modify standard array directly
-                updated = true;
-            }
-        }
-    }
-    // 3. Handle YAML Sequences (using eemeli/yaml API)
-    //    Check for properties/methods typical of YAMLSeq from 'yaml' library.
-    else if (typeof arr.get === 'function' && typeof arr.set === 'function' && Array.isArray(arr.items)) {
-         // console.log(`    Checking YAML Sequence at path "${path}"`);
-        // Iterate using the length of the underlying items array
-        for (let i = 0; i < arr.items.length; i++) {
-            // Use .get(index) to retrieve the *Node object* (likely a Scalar) at the index
-            const currentNode = arr.get(i);
-
-            // Check if the node exists and if its 'value' property matches the old ID.
-            // Scalars store their primitive value in the 'value' property.
-            if (currentNode && typeof currentNode !== 'undefined' && currentNode === oldId) {
-                console.log(`      Updating ID at ${path}[${i}]: Node value "${oldId}" -> "${newId}" (YAML Seq)`);
-
-                // Use .set(index, newValue) to modify the YAML sequence IN PLACE.
-                // The library handles creating the appropriate Scalar node
-                // internally when given the new string value 'newId'.
-                arr.set(i, newId);
-                updated = true;
-            }
-        }
-    }
-    // 4. Handle other potential collection types (add specific checks if needed)
-    else if (typeof arr.get === 'function' && typeof arr.set === 'function' && typeof arr.size === 'number') {
-         console.warn(`    Path "${path}": Encountered map-like sequence, specific update logic may be needed.`);
-         // Add specific logic here if this case is relevant and structure is known
-         // Might involve checking node.value if .get returns nodes, or direct value if not.
-    }
-    // 5. Log if type is unsupported
-    else {
-        console.warn(`    Skipping update for path "${path}": Unsupported collection type or structure. Type: ${typeof arr}`, arr);
-        return;
-    }
-
-    // Optional: Log if no changes were made
-    // if (!updated) {
-    //     console.log(`    No updates needed in ${path} for ID "${oldId}"`);
-    // }
-}
 
 /**
  * Traverses the YAML document/node structure and updates anchor names
@@ -1026,136 +716,17 @@ function updateAnchorsAndAliases(docOrNode, oldAnchorName, newAnchorName) {
 }
 
 /**
- * Updates all known references to a data asset ID throughout the Threagile model.
- * Handles technical assets, top-level communication links, nested communication links,
- * and risk tracking keys, correctly iterating over YAML object structures.
+ * Replaces a data asset ID in the processed/stored lists of the technical assets, the
+ * sent/received lists of their communication links and the risk tracking keys. Only the
+ * references are visited, looked up in the model store's reverse index.
  *
- * @param {object} model - The parsed Threagile model object (likely a YAML Document or YAMLMap).
+ * @param {YAML.Document} model - The Threagile model Document.
  * @param {string} oldId - The data asset ID to replace.
  * @param {string} newId - The new data asset ID.
  */
 function updateReferences(model, oldId, newId) {
-    console.log(`>>> Starting reference update for Data Asset: ${oldId} -> ${newId}`);
-
-    // Helper to check if a value is a YAML Map or Sequence we can work with
-    const isYAMLCollection = (val) => val && (typeof val.get === 'function' || Array.isArray(val.items));
-
-    // --- 1. Update Technical Assets ---
-    if (model.has("technical_assets")) {
-        const techAssetsYAML = model.get("technical_assets"); // Get the YAMLMap/Object
-
-        // Check if it's iterable (might be null or not the expected type)
-        if (techAssetsYAML && typeof techAssetsYAML.toJSON === 'function') {
-            const techAssetsJS = techAssetsYAML.toJSON(); // Convert to plain JS for iteration keys
-
-            Object.keys(techAssetsJS).forEach(assetKey => { // Iterate using keys from JS version
-                console.log(`  Checking Technical Asset: [${assetKey}]`);
-                const assetYAML = techAssetsYAML.get(assetKey); // <<< Get the ORIGINAL YAML object for this asset
-
-                if (!assetYAML) {
-                     console.warn(`    Skipping asset [${assetKey}]: Could not retrieve original YAML object.`);
-                     return; // Continue to next asset key
-                }
-
-                // 1a. Check data processed/stored (pass the original YAML sequence/array)
-                if (assetYAML.has("data_assets_processed")) {
-                    const processedSeq = assetYAML.get("data_assets_processed");
-                    if (isYAMLCollection(processedSeq)) {
-                        updateIdInArray(processedSeq, oldId, newId, `technical_assets[${assetKey}].data_assets_processed`);
-                    }
-                }
-                if (assetYAML.has("data_assets_stored")) {
-                     const storedSeq = assetYAML.get("data_assets_stored");
-                     if (isYAMLCollection(storedSeq)) {
-                         updateIdInArray(storedSeq, oldId, newId, `technical_assets[${assetKey}].data_assets_stored`);
-                     }
-                }
-
-                // 1b. Check nested communication links
-                if (assetYAML.has("communication_links")) {
-                    const nestedCommLinksYAML = assetYAML.get("communication_links"); // Original YAML Map/Object for links
-
-                    if (nestedCommLinksYAML && typeof nestedCommLinksYAML.toJSON === 'function') {
-                        const nestedCommLinksJS = nestedCommLinksYAML.toJSON(); // JS version for keys
-                         console.log(`    Checking Nested Communication Links within [${assetKey}]...`);
-
-                        Object.keys(nestedCommLinksJS).forEach(linkKey => {
-                             console.log(`      Checking Nested Link: [${linkKey}]`);
-                             const linkYAML = nestedCommLinksYAML.get(linkKey); // <<< Get ORIGINAL YAML Link object
-
-                             if (!linkYAML) {
-                                console.warn(`      Skipping nested link [${linkKey}]: Could not retrieve original YAML object.`);
-                                return; // Continue to next link key
-                             }
-
-                             if (linkYAML.has("data_assets_sent")) {
-                                 const sentSeq = linkYAML.get("data_assets_sent");
-                                 if (isYAMLCollection(sentSeq)) {
-                                     updateIdInArray(sentSeq, oldId, newId, `technical_assets[${assetKey}].communication_links[${linkKey}].data_assets_sent`);
-                                 }
-                             }
-                             if (linkYAML.has("data_assets_received")) {
-                                 const receivedSeq = linkYAML.get("data_assets_received");
-                                  if (isYAMLCollection(receivedSeq)) {
-                                     updateIdInArray(receivedSeq, oldId, newId, `technical_assets[${assetKey}].communication_links[${linkKey}].data_assets_received`);
-                                  }
-                             }
-                        });
-                    }
-                }
-            });
-        } else {
-             console.warn("Could not iterate over 'technical_assets': Not a recognized YAML collection or is null.");
-        }
-    } else {
-        console.log("  No 'technical_assets' section found.");
-    }
-
-    // --- 2. Update TOP-LEVEL Communication Links ---
-    if (model.has("communication_links")) {
-        const topLevelCommLinksYAML = model.get("communication_links"); // YAML Map/Object
-
-        if (topLevelCommLinksYAML && typeof topLevelCommLinksYAML.toJSON === 'function') {
-             const topLevelCommLinksJS = topLevelCommLinksYAML.toJSON(); // JS version for keys
-             console.log(`  Checking Top-Level Communication Links...`);
-
-             Object.keys(topLevelCommLinksJS).forEach(linkKey => {
-                 console.log(`    Checking Top-Level Link: [${linkKey}]`);
-                 const linkYAML = topLevelCommLinksYAML.get(linkKey); // <<< Get ORIGINAL YAML Link object
-
-                  if (!linkYAML) {
-                    console.warn(`    Skipping top-level link [${linkKey}]: Could not retrieve original YAML object.`);
-                    return; // Continue to next link key
-                  }
-
-                 if (linkYAML.has("data_assets_sent")) {
-                     const sentSeq = linkYAML.get("data_assets_sent");
-                     if (isYAMLCollection(sentSeq)) {
-                         updateIdInArray(sentSeq, oldId, newId, `communication_links[${linkKey}].data_assets_sent`);
-                     }
-                 }
-                 if (linkYAML.has("data_assets_received")) {
-                      const receivedSeq = linkYAML.get("data_assets_received");
-                      if (isYAMLCollection(receivedSeq)) {
-                         updateIdInArray(receivedSeq, oldId, newId, `communication_links[${linkKey}].data_assets_received`);
-                      }
-                 }
-             });
-        } else {
-             console.warn("Could not iterate over 'communication_links': Not a recognized YAML collection or is null.");
-        }
-    } else {
-        console.log("  No top-level 'communication_links' section found.");
-    }
-
-    // --- 3. Update Risk Tracking Keys ---
-    if (model.has("risk_tracking")) {
-        console.log("  Checking 'risk_tracking' keys...");
-    } else {
-        console.log("  No 'risk_tracking' section found.");
-    }
-
-    console.log(`>>> Reference update finished for ${oldId} -> ${newId}`);
+    const updated = modelStoreOf(model).renameId("data_assets", oldId, newId);
+    console.log(`Updated ${updated} references to data asset ${oldId} -> ${newId}`);
 }
 /**
  * Renames a key within a YAMLMap node inside a YAML Document by replacing the key node.
@@ -1234,6 +805,8 @@ function renameYamlMapKey(doc, mapPath, oldKey, newKey, YAML) {
             // 2. Replace the *entire* key node within the Pair object.
             pair.key = newKeyNode;
             // --- RENAMING DONE ---
+            // The pair was changed in place, the store's index of this section is out of date
+            modelStoreOf(doc).invalidate(mapPath[0]);
 
             console.log(`Successfully replaced key node "${oldKey}" with new key node "${newKey}" in map at path [${mapPath.join(', ')}].`);
             foundAndRenamed = true;
@@ -1776,269 +1349,17 @@ DiagramFormatPanel.prototype.showBackgroundImageOption = true;
  */
 DiagramFormatPanel.prototype.init = function () {
 /**
- * Removes occurrences of a specific ID from a collection (JS Array or YAML Sequence).
- * Uses eemeli/yaml methods (.get, .delete) for YAML Sequences, accessing the .value
- * property of Scalar nodes for comparison. Modifies the collection IN PLACE.
- *
- * @param {Array|object} arr - The collection to modify (original JS Array or YAML Sequence object from the model).
- * @param {string} idToRemove - The ID string value to search for and remove.
- * @param {string} path - The location of this collection in the model (for logging).
- */
-function removeIdFromArray(arr, idToRemove, path) {
-    // 1. Handle null or undefined input
-    if (!arr) {
-        // console.log(`    Skipping removal for path "${path}": Collection is null or undefined.`);
-        return;
-    }
-
-    let removed = false;
-
-    // 2. Handle standard JavaScript Arrays (assuming direct string values)
-    if (Array.isArray(arr)) {
-        // console.log(`    Checking JS Array at path "${path}" for removal of "${idToRemove}"`);
-        // Iterate backwards to safely remove elements using splice
-        for (let i = arr.length - 1; i >= 0; i--) {
-            if (arr[i] === idToRemove) {
-                console.log(`      Removing ID at ${path}[${i}]: "${idToRemove}" (JS Array)`);
-                arr.splice(i, 1); // Remove element at index i
-                removed = true;
-            }
-        }
-    }
-    // 3. Handle YAML Sequences (using eemeli/yaml API)
-    //    Check for properties/methods typical of YAMLSeq from 'yaml' library.
-    else if (typeof arr.get === 'function' && typeof arr.delete === 'function' && Array.isArray(arr.items)) {
-        // console.log(`    Checking YAML Sequence at path "${path}" for removal of "${idToRemove}"`);
-        // Iterate backwards to safely remove elements using .delete(index)
-        // Use the length of the underlying items array for the loop boundary
-        for (let i = arr.items.length - 1; i >= 0; i--) {
-            // Use .get(index) to retrieve the *Node object* or value
-            const currentNodeOrValue = arr.get(i);
-
-            // Determine the actual value to compare
-            // Check if it's a Node with a 'value' property (like Scalar) or just the value itself
-            let currentValue;
-            if (currentNodeOrValue && typeof currentNodeOrValue === 'object' && currentNodeOrValue.hasOwnProperty('value')) {
-                // It's likely a Scalar or similar Node from 'yaml'
-                 currentValue = currentNodeOrValue.value;
-                 // Ensure we are comparing against the actual value, not the Node itself
-                 // The original code had a potential bug here: it compared currentNode === oldId
-                 // which might fail if currentNode is a Scalar object. It should have been currentNode.value === oldId
-            } else {
-                // It might be a direct value if the sequence holds primitives directly
-                // or if .get() resolved the node to its value automatically in some cases.
-                currentValue = currentNodeOrValue;
-            }
-
-
-            // Compare the determined value with the ID to remove
-            if (currentValue === idToRemove) {
-                console.log(`      Removing ID at ${path}[${i}]: Value "${idToRemove}" (YAML Seq)`);
-
-                // Use .delete(index) to remove the item from the YAML sequence IN PLACE.
-                arr.delete(i);
-                removed = true;
-            }
-        }
-    }
-     // 4. Handle other potential collection types (add specific checks if needed)
-     //    Attempting generic sequence removal if API matches
-     else if (typeof arr.get === 'function' && typeof arr.delete === 'function' && typeof arr.size === 'number') {
-         console.warn(`    Path "${path}": Attempting removal in map-like sequence for "${idToRemove}". Logic assumes sequence behavior.`);
-          // Iterate backwards assuming sequence-like indexing
-          // Note: .size might not reflect indices directly if keys aren't 0..N-1
-          // This part is heuristic and might fail depending on the actual object type.
-          // A more robust solution would require knowing the exact type or structure.
-          // We'll iterate based on presumed indices up to size - 1 if possible,
-          // but a safer approach might be needed. Let's stick to the known .items.length if available,
-          // otherwise this branch might be unreliable for removal.
-          // *Correction*: The original logic checked arr.items.length. If that's not present, iterating
-          // based on .size for deletion by index is risky. Let's refine this branch.
-          // *Revision*: If it has get/delete/size but not items, it's less likely a standard sequence.
-          // Maybe iterate keys if possible? Or just log a more specific warning.
-          // Let's keep the warning strong and avoid potentially incorrect deletions.
-         console.warn(`    Path "${path}": Encountered map-like structure with get/delete/size but no 'items' array. Cannot reliably perform indexed removal. Skipping removal for this specific type.`);
-         // Removed the potentially incorrect backwards loop for this case.
-     }
-    // 5. Log if type is unsupported
-    else {
-        console.warn(`    Skipping removal for path "${path}": Unsupported collection type or structure for removal. Type: ${typeof arr}`, arr);
-        return;
-    }
-
-    // Optional: Log if no changes were made
-    // if (!removed) {
-    //     console.log(`    No instances of "${idToRemove}" found to remove in ${path}`);
-    // }
-}
-/**
- * Removes all known references to a data asset ID from relevant arrays/sequences
- * throughout the Threagile model.
- * Handles technical assets (processed/stored data), top-level communication links (sent/received data),
- * and nested communication links (sent/received data). Modifies the model IN PLACE.
- * NOTE: Does not currently modify risk_tracking entries.
+ * Removes a data asset ID from the processed/stored lists of the technical assets and the
+ * sent/received lists of their communication links. Only the references are visited, looked up
+ * in the model store's reverse index; the items are deleted through the Document API.
+ * Risk tracking entries are kept.
  *
- * @param {object} model - The parsed Threagile model object (likely a YAML Document or YAMLMap).
- * @param {string} idToRemove - The data asset ID to remove from arrays/sequences.
+ * @param {YAML.Document} model - The Threagile model Document.
+ * @param {string} idToRemove - The data asset ID to remove.
  */
 function removeReferences(model, idToRemove) {
-    console.log(`>>> Starting reference removal for Data Asset ID: ${idToRemove}`);
-
-    // Helper to check if a value is a YAML Sequence or JS Array we can work with
-    const isProcessableArray = (val) => {
-        // Check for standard JS Array
-        if (Array.isArray(val)) {
-            return true;
-        }
-        // Check for eemeli/yaml Sequence (needs .get and .delete)
-        if (val && typeof val.get === 'function' && typeof val.delete === 'function' && Array.isArray(val.items)) {
-            return true;
-        }
-        return false;
-    };
-
-    // --- 1. Process Technical Assets ---
-    if (model.has("technical_assets")) {
-        const techAssetsYAML = model.get("technical_assets"); // Get the YAMLMap/Object
-
-        // Check if it's iterable (might be null or not the expected type)
-        if (techAssetsYAML && typeof techAssetsYAML.toJSON === 'function') {
-            const techAssetsJS = techAssetsYAML.toJSON(); // Convert to plain JS for iteration keys
-
-            Object.keys(techAssetsJS).forEach(assetKey => { // Iterate using keys from JS version
-                console.log(`  Checking Technical Asset: [${assetKey}] for removal of "${idToRemove}"`);
-                const assetYAML = techAssetsYAML.get(assetKey); // <<< Get the ORIGINAL YAML object for this asset
-
-                if (!assetYAML) {
-                     console.warn(`    Skipping asset [${assetKey}]: Could not retrieve original YAML object.`);
-                     return; // Continue to next asset key
-                }
-
-                // 1a. Check data processed/stored (pass the original YAML sequence/array)
-                if (assetYAML.has("data_assets_processed")) {
-                    const processedSeq = assetYAML.get("data_assets_processed");
-                    if (isProcessableArray(processedSeq)) {
-                        // Use removeIdFromArray instead of updateIdInArray
-                        removeIdFromArray(processedSeq, idToRemove, `technical_assets[${assetKey}].data_assets_processed`);
-                    } else if (processedSeq) {
-                        console.warn(`    Skipping removal in technical_assets[${assetKey}].data_assets_processed: Not a processable array/sequence.`);
-                    }
-                }
-                if (assetYAML.has("data_assets_stored")) {
-                     const storedSeq = assetYAML.get("data_assets_stored");
-                     if (isProcessableArray(storedSeq)) {
-                         // Use removeIdFromArray instead of updateIdInArray
-                         removeIdFromArray(storedSeq, idToRemove, `technical_assets[${assetKey}].data_assets_stored`);
-                     } else if (storedSeq) {
-                        console.warn(`    Skipping removal in technical_assets[${assetKey}].data_assets_stored: Not a processable array/sequence.`);
-                     }
-                }
-
-                // 1b. Check nested communication links
-                if (assetYAML.has("communication_links")) {
-                    const nestedCommLinksYAML = assetYAML.get("communication_links"); // Original YAML Map/Object for links
-
-                    if (nestedCommLinksYAML && typeof nestedCommLinksYAML.toJSON === 'function') {
-                        const nestedCommLinksJS = nestedCommLinksYAML.toJSON(); // JS version for keys
-                         console.log(`    Checking Nested Communication Links within [${assetKey}] for removal of "${idToRemove}"...`);
-
-                        Object.keys(nestedCommLinksJS).forEach(linkKey => {
-                             console.log(`      Checking Nested Link: [${linkKey}]`);
-                             const linkYAML = nestedCommLinksYAML.get(linkKey); // <<< Get ORIGINAL YAML Link object
-
-                             if (!linkYAML) {
-                                console.warn(`      Skipping nested link [${linkKey}]: Could not retrieve original YAML object.`);
-                                return; // Continue to next link key
-                             }
-
-                             if (linkYAML.has("data_assets_sent")) {
-                                 const sentSeq = linkYAML.get("data_assets_sent");
-                                 if (isProcessableArray(sentSeq)) {
-                                     // Use removeIdFromArray
-                                     removeIdFromArray(sentSeq, idToRemove, `technical_assets[${assetKey}].communication_links[${linkKey}].data_assets_sent`);
-                                 } else if (sentSeq) {
-                                    console.warn(`      Skipping removal in ...communication_links[${linkKey}].data_assets_sent: Not a processable array/sequence.`);
-                                 }
-                             }
-                             if (linkYAML.has("data_assets_received")) {
-                                 const receivedSeq = linkYAML.get("data_assets_received");
-                                  if (isProcessableArray(receivedSeq)) {
-                                     // Use removeIdFromArray
-                                     removeIdFromArray(receivedSeq, idToRemove, `technical_assets[${assetKey}].communication_links[${linkKey}].data_assets_received`);
-                                  } else if (receivedSeq) {
-                                     console.warn(`      Skipping removal in ...communication_links[${linkKey}].data_assets_received: Not a processable array/sequence.`);
-                                  }
-                             }
-                        });
-                    }
-                }
-            });
-        } else {
-             console.warn(`Could not iterate over 'technical_assets' for removal: Not a recognized YAML collection or is null.`);
-        }
-    } else {
-        console.log("  No 'technical_assets' section found, skipping removal within.");
-    }
-
-    // --- 2. Process TOP-LEVEL Communication Links ---
-    if (model.has("communication_links")) {
-        const topLevelCommLinksYAML = model.get("communication_links"); // YAML Map/Object
-
-        if (topLevelCommLinksYAML && typeof topLevelCommLinksYAML.toJSON === 'function') {
-             const topLevelCommLinksJS = topLevelCommLinksYAML.toJSON(); // JS version for keys
-             console.log(`  Checking Top-Level Communication Links for removal of "${idToRemove}"...`);
-
-             Object.keys(topLevelCommLinksJS).forEach(linkKey => {
-                 console.log(`    Checking Top-Level Link: [${linkKey}]`);
-                 const linkYAML = topLevelCommLinksYAML.get(linkKey); // <<< Get ORIGINAL YAML Link object
-
-                  if (!linkYAML) {
-                    console.warn(`    Skipping top-level link [${linkKey}]: Could not retrieve original YAML object.`);
-                    return; // Continue to next link key
-                  }
-
-                 if (linkYAML.has("data_assets_sent")) {
-                     const sentSeq = linkYAML.get("data_assets_sent");
-                     if (isProcessableArray(sentSeq)) {
-                         // Use removeIdFromArray
-                         removeIdFromArray(sentSeq, idToRemove, `communication_links[${linkKey}].data_assets_sent`);
-                     } else if (sentSeq) {
-                        console.warn(`    Skipping removal in communication_links[${linkKey}].data_assets_sent: Not a processable array/sequence.`);
-                     }
-                 }
-                 if (linkYAML.has("data_assets_received")) {
-                      const receivedSeq = linkYAML.get("data_assets_received");
-                      if (isProcessableArray(receivedSeq)) {
-                         // Use removeIdFromArray
-                         removeIdFromArray(receivedSeq, idToRemove, `communication_links[${linkKey}].data_assets_received`);
-                      } else if (receivedSeq) {
-                         console.warn(`    Skipping removal in communication_links[${linkKey}].data_assets_received: Not a processable array/sequence.`);
-                      }
-                 }
-             });
-        } else {
-             console.warn(`Could not iterate over 'communication_links' for removal: Not a recognized YAML collection or is null.`);
-        }
-    } else {
-        console.log("  No top-level 'communication_links' section found, skipping removal within.");
-    }
-
-    // --- 3. Process Risk Tracking ---
-    if (model.has("risk_tracking")) {
-        console.log(`  Checking 'risk_tracking': Removal logic for risk keys containing "${idToRemove}" is NOT IMPLEMENTED.`);
-        // NOTE: Removing items from risk_tracking might require different logic,
-        // e.g., removing entire key-value pairs if the key contains the ID.
-        // This is more complex than removing an ID from a list of strings.
-        // const riskTrackingYAML = model.get("risk_tracking");
-        // if (riskTrackingYAML && typeof riskTrackingYAML.toJSON === 'function') {
-        //     // Implement logic here if needed, e.g., iterate keys and check if idToRemove is part of the key string.
-        //     // Be careful: Removing items from a map while iterating requires care.
-        // }
-    } else {
-        console.log("  No 'risk_tracking' section found.");
-    }
-
-    console.log(`>>> Reference removal finished for ID: ${idToRemove}`);
+    const removed = modelStoreOf(model).removeId("data_assets", idToRemove);
+    console.log(`Removed ${removed.length} references to data asset ${idToRemove}`);
 }
   var ui = this.editorUi;
   var editor = ui.editor;
@@ -2083,7 +1404,7 @@ if (
     typeof this.editorUi.editor.graph.model.threagile.getIn(["data_assets"]) !==
       "undefined"
   ) {
-    let data_assets_map = graph.model.threagile.getIn(["data_assets"]).toJSON();
+    let store = modelStoreOf(graph.model.threagile);
 
     function interpolateColorForRisks(minColor, maxColor, minVal, maxVal, val) {
       function interpolate(start, end, step) {
@@ -2149,11 +1470,14 @@ if (
     const highRiskColor = [255, 0, 0]; // Red
     
 
-    Object.entries(data_assets_map).forEach(([property, value]) => {
+    store.keys("data_assets").forEach((property) => {
+      let value = store.entry("data_assets", property);
       let data_asset = this.editorUi.editor.graph.model.threagile.getIn(["data_assets", property]);
         
         
-        var clonedMenu = this.addDataMenu(this.createPanel(), property);
+        // The menu of a data asset is only built when it is first expanded, a long list of
+        // data assets creates just the headers
+        var clonedMenu = this.createPanel();
         let orginalProperty = property; 
         property = property +":";
         clonedMenu.id = property;
@@ -2163,7 +1487,6 @@ if (
         listItem.style.padding = "8px";
         listItem.style.borderBottom = "1px solid #ccc";
         listItem.dataset.visible = "false"; 
-        var parentNode = clonedMenu.childNodes[0];
         let riskScore = 0;
         console.log(value.quantity);
 
@@ -2180,6 +1503,9 @@ if (
           riskScore += mapRiskLevel(value.integrity, 'integrity');
         if(value.availability!== undefined)
           riskScore *= mapRiskLevel(value.availability, 'availability');
+        let fillMenu = () => {
+        this.addDataMenu(clonedMenu, orginalProperty);
+        var parentNode = clonedMenu.childNodes[0];
         for (var key in value) {
           if (value.hasOwnProperty(key)) {
             var childNode = value[key];
@@ -2223,6 +1549,7 @@ if (
             }
           }
         }
+        };
         var textContainer = document.createElement("div");
         textContainer.style.display = "flex";
         textContainer.style.alignItems = "center";
@@ -2259,7 +1586,7 @@ if (
             const uiListItem = xButton.parentNode.parentNode; // The <li> or equivalent UI element
             const uiList = uiListItem.parentNode; // The <ul> or equivalent UI element
             const model = graph.model; // Get the Threagile model object
-            const dataAssetIdToDeleteID = model.threagile.getIn(["data_assets",dataAssetKeyToDelete],true).toJSON().id;
+            const dataAssetIdToDeleteID = modelStoreOf(model.threagile).idOf("data_assets", dataAssetKeyToDelete);
             if (!model || !model.threagile) { // Ensure model and its data exist
                 console.error("Threagile model data not found!");
                 Swal.fire({
@@ -2272,12 +1599,12 @@ if (
 
             // --- 2. Find Direct Dependencies (Simplified: Data Assets using '<<') ---
             const dependents = [];
-            const dataAssets = model.threagile.toJSON().data_assets || {}; // Access data within the model structure
+            const dataAssetStore = modelStoreOf(model.threagile); // Entries are converted one by one, not the whole model
 
-            for (const assetId in dataAssets) {
+            for (const assetId of dataAssetStore.keys("data_assets")) {
                 if (assetId === dataAssetKeyToDelete) continue; // Skip self
 
-                const asset = dataAssets[assetId];
+                const asset = dataAssetStore.entry("data_assets", assetId);
                 // Check for '<<' anchor reference (string or object format)
                 if (asset && asset['<<']) {
                     let referencedId = '';
@@ -2522,6 +1849,10 @@ if (
               arrowIcon.style.transform = "rotate(270deg)";
               xButton.style.display = "inline-block";
               clonedMenu.style.display = "block";
+              if (fillMenu != null) {
+                fillMenu();
+                fillMenu = null;
+              }
           } else {
             listItem.style.backgroundColor = initialColor;
             listItem.dataset.initialColor = initialColor;
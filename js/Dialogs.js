@@ -1232,8 +1232,10 @@ function keysToLower(obj) {
   }, {});
 }
 function exportToYaml(graph, full) {
-
- return graph.model.threagile.toString();
+  // The diagram is saved with the model, so reopening it needs no new layout
+  let doc = graph.model.threagile.clone();
+  doc.set(window.diagramGeometrySection, collectDiagramGeometry(graph, doc));
+  return doc.toString();
 }
 /**
  * Remembers last value for border.
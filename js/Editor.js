@@ -1,327 +1,48 @@
-/*
- *
- *We need to restome something in the cell too, the thing that is saved in the cell 
- We need a test that checks if after restoration, there is no error !
- * */
-class DeleteElementCommand {
-    /**
-     * @param {object} threagile - The Threagile model object (expecting .getIn, .setIn, .deleteIn methods)
-     * @param {object} asset - The original asset object being deleted.
-     * @param {(string|number)[]} path - The path array to the asset within the model.
-     * @param {string} assetType - Type like "TrustBoundary", "TechnicalAsset", "CommunicationLink".
-     */
-    constructor(mxObjectId,cellid, threagile, asset, path, assetType, assetInformation,graph,  batchId = null) {
-        this.mxObjectId = mxObjectId;
-        this.cellid = cellid;
-        this.threagile = threagile;
-        this.graph = graph;
-        // Deep copy the asset to preserve its state at the time of deletion for undo
-        // Ensure asset is not null/undefined before stringify/parse
-        this.asset = asset ? JSON.parse(JSON.stringify(asset)) : null;
-        this.path = path; // Assuming path is already an array like ['technical_assets', 'asset-id']
-        this.assetType = assetType;
-        this.references = []; // Stores paths where this asset's ID was referenced (for TechnicalAsset)
-        this.assetId = null; // Store the ID specifically for TechnicalAsset restoration
-        this.batchId = batchId;
-        this.assetInformation = assetInformation;
-        // Pre-calculate asset ID if it's a technical asset being deleted
-        if (this.assetType === "TechnicalAsset" && this.asset && this.asset.id) {
-             this.assetId = this.asset.id;
-        } else if (this.assetType === "TechnicalAsset") {
-            console.warn("Cannot determine ID for Technical Asset being deleted. Reference restoration during undo might fail.", this.path, this.asset);
-        }
-
-        console.log(`Command created: Delete ${this.assetType} at path:`, this.path);
-        // console.log("Asset data snapshot:", JSON.stringify(this.asset, null, 2)); // Debugging
-    }
-
-    execute() {
-        console.log(`Executing delete for ${this.assetType} at path:`, this.path);
-
-        if (!this.threagile || typeof this.threagile.deleteIn !== 'function') {
-            console.error("Threagile object or deleteIn method is missing!");
-            return; // Cannot proceed
-        }
-        if (!this.path || this.path.length === 0) {
-            console.error("Invalid path provided for deletion.");
-            return;
-        }
-
-        try {
-            // For Technical Assets, find where they are referenced BEFORE deleting
-            if (this.assetType === "TechnicalAsset" && this.assetId) {
-                console.log(`Finding references for Technical Asset ID: ${this.assetId}`);
-                // We use this.assetId which was captured in the constructor
-                this.references = findIdInTrustBoundaryAssets(this.threagile, this.assetId);
-                console.log(`Found ${this.references.length} references to restore on undo:`, this.references);
-            } else if (this.assetType === "TechnicalAsset" && !this.assetId) {
-                 console.warn("Skipping reference finding because asset ID was not available.");
-            }
-
-            // Perform the deletion
-            if(this.asset){
-                this.threagile.deleteIn(this.path);
-            }
-            console.log(`Successfully deleted element at path:`, this.path);
-
-        } catch (error) {
-            console.error(`Error during command execution (deleteIn) for path [${this.path.join(', ')}]:`, error);
-            // Depending on requirements, you might want to re-throw or handle differently
-        }
-    }
-
-    undo() {
-        console.log(`Undoing delete for ${this.assetType} at path:`, this.path);
-
-        if (!this.threagile || typeof this.threagile.setIn !== 'function') {
-            console.error("Threagile object or setIn method is missing! Cannot undo.");
-            return; // Cannot proceed
-        }
-         if (!this.path || this.path.length === 0) {
-            console.error("Invalid path provided for undo.");
-            return;
-        }
-        if (this.asset) {
-       
-
-
-        try {
-            // Step 1: Restore the main asset itself
-            console.log("Restoring main asset object:", JSON.stringify(this.asset)); // Debugging
-            const assetNode = this.threagile.createNode(this.asset);
-            this.threagile.setIn(this.path, assetNode);
-            console.log(`Restored main ${this.assetType} object at path:`, this.path);
-
-            // Step 2: If it was a Technical Asset, restore its references in trust boundaries
-            if (this.assetType === "TechnicalAsset") {
-                if (!this.assetId) {
-                    console.warn("Cannot restore references: Original Technical Asset ID was not stored.");
-                } else if (this.references && this.references.length > 0) {
-                    console.log(`Restoring ${this.references.length} references for ID: ${this.assetId}`);
-                    const assetIdToAdd = assetNode.toJSON().id; // Get the ID once
-
-                    this.references.forEach(refPathString => {
-                        let parsedRefPath; // Define for scope
-                        try {
-                            parsedRefPath = parsePathString(refPathString);
-
-                             // Ensure path is valid and has enough parts (parent + element index/key)
-                            if (parsedRefPath && parsedRefPath.length > 1) {
-
-                                // --- Correctly identify the target array path ---
-                                const pathToArray = parsedRefPath.slice(0, -1); // Path to the array itself
-
-                                console.log(`  Attempting to add/ensure ID ${assetIdToAdd} in collection at path: ${JSON.stringify(pathToArray)} (derived from: ${refPathString})`);
-
-                                try {
-                                    // --- Try to get the existing array node ---
-                                    // Use 'true' to get the node itself for manipulation/checking type
-                                    const arrayNode = this.threagile.getIn(pathToArray, true);
-
-                                    if (YAML.isSeq(arrayNode)) {
-                                        // --- Case 1: Array exists and is a sequence ---
-                                        console.log(`    Collection exists. Checking if ID ${assetIdToAdd} is present.`);
-                                        // Check if ID already exists to prevent duplicates (optional but recommended)
-                                        const alreadyExists = arrayNode.items.some(item => {
-                                           const itemValue = (item && item.constructor?.name === 'Scalar') ? item.value : item; // Handle Scalar nodes
-                                           return itemValue === assetIdToAdd;
-                                        });
-
-                                        if (!alreadyExists) {
-                                            console.log(`    Adding ID ${assetIdToAdd}.`);
-                                            arrayNode.add(assetIdToAdd); // Use node's add method
-                                            console.log(`    -> Successfully added ID.`);
-                                        } else {
-                                             console.log(`    ID ${assetIdToAdd} is already present. No action needed.`);
-                                             console.log(`    -> Reference effectively restored (already present).`);
-                                        }
-                                    } else {
-                                        // --- Case 2: Path exists but it's NOT a sequence ---
-                                        // (e.g., null, scalar, map). Overwrite it with a new array.
-                                        console.warn(`    Path ${JSON.stringify(pathToArray)} exists but is not a sequence. Overwriting with new array containing ID ${assetIdToAdd}.`);
-                                        this.threagile.setIn(pathToArray, [assetIdToAdd]); // Use setIn to replace/create
-                                        console.log(`    -> Successfully restored reference by creating/overwriting array.`);
-                                    }
-                                } catch (getError) {
-                                     // Check if error is because path doesn't exist (common reason for getIn failure)
-                                     // Note: Error types/messages might vary, this is a guess
-                                     const pathNotFound = getError.message.includes('Cannot'); // Basic check, adjust if needed
-
-                                    if (pathNotFound) {
-                                      // --- Case 3: getIn failed - Path likely doesn't exist ---
-                                      // Assume we need to create the array structure.
-                                      console.log(`    Collection or parent path does not exist. Creating array at ${JSON.stringify(pathToArray)} with ID ${assetIdToAdd}.`);
-                                      // Use setIn to create the array (and any missing parent maps)
-                                      this.threagile.setIn(pathToArray, [assetIdToAdd]);
-                                      console.log(`    -> Successfully restored reference by creating array.`);
-                                    } else {
-                                       // Different error during getIn, re-throw or handle differently
-                                       console.error(`    Unexpected error getting node at ${JSON.stringify(pathToArray)}:`, getError);
-                                       throw getError; // Re-throw if unexpected
-                                    }
-                                }
-
-                            } else {
-                                console.warn(`  Could not parse reference path string effectively: "${refPathString}"`);
-                            }
-                        } catch (outerError) { // Catch errors from parsePathString or re-thrown errors
-                            console.error(`  Error processing reference restoration for path "${refPathString}":`, outerError);
-                            // Decide if you want to stop or continue with other references
-                        }
-                    }); // End forEach reference
-
-                    console.log("Finished restoring references.");
-                } else {
-                    console.log("No references needed restoration for this Technical Asset.");
-                }
-            }
-
-             console.log(`Successfully undone deletion for ${this.assetType} at path:`, this.path);
-
-        } catch (error) {
-            console.error(`Error during command undo (setIn) for path [${this.path.join(', ')}]:`, error);
-            // Consider cleanup or state reset if undo fails partially
-        }
-         }
-        // Writing to the cell
-        let cell = this.graph.model.getCell(this.cellid);
-        if (this.assetType === "TechnicalAsset"){
-            cell.technicalAsset =this.assetInformation;  
-        }else if(this.assetType === "CommunicationAsset"){
-            cell.communicationAssetKey = this.assetInformation;
-            cell.commnunicationAsset = this.threagile.getIn(this.path);
-        }else if(this.assetType === "trust_boundaries") {
-            cell.trust_boundarieskey = this.assetInformation;
-        }
-
-    }
+// Rough memory cost of a YAML node or map pair kept for undo, counted in YAML nodes
+function retainedNodeCount(node) {
+  let count = 0;
+  if (YAML.isNode(node) || YAML.isPair(node)) {
+    YAML.visit(node, () => { count++; });
+  }
+  return count;
 }
-class UndoRedoManager {
-    constructor() {
-        this.undoStack = [];
-        this.redoStack = [];
-    }
-
-    executeCommand(command) {
-        command.execute(); // Apply the change
-        this.undoStack.push(command);
-        // Clear the redo stack whenever a new command is executed
-        this.redoStack = [];
-        // Optionally: Update UI state (enable/disable undo/redo buttons)
-        this.updateUIState();
-    }
 
-    // *** UNDO METHOD WITH BATCH LOOP ***
-    undo() {
-        if (this.undoStack.length === 0) {
-            Logger.log("Undo stack empty.");
-            return;
-        }
-
-        // Look at the command on top WITHOUT removing it yet
-        const topCommand = this.undoStack[this.undoStack.length - 1];
-        const targetBatchId = topCommand.batchId; // Get the batch ID (can be null)
-
-        const commandsToUndo = [];
-
-        // Check if the top command has a batchId AND if there are potentially more commands
-        if (targetBatchId && this.undoStack.length > 0) {
-             // *** THE LOOP FOR BATCH UNDO ***
-             // Keep popping commands as long as the stack is not empty AND
-             // the batchId matches the targetBatchId we identified.
-             while (this.undoStack.length > 0 && this.undoStack[this.undoStack.length - 1].batchId === targetBatchId) {
-                 commandsToUndo.push(this.undoStack.pop()); // Pop and add to temp list
-             }
-        } else {
-            // Handle single command (either no batchId or only one command left)
-            Logger.log("Performing single undo (no batch ID or last in batch).");
-            commandsToUndo.push(this.undoStack.pop()); // Pop the single command
-        }
-
-        // Now, execute undo() on the popped commands
-        // Undo in reverse order of execution (which is the order they were popped)
-        commandsToUndo.forEach(cmd => {
-            try {
-                cmd.undo();
-            } catch (e) {
-                Logger.error(`Error during undo execution (Batch: ${cmd.batchId}):`, e);
-                // Decide how to handle partial failures - maybe stop? maybe continue?
-            }
-        });
-
-        // Push the undone commands onto the redo stack
-        // Push them in reverse order so the first one executed is on top of redo stack
-        this.redoStack.push(...commandsToUndo.reverse());
-        Logger.log(`Undo complete. Redo stack size: ${this.redoStack.length}`);
-    }
-
-    // *** REDO METHOD WITH BATCH LOOP ***
-    redo() {
-        if (this.redoStack.length === 0) {
-            return;
-        }
-
-        // Look at the command on top of REDO stack WITHOUT removing it yet
-        const topCommand = this.redoStack[this.redoStack.length - 1];
-        const targetBatchId = topCommand.batchId; // Get the batch ID (can be null)
-
-        const commandsToRedo = [];
-
-        // Check if the top command has a batchId AND if there are potentially more commands
-        if (targetBatchId && this.redoStack.length > 0) {
-             // *** THE LOOP FOR BATCH REDO ***
-             // Keep popping commands from REDO stack as long as the stack is not empty AND
-             // the batchId matches the targetBatchId.
-             while (this.redoStack.length > 0 && this.redoStack[this.redoStack.length - 1].batchId === targetBatchId) {
-                 commandsToRedo.push(this.redoStack.pop()); // Pop and add to temp list
-             }
-        } else {
-            // Handle single command
-            commandsToRedo.push(this.redoStack.pop()); // Pop the single command
-        }
-
-        // Now, execute redo() on the popped commands
-        // Redo in the order they were originally executed (reverse of how they were popped from redo)
-        commandsToRedo.reverse().forEach(cmd => {
-            try {
-                cmd.redo(); // Or cmd.execute() if redo is just execute
-            } catch (e) {
-                Logger.error(`Error during redo execution (Batch: ${cmd.batchId}):`, e);
-                // Decide how to handle partial failures
-            }
-        });
-
-        // Push the redone commands back onto the undo stack
-        // Push them in the order they were redone (which is original execution order)
-        this.undoStack.push(...commandsToRedo);
-        Logger.log(`Redo complete. Undo stack size: ${this.undoStack.length}`);
-    }
-
-    canUndo() {
-        return this.undoStack.length > 0;
-    }
-
-    canRedo() {
-        return this.redoStack.length > 0;
-    }
-
-    updateUIState() {
-        // Logic to enable/disable undo/redo buttons in your UI
-        console.log(`Undo possible: ${this.canUndo()}, Redo possible: ${this.canRedo()}`);
-        // Example: document.getElementById('undoButton').disabled = !this.canUndo();
-        // Example: document.getElementById('redoButton').disabled = !this.canRedo();
-    }
-
-     clearHistory() {
-        this.undoStack = [];
-        this.redoStack = [];
-        this.updateUIState();
-    }
+/**
+ * A batch of Threagile model edits as a graph model change. It holds the inverse of each edit (see
+ * trackThreagileEdits in Utils.js) and, like the mxGraph changes, swaps them for their own inverses
+ * when executed, so the same change undoes and redoes. Added to the graph's undoable edits by
+ * Editor.logThreagileEdits.
+ */
+function ThreagileChange(editor, doc, edits) {
+  this.editor = editor;
+  this.doc = doc;
+  this.edits = [];
+  this.retainedNodes = 0; // YAML nodes the inverses keep, e.g. removed assets; see maxRetainedNodes
+  (edits || []).forEach(edit => this.add(edit));
 }
 
-// Instantiate your manager
-
+ThreagileChange.prototype.add = function (edit) {
+  this.edits.push(edit);
+  this.retainedNodes += retainedNodeCount(edit.node);
+};
 
+ThreagileChange.prototype.execute = function () {
+  if (this.editor.graph.model.threagile !== this.doc) {
+    console.warn("Skipping Threagile changes of a model that is no longer loaded.");
+    return;
+  }
+  let edits = this.edits;
+  this.edits = [];
+  this.retainedNodes = 0;
+  this.doc.replayingThreagileChange = this;
+  try {
+    for (let i = edits.length - 1; i >= 0; i--) {
+      window.applyThreagileEdit(this.doc, edits[i]);
+    }
+  } finally {
+    this.doc.replayingThreagileChange = null;
+  }
+};
 
 /**
  * Copyright (c) 2006-2012, JGraph Ltd
@@ -330,14 +51,12 @@ class UndoRedoManager {
  * Editor constructor executed on page load.
  */
 Editor = function (chromeless, themes, model, graph, editable) {
-  undoManagerThreat = new UndoRedoManager();
-
   mxEventSource.call(this);
   this.chromeless = chromeless != null ? chromeless : this.chromeless;
   this.initStencilRegistry();
   this.graph = graph || this.createGraph(themes, model);
   this.editable = editable != null ? editable : !chromeless;
-  this.undoManager = this.createUndoManager(undoManagerThreat);
+  this.undoManager = this.createUndoManager();
   this.status = "";
   this.getOrCreateFilename = function () {
     return (
@@ -485,58 +204,39 @@ Editor = function (chromeless, themes, model, graph, editable) {
 
 
     let self = this;
+    // Fired inside the graph's update, so the model edits are undone and redone with the removed cells
     this.graph.addListener(mxEvent.REMOVE_CELLS, function(sender, evt) {
-
-        let graph = self.graph;
-           const currentBatchId = `batch-${Date.now()}-${Math.random().toString(36).substring(2, 7)}`;
-            evt.properties.cells.forEach(cell => {
-		    let cellType;
-		    let asset;
-		    let path; 
-            let assetInformation;
-			if (cell.trust_boundarieskey){
-				cellType="TrustBoundary";
-				path = ["trust_boundaries"]
-                assetInformation=cell.trust_boundarieskey;
-                path.push( cell.trust_boundarieskey);
-				asset = self.graph.getModel().threagile.getIn(path,true); 
-			}else if(cell.technicalAsset && cell.technicalAsset.key){
-				cellType = "TechnicalAsset";
-				path = ["technical_assets"]
-                path.push(cell.technicalAsset.key);
-                assetInformation=JSON.parse(JSON.stringify(cell.technicalAsset));
-				asset = self.graph.getModel().threagile.getIn(path,true); 
-			}else if(cell.communicationAsset){
-				// Here is some logic missing which copies the cellKey and cellid I think
-				cellType = "CommunicationAsset";
-			    path = ['technical_assets', cell.source.technicalAsset.key, 'communication_links',cell.communicationAssetKey];
-				asset = self.graph.getModel().threagile.getIn(path,true); 
-                assetInformation=cell.communicationAssetKey;
-			}else{
-				console.log("Not a regular threat asset");
-			}
-
-                if (cellType) {
-                const command = new DeleteElementCommand(
-                    cell.mxObjectId,
-                    cell.id, 
-                    self.graph.getModel().threagile,
-                    asset, 
-                    path,
-                    cellType,
-                    assetInformation,
-                    self.graph,
-                    currentBatchId
-                );
-                    undoManagerThreat.executeCommand(command);
-                } else {
-                    console.warn(`No Threagile data found for deleted cell ${cell.id}`);
+        let threagile = self.graph.getModel().threagile;
+        if (!threagile) {
+            return;
+        }
+        evt.properties.cells.forEach(cell => {
+            let path;
+            if (cell.trust_boundarieskey) {
+                path = ["trust_boundaries", cell.trust_boundarieskey];
+            } else if (cell.technicalAsset && cell.technicalAsset.key) {
+                path = ["technical_assets", cell.technicalAsset.key];
+                // Only the trust boundaries and shared runtimes listing it are visited
+                let id = threagile.getIn([...path, "id"]);
+                if (id) {
+                    modelStoreOf(threagile).removeId("technical_assets", id);
+                }
+            } else if (cell.communicationAsset) {
+                path = ["technical_assets", cell.source.technicalAsset.key, "communication_links", cell.communicationAssetKey];
+            } else {
+                console.log("Not a regular threat asset");
+                return;
+            }
+            try {
+                // The link is gone already if its source asset was removed before it
+                if (threagile.hasIn(path)) {
+                    threagile.deleteIn(path);
                 }
-            });
+            } catch (error) {
+                console.error(`Error deleting [${path.join(', ')}] for cell ${cell.id}:`, error);
+            }
         });
-
-
-
+    });
 };
 
 /**
@@ -1137,7 +837,7 @@ Editor.prototype.setFilename = function (value) {
 /**
  * Creates and returns a new undo manager.
  */
-Editor.prototype.createUndoManager = function (undoRedoManagerThreat) {
+Editor.prototype.createUndoManager = function () {
   var graph = this.graph;
   var undoMgr = new mxUndoManager();
 
@@ -1157,12 +857,6 @@ Editor.prototype.createUndoManager = function (undoRedoManagerThreat) {
   var undoHandler = function (sender, evt) {
     var eventName = evt.name; // Get the name of the event ("undo" or "redo")
 
-    if (eventName === mxEvent.UNDO) {
-       undoRedoManagerThreat.undo();
-
-    } else if (eventName === mxEvent.REDO) {
-        console.log("Processing REDO event in undoHandler...");
-    }
     var cand = graph.getSelectionCellsForChanges(
       evt.getProperty("edit").changes,
       function (change) {
@@ -1195,9 +889,97 @@ Editor.prototype.createUndoManager = function (undoRedoManagerThreat) {
   undoMgr.addListener(mxEvent.UNDO, undoHandler);
   undoMgr.addListener(mxEvent.REDO, undoHandler);
 
+  // Besides the entry count (size), the history is bounded by the YAML nodes its Threagile changes
+  // keep for undo, e.g. deleted assets; the oldest entries are dropped first, the newest is always kept
+  var retainedNodesOf = function (edit) {
+    var count = 0;
+    var changes = edit.changes || [];
+    for (var i = 0; i < changes.length; i++) {
+      if (changes[i] instanceof ThreagileChange) {
+        count += changes[i].retainedNodes;
+      }
+    }
+    return count;
+  };
+  undoMgr.maxRetainedNodes = 200000;
+  undoMgr.retainedNodeCount = function () {
+    return this.history.reduce(function (count, edit) {
+      return count + retainedNodesOf(edit);
+    }, 0);
+  };
+  undoMgr.trimRetainedNodes = function () {
+    var count = this.retainedNodeCount();
+    while (count > this.maxRetainedNodes && this.indexOfNextAdd > 1) {
+      var edit = this.history.shift();
+      this.indexOfNextAdd--;
+      count -= retainedNodesOf(edit);
+      edit.die();
+    }
+  };
+  undoMgr.addListener(mxEvent.ADD, function () {
+    undoMgr.trimRetainedNodes();
+  });
+
+  // Moves to the state after the given number of history entries, undoing or redoing only the entries in between
+  undoMgr.jumpTo = function (index) {
+    index = Math.max(0, Math.min(index, this.history.length));
+    if (this.indexOfNextAdd > index) {
+      while (this.indexOfNextAdd > index) {
+        this.undo();
+      }
+    } else {
+      while (this.indexOfNextAdd < index) {
+        this.redo();
+      }
+    }
+  };
+
   return undoMgr;
 };
 
+/**
+ * Makes the edits of a Threagile model Document part of the graph's history. Edits made while the
+ * graph model is being updated join that undoable edit, so e.g. deleting cells and the assets behind
+ * them is undone in one step; edits made outside an update (the format panels) become an undoable
+ * edit of their own, one per task. Undo, the modified state and the engine's edit batches all follow
+ * the same recorded edits; nothing is copied.
+ */
+Editor.prototype.logThreagileEdits = function (doc) {
+  var editor = this;
+  var model = this.graph.getModel();
+  var pendingChange = null; // Change of the edits made outside an update in the current task
+
+  window.trackThreagileEdits(doc);
+  doc.threagileEditListener = function (inverse) {
+    if (doc.replayingThreagileChange) {
+      // Undone or redone, the inverse is what the change does next time
+      doc.replayingThreagileChange.add(inverse);
+    } else if (model.updateLevel > 0) {
+      var changes = model.currentEdit.changes;
+      var last = changes[changes.length - 1];
+      if (last instanceof ThreagileChange && last.doc === doc) {
+        last.add(inverse);
+      } else {
+        model.currentEdit.add(new ThreagileChange(editor, doc, [inverse]));
+      }
+    } else {
+      if (pendingChange == null) {
+        pendingChange = new ThreagileChange(editor, doc, []);
+        var edit = model.createUndoableEdit();
+        edit.add(pendingChange);
+        // Not fired as a model change, the panel making the edit refreshes itself
+        editor.undoManager.undoableEditHappened(edit);
+        editor.setModified(true);
+        Promise.resolve().then(function () {
+          pendingChange = null;
+        });
+      }
+      pendingChange.add(inverse);
+      editor.undoManager.trimRetainedNodes();
+    }
+  };
+};
+
 /**
  * Adds basic stencil set (no namespace).
  */
@@ -3558,145 +3340,3 @@ Editor.prototype.findThreagileElementForCell = function(cell) {
     }
     return elementInfo;
 };
-/**
- * Finds all locations (paths) where a specific technical asset ID is referenced
- * within the 'technical_assets_inside' list of any trust boundary.
- * Assumes the input model uses YAML library objects (like YAMLMap, YAMLSequence).
- *
- * @param {object} model - The parsed Threagile model object (likely a YAML Document or YAMLMap).
- * @param {string} idToFind - The technical asset ID to search for within the trust boundaries.
- * @returns {string[]} An array of path strings indicating where the idToFind was found.
- *                     Example path: "trust_boundaries[Web DMZ].technical_assets_inside[1]"
- */
-function findIdInTrustBoundaryAssets(model, idToFind) {
-    console.log(`>>> Starting search for Asset ID '${idToFind}' within trust boundary assets...`);
-    const foundPaths = []; // Array to store the paths where the ID is found
-
-    // Helper to check if a value is a YAML Map or Sequence
-    // NOTE: You might need to import Scalar from 'yaml' if not already globally available
-    const isYAMLMap = (val) => val && typeof val.get === 'function';
-    const isYAMLSequence = (val) => val && val.items && Array.isArray(val.items);
-
-    // --- Search within Trust Boundaries ---
-    if (!model || !model.has || !model.has("trust_boundaries")) {
-        console.log("  No 'trust_boundaries' section found in the model.");
-        return foundPaths; // Return empty array early
-    }
-
-    const trustBoundariesYAML = model.get("trust_boundaries");
-
-    if (!isYAMLMap(trustBoundariesYAML)) {
-        console.warn("  'trust_boundaries' section is not a valid YAML map. Cannot search.");
-        return foundPaths; // Return empty array
-    }
-
-    const trustBoundariesJS = trustBoundariesYAML.toJSON(); // Use JS version for easy key iteration
-
-    Object.keys(trustBoundariesJS).forEach(boundaryKey => {
-        // console.log(`  Checking Trust Boundary: [${boundaryKey}]`); // Optional: more verbose logging
-        const boundaryYAML = trustBoundariesYAML.get(boundaryKey);
-
-        if (!isYAMLMap(boundaryYAML)) {
-             console.warn(`    Skipping trust boundary [${boundaryKey}]: Not a valid YAML map.`);
-             return; // Continue to next boundary key
-        }
-
-        // Check specifically for the 'technical_assets_inside' key
-        if (boundaryYAML.has("technical_assets_inside")) {
-            const assetsInsideSeq = boundaryYAML.get("technical_assets_inside", true); // Get node itself
-
-            if (isYAMLSequence(assetsInsideSeq)) {
-                console.log(`    Checking 'technical_assets_inside' list within [${boundaryKey}] for ID: ${idToFind}`);
-
-                // *** Iterate backwards when removing elements ***
-                for (let index = assetsInsideSeq.items.length - 1; index >= 0; index--) {
-                    const item = assetsInsideSeq.items[index];
-                    // item might be a Scalar node, access its value for comparison
-                    // Make sure Scalar is defined/imported if you use instanceof
-                    const itemValue = (item && typeof item.value !== 'undefined' && item.constructor?.name === 'Scalar') ? item.value : item; // Safer check if Scalar isn't imported
-
-                    if (itemValue === idToFind) {
-                        // --- Calculate and store the path BEFORE deletion ---
-                        const fullPath = `trust_boundaries[${boundaryKey}].technical_assets_inside[${index}]`;
-                        console.log(`      FOUND reference to ID '${idToFind}' at path: ${fullPath}. Removing...`);
-                        foundPaths.push(fullPath); // Keep track of the path where it was found
-
-                        // --- Use the delete method on the YAMLSeq node ---
-                        const deleted = assetsInsideSeq.delete(index);
-
-                        if (deleted) {
-                            console.log(`      Successfully removed item originally at index ${index}.`);
-                        } else {
-                            // This should ideally not happen if the index was valid
-                            console.error(`      Failed to remove item at index ${index}.`);
-                        }
-
-                        // If you only want to remove the *first* occurrence you find,
-                        // you could add a 'break;' here after a successful deletion.
-                    }
-                }
-            } else {
-                 console.log(`    'technical_assets_inside' in [${boundaryKey}] is not a sequence.`);
-            }
-        } // <--- THIS CLOSING BRACE WAS MISSING
-
-        // Add any logic here that should happen *after* checking 'technical_assets_inside'
-        // for the current boundary, but before moving to the next boundary.
-
-    }); // End of forEach boundaryKey
-
-    console.log(`>>> Trust boundary asset search finished for '${idToFind}'. Found ${foundPaths.length} occurrences.`);
-    return foundPaths;
-}/**
- * Parses a path string like "a.b[key].c[0]" into an array like ['a', 'b', 'key', 'c', 0].
- * Handles simple dot notation and bracket notation for keys/indices.
- * Converts numeric indices within brackets to numbers.
- *
- * @param {string} pathString The path string to parse.
- * @returns {(string|number)[]} An array of path segments.
- */
-function parsePathString(pathString) {
-    if (!pathString) return [];
-    // Regex to match segments: either non-bracket characters followed by a dot (or end of string),
-    // or characters inside brackets.
-    // Matches ".key", "[key]", "[0]" parts, capturing the content.
-    const segments = [];
-    const regex = /\.([^.[\]]+)|\[([^\]]+)]/g; // Matches .key or [key] or [0]
-    let lastIndex = 0;
-
-    // Handle the first part if it doesn't start with '.' or '['
-    const firstDelimiter = pathString.search(/[.[]/);
-    if (firstDelimiter === 0) {
-        // Path starts with delimiter, handled by loop
-    } else if (firstDelimiter === -1) {
-        // Path is just a single key
-        segments.push(pathString);
-        lastIndex = pathString.length;
-    } else {
-        segments.push(pathString.substring(0, firstDelimiter));
-        lastIndex = firstDelimiter;
-    }
-
-    let match;
-    regex.lastIndex = lastIndex; // Start searching from the correct position
-
-    while ((match = regex.exec(pathString)) !== null) {
-        // match[1] is for .key notation, match[2] is for [key] or [0] notation
-        const segment = match[1] || match[2];
-        // Try converting bracketed segments to numbers if they look numeric
-        if (match[2] && /^\d+$/.test(segment)) {
-            segments.push(parseInt(segment, 10));
-        } else {
-            segments.push(segment);
-        }
-        lastIndex = regex.lastIndex;
-    }
-
-    // Handle potential trailing characters if regex didn't consume everything (less likely with this regex)
-    // if (lastIndex < pathString.length) {
-    //    segments.push(pathString.substring(lastIndex));
-    // }
-
-    return segments;
-}
-
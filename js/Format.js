@@ -1,5 +1,5 @@
 import {BaseFormatPanel} from './BaseFormatPanel.js';
-import {InspectionFormatPanel} from './InspectionFormatPanel.js';
+import {InspectionFormatPanel, addTechnicalAssetOfCell} from './InspectionFormatPanel.js';
 import {BoundaryFormatPanel} from './BoundaryFormatPanel.js';
 import {DiagramFormatPanel} from './DiagramFormatPanel.js';
 import {AssetFormatPanel} from './AssetFormatPanel.js';
@@ -164,7 +164,7 @@ Format.prototype.init = function () {
   };
   this.update = mxUtils.bind(this, function (sender, evt) {
     this.clearSelectionState();
-    this.refresh();
+    this.scheduleRefresh();
   });
 
   graph.getSelectionModel().addListener(mxEvent.CHANGE, this.update);
@@ -174,27 +174,42 @@ Format.prototype.init = function () {
   graph.addListener(
     mxEvent.ROOT,
     mxUtils.bind(this, function () {
-      this.refresh();
+      this.scheduleRefresh();
     })
   );
 
   ui.addListener(
     "styleChanged",
     mxUtils.bind(this, function (sender, evt) {
-      this.refresh();
+      this.scheduleRefresh();
     })
   );
 
   editor.addListener(
     "autosaveChanged",
     mxUtils.bind(this, function () {
-      this.refresh();
+      this.scheduleRefresh();
     })
   );
 
   this.refresh();
 };
 
+/**
+ * Refreshes the panels in the next animation frame. All selection and model changes of a
+ * frame, including the ones the panels make while they are built, result in one refresh.
+ */
+Format.prototype.scheduleRefresh = function () {
+  if (this.refreshFrame == null) {
+    this.refreshFrame = window.requestAnimationFrame(
+      mxUtils.bind(this, function () {
+        this.refreshFrame = null;
+        this.refresh();
+      })
+    );
+  }
+};
+
 /**
  * Returns information about the current selection.
  */
@@ -482,6 +497,12 @@ function isTrustBoundaries(cell) {
  * Adds the label menu items to the given menu and parent.
  */
 Format.prototype.refresh = function () {
+  // A scheduled refresh is covered by this one
+  if (this.refreshFrame != null) {
+    window.cancelAnimationFrame(this.refreshFrame);
+    this.refreshFrame = null;
+  }
+
   // Performance tweak: No refresh needed if not visible
   if (this.container.style.width == "0px") {
     return;
@@ -524,7 +545,8 @@ Format.prototype.refresh = function () {
   var currentLabel = null;
   var currentPanel = null;
 
-  var addClickHandler = mxUtils.bind(this, function (elt, panel, index) {
+  // createPanel builds the panel when its tab is first shown, for panels that are expensive to build
+  var addClickHandler = mxUtils.bind(this, function (elt, panel, index, createPanel) {
     var clickHandler = mxUtils.bind(this, function (evt) {
       var cell = graph.getSelectionCell();
       if (currentLabel != elt) {
@@ -553,6 +575,11 @@ Format.prototype.refresh = function () {
 
           currentPanel = panel;
           currentPanel.style.display = "";
+
+          if (createPanel != null) {
+            this.panels.push(createPanel());
+            createPanel = null;
+          }
         }
       }
     });
@@ -779,6 +806,9 @@ Format.prototype.refresh = function () {
     label3.style.backgroundColor = this.inactiveTabBackgroundColor;
     label4.style.backgroundColor = this.inactiveTabBackgroundColor;
 
+    // The Inspection tab is built on demand, the asset of a new vertex is added here
+    addTechnicalAssetOfCell(graph);
+
     // Style
     if (containsLabel) {
       label4.style.borderLeftWidth = "0px";
@@ -803,7 +833,6 @@ Format.prototype.refresh = function () {
     var textPanel = div.cloneNode(false);
     textPanel.style.display = "none";
     this.container.appendChild(textPanel);
-    this.panels.push(new InspectionFormatPanel(this, ui, textPanel));
     // Arrange
     mxUtils.write(label3, mxResources.get("arrange"));
     div.appendChild(label3);
@@ -818,7 +847,14 @@ Format.prototype.refresh = function () {
     this.panels.push(new TextFormatPanel(this, ui, arrangePanel));
     this.container.appendChild(arrangePanel);
 
-    addClickHandler(label2, textPanel, idx++);
+    addClickHandler(
+      label2,
+      textPanel,
+      idx++,
+      mxUtils.bind(this, function () {
+        return new InspectionFormatPanel(this, ui, textPanel);
+      })
+    );
     addClickHandler(label3, arrangePanel, idx++);
   }
 };
@@ -3170,6 +3170,61 @@ Graph.prototype.restoreSelection = function (cells) {
   }
 };
 
+/**
+ * Function: replaceCells
+ *
+ * Replaces the contents of the model with the given prebuilt cells in a
+ * single change: the cells are put into a new root, which is then set with
+ * one <mxRootChange>. Compared to one insertVertex or insertEdge per cell
+ * this needs no per-cell change, event or view update, the view is
+ * validated once when the change is applied. Graph events are disabled
+ * meanwhile.
+ *
+ * Parameters:
+ *
+ * cells - Array of <mxCell>s with their value, style and geometry set.
+ * Vertices come before the edges that connect them; the terminals of an
+ * edge are given with setTerminal and are cells of the same array.
+ *
+ * Returns the layer that contains the cells.
+ */
+Graph.prototype.replaceCells = function (cells) {
+  var model = this.getModel();
+  var root = model.createRoot();
+  var layer = root.getChildAt(0);
+
+  for (var i = 0; i < cells.length; i++) {
+    var cell = cells[i];
+    layer.insert(cell);
+
+    if (cell.isEdge()) {
+      var source = cell.getTerminal(true);
+      var target = cell.getTerminal(false);
+
+      if (source != null) {
+        source.insertEdge(cell, true);
+      }
+
+      if (target != null) {
+        target.insertEdge(cell, false);
+      }
+    }
+  }
+
+  var eventsEnabled = this.isEventsEnabled();
+  this.setEventsEnabled(false);
+  model.beginUpdate();
+
+  try {
+    model.setRoot(root);
+  } finally {
+    model.endUpdate();
+    this.setEventsEnabled(eventsEnabled);
+  }
+
+  return layer;
+};
+
 /**
  * Selects cells for connect vertex return value.
  */
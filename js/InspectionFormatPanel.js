@@ -2,7 +2,9 @@ import {BaseFormatPanel} from './BaseFormatPanel.js';
 import  {
     createSection,
     generateUniquekey,
-    generateUniqueId
+    generateUniqueId,
+    trackThreagileEdits,
+    takeThreagileEdits
     }
 from './Utils.js';
 
@@ -14,20 +16,11 @@ export const InspectionFormatPanel = function (format, editorUi, container) {
 
 mxUtils.extend(InspectionFormatPanel, BaseFormatPanel);
 
-InspectionFormatPanel.prototype.init = function () {
-  var ui = this.editorUi;
-  let self = this;
-  var editor = ui.editor;
-  var graph = editor.graph;
-  var ss = this.format.getSelectionState();
-  let yaml = "";
-  let cellsBegin =
-    self.editorUi && self.editorUi.editor && self.editorUi.editor.graph
-      ? self.editorUi.editor.graph.getSelectionCells()
-      : null;
-  let cellBegin = cellsBegin && cellsBegin.length > 0 ? cellsBegin[0] : null;
-  
-
+// Adds the technical asset of a newly drawn vertex to the model and returns its key, or the
+// technicalAsset of the cell if it already has one. Format calls this before building the
+// panels, since the Inspection tab is only built once it is shown.
+export function addTechnicalAssetOfCell(graph) {
+  let cellsBegin = graph.getSelectionCells();
   const undefinedAsset = cellsBegin[0].technicalAsset === undefined 
 
   
@@ -66,7 +59,7 @@ if (undefinedAsset)
       graph.model.threagile.setIn([...path, property], assetProperties[property]);
   });
  
-    let cells = self.editorUi.editor.graph.getSelectionCells();
+    let cells = graph.getSelectionCells();
     let cell = cells && cells.length > 0 ? cells[0] : null;
     
     if (!cell.technicalAsset) { // Check if technicalAsset does not exist
@@ -82,49 +75,77 @@ if (undefinedAsset)
       graph.model.threagile.deleteIn(['technical_assets','__DELETE_ME__'])
     }
 
-    let cells = self.editorUi.editor.graph.getSelectionCells();
+    let cells = graph.getSelectionCells();
     let cell = cells && cells.length > 0 ? cells[0] : null;
-    let model = self.editorUi.editor.graph.model;
+    let model = graph.model;
     model.beginUpdate();
       try {
         model.setValue(cell, technicalAssetId);
-        self.editorUi.editor.graph.refresh(cell);
-        self.editorUi.editor.graph.refresh();
+        graph.refresh(cell);
+        graph.refresh();
       } finally {
         model.endUpdate();
       }
     
 }
+return technicalAssetId;
+}
 
-let start, end;
-
-// Start timing
-start = performance.now();
-
-// Serialize the object to a string
-let threagileString = graph.model.threagile.toString();
-
-// End timing and calculate the duration
-end = performance.now();
-console.log('toString() time: ' + (end - start) + ' ms');
-
-// Start timing again
-start = performance.now();
+InspectionFormatPanel.prototype.init = async function () {
+  var ui = this.editorUi;
+  let self = this;
+  var editor = ui.editor;
+  var graph = editor.graph;
+  var ss = this.format.getSelectionState();
+  let yaml = "";
+  let risksByTechnicalAssetId = {};
+  let cellsBegin =
+    self.editorUi && self.editorUi.editor && self.editorUi.editor.graph
+      ? self.editorUi.editor.graph.getSelectionCells()
+      : null;
+  let cellBegin = cellsBegin && cellsBegin.length > 0 ? cellsBegin[0] : null;
+  
 
-// Parse the string with your custom function
-let parsedString = window.parseModelViaString(threagileString);
+  var technicalAssetId = addTechnicalAssetOfCell(graph);
 
-// End timing and calculate the duration
-end = performance.now();
-console.log('parseModelViaString() time: ' + (end - start) + ' ms');
+let start, end;
+let parsedString;
+let threagileDoc = graph.model.threagile;
 
-// Start timing again
+// Start timing
 start = performance.now();
-
-if(!parsedString.technicalAssets && parsedString.includes("$$__ERROR__$$"))
-{
-
-  let errorMessage = parsedString.split("$$__ERROR__$$")[1];  // Extract the error message
+try {
+  let result;
+  if (graph.model.threagileEngineDoc === threagileDoc) {
+    // The engine already holds this document, only the edits since the last refresh are sent
+    try {
+      result = await window.threagileEngine.applyEdits(takeThreagileEdits(threagileDoc));
+    } catch (error) {
+      if (!error.needsFullParse) {
+        throw error;
+      }
+    }
+  }
+  if (!result) {
+    // Serialize the object to a string (the cache key) and start recording edits from this state on;
+    // the engine builds the model from the document's plain JS instead of parsing the string
+    let threagileString = threagileDoc.toString();
+    trackThreagileEdits(threagileDoc);
+    takeThreagileEdits(threagileDoc);
+    result = await window.threagileEngine.analyzeYaml(threagileString, false, threagileDoc.toJS());
+    graph.model.threagileEngineDoc = threagileDoc;
+  }
+  parsedString = result.parsedModel;
+  yaml = result.risksByCategory;
+  risksByTechnicalAssetId = result.risksByTechnicalAssetId;
+} catch (error) {
+  if (error.name === 'EngineCancelledError') {
+    // A newer refresh superseded this one
+    return;
+  }
+  let errorMessage = error.message;
+  // The parse stops at the first problem, the validator reports all of them
+  errorMessage += await describeModelValidationErrors(threagileDoc.toJS());
 
   Swal.fire({
       title: '<span style="color: #333; font-family: Arial, sans-serif;">Error Detected!</span>',
@@ -165,14 +186,14 @@ if(!parsedString.technicalAssets && parsedString.includes("$$__ERROR__$$"))
           document.head.appendChild(styleTag);
       }
   });
+  return;
 }
-      let jsonObj = (parsedString);
 
-      // End timing and calculate the duration
-      end = performance.now();
-      console.log('JSON.parse() time: ' + (end - start) + ' ms');
-      window.applyRAAJS();
-      yaml = (window.applyRiskGenerationJS());
+// End timing and calculate the duration
+end = performance.now();
+console.log('Risk engine time: ' + (end - start) + ' ms');
+
+      let jsonObj = (parsedString);
 
       let span = document.createElement("span");
       span.innerHTML = "<b>Relative Attacker Attractivness:</b> ";
@@ -318,21 +339,8 @@ function interpolateColorForRisks(minColor, maxColor, minVal, maxVal, val) {
           decimals: 2,
           gaugeWidthScale: 0.6,
         });
-        for (const riskArray of yaml.values()) {
-            // Iterate through each individual risk object in the current array
-            for (const risk of riskArray) {
-                // Check if the risk object exists and has a syntheticId property
-                if (risk && risk.syntheticId && typeof risk.syntheticId === 'string') {
-                    // Perform the check using the risk object's syntheticId
-                    if (risk.syntheticId.includes(id)) {
-                        filteredArray.push(risk); // Add the matching risk object
-                    }
-                } else {
-                    // Optional: Log if a risk object is malformed
-                    // console.warn("Encountered invalid risk object structure:", risk);
-                }
-            }
-        }
+        // Risks naming this asset in their synthetic ID, indexed by the engine
+        filteredArray.push(...(risksByTechnicalAssetId[id] || []));
         for (let jsonData in filteredArray) {
           let value = filteredArray[jsonData];
           let riskScore = 0;
@@ -349,10 +357,9 @@ function interpolateColorForRisks(minColor, maxColor, minVal, maxVal, val) {
           if (match && match[1]) {
             property = match[1];
           }
-          let clonedMenu = this.addInspectionMenu(
-            this.createPanel(),
-            filteredArray[jsonData]
-          );
+          // The menu of a risk is only built when it is first expanded, a long risk list
+          // creates just the headers
+          let clonedMenu = this.createPanel();
           clonedMenu.id = property;
           var listItem = document.createElement("li");
           listItem.style.display = "flex";
@@ -364,6 +371,8 @@ function interpolateColorForRisks(minColor, maxColor, minVal, maxVal, val) {
           listItem.dataset.initialColor = initialColor;
           listItem.metaData = value;
 
+          let fillMenu = () => {
+          this.addInspectionMenu(clonedMenu, value);
           let parentNode = clonedMenu.childNodes[0];
           for (var key in value) {
             if (value.hasOwnProperty(key)) {
@@ -398,6 +407,7 @@ function interpolateColorForRisks(minColor, maxColor, minVal, maxVal, val) {
             }
         }
         
+          };
           let textContainer = document.createElement("div");
           textContainer.style.display = "flex";
           textContainer.style.alignItems = "center";
@@ -441,6 +451,10 @@ function interpolateColorForRisks(minColor, maxColor, minVal, maxVal, val) {
               arrowIcon.style.transform = "rotate(270deg)";
               clonedMenu.style.display = "block";
               listItem.focus(); 
+              if (fillMenu != null) {
+                fillMenu();
+                fillMenu = null;
+              }
             } else {
               console.log('Collapsing: Setting background color to', listItem.dataset.initialColor);
               listItem.style.backgroundColor = listItem.dataset.initialColor;  
@@ -656,16 +670,17 @@ function interpolateColorForRisks(minColor, maxColor, minVal, maxVal, val) {
           if (match && match[1]) {
             property = match[1];
           }
-          let clonedMenu = this.addInspectionMenu2(
-            this.createPanel(),
-            filteredArray[jsonData]
-          );
+          // The menu of a risk is only built when it is first expanded, a long risk list
+          // creates just the headers
+          let clonedMenu = this.createPanel();
           clonedMenu.id = property;
           let listItem = document.createElement("li");
           listItem.style.display = "flex";
           listItem.style.flexDirection = "column";
           listItem.style.padding = "8px";
           listItem.style.borderBottom = "1px solid #ccc";
+          let fillMenu = () => {
+          this.addInspectionMenu2(clonedMenu, value);
           let parentNode = clonedMenu.childNodes[0];
           for (var key in value) {
             if (value.hasOwnProperty(key)) {
@@ -694,6 +709,7 @@ function interpolateColorForRisks(minColor, maxColor, minVal, maxVal, val) {
               }
             }
           }
+          };
           let textContainer = document.createElement("div");
           textContainer.style.display = "flex";
           textContainer.style.alignItems = "center";
@@ -734,6 +750,10 @@ function interpolateColorForRisks(minColor, maxColor, minVal, maxVal, val) {
               listItem.style.backgroundColor = "";
               arrowIcon.style.transform = "rotate(270deg)";
               clonedMenu.style.display = "block";
+              if (fillMenu != null) {
+                fillMenu();
+                fillMenu = null;
+              }
             } else {
               listItem.style.backgroundColor = "lightgray";
               arrowIcon.style.transform = "rotate(90deg)";
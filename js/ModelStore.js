@@ -0,0 +1,345 @@
+// Indexed view of the Threagile model Document for the editor panels. The entries of the keyed
+// sections are looked up by key and by ID in O(1), read as plain objects without converting the
+// whole section, and every ID maps to the paths that reference it. The Document stays the source
+// of truth and is what gets serialized; the store follows it through the Document API (setIn,
+// deleteIn, addIn, set, delete). Code that changes nodes in place has to call invalidate().
+
+export const keyedSections = ['data_assets', 'technical_assets', 'trust_boundaries', 'shared_runtimes'];
+
+// ID lists of an entry, by section, and the section of the IDs they hold
+const referenceLists = {
+  technical_assets: { data_assets_processed: 'data_assets', data_assets_stored: 'data_assets' },
+  trust_boundaries: { technical_assets_inside: 'technical_assets', trust_boundaries_nested: 'trust_boundaries' },
+  shared_runtimes: { technical_assets_running: 'technical_assets' },
+};
+const linkReferenceLists = { data_assets_sent: 'data_assets', data_assets_received: 'data_assets' };
+// Sections whose entries reference IDs; risk_tracking through the IDs inside its keys
+const referencingSections = [...Object.keys(referenceLists), 'risk_tracking'];
+
+function keyOf(pair) {
+  return YAML.isScalar(pair.key) ? pair.key.value : pair.key;
+}
+
+function scalarOf(node) {
+  return YAML.isScalar(node) ? node.value : node;
+}
+
+// Synthetic risk IDs are "<category>@<id>@<id>...", communication link IDs inside them "<source>-><target>"
+function idsOfSyntheticId(syntheticId) {
+  return new Set(String(syntheticId).split('@').slice(1).flatMap(segment => segment.split('->')));
+}
+
+function renameInSyntheticId(syntheticId, oldId, newId) {
+  const [category, ...segments] = String(syntheticId).split('@');
+  return [category, ...segments.map(segment => segment.split('->').map(id => id === oldId ? newId : id).join('->'))].join('@');
+}
+
+export class ModelStore {
+  constructor(doc) {
+    this.doc = doc;
+    this.sections = new Map(); // Section -> { keys, nodes, positions, keyById }, built on first use
+    this.entries = new Map(); // Section -> Map of key -> plain entry
+    this.references = null; // { byId: ID -> references, byEntry: section -> key -> references }, built on first use
+  }
+
+  section(name) {
+    let section = this.sections.get(name);
+    if (!section) {
+      section = { keys: [], nodes: new Map(), positions: new Map(), keyById: new Map() };
+      const map = this.doc.get(name, true);
+      if (YAML.isMap(map)) {
+        for (const pair of map.items) {
+          const key = keyOf(pair);
+          section.positions.set(key, section.keys.length);
+          section.keys.push(key);
+          section.nodes.set(key, pair.value);
+          const id = YAML.isMap(pair.value) ? pair.value.get('id') : undefined;
+          if (id !== undefined && id !== null) {
+            section.keyById.set(String(id), key);
+          }
+        }
+      }
+      this.sections.set(name, section);
+    }
+    return section;
+  }
+
+  // Keys of a section in document order; the array is shared, don't modify it
+  keys(name) {
+    return this.section(name).keys;
+  }
+
+  has(name, key) {
+    return this.section(name).nodes.has(key);
+  }
+
+  // The YAML node of an entry, for reading with keepScalar or changing it through the Document API
+  node(name, key) {
+    return this.section(name).nodes.get(key);
+  }
+
+  // Plain JS copy of an entry, converted once and shared until the entry changes; don't modify it
+  entry(name, key) {
+    let entries = this.entries.get(name);
+    if (!entries) {
+      entries = new Map();
+      this.entries.set(name, entries);
+    }
+    if (!entries.has(key)) {
+      const node = this.node(name, key);
+      // Converted in the context of the document, so aliases to anchors elsewhere resolve
+      entries.set(key, node && typeof node.toJS === 'function' ? node.toJS(this.doc) : node);
+    }
+    return entries.get(key);
+  }
+
+  keyOfId(name, id) {
+    return this.section(name).keyById.get(id);
+  }
+
+  idOf(name, key) {
+    const node = this.node(name, key);
+    return YAML.isMap(node) ? node.get('id') : undefined;
+  }
+
+  // Keys of the entries with the given IDs (a list or a single ID), in document order; unknown IDs are skipped
+  keysOfIds(name, ids) {
+    const section = this.section(name);
+    const keys = [];
+    for (const id of Array.isArray(ids) ? ids : [ids]) {
+      const key = section.keyById.get(id);
+      if (key !== undefined && !keys.includes(key)) {
+        keys.push(key);
+      }
+    }
+    return keys.sort((a, b) => section.positions.get(a) - section.positions.get(b));
+  }
+
+  // Paths of all ID list items, link targets and risk tracking entries that reference the ID of an
+  // entry of the section, e.g.
+  // ['technical_assets', 'Web Server', 'communication_links', 'To DB', 'data_assets_sent', 0]
+  // ['risk_tracking', 'unencrypted-communication@web-server->db@db']
+  referencesTo(name, id) {
+    return this.referencesOf(name, id).map(reference => [...reference.path]);
+  }
+
+  referencesOf(name, id) {
+    if (!this.references) {
+      this.references = { byId: new Map(), byEntry: new Map() };
+      for (const section of referencingSections) {
+        for (const key of this.keys(section)) {
+          this.indexEntry(section, key);
+        }
+      }
+    }
+    const references = this.references.byId.get(id) || [];
+    const riskTrackingMatches = references.some(reference => reference.section === null) && this.riskTrackingIdOf(name, id);
+    return references.filter(reference => reference.section === name || (reference.section === null && riskTrackingMatches));
+  }
+
+  // Risk tracking keys don't tell which section an ID is from. They count for the sections that have
+  // an entry with the ID, or for any section if none has, e.g. after the entry's id was changed.
+  riskTrackingIdOf(name, id) {
+    const sections = keyedSections.filter(section => this.keyOfId(section, id) !== undefined);
+    return sections.length === 0 || sections.includes(name);
+  }
+
+  indexEntry(name, key) {
+    const node = this.node(name, key);
+    const references = [];
+    const add = (id, section, path) => {
+      if (typeof id === 'string') {
+        references.push({ id, section, path });
+      }
+    };
+    if (name === 'risk_tracking') {
+      idsOfSyntheticId(key).forEach(id => add(id, null, [name, key]));
+    } else if (YAML.isMap(node)) {
+      this.indexLists(add, [name, key], node, referenceLists[name]);
+      const links = name === 'technical_assets' ? node.get('communication_links', true) : null;
+      if (YAML.isMap(links)) {
+        for (const pair of links.items) {
+          const path = [name, key, 'communication_links', keyOf(pair)];
+          if (YAML.isMap(pair.value)) {
+            add(scalarOf(pair.value.get('target', true)), 'technical_assets', [...path, 'target']);
+            this.indexLists(add, path, pair.value, linkReferenceLists);
+          }
+        }
+      }
+    }
+    let entries = this.references.byEntry.get(name);
+    if (!entries) {
+      entries = new Map();
+      this.references.byEntry.set(name, entries);
+    }
+    entries.set(key, references);
+    for (const reference of references) {
+      let list = this.references.byId.get(reference.id);
+      if (!list) {
+        list = [];
+        this.references.byId.set(reference.id, list);
+      }
+      list.push(reference);
+    }
+  }
+
+  indexLists(add, path, node, lists) {
+    for (const list in lists) {
+      const seq = node.get(list, true);
+      if (YAML.isSeq(seq)) {
+        seq.items.forEach((item, i) => add(scalarOf(item), lists[list], [...path, list, i]));
+      }
+    }
+  }
+
+  unindexEntry(name, key) {
+    const entries = this.references.byEntry.get(name);
+    const references = entries?.get(key);
+    if (!references) {
+      return;
+    }
+    entries.delete(key);
+    for (const reference of references) {
+      const list = this.references.byId.get(reference.id);
+      list.splice(list.indexOf(reference), 1);
+      if (list.length === 0) {
+        this.references.byId.delete(reference.id);
+      }
+    }
+  }
+
+  // The node at a path, walked from the indexed entry instead of from the document root
+  nodeAt(path) {
+    let node = this.node(scalarOf(path[0]), scalarOf(path[1]));
+    for (let i = 2; i < path.length && node !== undefined; i++) {
+      node = YAML.isCollection(node) ? node.get(path[i], true) : undefined;
+    }
+    return node;
+  }
+
+  // References that were changed in place without invalidate() are found stale here and the index
+  // is rebuilt once, rather than editing the wrong items
+  checkedReferences(name, id) {
+    const references = this.referencesOf(name, id);
+    const stale = references.some(reference => reference.path[0] === 'risk_tracking'
+      ? !this.has('risk_tracking', reference.path[1])
+      : scalarOf(this.nodeAt(reference.path)) !== id);
+    if (stale) {
+      console.warn(`Model store: references to ${id} were out of date, rebuilding the index.`);
+      this.references = null;
+      return [...this.referencesOf(name, id)];
+    }
+    return [...references];
+  }
+
+  // Replaces the ID of an entry of the section everywhere it is referenced, at O(references) instead
+  // of walking the model. Changes go through the Document API so every edit hook sees them; risk
+  // tracking entries are moved to the renamed key. Returns the number of references changed.
+  renameId(name, oldId, newId) {
+    const references = this.checkedReferences(name, oldId);
+    for (const reference of references) {
+      const [section, key] = reference.path;
+      if (section === 'risk_tracking') {
+        const renamed = renameInSyntheticId(key, oldId, newId);
+        if (this.has(section, renamed)) {
+          console.warn(`Model store: risk tracking ${renamed} already exists, keeping ${key}.`);
+          continue;
+        }
+        const node = this.node(section, key);
+        this.doc.deleteIn([section, key]);
+        this.doc.setIn([section, renamed], node);
+      } else {
+        this.doc.setIn(reference.path, newId);
+      }
+    }
+    return references.length;
+  }
+
+  // Removes the ID of an entry of the section from every ID list that contains it, later items first
+  // so the indexes of the earlier ones stay valid. Link targets and risk tracking are left alone.
+  // Returns the paths of the removed items.
+  removeId(name, id) {
+    const paths = this.checkedReferences(name, id)
+      .map(reference => reference.path)
+      .filter(path => typeof path[path.length - 1] === 'number')
+      .sort((a, b) => b[b.length - 1] - a[a.length - 1]);
+    paths.forEach(path => this.doc.deleteIn(path));
+    return paths.map(path => [...path]);
+  }
+
+  // Called for every change made through the Document API. The keys and IDs of a section only change
+  // with whole entries or their id; the references of the changed entry are indexed again and of the
+  // converted entries only the changed one is dropped.
+  changed(path) {
+    const name = path.length > 0 ? scalarOf(path[0]) : undefined;
+    if (name === undefined) {
+      this.invalidate();
+      return;
+    }
+    const key = path.length > 1 ? scalarOf(path[1]) : undefined;
+    if (path.length <= 2 || scalarOf(path[2]) === 'id' || !this.sections.get(name)?.nodes.has(key)) {
+      this.sections.delete(name);
+    }
+    if (key === undefined) {
+      this.entries.delete(name);
+    } else {
+      this.entries.get(name)?.delete(key);
+    }
+    if (this.references && referencingSections.includes(name)) {
+      if (key === undefined) {
+        this.references = null;
+      } else {
+        this.unindexEntry(name, key);
+        if (this.has(name, key)) {
+          this.indexEntry(name, key);
+        }
+      }
+    }
+  }
+
+  // Drops the indexes of one section, or of all sections, after nodes were changed in place
+  invalidate(name) {
+    if (name === undefined) {
+      this.sections.clear();
+      this.entries.clear();
+    } else {
+      this.sections.delete(name);
+      this.entries.delete(name);
+    }
+    this.references = null;
+  }
+}
+
+// The store of a model Document, created and hooked into its edit methods on first use
+export function modelStoreOf(doc) {
+  if (!doc.modelStore) {
+    const store = new ModelStore(doc);
+    doc.modelStore = store;
+    const setIn = doc.setIn, deleteIn = doc.deleteIn, addIn = doc.addIn, set = doc.set, del = doc.delete;
+    doc.setIn = function (path, value) {
+      setIn.call(this, path, value);
+      store.changed(path);
+    };
+    doc.deleteIn = function (path) {
+      const deleted = deleteIn.call(this, path);
+      store.changed(path);
+      return deleted;
+    };
+    doc.addIn = function (path, value) {
+      addIn.call(this, path, value);
+      store.changed(path);
+    };
+    doc.set = function (key, value) {
+      set.call(this, key, value);
+      store.changed([key]);
+    };
+    doc.delete = function (key) {
+      const deleted = del.call(this, key);
+      store.changed([key]);
+      return deleted;
+    };
+  }
+  return doc.modelStore;
+}
+
+window.modelStoreOf = modelStoreOf;
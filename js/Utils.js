@@ -1,5 +1,118 @@
 export function restartWasm() {
     window.initModelState();
+    if (window.threagileEngine) {
+        window.threagileEngine.reset();
+    }
+}
+// The edit that undoes an edit at path, captured before the edit is made; null if there is nothing to undo
+function inverseOf(doc, op, path) {
+  const key = path[path.length - 1];
+  const parent = path.length > 1 ? doc.getIn(path.slice(0, -1), true) : doc.contents;
+  if (op === 'add') {
+    const collection = doc.getIn(path, true);
+    if (YAML.isSeq(collection)) {
+      return { op: 'delete', path: [...path, collection.items.length] };
+    }
+    return YAML.isCollection(collection) ? { op: 'set', path: [...path], node: collection.clone() } : { op: 'delete', path: [...path] };
+  }
+  if (!YAML.isCollection(parent) || !parent.has(key)) {
+    return op === 'set' ? { op: 'delete', path: [...path] } : null;
+  }
+  const previous = parent.get(key, true);
+  if (op === 'set') {
+    // Scalars are changed in place, other nodes are replaced and stay as they were
+    return { op: 'set', path: [...path], node: YAML.isScalar(previous) ? previous.value : previous };
+  }
+  // Deleted list items and map pairs are put back at their position
+  if (YAML.isSeq(parent)) {
+    return { op: 'insert', path: [...path], index: Number(key), node: previous };
+  }
+  const index = parent.items.findIndex(pair => pair.key === key || (YAML.isScalar(pair.key) && pair.key.value === key));
+  return { op: 'insert', path: [...path], index: index, node: parent.items[index] };
+}
+// Records every edit made through the Document API once. The engine takes the edits since its last
+// refresh (takeThreagileEdits); the inverse of each edit goes to doc.threagileEditListener, which the
+// editor turns into undoable graph changes (see Editor.prototype.logThreagileEdits).
+export function trackThreagileEdits(doc) {
+  if (!doc || doc.pendingEngineEdits) {
+    return doc;
+  }
+  doc.pendingEngineEdits = [];
+  const record = function (op, path, inverse) {
+    let value;
+    if (op === 'set') {
+      let node = doc.getIn(path, true);
+      value = node && typeof node.toJSON === 'function' ? node.toJSON() : node;
+    }
+    doc.pendingEngineEdits.push({ op: op, path: [...path], value: value });
+    if (inverse && doc.threagileEditListener) {
+      doc.threagileEditListener(inverse);
+    }
+  };
+  const setIn = doc.setIn, deleteIn = doc.deleteIn, addIn = doc.addIn, set = doc.set, del = doc.delete;
+  let inserted = null; // Path of the item insertIn is putting back
+  doc.setIn = function (path, value) {
+    let inverse = inserted ? { op: 'delete', path: [...inserted] } : inverseOf(this, 'set', path);
+    setIn.call(this, path, value);
+    record('set', path, inverse);
+  };
+  doc.deleteIn = function (path) {
+    let inverse = inverseOf(this, 'delete', path);
+    let deleted = deleteIn.call(this, path);
+    record('delete', path, inverse);
+    return deleted;
+  };
+  doc.addIn = function (path, value) {
+    let inverse = inverseOf(this, 'add', path);
+    addIn.call(this, path, value);
+    // The collection at path changed as a whole
+    record('set', path, inverse);
+  };
+  doc.set = function (key, value) {
+    let inverse = inverseOf(this, 'set', [key]);
+    set.call(this, key, value);
+    record('set', [key], inverse);
+  };
+  doc.delete = function (key) {
+    let inverse = inverseOf(this, 'delete', [key]);
+    let deleted = del.call(this, key);
+    record('delete', [key], inverse);
+    return deleted;
+  };
+  // Puts a deleted list item or map pair back at its position, the inverse of deleteIn
+  doc.insertIn = function (path, index, node) {
+    const parentPath = path.slice(0, -1);
+    const parent = parentPath.length > 0 ? this.getIn(parentPath, true) : this.contents;
+    parent.items.splice(index, 0, node);
+    inserted = path;
+    try {
+      // Set to itself, so the other hooks see the change: a list as a whole, as the engine can't insert
+      if (YAML.isSeq(parent)) {
+        this.setIn(parentPath, parent);
+      } else {
+        this.setIn(path, node.value);
+      }
+    } finally {
+      inserted = null;
+    }
+  };
+  return doc;
+}
+// Applies an edit recorded by trackThreagileEdits, e.g. an inverse when undoing
+export function applyThreagileEdit(doc, edit) {
+  if (edit.op === 'insert') {
+    doc.insertIn(edit.path, edit.index, edit.node);
+  } else if (edit.op === 'delete') {
+    doc.deleteIn(edit.path);
+  } else {
+    doc.setIn(edit.path, edit.node);
+  }
+}
+// Returns the edits recorded since the last call and starts a new batch
+export function takeThreagileEdits(doc) {
+  let edits = doc.pendingEngineEdits || [];
+  doc.pendingEngineEdits = [];
+  return edits;
 }
 // Function to check if an ID already exists in the graph's model
 function checkIdExists(graph, id) {
@@ -115,3 +228,6 @@ export function setCustomOption(self, parameter) {
   };
 }
 
+
+window.trackThreagileEdits = trackThreagileEdits;
+window.applyThreagileEdit = applyThreagileEdit;